@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Startup benchmark: how long ``dot-work --help`` and ``dot-work status`` take to start.
+
+Runs each command in fresh interpreters under ``python -X importtime`` and
+reports the median wall time of the whole process, the median cumulative
+import time of ``dot_work.cli`` and the slowest packages it pulls in.
+``status`` runs in a temporary project set up with ``dot-work init-tracking``.
+
+To compare two revisions, check the older one out into a worktree and point
+``--src`` at its ``src`` directory:
+
+    git worktree add /tmp/dot-work-base <rev>
+    python benchmarks/bench_cli_startup.py --src /tmp/dot-work-base/src
+
+Usage:
+    python benchmarks/bench_cli_startup.py [--runs N] [--top N] [--src DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+COMMANDS = {
+    "--help": ["--help"],
+    "status": ["status"],
+}
+
+# Invoke the app like the console script does, so dot_work.cli shows up in the report
+RUNNER = "import sys; sys.argv[0] = 'dot-work'; from dot_work.cli import app; app()"
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Map each imported module to (depth, cumulative microseconds)."""
+    modules: dict[str, tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            _, cumulative, indent, name = match.groups()
+            modules.setdefault(name, (len(indent) // 2, int(cumulative)))
+    return modules
+
+
+def children_of(stderr: str, parent: str) -> dict[str, int]:
+    """Cumulative microseconds of the direct imports of a module."""
+    # importtime prints children before their parent, one level deeper
+    lines = [IMPORTTIME_LINE.match(line) for line in stderr.splitlines()]
+    entries = [(len(m.group(3)) // 2, m.group(4), int(m.group(2))) for m in lines if m]
+    for index, (depth, name, _) in enumerate(entries):
+        if name != parent:
+            continue
+        children: dict[str, int] = {}
+        for child_depth, child, cumulative in reversed(entries[:index]):
+            if child_depth <= depth:
+                break
+            if child_depth == depth + 1:
+                children[child] = cumulative
+        return children
+    return {}
+
+
+def run_once(src: Path, args: list[str], cwd: Path) -> tuple[float, str]:
+    """Run one command in a fresh interpreter; return (wall seconds, importtime output)."""
+    env = dict(os.environ, PYTHONPATH=str(src.resolve()), COLUMNS="100")
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUNNER, *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time")]
+        raise RuntimeError(
+            f"dot-work {' '.join(args)} failed:\n{result.stdout}" + "\n".join(errors)
+        )
+    return wall, result.stderr
+
+
+def main() -> None:
+    """Benchmark the startup of each command and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Runs per command (default: 10)")
+    parser.add_argument("--top", type=int, default=8, help="Slowest imports to list (default: 8)")
+    parser.add_argument("--src", type=Path, default=SRC_DIR, help="src directory to benchmark")
+    args = parser.parse_args()
+
+    print(f"Python {sys.version.split()[0]}, src {args.src}, {args.runs} runs per command")
+    with tempfile.TemporaryDirectory() as tmp:
+        project = Path(tmp)
+        run_once(args.src, ["init-tracking"], project)
+        for label, command in COMMANDS.items():
+            walls: list[float] = []
+            cli_imports: list[float] = []
+            children: dict[str, list[int]] = {}
+            # One warm-up run so every measured run sees warm OS caches
+            run_once(args.src, command, project)
+            for _ in range(args.runs):
+                wall, stderr = run_once(args.src, command, project)
+                walls.append(wall)
+                cli_imports.append(parse_importtime(stderr).get("dot_work.cli", (0, 0))[1])
+                for name, cumulative in children_of(stderr, "dot_work.cli").items():
+                    children.setdefault(name, []).append(cumulative)
+
+            print(f"\ndot-work {label}")
+            print(f"  wall time (median):          {statistics.median(walls) * 1000:8.1f} ms")
+            print(
+                f"  import dot_work.cli (median): {statistics.median(cli_imports) / 1000:8.1f} ms"
+            )
+            slowest = sorted(
+                ((statistics.median(values) / 1000, name) for name, values in children.items()),
+                reverse=True,
+            )[: args.top]
+            for ms, name in slowest:
+                print(f"    {name:<40} {ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: layered frontmatter merge vs. the legacy deepcopy merge.
+
+Replays the merge step of CanonicalPromptParser for every bundled prompt and
+hook (frontmatter is YAML-parsed once up front so only the merge and the
+fields a parser reads are timed), then reports per-parse latency and the bytes
+each merged result allocates for both strategies.
+
+Usage:
+    python benchmarks/bench_frontmatter_merge.py [--iterations N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import re
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dot_work.utils.defaults import load_global_defaults, merge_defaults, thaw  # noqa: E402
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "src" / "dot_work" / "assets"
+FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n?(.*)$", re.DOTALL)
+
+
+def legacy_deep_merge(a: dict, b: dict) -> dict:
+    """The deepcopy-based merge the parsers used before LayeredDefaults."""
+    result = copy.deepcopy(a)
+    for k, v in b.items():
+        if k in result and isinstance(result[k], dict) and isinstance(v, dict):
+            if v:
+                result[k] = legacy_deep_merge(result[k], v)
+                if "filename" in v:
+                    result[k].pop("filename_suffix", None)
+                elif "filename_suffix" in v:
+                    result[k].pop("filename", None)
+        else:
+            result[k] = copy.deepcopy(v)
+    return result
+
+
+def consume(merged: Mapping[str, Any]) -> int:
+    """Read what CanonicalPromptParser reads from merged frontmatter."""
+    touched = len(thaw(merged.get("meta", {})) or {})
+    for env in merged.get("environments", {}).values():
+        touched += len(env["target"]) + bool(env.get("filename")) + bool(env.get("filename_suffix"))
+    return touched
+
+
+def load_corpus() -> list[tuple[Any, dict]]:
+    """Return (frozen global defaults, frontmatter) pairs for bundled prompts and hooks."""
+    corpus: list[tuple[Any, dict]] = []
+    for category in ("prompts", "hooks"):
+        category_dir = ASSETS_DIR / category
+        defaults = load_global_defaults(category_dir / "global.yml")
+        for path in sorted(category_dir.glob("*.md")):
+            match = FRONTMATTER_PATTERN.match(path.read_text(encoding="utf-8").strip())
+            if not match:
+                continue
+            frontmatter = yaml.safe_load(match.group(1))
+            if isinstance(frontmatter, dict):
+                corpus.append((defaults, frontmatter))
+    return corpus
+
+
+def run(
+    name: str, merge: Callable[[Any, dict], Mapping[str, Any]], corpus: list, iterations: int
+) -> tuple[float, float]:
+    """Time one merge strategy and measure the memory its merged results hold."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for defaults, frontmatter in corpus:
+            consume(merge(defaults, frontmatter))
+    elapsed = time.perf_counter() - start
+    parses = iterations * len(corpus)
+
+    # Keep every merged result alive so tracemalloc sees what each parse allocates
+    tracemalloc.start()
+    retained = []
+    for defaults, frontmatter in corpus:
+        merged = merge(defaults, frontmatter)
+        consume(merged)
+        retained.append(merged)
+    allocated, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retained
+
+    per_parse_us = elapsed / parses * 1e6
+    per_parse_bytes = allocated / len(corpus)
+    print(f"{name:<10} {per_parse_us:9.2f} us/parse   {per_parse_bytes:9.0f} B/parse")
+    return per_parse_us, per_parse_bytes
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", "-n", type=int, default=200)
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    if not corpus:
+        print("No bundled frontmatter found")
+        return 1
+
+    # Both strategies must produce identical merged frontmatter
+    for defaults, frontmatter in corpus:
+        legacy = legacy_deep_merge(thaw(defaults), frontmatter)
+        assert thaw(merge_defaults(defaults, frontmatter)) == legacy
+        assert list(merge_defaults(defaults, frontmatter)) == list(legacy)
+
+    print(f"{len(corpus)} bundled files x {args.iterations} iterations\n")
+    # The legacy parsers worked on a plain dict freshly loaded from global.yml
+    legacy_corpus = [(thaw(defaults), frontmatter) for defaults, frontmatter in corpus]
+    legacy_us, legacy_bytes = run("deepcopy", legacy_deep_merge, legacy_corpus, args.iterations)
+    layered_us, layered_bytes = run("layered", merge_defaults, corpus, args.iterations)
+    print(
+        f"\nlatency {legacy_us / layered_us:.1f}x faster, "
+        f"allocation {legacy_bytes / layered_bytes:.1f}x smaller"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: SafeLoader vs. CSafeLoader vs. the frontmatter fast path.
+
+Loads the frontmatter of every bundled asset, plus a synthetic corpus of
+canonical-prompt-shaped frontmatter (10,000 documents by default), with each
+YAML path and reports per-document latency:
+
+- ``safe_load``: pure-Python ``yaml.safe_load`` (what the parsers used before)
+- ``csafe``: ``dot_work.utils.yaml_loader.safe_load`` (libyaml when available)
+- ``fast``: ``dot_work.utils.yaml_loader.load_frontmatter`` (fast path with
+  fallback to ``csafe``)
+
+Usage:
+    python benchmarks/bench_yaml_loading.py [--iterations N] [--synthetic N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dot_work.utils.frontmatter import read_frontmatter  # noqa: E402
+from dot_work.utils.yaml_loader import (  # noqa: E402
+    CSafeLoader,
+    fast_load,
+    load_frontmatter,
+    safe_load,
+)
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "src" / "dot_work" / "assets"
+
+ENVIRONMENTS = {
+    "claude": ('".claude/commands/"', "filename_suffix", '".md"'),
+    "copilot": ('".github/prompts/"', "filename_suffix", '".prompt.md"'),
+    "cursor": ('".cursor/rules/"', "filename_suffix", '".mdc"'),
+    "opencode": ('".opencode/prompts/"', "filename", '"AGENTS.md"'),
+    "windsurf": ('".windsurf/rules/"', "filename_suffix", '".md"'),
+}
+
+
+def load_bundled_corpus() -> list[str]:
+    """Return the frontmatter text of every bundled asset."""
+    corpus: list[str] = []
+    for path in sorted(ASSETS_DIR.rglob("*.md")):
+        block = read_frontmatter(path)
+        if block is not None:
+            corpus.append(block.text)
+    return corpus
+
+
+def make_synthetic_corpus(count: int, seed: int = 0) -> list[str]:
+    """Generate canonical-prompt frontmatter: meta plus a few environments."""
+    rng = random.Random(seed)
+    corpus: list[str] = []
+    for i in range(count):
+        lines = [
+            "meta:",
+            f"  name: prompt-{i}",
+            f'  title: "Prompt {i}"',
+            f'  description: "Synthetic prompt number {i} for benchmarking"',
+            f'  version: "{rng.randint(0, 3)}.{rng.randint(0, 9)}.0"',
+        ]
+        if rng.random() < 0.3:
+            lines.append("  tags: [benchmark, synthetic]")
+        lines.append("")
+        lines.append("environments:")
+        for env in rng.sample(sorted(ENVIRONMENTS), rng.randint(1, 4)):
+            target, key, value = ENVIRONMENTS[env]
+            lines += [f"  {env}:", f"    target: {target}", f"    {key}: {value}"]
+        corpus.append("\n".join(lines))
+    return corpus
+
+
+def run(name: str, load: Callable[[str], Any], corpus: list[str], iterations: int) -> float:
+    """Time one loader over the corpus and return microseconds per document."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for text in corpus:
+            load(text)
+    elapsed = time.perf_counter() - start
+
+    per_doc_us = elapsed / (iterations * len(corpus)) * 1e6
+    print(f"  {name:<10} {per_doc_us:9.2f} us/doc")
+    return per_doc_us
+
+
+def bench(label: str, corpus: list[str], iterations: int) -> None:
+    """Benchmark all three loaders on one corpus."""
+    # Every path must produce exactly what yaml.safe_load does
+    for text in corpus:
+        expected = yaml.safe_load(text)
+        assert safe_load(text) == expected
+        assert load_frontmatter(text) == expected
+
+    hits = sum(fast_load(text) is not None for text in corpus)
+    print(
+        f"{label}: {len(corpus)} documents x {iterations} iterations "
+        f"(fast path covers {hits}/{len(corpus)})"
+    )
+    pure_us = run("safe_load", yaml.safe_load, corpus, iterations)
+    csafe_us = run("csafe", safe_load, corpus, iterations)
+    fast_us = run("fast", load_frontmatter, corpus, iterations)
+    print(
+        f"  csafe {pure_us / csafe_us:.1f}x, fast {pure_us / fast_us:.1f}x faster than safe_load\n"
+    )
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", "-n", type=int, default=20)
+    parser.add_argument("--synthetic", type=int, default=10_000)
+    args = parser.parse_args()
+
+    bundled = load_bundled_corpus()
+    if not bundled:
+        print("No bundled frontmatter found")
+        return 1
+
+    print(f"libyaml: {'yes' if CSafeLoader is not None else 'no (csafe = safe_load)'}\n")
+    bench("bundled", bundled, args.iterations)
+    bench("synthetic", make_synthetic_corpus(args.synthetic), 1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
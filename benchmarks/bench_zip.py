@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Throughput benchmark: ``zip_folder`` with 1..N compression jobs.
+
+Generates a synthetic source tree (mostly compressible, text-like files of
+varied sizes, some incompressible binaries and a few large files that the
+writer streams itself), zips it with each number of jobs and reports the best
+time of --runs, the input throughput in MB/s and the speedup over the first
+job count (one job by default). Every archive is checked to be byte-identical
+to the first one.
+
+Usage:
+    python benchmarks/bench_zip.py [--size-mb 200] [--files 2000] [--jobs 1,2,4,8] [--runs 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dot_work.zip.zipper import MAX_BUFFERED_FILE_SIZE, default_jobs, zip_folder  # noqa: E402
+
+# Share of the tree that is random (incompressible) data
+BINARY_SHARE = 0.15
+
+# Share of the tree in files too large to be compressed in memory
+LARGE_SHARE = 0.1
+
+
+def _text(rng: random.Random, size: int, words: list[bytes]) -> bytes:
+    """Source-code-like bytes: repeated words and indented lines."""
+    chunks: list[bytes] = []
+    length = 0
+    while length < size:
+        line = b"    " * rng.randint(0, 3) + b" ".join(rng.choices(words, k=rng.randint(3, 12)))
+        chunks.append(line + b"\n")
+        length += len(line) + 1
+    return b"".join(chunks)[:size]
+
+
+def make_tree(root: Path, total_bytes: int, files: int, seed: int = 0) -> int:
+    """Write a synthetic source tree under root; return its size in bytes."""
+    rng = random.Random(seed)
+    words = [
+        bytes(rng.choices(b"abcdefghijklmnopqrstuvwxyz_().:", k=rng.randint(2, 10)))
+        for _ in range(2000)
+    ]
+    large_bytes = int(total_bytes * LARGE_SHARE)
+    written = 0
+    for index in range(files):
+        directory = root / f"pkg{index % 17}" / f"mod{index % 5}"
+        directory.mkdir(parents=True, exist_ok=True)
+        # Log-normal sizes: many small files, some large ones
+        size = int(rng.lognormvariate(0, 1.2) * (total_bytes - large_bytes) / files / 2)
+        if rng.random() < BINARY_SHARE:
+            (directory / f"blob{index}.bin").write_bytes(os.urandom(size))
+        else:
+            (directory / f"file{index}.py").write_bytes(_text(rng, size, words))
+        written += size
+    while large_bytes > 0:
+        size = min(large_bytes, MAX_BUFFERED_FILE_SIZE + 1024 * 1024)
+        (root / f"large{large_bytes}.txt").write_bytes(_text(rng, size, words))
+        large_bytes -= size
+        written += size
+    return written
+
+
+def main() -> None:
+    """Zip the synthetic tree with each number of jobs and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=200, help="Tree size (default: 200)")
+    parser.add_argument("--files", type=int, default=2000, help="Number of files (default: 2000)")
+    parser.add_argument(
+        "--jobs",
+        default=",".join(str(jobs) for jobs in sorted({1, 2, 4, default_jobs()})),
+        help="Comma-separated job counts to compare (default: 1,2,4,<CPUs>)",
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Runs per job count (default: 3)")
+    args = parser.parse_args()
+    job_counts = [int(jobs) for jobs in args.jobs.split(",")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tree = Path(tmp) / "tree"
+        size = make_tree(tree, args.size_mb * 1024 * 1024, args.files)
+        print(
+            f"Python {sys.version.split()[0]}, {os.cpu_count()} CPUs, "
+            f"{size / 1e6:.0f} MB in {args.files} files, best of {args.runs} runs"
+        )
+        print(f"\n{'jobs':>4} {'time':>9} {'MB/s':>8} {'speedup':>8} {'ratio':>6}")
+
+        reference = None
+        first_time = None
+        for jobs in job_counts:
+            output = Path(tmp) / f"jobs{jobs}.zip"
+            times = []
+            for _ in range(args.runs):
+                start = time.perf_counter()
+                zip_folder(tree, output, jobs=jobs)
+                times.append(time.perf_counter() - start)
+            best = min(times)
+            archive = output.read_bytes()
+            if reference is None:
+                reference = archive
+            elif archive != reference:
+                raise SystemExit(f"Archive with {jobs} jobs differs from the first one")
+            first_time = first_time or best
+            print(
+                f"{jobs:>4} {best:8.2f}s {size / 1e6 / best:8.1f} "
+                f"{first_time / best:7.2f}x {len(archive) / size:6.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""Startup performance suite with JSON baselines and regression thresholds.
+
+Measures, each in fresh interpreters (best of --runs, which is far less
+sensitive to a busy machine than the mean or median):
+
+- Import time of ``dot_work.cli`` and of each lazily loaded subcommand module,
+  from ``python -X importtime``. "cold" runs start with an empty bytecode
+  cache (a fresh ``PYTHONPYCACHEPREFIX``), so every module is compiled;
+  "warm" runs reuse the bytecode written by a warm-up run.
+- Wall time of ``dot-work --help``, ``status``, ``list``, ``install --dry-run``
+  and ``skills list``, run in a temporary project with warm dot-work caches.
+
+Every number is stored in milliseconds, next to the startup time of a bare
+interpreter (``python -c pass``), the reference. When checking, baseline
+numbers are scaled by the ratio of the current reference to the baseline one,
+so a baseline recorded on a faster or slower machine still applies. A metric
+regresses when it exceeds its scaled baseline by more than the tolerance and
+by more than --min-ms (to ignore noise on tiny numbers). The reference is
+sampled around every metric and its best time is used; regressed metrics are
+measured again (--retries) before the check fails, since load on the machine
+only ever makes numbers worse.
+
+Usage:
+    python benchmarks/perf_suite.py [--runs N] [--tolerance 0.25] [--min-ms 15]
+    python benchmarks/perf_suite.py --update-baseline
+    python benchmarks/perf_suite.py --json results.json
+
+Exits with status 1 if a metric regressed (scripts/build.py --perf runs this).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterable
+from functools import partial
+from pathlib import Path
+
+from bench_cli_startup import RUNNER, parse_importtime
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = PROJECT_ROOT / "src"
+BASELINE_FILE = Path(__file__).resolve().parent / "baselines" / "startup.json"
+
+# Bump when metrics are renamed or measured differently
+BASELINE_VERSION = 1
+
+# Modules whose import time is tracked: the CLI and each lazily loaded subcommand group
+IMPORT_MODULES = (
+    "dot_work.cli",
+    "dot_work.zip.cli",
+    "dot_work.skills.cli",
+    "dot_work.subagents.cli",
+    "dot_work.profile.cli",
+)
+
+# End-to-end commands whose wall time is tracked
+COMMANDS = {
+    "--help": ["--help"],
+    "status": ["status"],
+    "list": ["list"],
+    "install --dry-run": ["install", "--env", "claude", "--dry-run"],
+    "skills list": ["skills", "list"],
+}
+
+
+def _run(
+    argv: list[str], cwd: Path, env: dict[str, str], *, importtime: bool = False
+) -> tuple[float, str]:
+    """Run a fresh interpreter; return (wall seconds, stderr)."""
+    flags = ["-X", "importtime"] if importtime else []
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, *flags, *argv],
+        cwd=cwd,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    wall = time.perf_counter() - start
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time")]
+        raise RuntimeError(f"{' '.join(argv)} failed:\n{result.stdout}" + "\n".join(errors))
+    return wall, result.stderr
+
+
+def _import_ms(module: str, cwd: Path, env: dict[str, str]) -> float:
+    """Cumulative import time of module in a fresh interpreter, in milliseconds."""
+    _, stderr = _run(["-c", f"import {module}"], cwd, env, importtime=True)
+    return parse_importtime(stderr)[module][1] / 1000
+
+
+class _Suite:
+    """Runs the measurements in a temporary project with its own caches."""
+
+    def __init__(self, tmp_path: Path) -> None:
+        self.tmp_path = tmp_path
+        self.project = tmp_path / "project"
+        self.project.mkdir()
+        self.env = dict(
+            os.environ,
+            PYTHONPATH=str(SRC_DIR),
+            COLUMNS="100",
+            DOT_WORK_CACHE_DIR=str(tmp_path / "cache"),
+            PYTHONPYCACHEPREFIX=str(tmp_path / "pycache"),
+        )
+        self.env.pop("PYTHONDONTWRITEBYTECODE", None)
+        self.env.pop("DOT_WORK_NO_CACHE", None)
+        self.reference_samples: list[float] = []
+        self._cold_runs = 0
+        _run(["-c", RUNNER, "init-tracking"], self.project, self.env)
+
+    def sample_reference(self) -> None:
+        """Time a bare interpreter; sampled between metrics to track machine load."""
+        self.reference_samples.append(_run(["-c", "pass"], self.project, self.env)[0] * 1000)
+
+    def cold_import(self, module: str) -> float:
+        """Import time of module with an empty bytecode cache."""
+        self._cold_runs += 1
+        cold_env = dict(
+            self.env, PYTHONPYCACHEPREFIX=str(self.tmp_path / f"cold-{self._cold_runs}")
+        )
+        return _import_ms(module, self.project, cold_env)
+
+    def warm_import(self, module: str) -> float:
+        """Import time of module reusing the suite's bytecode cache."""
+        return _import_ms(module, self.project, self.env)
+
+    def wall(self, args: list[str]) -> float:
+        """Wall time of one dot-work command."""
+        return _run(["-c", RUNNER, *args], self.project, self.env)[0] * 1000
+
+    def metrics(self) -> dict[str, Callable[[], float]]:
+        """Metric names mapped to a function taking one sample in milliseconds."""
+        metrics: dict[str, Callable[[], float]] = {}
+        for module in IMPORT_MODULES:
+            metrics[f"import.cold.{module}"] = partial(self.cold_import, module)
+            metrics[f"import.warm.{module}"] = partial(self.warm_import, module)
+        for label, args in COMMANDS.items():
+            metrics[f"wall.{label}"] = partial(self.wall, args)
+        return metrics
+
+    def measure(self, runs: int, names: Iterable[str] | None = None) -> dict[str, float]:
+        """Return the best of runs in milliseconds for each metric (default: all)."""
+        metrics = self.metrics()
+        results: dict[str, float] = {}
+        for name in names if names is not None else metrics:
+            self.sample_reference()
+            take_sample = metrics[name]
+            take_sample()  # warm-up: writes bytecode and dot-work caches
+            results[name] = round(min(take_sample() for _ in range(runs)), 2)
+            self.sample_reference()
+        return results
+
+    @property
+    def reference(self) -> float:
+        """Best bare-interpreter startup time sampled so far."""
+        return round(min(self.reference_samples), 2)
+
+
+def compare(
+    baseline: dict[str, float], current: dict[str, float], tolerance: float, min_ms: float
+) -> list[tuple[str, float, float, float, bool]]:
+    """Compare metrics with a baseline scaled to this machine.
+
+    Returns:
+        (metric, scaled baseline, current, change ratio, regressed) for every
+        metric present in both.
+    """
+    scale = current["reference"] / baseline["reference"] if baseline.get("reference") else 1.0
+    rows = []
+    for name, value in current.items():
+        if name == "reference" or name not in baseline:
+            continue
+        expected = baseline[name] * scale
+        ratio = value / expected - 1 if expected else 0.0
+        regressed = ratio > tolerance and value - expected > min_ms
+        rows.append((name, expected, value, ratio, regressed))
+    return rows
+
+
+def _load_baseline(path: Path) -> dict | None:
+    """Read a baseline, or print why it cannot be used and return None."""
+    try:
+        baseline = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        print(f"No baseline at {path}; run with --update-baseline first")
+        return None
+    if baseline.get("version") != BASELINE_VERSION:
+        print(f"Baseline {path} is outdated; run with --update-baseline")
+        return None
+    return baseline
+
+
+def main() -> int:
+    """Measure, then compare with or update the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per metric (default: 5)")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown as a fraction of the baseline (default: 0.25)",
+    )
+    parser.add_argument(
+        "--min-ms",
+        type=float,
+        default=15.0,
+        help="Slowdowns smaller than this many ms never fail (default: 15)",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=2,
+        help="Times a regressed metric is measured again before failing (default: 2)",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Baseline JSON file")
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Write the results as the new baseline"
+    )
+    parser.add_argument("--json", type=Path, help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    baseline = None
+    if not args.update_baseline:
+        baseline = _load_baseline(args.baseline)
+        if baseline is None:
+            return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        suite = _Suite(Path(tmp))
+        metrics = suite.measure(args.runs)
+        rows = []
+        if baseline is not None:
+            # A busy machine only ever makes numbers worse: confirm regressions before failing
+            for attempt in range(args.retries + 1):
+                current = {"reference": suite.reference, **metrics}
+                rows = compare(baseline["metrics"], current, args.tolerance, args.min_ms)
+                regressed = [row[0] for row in rows if row[4]]
+                if not regressed or attempt == args.retries:
+                    break
+                for name, value in suite.measure(args.runs, regressed).items():
+                    metrics[name] = min(metrics[name], value)
+
+    results = {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "runs": args.runs,
+        "metrics": {"reference": suite.reference, **metrics},
+    }
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    if baseline is None:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        for name, value in results["metrics"].items():
+            print(f"{name:<40} {value:9.1f} ms")
+        print(f"\nWrote baseline {args.baseline}")
+        return 0
+
+    if baseline.get("python", "").rsplit(".", 1)[0] != results["python"].rsplit(".", 1)[0]:
+        print(f"Note: baseline recorded with Python {baseline.get('python')}")
+    print(f"{'metric':<40} {'baseline':>9} {'current':>9} {'change':>8}")
+    for name, expected, value, ratio, regressed in rows:
+        flag = "  REGRESSED" if regressed else ""
+        print(f"{name:<40} {expected:9.1f} {value:9.1f} {ratio:+8.0%}{flag}")
+
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed beyond {args.tolerance:.0%}")
+        return 1
+    print(f"\nNo regressions beyond {args.tolerance:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+"""Hatch build hook that regenerates the bundled asset index and compiled templates."""
+
+import sys
+from pathlib import Path
+from typing import Any
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+class AssetIndexBuildHook(BuildHookInterface):
+    """Write the asset index and precompiled prompt templates so wheels ship current ones."""
+
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        """Build the asset index and compiled templates from the source tree."""
+        src_dir = Path(self.root) / "src"
+        sys.path.insert(0, str(src_dir))
+        try:
+            from dot_work.asset_index import write_asset_index
+            from dot_work.template_cache import write_compiled_templates
+        finally:
+            sys.path.remove(str(src_dir))
+
+        assets_dir = src_dir / "dot_work" / "assets"
+        index_path = write_asset_index(assets_dir)
+        self.app.display_info(f"Wrote asset index: {index_path.relative_to(self.root)}")
+        compiled_dir = write_compiled_templates(assets_dir / "prompts")
+        self.app.display_info(f"Wrote compiled templates: {compiled_dir.relative_to(self.root)}")
@@ -159,6 +159,52 @@ class BuildRunner:
         self.print_result(success, f"mypy {self.src_path}", output, error)
         return success
 
+    def build_asset_index(self) -> bool:
+        """Regenerate assets/index.json so discovery can skip YAML parsing."""
+        self.print_step("Building Asset Index")
+
+        assets_path = self.src_path / "assets"
+        if not assets_path.exists():
+            print(f"[WARN] Assets directory not found at {assets_path}")
+            return False
+
+        code = (
+            "import sys; from pathlib import Path; "
+            "from dot_work.asset_index import write_asset_index; "
+            "print(write_asset_index(Path(sys.argv[1])))"
+        )
+        success, output, error = self.run_command(
+            ["uv", "run", "python", "-c", code, str(assets_path)],
+            "Build asset index",
+        )
+        if success and output:
+            print(f"[OK] Wrote {output.strip()}")
+        self.print_result(success, "Asset Index", output, error)
+        return success
+
+    def build_compiled_templates(self) -> bool:
+        """Precompile the bundled prompt templates so installs skip Jinja compilation."""
+        self.print_step("Building Compiled Templates")
+
+        prompts_path = self.src_path / "assets" / "prompts"
+        if not prompts_path.exists():
+            print(f"[WARN] Prompts directory not found at {prompts_path}")
+            return False
+
+        code = (
+            "import sys; from pathlib import Path; "
+            "from dot_work.template_cache import write_compiled_templates; "
+            "print(write_compiled_templates(Path(sys.argv[1])))"
+        )
+        success, output, error = self.run_command(
+            ["uv", "run", "python", "-c", code, str(prompts_path)],
+            "Build compiled templates",
+        )
+        if success and output:
+            print(f"[OK] Wrote {output.strip()}")
+        self.print_result(success, "Compiled Templates", output, error)
+        return success
+
     def run_unit_tests(self) -> bool:
         """Run unit tests with coverage."""
         self.print_step("Unit Tests")
@@ -234,6 +280,23 @@ class BuildRunner:
 
         return success
 
+    def run_perf_checks(self) -> bool:
+        """Fail if startup or import times regressed against the stored baseline."""
+        self.print_step("Performance Checks")
+
+        suite = self.project_root / "benchmarks" / "perf_suite.py"
+        if not suite.exists():
+            print(f"[WARN] Performance suite not found at {suite}")
+            return False
+
+        success, output, error = self.run_command(
+            ["uv", "run", "python", str(suite)],
+            "Performance checks",
+        )
+        print(output)
+        self.print_result(success, "Performance Checks", error=error)
+        return success
+
     def step_security(self) -> bool:
         """Run security checks."""
         self.print_step("Security Checks")
@@ -309,7 +372,10 @@ class BuildRunner:
             ("Lint Code", self.lint_code),
             ("Type Check", self.type_check),
             ("Security Check", self.step_security),
+            ("Asset Index", self.build_asset_index),
+            ("Compiled Templates", self.build_compiled_templates),
             ("Unit Tests", self.run_unit_tests),
+            ("Performance Checks", self.run_perf_checks),
             ("Generate Reports", self.generate_reports),
         ]
 
@@ -356,6 +422,19 @@ def main():
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose output")
     parser.add_argument("--fix", action="store_true", help="Auto-fix formatting and linting issues")
     parser.add_argument("--clean", action="store_true", help="Clean build artifacts and exit")
+    parser.add_argument(
+        "--asset-index", action="store_true", help="Regenerate assets/index.json and exit"
+    )
+    parser.add_argument(
+        "--compiled-templates",
+        action="store_true",
+        help="Regenerate assets/compiled_templates/ and exit",
+    )
+    parser.add_argument(
+        "--perf",
+        action="store_true",
+        help="Check startup times against benchmarks/baselines/startup.json and exit",
+    )
     parser.add_argument(
         "--integration",
         choices=["all", "none"],
@@ -375,6 +454,15 @@ def main():
         builder.clean_artifacts()
         return 0
 
+    if args.asset_index:
+        return 0 if builder.build_asset_index() else 1
+
+    if args.compiled_templates:
+        return 0 if builder.build_compiled_templates() else 1
+
+    if args.perf:
+        return 0 if builder.run_perf_checks() else 1
+
     success = builder.run_full_build()
     return 0 if success else 1
 
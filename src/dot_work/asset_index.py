@@ -0,0 +1,255 @@
+"""Prebuilt index of the bundled assets.
+
+The build writes ``assets/index.json`` describing every bundled prompt, hook,
+skill and subagent: its size, SHA-256 hash and, per environment, the target
+directory and filename settings resolved from its frontmatter and global.yml.
+
+Discovery code (e.g. discover_available_environments) reads the index instead
+of YAML-parsing every asset on startup. An index is only trusted for a
+category when the hash of the global.yml its parser merges with, and the name,
+size and hash of every asset, still match the files on disk. Otherwise the caller falls back to parsing.
+User-supplied directories never have an index, so they are always parsed.
+
+Regenerate the index with ``python scripts/build.py --asset-index``; wheel
+builds do this automatically through the hatch build hook in hatch_build.py.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# File name of the index inside the assets/ directory
+INDEX_FILENAME = "index.json"
+
+# Bump when the index layout changes; older indexes are ignored
+INDEX_VERSION = 1
+
+
+def _sha256(path: Path) -> str:
+    """Hex SHA-256 of a file's contents."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _defaults_sha256(category_name: str) -> str:
+    """Hex SHA-256 of the global.yml the category's parser merges with ("" if absent).
+
+    Note the canonical parser always uses assets/prompts/global.yml, also for
+    hooks, so this is not necessarily the category's own global.yml.
+    """
+    if category_name == "skills":
+        from dot_work.skills import parser as skills_parser
+
+        defaults_path = skills_parser.GLOBAL_DEFAULTS_PATH
+    elif category_name == "subagents":
+        from dot_work.subagents import parser as subagents_parser
+
+        defaults_path = subagents_parser.GLOBAL_DEFAULTS_PATH
+    else:
+        from dot_work.prompts import canonical
+
+        defaults_path = canonical.GLOBAL_DEFAULTS_PATH
+
+    try:
+        return _sha256(defaults_path)
+    except FileNotFoundError:
+        return ""
+
+
+def _category_asset_files(category_name: str, category_dir: Path) -> list[Path]:
+    """List the asset files the installer would pick up for a category.
+
+    Args:
+        category_name: Category directory name (skills are directories of SKILL.md).
+        category_dir: Path to the category directory.
+
+    Returns:
+        Sorted list of asset files.
+    """
+    if category_name == "skills":
+        return sorted(d / "SKILL.md" for d in category_dir.iterdir() if (d / "SKILL.md").is_file())
+    return sorted(category_dir.glob("*.md"))
+
+
+def _asset_environments(category_name: str, asset_file: Path) -> dict[str, dict[str, Any]]:
+    """Parse one asset and return its per-environment install settings.
+
+    Args:
+        category_name: Category the asset belongs to (selects the parser).
+        asset_file: Path to the asset file.
+
+    Returns:
+        Mapping of environment name to target/filename/filename_suffix.
+
+    Raises:
+        Exception: Whatever the category's parser raises for an invalid file.
+    """
+    if category_name == "skills":
+        from dot_work.skills.parser import SKILL_PARSER
+
+        metadata = SKILL_PARSER.parse_metadata_only(asset_file.parent)
+        skill_envs = metadata.environments or {}
+        return {
+            name: {
+                "target": env.target,
+                "filename": env.filename,
+                "filename_suffix": env.filename_suffix,
+            }
+            for name, env in skill_envs.items()
+        }
+
+    if category_name == "subagents":
+        from dot_work.subagents.parser import SUBAGENT_PARSER
+
+        subagent = SUBAGENT_PARSER.parse(asset_file)
+        return {
+            name: {"target": env.target, "filename": None, "filename_suffix": None}
+            for name, env in subagent.environments.items()
+        }
+
+    from dot_work.prompts.canonical import CANONICAL_PARSER
+
+    prompt = CANONICAL_PARSER.parse(asset_file)
+    return {
+        name: {
+            "target": env.target,
+            "filename": env.filename,
+            "filename_suffix": env.filename_suffix,
+        }
+        for name, env in prompt.environments.items()
+    }
+
+
+def build_asset_index(assets_dir: Path) -> dict[str, Any]:
+    """Parse every bundled asset and build the index structure.
+
+    Assets that fail to parse are recorded with an ``error`` and no
+    environments, mirroring how discovery skips them.
+
+    Args:
+        assets_dir: Path to the assets/ directory.
+
+    Returns:
+        JSON-serializable index.
+    """
+    categories: dict[str, Any] = {}
+
+    for category_dir in sorted(p for p in assets_dir.iterdir() if p.is_dir()):
+        global_yml = category_dir / "global.yml"
+        if not global_yml.exists():
+            continue
+
+        assets: dict[str, Any] = {}
+        for asset_file in _category_asset_files(category_dir.name, category_dir):
+            entry: dict[str, Any] = {
+                "size": asset_file.stat().st_size,
+                "sha256": _sha256(asset_file),
+            }
+            try:
+                entry["environments"] = _asset_environments(category_dir.name, asset_file)
+            except Exception as e:  # noqa: BLE001 - recorded so discovery skips the asset
+                entry["environments"] = {}
+                entry["error"] = str(e)
+            assets[asset_file.relative_to(category_dir).as_posix()] = entry
+
+        categories[category_dir.name] = {
+            "defaults_sha256": _defaults_sha256(category_dir.name),
+            "assets": assets,
+        }
+
+    return {"version": INDEX_VERSION, "categories": categories}
+
+
+def write_asset_index(assets_dir: Path) -> Path:
+    """Build the index and write it to ``assets_dir/index.json``.
+
+    Args:
+        assets_dir: Path to the assets/ directory.
+
+    Returns:
+        Path of the written index.
+    """
+    index = build_asset_index(assets_dir)
+    index_path = assets_dir / INDEX_FILENAME
+    index_path.write_text(json.dumps(index, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return index_path
+
+
+def load_category_index(category_dir: Path) -> dict[str, Any] | None:
+    """Return the indexed assets of a category if the index is present and current.
+
+    Looks for ``index.json`` next to the category directory. The index is
+    rejected when its version differs, the category is missing, or the parser's
+    global.yml or any of the category's assets were added, removed or changed
+    since the index was built. No YAML is parsed.
+
+    Args:
+        category_dir: Path to a category directory (e.g. assets/prompts).
+
+    Returns:
+        Mapping of relative asset path to its index entry, or None to fall back
+        to parsing.
+    """
+    index_path = category_dir.parent / INDEX_FILENAME
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable asset index {index_path}: {e}")
+        return None
+
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return None
+
+    category = index.get("categories", {}).get(category_dir.name)
+    if not isinstance(category, dict):
+        return None
+
+    try:
+        if category.get("defaults_sha256") != _defaults_sha256(category_dir.name):
+            return None
+
+        assets: dict[str, Any] = category.get("assets", {})
+        files = _category_asset_files(category_dir.name, category_dir)
+        if sorted(assets) != [f.relative_to(category_dir).as_posix() for f in files]:
+            return None
+
+        for asset_file in files:
+            entry = assets[asset_file.relative_to(category_dir).as_posix()]
+            if entry.get("size") != asset_file.stat().st_size:
+                return None
+            if entry.get("sha256") != _sha256(asset_file):
+                return None
+    except OSError:
+        return None
+
+    return assets
+
+
+def indexed_environments(category_dir: Path) -> dict[str, set[str]] | None:
+    """Map environment names to asset names using the prebuilt index.
+
+    Args:
+        category_dir: Path to a category directory (e.g. assets/prompts).
+
+    Returns:
+        The same structure as discover_available_environments, or None when no
+        current index covers the directory.
+    """
+    assets = load_category_index(category_dir)
+    if assets is None:
+        return None
+
+    environments: dict[str, set[str]] = {}
+    for rel_path, entry in assets.items():
+        path = Path(rel_path)
+        asset_name = path.parent.name if category_dir.name == "skills" else path.stem
+        for env_name in entry.get("environments", {}):
+            environments.setdefault(env_name, set()).add(asset_name)
+    return environments
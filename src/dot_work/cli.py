@@ -2,34 +2,49 @@
 
 import json
 import logging
-import re
+import sys
+import time
+from collections.abc import Collection
+from functools import partial
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import TYPE_CHECKING, Annotated, Literal
 
 import typer
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 
 from dot_work.environments import ENVIRONMENTS
-from dot_work.installer import (
-    discover_available_environments,
-    get_bundled_assets_dir,
-    get_prompts_dir,
-    initialize_work_directory,
-    install_all_assets_by_environment,
-    install_prompts,
-)
 from dot_work.plugins import discover_plugins, register_all_plugins
-from dot_work.profile.cli import profile_app
-from dot_work.skills.cli import app as skills_app
-from dot_work.subagents.cli import app as subagents_app
+from dot_work.utils.lazy_typer import LazySubcommand, lazy_group
 from dot_work.utils.sanitization import sanitize_error_message
-from dot_work.zip.cli import app as zip_app
+from dot_work.work_status import find_issue, read_work_status
+
+# The installer and its helpers are imported by the commands that use them, so
+# `dot-work --help`, `status` and friends start without loading them
+if TYPE_CHECKING:
+    from dot_work.install_manifest import InstallManifest
+    from dot_work.installer import CopyMode, ParsedAssets
+    from dot_work.utils.profiling import InstallProfile
 
 logger = logging.getLogger(__name__)
 
+# Subcommand groups retained in core, imported only when invoked. The help text
+# must match each group's own Typer help (checked by the unit tests).
+LAZY_SUBCOMMANDS = {
+    "zip": LazySubcommand("dot_work.zip.cli:app", "Zip folders respecting .gitignore."),
+    "skills": LazySubcommand("dot_work.skills.cli:skills_app", "Agent Skills management commands."),
+    "subagents": LazySubcommand(
+        "dot_work.subagents.cli:subagents_app", "Subagents management commands."
+    ),
+    "profile": LazySubcommand(
+        "dot_work.profile.cli:profile_app", "Manage user profile information."
+    ),
+}
+
 app = typer.Typer(
+    cls=lazy_group(LAZY_SUBCOMMANDS),
     name="dot-work",
     help="Install AI coding prompts for your development environment.",
     no_args_is_help=True,
@@ -47,14 +62,398 @@ canonical_app = typer.Typer(help="Validate and install canonical prompt files.")
 # Create subcommand group for prompt management
 prompt_app = typer.Typer(help="Create and manage canonical prompt files.")
 
+# Create subcommand group for issue lookup
+issue_app = typer.Typer(help="Look up issues in .work/agent/issues/.")
+
+
+# --env value that installs for every environment detected in the target
+ALL_DETECTED = "all-detected"
+
+
+def detect_environments(target: Path) -> list[str]:
+    """Detect every AI environment configured in the target project.
+
+    Returns:
+        Keys of all environments with at least one detection marker present,
+        in ENVIRONMENTS order.
+    """
+    from dot_work.utils.fingerprint import project_fingerprint
+
+    fingerprint = project_fingerprint(target)
+    return list(
+        fingerprint.detect(
+            "environments",
+            lambda: [
+                key
+                for key, env in ENVIRONMENTS.items()
+                if any(fingerprint.exists(marker) for marker in env.detection)
+            ],
+        )
+    )
+
 
 def detect_environment(target: Path) -> str | None:
     """Try to detect which AI environment is configured in the target project."""
-    for key, env in ENVIRONMENTS.items():
-        for marker in env.detection:
-            if (target / marker).exists():
-                return key
-    return None
+    detected = detect_environments(target)
+    return detected[0] if detected else None
+
+
+def _install_environment(
+    env_key: str,
+    target: Path,
+    prompts_dir: Path,
+    console: Console,
+    *,
+    force: bool,
+    dry_run: bool,
+    manifest: "InstallManifest",
+    parsed: "ParsedAssets",
+    copy_mode: "CopyMode",
+    categories: Collection[str] | None = None,
+) -> None:
+    """Install prompts and all other asset categories for one environment.
+
+    Only the given asset categories are installed if categories is set.
+
+    Raises:
+        typer.Exit: If installation fails.
+    """
+    from dot_work.installer import (
+        get_bundled_assets_dir,
+        install_all_assets_by_environment,
+        install_prompts,
+    )
+
+    env_config = ENVIRONMENTS[env_key]
+    if dry_run:
+        console.print(
+            f"\n[bold yellow]🔍 Dry run: Previewing installation for {env_config.name}...[/bold yellow]\n"
+        )
+    else:
+        console.print(f"\n[bold blue]📦 Installing prompts for {env_config.name}...[/bold blue]\n")
+
+    try:
+        # Install prompts (keep for backward compatibility)
+        if categories is None or "prompts" in categories:
+            install_prompts(
+                env_key,
+                target,
+                prompts_dir,
+                console,
+                force=force,
+                dry_run=dry_run,
+                manifest=manifest,
+                parsed=parsed,
+                copy_mode=copy_mode,
+            )
+
+        # Install all other asset categories (skills, subagents, hooks, etc.)
+        try:
+            assets_dir = get_bundled_assets_dir()
+            install_all_assets_by_environment(
+                env_key,
+                target,
+                assets_dir,
+                console,
+                force=force,
+                dry_run=dry_run,
+                manifest=manifest,
+                parsed=parsed,
+                copy_mode=copy_mode,
+                categories=categories,
+            )
+        except FileNotFoundError:
+            # No assets directory - not an error, prompts were installed
+            pass
+
+    except ValueError as e:
+        console.print(f"\n[red]❌ Installation failed:[/red] {e}")
+        raise typer.Exit(1) from None
+    except Exception as e:
+        # Log full error for debugging
+        logger.error(f"Installation error: {e}", exc_info=True)
+        console.print("\n[red]❌ Unexpected error during installation:[/red]")
+        console.print(f"[dim]{sanitize_error_message(e)}[/dim]")
+        console.print("\n[dim]💡 Try running with --dry-run to preview changes[/dim]")
+        console.print("[dim]💡 Report this issue if it persists[/dim]")
+        raise typer.Exit(1) from None
+
+
+def _install_target(
+    target: Path,
+    env_keys: list[str],
+    prompts_dir: Path,
+    console: Console,
+    *,
+    force: bool,
+    dry_run: bool,
+    parsed: "ParsedAssets",
+    copy_mode: "CopyMode",
+    categories: Collection[str] | None = None,
+) -> dict[str, int]:
+    """Install every environment into one target project.
+
+    One manifest is used for the whole target, so unchanged files are skipped
+    across categories. A failing environment does not stop the others. Only
+    the given asset categories are installed if categories is set.
+
+    Returns:
+        Exit code per environment (0 on success).
+    """
+    from dot_work.install_manifest import InstallManifest
+
+    manifest = InstallManifest.load(target)
+    codes: dict[str, int] = {}
+    for env_key in env_keys:
+        try:
+            _install_environment(
+                env_key,
+                target,
+                prompts_dir,
+                console,
+                force=force,
+                dry_run=dry_run,
+                manifest=manifest,
+                parsed=parsed,
+                copy_mode=copy_mode,
+                categories=categories,
+            )
+            codes[env_key] = 0
+        except typer.Exit as e:
+            codes[env_key] = e.exit_code
+    return codes
+
+
+def _changed_categories(changed: set[Path], assets_dir: Path) -> set[str] | None:
+    """Map changed files under assets/ to the asset categories they belong to.
+
+    Returns:
+        Category names, or None if every category is affected (a global.yml
+        changed, which the canonical parser also uses for hooks, or the
+        watcher lost events).
+    """
+    from dot_work.template_cache import COMPILED_DIRNAME
+
+    categories: set[str] = set()
+    for path in changed:
+        if path == assets_dir or path.name == "global.yml":
+            return None
+        try:
+            parts = path.relative_to(assets_dir).parts
+        except ValueError:
+            continue
+        # Top-level files (index.json) and build output are not asset sources
+        if len(parts) > 1 and parts[0] != COMPILED_DIRNAME:
+            categories.add(parts[0])
+    return categories
+
+
+def _watch_install(
+    target: Path,
+    env_keys: list[str],
+    prompts_dir: Path,
+    *,
+    force: bool,
+    dry_run: bool,
+    parsed: "ParsedAssets",
+    copy_mode: "CopyMode",
+) -> None:
+    """Re-install the asset categories whose sources change, until interrupted.
+
+    Parses of unchanged sources are reused from parsed and unchanged outputs
+    are skipped through the install manifest, so each save only rewrites the
+    assets that changed. Files dot-work wrote are updated without prompting.
+    """
+    from dot_work.installer import get_bundled_assets_dir
+    from dot_work.utils.watch import watch_changes
+
+    try:
+        assets_dir = get_bundled_assets_dir()
+    except FileNotFoundError:
+        assets_dir = prompts_dir
+
+    console.print(f"\n[bold cyan]👀 Watching {assets_dir} for changes (Ctrl-C to stop)[/bold cyan]")
+    try:
+        for changed in watch_changes(assets_dir):
+            categories = _changed_categories(changed, assets_dir)
+            if categories is not None and not categories:
+                continue
+            parsed.invalidate(None if categories is None else changed)
+
+            names = ", ".join(sorted(path.name for path in changed))
+            scope = "all assets" if categories is None else ", ".join(sorted(categories))
+            console.print(
+                f"\n[bold cyan]🔄 {time.strftime('%H:%M:%S')} Changed: {names} ({scope})[/bold cyan]"
+            )
+            codes = _install_target(
+                target,
+                env_keys,
+                prompts_dir,
+                console,
+                force=force,
+                dry_run=dry_run,
+                parsed=parsed,
+                copy_mode=copy_mode,
+                categories=categories,
+            )
+            if any(codes.values()):
+                console.print("[yellow]⚠ Re-install failed; waiting for the next change[/yellow]")
+    except KeyboardInterrupt:
+        console.print("\n[dim]Stopped watching[/dim]")
+
+
+def _parse_env_keys(env: str) -> list[str]:
+    """Split a comma-separated --env value into unique environment keys.
+
+    Raises:
+        typer.BadParameter: If the value names no environment (e.g. "," or " ").
+    """
+    env_keys = list(dict.fromkeys(key.strip() for key in env.split(",") if key.strip()))
+    if not env_keys:
+        raise typer.BadParameter(f"no environment given in {env!r}", param_hint="'--env'")
+    return env_keys
+
+
+def _check_env_keys(env_keys: list[str], discovered_envs: dict[str, set[str]]) -> None:
+    """Validate environment keys, asking before falling back to legacy installs.
+
+    Raises:
+        typer.Exit: If an environment is unknown (1) or the user declines (0).
+    """
+    for env_key in env_keys:
+        if env_key not in ENVIRONMENTS:
+            console.print(f"[red]❌ Unknown environment:[/red] {env_key}")
+            console.print(f"Available in ENVIRONMENTS: {', '.join(ENVIRONMENTS.keys())}")
+            raise typer.Exit(1)
+
+    # Check if environments are supported by any prompts
+    for env_key in env_keys:
+        if env_key not in discovered_envs:
+            console.print(
+                f"[yellow]⚠ Environment '{env_key}' not found in any prompt frontmatter.[/yellow]"
+            )
+            console.print(
+                f"[dim]Available environments: {', '.join(sorted(discovered_envs.keys()))}[/dim]"
+            )
+            if not typer.confirm("Continue with legacy installation?", default=False):
+                raise typer.Exit(0)
+
+
+def _read_targets_file(path: Path) -> list[Path]:
+    """Read target directories from a file, one per line ('-' reads stdin).
+
+    Blank lines and lines starting with '#' are ignored.
+
+    Raises:
+        typer.Exit: If the file cannot be read.
+    """
+    try:
+        text = sys.stdin.read() if str(path) == "-" else path.read_text(encoding="utf-8")
+    except OSError as e:
+        console.print(f"[red]❌ Cannot read targets file:[/red] {path}")
+        console.print(f"[dim]Error: {e}[/dim]")
+        raise typer.Exit(1) from None
+    lines = (line.strip() for line in text.splitlines())
+    return [Path(line).expanduser() for line in lines if line and not line.startswith("#")]
+
+
+def _install_fleet(
+    targets: list[Path],
+    env: str | None,
+    *,
+    force: bool,
+    dry_run: bool,
+    copy_mode: "CopyMode",
+) -> None:
+    """Install into several target projects, parsing the bundled assets once.
+
+    Targets are installed concurrently on the I/O thread pool; each target's
+    output is printed as one block, in the order the targets were given. A
+    summary table shows the exit code per target and environment.
+
+    Raises:
+        typer.Exit: 1 if any target failed, otherwise 0 is implied.
+    """
+    from dot_work.installer import ParsedAssets, discover_available_environments, get_prompts_dir
+    from dot_work.utils.io_pool import run_ordered
+
+    if not env:
+        console.print("[red]❌ --env is required when installing into several targets[/red]")
+        console.print(f"[dim]💡 Fix: Pass e.g. --env claude,copilot or --env {ALL_DETECTED}[/dim]")
+        raise typer.Exit(1)
+
+    try:
+        prompts_dir = get_prompts_dir()
+    except FileNotFoundError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        console.print("[dim]💡 Fix: Reinstall dot-work to ensure prompt files are available[/dim]")
+        raise typer.Exit(1) from None
+
+    explicit_envs: list[str] | None = None
+    if env != ALL_DETECTED:
+        explicit_envs = _parse_env_keys(env)
+        _check_env_keys(explicit_envs, discover_available_environments(prompts_dir))
+
+    parsed = ParsedAssets()
+
+    def install_one(target: Path, console: Console) -> dict[str, int]:
+        console.print(f"\n[bold magenta]🎯 {escape(str(target))}[/bold magenta]")
+        if not target.is_dir():
+            console.print(f"[red]❌ Target directory does not exist:[/red] {target}")
+            return {}
+        env_keys = explicit_envs if explicit_envs is not None else detect_environments(target)
+        if not env_keys:
+            console.print(f"[red]❌ No AI environment detected in:[/red] {target}")
+            return {}
+        return _install_target(
+            target,
+            env_keys,
+            prompts_dir,
+            console,
+            force=force,
+            dry_run=dry_run,
+            parsed=parsed,
+            copy_mode=copy_mode,
+        )
+
+    console.print(f"[bold blue]📦 Installing into {len(targets)} target(s)...[/bold blue]")
+    start = time.perf_counter()
+    results: list[dict[str, int]] = run_ordered(
+        console, [partial(install_one, target) for target in targets]
+    )
+    elapsed = time.perf_counter() - start
+
+    # Exit-code matrix: one row per target, one column per environment
+    env_columns = list(dict.fromkeys(key for codes in results for key in codes))
+    table = Table(title="Fleet install summary")
+    table.add_column("Target", style="cyan")
+    for env_key in env_columns:
+        table.add_column(env_key, justify="center")
+    table.add_column("Exit", justify="right")
+
+    failed = 0
+    for target, codes in zip(targets, results, strict=True):
+        exit_code = 1 if not codes else max(codes.values())
+        failed += exit_code != 0
+        cells = [
+            "-" if key not in codes else ("[green]0[/green]" if codes[key] == 0 else "[red]1[/red]")
+            for key in env_columns
+        ]
+        style = "green" if exit_code == 0 else "red"
+        table.add_row(escape(str(target)), *cells, f"[{style}]{exit_code}[/{style}]")
+    console.print()
+    console.print(table)
+    console.print(
+        f"{len(targets)} target(s): {len(targets) - failed} succeeded, {failed} failed "
+        f"in {elapsed:.2f}s"
+    )
+
+    if failed:
+        raise typer.Exit(1)
+    if dry_run:
+        console.print("\n[bold yellow]⚠️  Dry run complete - no files were written[/bold yellow]")
+    else:
+        console.print("\n[bold green]✅ Installation complete![/bold green]")
 
 
 @app.command("install")
@@ -64,17 +463,31 @@ def install(
         typer.Option(
             "--env",
             "-e",
-            help="AI environment to install for (copilot, claude, cursor, opencode, etc.)",
+            help=(
+                "AI environment(s) to install for (copilot, claude, cursor, opencode, etc.). "
+                f"Comma-separate several, or use '{ALL_DETECTED}' for every environment "
+                "detected in the target"
+            ),
         ),
     ] = None,
     target: Annotated[
-        Path,
+        list[Path] | None,
         typer.Option(
             "--target",
             "-t",
-            help="Target project directory (default: current directory)",
+            help="Target project directory; repeat for several (default: current directory)",
         ),
-    ] = Path("."),
+    ] = None,
+    targets_from: Annotated[
+        Path | None,
+        typer.Option(
+            "--targets-from",
+            help=(
+                "File listing target project directories, one per line "
+                "('-' for stdin; blank lines and # comments are ignored)"
+            ),
+        ),
+    ] = None,
     force: Annotated[
         bool,
         typer.Option(
@@ -91,17 +504,137 @@ def install(
             help="Preview changes without writing files",
         ),
     ] = False,
+    watch: Annotated[
+        bool,
+        typer.Option(
+            "--watch",
+            help=(
+                "After installing, keep watching the bundled assets and re-install the ones "
+                "that change (single target only)"
+            ),
+        ),
+    ] = False,
+    link: Annotated[
+        bool,
+        typer.Option(
+            "--link",
+            help=(
+                "Link files to a shared read-only store instead of copying them, so projects "
+                "on this machine share one copy of each asset (hard link, else symlink)"
+            ),
+        ),
+    ] = False,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="Report wall time and counters of each install phase, per asset category",
+        ),
+    ] = False,
+    profile_json: Annotated[
+        Path | None,
+        typer.Option(
+            "--profile-json",
+            help=(
+                "Write the install profile as JSON to this file ('-' for stdout, "
+                "with the install output on stderr)"
+            ),
+        ),
+    ] = None,
 ) -> None:
     """Install AI prompts, skills, and subagents to your project directory.
 
     Supported content types vary by environment:
     - Claude Code: prompts, skills, and subagents
     - Other environments: prompts and subagents (skills not supported)
+
+    With several environments or targets, each asset is parsed once and then
+    written for every environment and target.
+
+    Files are copied with the fastest method the filesystem offers (reflink,
+    then in-kernel copy). With --link they are hard-linked (or symlinked) to a
+    content-addressed store in $DOT_WORK_STORE_DIR (default
+    ~/.local/share/dot-work/store) instead.
+
+    With --watch the command keeps running after the install and re-installs
+    the assets whose sources (or global.yml) change, for quick iteration on
+    prompts, skills, subagents and hooks.
+
+    With --profile (or --profile-json) the install reports how long discovery,
+    parsing, the global-defaults merge, rendering, the conflict scan and
+    writing took for each asset category, with bytes written and files skipped.
     """
-    target = target.resolve()
+    if not (profile or profile_json):
+        _run_install(env, target, targets_from, force, dry_run, watch, link)
+        return
+    if watch:
+        console.print("[red]❌ --profile cannot be combined with --watch[/red]")
+        raise typer.Exit(1)
 
-    if not target.exists():
-        console.print(f"[red]❌ Target directory does not exist:[/red] {target}")
+    from dot_work.utils.profiling import profiling
+
+    # With the JSON on stdout, the install output goes to stderr so stdout parses
+    console.stderr = profile_json is not None and str(profile_json) == "-"
+    try:
+        with profiling() as report:
+            _run_install(env, target, targets_from, force, dry_run, watch, link)
+    finally:
+        if profile:
+            report.print_table(console)
+        if profile_json is not None:
+            _write_profile_json(report, profile_json)
+        console.stderr = False
+
+
+def _write_profile_json(report: "InstallProfile", path: Path) -> None:
+    """Write an install profile as JSON to path, or to stdout for '-'."""
+    text = json.dumps(report.to_dict(), indent=2)
+    if str(path) == "-":
+        sys.stdout.write(text + "\n")
+        return
+    try:
+        path.write_text(text + "\n", encoding="utf-8")
+    except OSError as e:
+        console.print(f"[red]❌ Cannot write profile to {path}:[/red] {e}")
+        raise typer.Exit(1) from None
+    console.print(f"[dim]Install profile written to {path}[/dim]")
+
+
+def _run_install(
+    env: str | None,
+    target: list[Path] | None,
+    targets_from: Path | None,
+    force: bool,
+    dry_run: bool,
+    watch: bool,
+    link: bool,
+) -> None:
+    """Body of the install command (see install for the options)."""
+    from dot_work.installer import (
+        CopyMode,
+        ParsedAssets,
+        discover_available_environments,
+        get_prompts_dir,
+    )
+
+    copy_mode = CopyMode.LINK if link else CopyMode.COPY
+    targets = list(target or [])
+    if targets_from is not None:
+        targets += _read_targets_file(targets_from)
+    if not targets:
+        targets = [Path(".")]
+    targets = list(dict.fromkeys(path.resolve() for path in targets))
+
+    if len(targets) > 1:
+        if watch:
+            console.print("[red]❌ --watch supports a single target[/red]")
+            raise typer.Exit(1)
+        _install_fleet(targets, env, force=force, dry_run=dry_run, copy_mode=copy_mode)
+        return
+
+    single_target = targets[0]
+    if not single_target.exists():
+        console.print(f"[red]❌ Target directory does not exist:[/red] {single_target}")
         raise typer.Exit(1)
 
     # Get prompts directory
@@ -115,71 +648,60 @@ def install(
     # Discover available environments from prompt frontmatter
     discovered_envs = discover_available_environments(prompts_dir)
 
-    # Determine environment
-    env_key = env
-    if not env_key:
+    # Determine environment(s)
+    env_keys: list[str] = []
+    if env == ALL_DETECTED:
+        env_keys = detect_environments(single_target)
+        if not env_keys:
+            console.print(f"[red]❌ No AI environment detected in:[/red] {single_target}")
+            console.print(
+                "[dim]💡 Fix: Pass environments explicitly, e.g. --env claude,copilot[/dim]"
+            )
+            raise typer.Exit(1)
+        names = ", ".join(ENVIRONMENTS[key].name for key in env_keys)
+        console.print(f"[cyan]🔍 Detected environments:[/cyan] {names}")
+    elif env:
+        env_keys = _parse_env_keys(env)
+    else:
         # Try to detect
-        detected = detect_environment(target)
+        detected = detect_environment(single_target)
         if detected and detected in discovered_envs:
             console.print(f"[cyan]🔍 Detected environment:[/cyan] {ENVIRONMENTS[detected].name}")
             if typer.confirm("Use this environment?", default=True):
-                env_key = detected
+                env_keys = [detected]
 
         # Fall back to interactive selection with discovered environments
-        if not env_key:
-            env_key = prompt_for_environment(discovered_envs)
-
-    # Validate environment
-    if env_key not in ENVIRONMENTS:
-        console.print(f"[red]❌ Unknown environment:[/red] {env_key}")
-        console.print(f"Available in ENVIRONMENTS: {', '.join(ENVIRONMENTS.keys())}")
-        raise typer.Exit(1)
-
-    # Check if environment is supported by any prompts
-    if env_key not in discovered_envs:
-        console.print(
-            f"[yellow]⚠ Environment '{env_key}' not found in any prompt frontmatter.[/yellow]"
+        if not env_keys:
+            env_keys = [prompt_for_environment(discovered_envs)]
+
+    _check_env_keys(env_keys, discovered_envs)
+
+    # Sources are parsed once and shared by every environment
+    parsed = ParsedAssets()
+    codes = _install_target(
+        single_target,
+        env_keys,
+        prompts_dir,
+        console,
+        force=force,
+        dry_run=dry_run,
+        parsed=parsed,
+        copy_mode=copy_mode,
+    )
+    if watch:
+        # Keep going after a failed install: the next save may fix it
+        _watch_install(
+            single_target,
+            env_keys,
+            prompts_dir,
+            force=force,
+            dry_run=dry_run,
+            parsed=parsed,
+            copy_mode=copy_mode,
         )
-        console.print(
-            f"[dim]Available environments: {', '.join(sorted(discovered_envs.keys()))}[/dim]"
-        )
-        if not typer.confirm("Continue with legacy installation?", default=False):
-            raise typer.Exit(0)
-
-    # Install
-    env_config = ENVIRONMENTS[env_key]
-    if dry_run:
-        console.print(
-            f"\n[bold yellow]🔍 Dry run: Previewing installation for {env_config.name}...[/bold yellow]\n"
-        )
-    else:
-        console.print(f"\n[bold blue]📦 Installing prompts for {env_config.name}...[/bold blue]\n")
-
-    try:
-        # Install prompts (keep for backward compatibility)
-        install_prompts(env_key, target, prompts_dir, console, force=force, dry_run=dry_run)
-
-        # Install all other asset categories (skills, subagents, hooks, etc.)
-        try:
-            assets_dir = get_bundled_assets_dir()
-            install_all_assets_by_environment(
-                env_key, target, assets_dir, console, force=force, dry_run=dry_run
-            )
-        except FileNotFoundError:
-            # No assets directory - not an error, prompts were installed
-            pass
-
-    except ValueError as e:
-        console.print(f"\n[red]❌ Installation failed:[/red] {e}")
-        raise typer.Exit(1) from None
-    except Exception as e:
-        # Log full error for debugging
-        logger.error(f"Installation error: {e}", exc_info=True)
-        console.print("\n[red]❌ Unexpected error during installation:[/red]")
-        console.print(f"[dim]{sanitize_error_message(e)}[/dim]")
-        console.print("\n[dim]💡 Try running with --dry-run to preview changes[/dim]")
-        console.print("[dim]💡 Report this issue if it persists[/dim]")
-        raise typer.Exit(1) from None
+        return
+    if any(codes.values()):
+        raise typer.Exit(1)
 
     if dry_run:
         console.print("\n[bold yellow]⚠️  Dry run complete - no files were written[/bold yellow]")
@@ -261,7 +783,7 @@ def init_project(
     For more control over installation, use the 'install' command directly.
     """
     # This is an alias for install that's more intuitive for new users
-    install(env=env, target=target, force=False)
+    install(env=env, target=[target], force=False)
 
 
 @app.command("init-tracking")
@@ -296,6 +818,8 @@ def init_tracking(
         console.print(f"[red]❌ Target directory does not exist:[/red] {target}")
         raise typer.Exit(1)
 
+    from dot_work.installer import initialize_work_directory
+
     console.print("\n[bold blue]📋 Initializing work directory...[/bold blue]\n")
 
     initialize_work_directory(target, console, force=force)
@@ -314,59 +838,30 @@ def status(
             help="Output format (table, markdown, json, simple)",
         ),
     ] = "table",
+    issue: Annotated[
+        str | None,
+        typer.Option(
+            "--issue",
+            "-i",
+            help="Show this issue instead (same as 'dot-work issue show')",
+        ),
+    ] = None,
 ) -> None:
     """Show project status including focus and issue counts.
 
     Displays the current focus (Previous/Current/Next from .work/agent/focus.md)
     and counts issues by priority level.
     """
-    # Get work directory
-    work_dir = Path(".work")
-    issues_dir = work_dir / "agent" / "issues"
-    focus_file = work_dir / "agent" / "focus.md"
-
-    # Check if work directory exists
-    if not work_dir.exists():
-        console.print("[yellow]⚠ No .work/ directory found[/yellow]")
-        console.print("[dim]Run 'dot-work init-tracking' to initialize issue tracking[/dim]")
-        raise typer.Exit(1)
+    work_dir = _require_work_dir()
 
-    # Parse focus.md
-    focus_data: dict[str, str] = {"previous": "N/A", "current": "N/A", "next": "N/A"}
-    if focus_file.exists():
-        content = focus_file.read_text(encoding="utf-8")
-        # Extract sections using simple regex patterns
-        current_section = None
-        for line in content.splitlines():
-            line = line.strip()
-            if line.startswith("## Previous"):
-                current_section = "previous"
-            elif line.startswith("## Current"):
-                current_section = "current"
-            elif line.startswith("## Next"):
-                current_section = "next"
-            elif line.startswith("- Issue:") and current_section:
-                issue_id = re.search(r"[\w-]+@[\w-]+", line)
-                if issue_id:
-                    focus_data[current_section] = issue_id.group(0)
-
-    # Count issues in each priority file
-    issue_counts: dict[str, int] = {}
-    priority_files = {
-        "shortlist": issues_dir / "shortlist.md",
-        "critical": issues_dir / "critical.md",
-        "high": issues_dir / "high.md",
-        "medium": issues_dir / "medium.md",
-        "low": issues_dir / "low.md",
-        "backlog": issues_dir / "backlog.md",
-    }
+    if issue is not None:
+        _show_issue(work_dir, issue, as_json=format == "json")
+        return
 
-    for priority, file_path in priority_files.items():
-        if file_path.exists():
-            count = len(re.findall(r'^id: "', file_path.read_text(encoding="utf-8"), re.MULTILINE))
-            issue_counts[priority] = count
-        else:
-            issue_counts[priority] = 0
+    # Focus from focus.md and issue counts per priority file (cached by mtime/size)
+    work_status = read_work_status(work_dir)
+    focus_data = work_status.focus
+    issue_counts = work_status.issue_counts
 
     # Output based on format
     if format == "table":
@@ -379,6 +874,16 @@ def status(
         _status_simple(console, focus_data, issue_counts)
 
 
+def _require_work_dir() -> Path:
+    """Return the .work/ directory, or exit if the project does not track issues."""
+    work_dir = Path(".work")
+    if not work_dir.exists():
+        console.print("[yellow]⚠ No .work/ directory found[/yellow]")
+        console.print("[dim]Run 'dot-work init-tracking' to initialize issue tracking[/dim]")
+        raise typer.Exit(1)
+    return work_dir
+
+
 def _status_table(
     console: Console, focus_data: dict[str, str], issue_counts: dict[str, int]
 ) -> None:
@@ -517,6 +1022,60 @@ def _status_simple(
     console.print(f"  Total: {total}")
 
 
+def _show_issue(work_dir: Path, issue_id: str, *, as_json: bool) -> None:
+    """Print one issue, read through the issue index."""
+    issue = find_issue(work_dir, issue_id)
+    if issue is None:
+        console.print(f"[red]❌ Issue not found:[/red] {escape(issue_id)}")
+        raise typer.Exit(1)
+
+    file = work_dir / "agent" / "issues" / issue.path.name
+    text = issue.read()
+    if as_json:
+        output = {
+            "id": issue.id,
+            "priority": issue.priority,
+            "file": str(file),
+            "offset": issue.offset,
+            "length": issue.length,
+            "status": issue.status,
+            "focus": issue.focus,
+            "text": text,
+        }
+        console.print(json.dumps(output, indent=2), markup=False, highlight=False, soft_wrap=True)
+        return
+
+    focus = f" · focus: {', '.join(issue.focus)}" if issue.focus else ""
+    console.print(
+        f"[bold]{escape(issue.id)}[/bold] [dim]{escape(str(file))}"
+        f" · status: {escape(issue.status or 'unknown')}{focus}[/dim]"
+    )
+    console.print(text.rstrip("\n"), markup=False, highlight=False, soft_wrap=True)
+
+
+@issue_app.command("show")
+def issue_show(
+    issue_id: Annotated[
+        str,
+        typer.Argument(help="Issue ID (e.g. BUG-003@a9f3c2, or just BUG-003)"),
+    ],
+    format: Annotated[
+        Literal["text", "json"],
+        typer.Option(
+            "--format",
+            "-f",
+            help="Output format (text, json)",
+        ),
+    ] = "text",
+) -> None:
+    """Show one issue, reading only its block of the priority file.
+
+    Issues are located through an index of .work/agent/issues/*.md that is
+    cached between runs and refreshed only for files that changed.
+    """
+    _show_issue(_require_work_dir(), issue_id, as_json=format == "json")
+
+
 @app.command("plugins")
 def plugins_cmd() -> None:
     """List installed dot-work plugins."""
@@ -543,9 +1102,8 @@ def plugins_cmd() -> None:
     table.add_column("Module", style="dim")
 
     for plugin in plugins_list:
-        command = plugin.cli_group if plugin.cli_group else plugin.name
         version = plugin.version if plugin.version else "-"
-        table.add_row(plugin.name, command, version, plugin.module)
+        table.add_row(plugin.name, plugin.command_name, version, plugin.module)
 
     console.print(table)
     console.print(f"\n[green]✓ {len(plugins_list)} plugin(s) installed[/green]")
@@ -831,25 +1389,73 @@ app.add_typer(validate_app, name="validate")
 
 @canonical_app.command("validate")
 def canonical_validate(
-    prompt_file: Annotated[
-        Path,
-        typer.Argument(help="Path to canonical prompt file to validate"),
+    prompt_files: Annotated[
+        list[str],
+        typer.Argument(
+            help="Canonical prompt files, directories (searched for *.md) or glob patterns"
+        ),
     ],
     strict: Annotated[
         bool,
         typer.Option("--strict", "-s", help="Use strict validation mode"),
     ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option("--jobs", "-j", min=1, help="Worker processes (default: CPU count)"),
+    ] = None,
+    format: Annotated[
+        Literal["text", "json"],
+        typer.Option("--format", "-f", help="Report format (text, json)"),
+    ] = "text",
 ) -> None:
-    """Validate a canonical prompt file."""
-    from dot_work.installer import validate_canonical_prompt_file
+    """Validate canonical prompt files, in parallel when given several."""
+    import os
+    import time
 
-    try:
-        validate_canonical_prompt_file(prompt_file, strict=strict)
-        console.print(f"[green]✅[/green] {prompt_file} is a valid canonical prompt")
-    except Exception as e:
-        logger.error(f"Validation error for {prompt_file}: {e}", exc_info=True)
-        console.print(f"[red]❌[/red] Validation failed: {sanitize_error_message(e)}")
-        raise typer.Exit(1) from e
+    from dot_work.prompts.canonical import CANONICAL_VALIDATOR, find_canonical_prompt_files
+
+    paths = find_canonical_prompt_files(prompt_files)
+    if not paths:
+        console.print("[red]❌[/red] No canonical prompt files matched")
+        raise typer.Exit(1)
+
+    workers = min(jobs or os.cpu_count() or 1, len(paths))
+    start = time.perf_counter()
+    results = CANONICAL_VALIDATOR.validate_many(paths, strict=strict, jobs=workers)
+    elapsed = time.perf_counter() - start
+    failed = [result for result in results if not result.valid]
+
+    if format == "json":
+        report = {
+            "files": [result.to_dict() for result in results],
+            "summary": {
+                "total": len(results),
+                "valid": len(results) - len(failed),
+                "invalid": len(failed),
+                "strict": strict,
+                "jobs": workers,
+                "duration_ms": round(elapsed * 1000, 3),
+            },
+        }
+        console.print(json.dumps(report, indent=2), markup=False, highlight=False, soft_wrap=True)
+    else:
+        for result in results:
+            timing = f"[dim]({result.duration * 1000:.1f} ms)[/dim]"
+            mark = "[green]✅[/green]" if result.valid else "[red]❌[/red]"
+            console.print(f"{mark} {escape(str(result.path))} {timing}")
+            for error in result.errors:
+                color = "red" if error.severity == "error" else "yellow"
+                console.print(f"  [{color}]•[/{color}] {escape(error.message)}")
+
+        summary = (
+            f"{len(results)} file(s): {len(results) - len(failed)} valid, "
+            f"{len(failed)} invalid in {elapsed:.2f}s ({workers} job(s))"
+        )
+        color = "red" if failed else "green"
+        console.print(f"\n[bold {color}]{summary}[/bold {color}]")
+
+    if failed:
+        raise typer.Exit(1)
 
 
 @canonical_app.command("install")
@@ -1029,21 +1635,15 @@ app.add_typer(canonical_app, name="canonical")
 app.add_typer(prompt_app, name="prompt")
 app.add_typer(prompt_app, name="prompts")
 
-# Review subcommand group is registered via dot-review plugin
-
-# Register the zip subcommand group (retained in core)
-app.add_typer(zip_app, name="zip")
+# Register the issue lookup subcommand group
+app.add_typer(issue_app, name="issue")
 
-# Register the skills subcommand group (retained in core)
-app.add_typer(skills_app, name="skills")
-
-# Register the subagents subcommand group (retained in core)
-app.add_typer(subagents_app, name="subagents")
+# Review subcommand group is registered via dot-review plugin
 
-# Register the profile subcommand group (retained in core)
-app.add_typer(profile_app, name="profile")
+# The zip, skills, subagents and profile subcommand groups (retained in core)
+# are registered lazily through LAZY_SUBCOMMANDS
 
-# Discover and register all plugins
+# Discover and register all plugins (from cached metadata; imported on first use)
 # This registers submodules that have been extracted as plugins:
 # - container (dot-container)
 # - git (dot-git)
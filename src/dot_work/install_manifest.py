@@ -0,0 +1,256 @@
+"""Manifest of the files ``dot-work install`` wrote into a project.
+
+``install`` records every file it writes in ``.work/.dot-work-manifest.json``
+inside the target project. For each destination (relative to the target) the
+manifest stores the source it came from, the SHA-256 of that source, the
+SHA-256 of the bytes written, and the destination's size and mtime right
+after the write.
+
+On the next install each destination is classified with
+:meth:`InstallManifest.status`:
+
+- ``MISSING``: not on disk; written as a new file.
+- ``CURRENT``: already holds exactly what would be written. Skipped without
+  writing; when its size and mtime still match the manifest it is not even read.
+- ``STALE``: unchanged since dot-work wrote it, but its source changed (e.g.
+  after a package upgrade) or it was placed in another way (copy vs. link).
+  Rewritten without asking.
+- ``MODIFIED``: dot-work wrote it and the user has edited it since.
+- ``UNTRACKED``: exists but was not written by dot-work (or predates the manifest).
+
+Re-running install after an upgrade therefore only writes the files whose
+sources changed, and only prompts about files the user actually touched.
+
+The manifest is best-effort: a missing, unreadable or older-format manifest is
+treated as empty, and a failure to save it is logged rather than raised.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from enum import Enum, auto
+from pathlib import Path
+
+from dot_work.utils.fileio import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+# Location of the manifest, relative to the target project
+MANIFEST_PATH = Path(".work") / ".dot-work-manifest.json"
+
+# Bump when the manifest layout changes; older manifests are ignored
+MANIFEST_VERSION = 1
+
+
+def sha256_hex(data: bytes) -> str:
+    """Hex SHA-256 of some bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path: Path) -> str:
+    """Hex SHA-256 of a file's contents, read in chunks."""
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+class InstallStatus(Enum):
+    """State of a destination file relative to what install would write."""
+
+    MISSING = auto()  # Destination does not exist
+    CURRENT = auto()  # Destination already holds the output
+    STALE = auto()  # Written by install and untouched, but the source changed
+    MODIFIED = auto()  # Written by install, then edited by the user
+    UNTRACKED = auto()  # Exists, but not recorded in the manifest
+
+
+@dataclass
+class ManifestEntry:
+    """What install last wrote to one destination.
+
+    Attributes:
+        source: Source file the destination was installed from.
+        source_sha256: SHA-256 of the source file at install time.
+        sha256: SHA-256 of the bytes written to the destination.
+        size: Destination size in bytes after the write.
+        mtime_ns: Destination modification time after the write.
+        environment: Environment the file was installed for.
+        mode: How the file was placed ("copy" or "link", see installer.CopyMode).
+    """
+
+    source: str
+    source_sha256: str
+    sha256: str
+    size: int
+    mtime_ns: int
+    environment: str = ""
+    mode: str = "copy"
+
+
+class InstallManifest:
+    """Installed-file manifest for one target project.
+
+    Attributes:
+        target: Target project directory.
+        entries: Manifest entries keyed by POSIX path relative to target.
+    """
+
+    def __init__(self, target: Path, entries: dict[str, ManifestEntry] | None = None) -> None:
+        self.target = target
+        self.entries: dict[str, ManifestEntry] = entries if entries is not None else {}
+        self._dirty = False
+        # Asset categories install concurrently and share one manifest
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """Path of the manifest file."""
+        return self.target / MANIFEST_PATH
+
+    @classmethod
+    def load(cls, target: Path) -> InstallManifest:
+        """Load the manifest of a target project.
+
+        Args:
+            target: Target project directory.
+
+        Returns:
+            The manifest; empty if there is none or it cannot be used.
+        """
+        manifest = cls(target)
+        try:
+            data = json.loads(manifest.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return manifest
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable install manifest %s: %s", manifest.path, e)
+            return manifest
+
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            logger.debug("Ignoring install manifest %s with another version", manifest.path)
+            return manifest
+
+        try:
+            manifest.entries = {
+                key: ManifestEntry(**entry) for key, entry in data.get("files", {}).items()
+            }
+        except (AttributeError, TypeError) as e:
+            logger.debug("Ignoring malformed install manifest %s: %s", manifest.path, e)
+        return manifest
+
+    def save(self) -> None:
+        """Write the manifest atomically if it changed since it was loaded."""
+        # Held across the write so concurrent saves cannot land out of order
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "version": MANIFEST_VERSION,
+                "files": {key: asdict(entry) for key, entry in sorted(self.entries.items())},
+            }
+            if not atomic_write_json(self.path, data, indent=2):
+                logger.warning("Could not save install manifest %s", self.path)
+                return
+            self._dirty = False
+
+    def _key(self, dest: Path) -> str:
+        """Manifest key for a destination path."""
+        try:
+            return dest.relative_to(self.target).as_posix()
+        except ValueError:
+            return dest.as_posix()
+
+    def get(self, dest: Path) -> ManifestEntry | None:
+        """Return the manifest entry for a destination, if any."""
+        return self.entries.get(self._key(dest))
+
+    def status(
+        self,
+        dest: Path,
+        source_sha256: str,
+        sha256: str,
+        mode: str = "copy",
+        size: int | None = None,
+    ) -> InstallStatus:
+        """Classify a destination against the output install would write there.
+
+        Args:
+            dest: Destination path.
+            source_sha256: SHA-256 of the current source file.
+            sha256: SHA-256 of the bytes that would be written.
+            mode: How the file would be placed ("copy" or "link").
+            size: Size of the bytes that would be written, if known; an
+                unrecorded destination of another size is then not hashed.
+
+        Returns:
+            The destination's InstallStatus.
+        """
+        try:
+            stat = dest.stat()
+        except FileNotFoundError:
+            return InstallStatus.MISSING
+
+        entry = self.get(dest)
+        if entry is not None and entry.size == stat.st_size:
+            if entry.mtime_ns == stat.st_mtime_ns:
+                # Same size and mtime as when install wrote it: trust the entry
+                unchanged = True
+            else:
+                unchanged = sha256_hex(dest.read_bytes()) == entry.sha256
+            if unchanged:
+                if (
+                    entry.source_sha256 == source_sha256
+                    and entry.sha256 == sha256
+                    and entry.mode == mode
+                ):
+                    return InstallStatus.CURRENT
+                return InstallStatus.STALE
+
+        # Edited or never recorded: it may still happen to hold the right bytes,
+        # in which case a link can safely replace it
+        if (size is None or stat.st_size == size) and sha256_hex(dest.read_bytes()) == sha256:
+            return InstallStatus.CURRENT if mode == "copy" else InstallStatus.STALE
+        return InstallStatus.MODIFIED if entry is not None else InstallStatus.UNTRACKED
+
+    def record(
+        self,
+        dest: Path,
+        *,
+        source: Path,
+        source_sha256: str,
+        sha256: str,
+        environment: str = "",
+        stat: os.stat_result | None = None,
+        mode: str = "copy",
+    ) -> None:
+        """Record that dest holds the output of source (after writing or verifying it).
+
+        Args:
+            dest: Destination path, which must exist.
+            source: Source file the destination was installed from.
+            source_sha256: SHA-256 of the source file.
+            sha256: SHA-256 of the destination's contents.
+            environment: Environment the file was installed for.
+            stat: The destination's stat right after writing, if already known.
+            mode: How the file was placed ("copy" or "link").
+        """
+        if stat is None:
+            stat = dest.stat()
+        entry = ManifestEntry(
+            source=str(source),
+            source_sha256=source_sha256,
+            sha256=sha256,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            environment=environment,
+            mode=mode,
+        )
+        key = self._key(dest)
+        with self._lock:
+            if self.entries.get(key) != entry:
+                self.entries[key] = entry
+                self._dirty = True
@@ -1,19 +1,36 @@
 """Installer functions for different AI environments."""
 
+import errno
 import importlib.resources
+import os
+import shutil
+import sys
+import threading
+from collections.abc import Callable, Collection, Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import UTC
 from enum import Enum, auto
+from functools import cached_property, partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO, cast
 
 import typer
-from jinja2 import Environment as JinjaEnvironment
-from jinja2 import FileSystemLoader
 from rich.console import Console
 from rich.table import Table
 
 from dot_work.environments import ENVIRONMENTS, Environment
+from dot_work.install_manifest import InstallManifest, InstallStatus, sha256_file, sha256_hex
+from dot_work.utils.fingerprint import ProjectFingerprint, project_fingerprint
+from dot_work.utils.io_pool import io_map, run_ordered
 from dot_work.utils.path import PathTraversalError, safe_path_join
+from dot_work.utils.profiling import GLOBAL_CATEGORY, count, span
+
+if TYPE_CHECKING:
+    from jinja2 import Environment as JinjaEnvironment
+
+    from dot_work.prompts.canonical import CanonicalPrompt, EnvironmentConfig
+    from dot_work.skills.models import Skill
 
 
 class BatchChoice(Enum):
@@ -25,6 +42,13 @@ class BatchChoice(Enum):
     CANCEL = auto()  # Cancel installation
 
 
+class CopyMode(Enum):
+    """How verbatim assets (canonical prompts, skills, subagents) are placed."""
+
+    COPY = "copy"  # Independent copy, using reflink/copy_file_range when available
+    LINK = "link"  # Hard link (or symlink) into the shared asset store
+
+
 @dataclass
 class InstallState:
     """Tracks state during batch installation."""
@@ -32,6 +56,8 @@ class InstallState:
     batch_choice: BatchChoice | None = None
     existing_files: list[Path] = field(default_factory=list)
     new_files: list[Path] = field(default_factory=list)
+    updated_files: list[Path] = field(default_factory=list)
+    up_to_date_files: list[Path] = field(default_factory=list)
 
     @property
     def has_existing_files(self) -> bool:
@@ -41,7 +67,150 @@ class InstallState:
     @property
     def total_files(self) -> int:
         """Total files to process."""
-        return len(self.existing_files) + len(self.new_files)
+        return len(self.existing_files) + len(self.new_files) + len(self.updated_files)
+
+
+@dataclass
+class InstallPlanItem:
+    """A single canonical asset resolved for installation.
+
+    Attributes:
+        source_file: Canonical source file the item was planned from.
+        prompt: Parsed canonical prompt (parsed exactly once per install).
+        output_path: Resolved destination path inside the target project.
+        data: Raw bytes of the source file, written verbatim to output_path.
+    """
+
+    source_file: Path
+    prompt: "CanonicalPrompt"
+    output_path: Path
+    data: bytes
+
+    @property
+    def output_dir(self) -> Path:
+        """Directory the item is written into."""
+        return self.output_path.parent
+
+    @cached_property
+    def sha256(self) -> str:
+        """Hex SHA-256 of the source bytes (and therefore of the installed file)."""
+        return sha256_hex(self.data)
+
+
+@dataclass
+class InstallPlan:
+    """Result of scanning a canonical asset directory for one environment.
+
+    The plan is built in a single pass (read + parse per file), consumed by the
+    write phase, and returned to the caller with the final counts.
+
+    Attributes:
+        env_name: Environment the plan was built for.
+        items: Files that support env_name, in scan order.
+        source_count: Number of source files scanned.
+        error_count: Number of source files skipped because they failed to parse.
+        installed_count: Number of items actually written.
+        skipped_count: Number of items not written (existing files the user kept).
+        up_to_date_count: Number of items whose destination already matched.
+    """
+
+    env_name: str
+    items: list[InstallPlanItem] = field(default_factory=list)
+    source_count: int = 0
+    error_count: int = 0
+    installed_count: int = 0
+    skipped_count: int = 0
+    up_to_date_count: int = 0
+
+    @property
+    def planned_count(self) -> int:
+        """Number of files that support the environment."""
+        return len(self.items)
+
+
+class ParsedAssets:
+    """Parsed asset sources shared by installs for several environments.
+
+    Installing for N environments (or N target projects) reads the same
+    sources N times; routing the parses through one ParsedAssets makes each
+    source read and parsed once, after which only the writes fan out. Parse
+    errors are remembered too and re-raised for every install that asks.
+    Digests of files copied verbatim (skill resources) are memoized the same
+    way, see :meth:`digest`. Safe to share between threads: concurrent requests for one source wait
+    for a single parse.
+    """
+
+    def __init__(self) -> None:
+        self._results: dict[tuple[str, Path], Any] = {}
+        self._lock = threading.Lock()
+        self._key_locks: dict[tuple[str, Path], threading.Lock] = {}
+
+    def get(self, kind: str, path: Path, parse: Callable[[Path], Any]) -> Any:
+        """Return parse(path), calling it only the first time for (kind, path).
+
+        Args:
+            kind: Parser kind, so one path can be parsed in different ways.
+            path: Source file or directory to parse.
+            parse: Parser function.
+
+        Returns:
+            The parse result.
+
+        Raises:
+            Exception: Whatever parse raised for this path.
+        """
+        return self._memo((kind, path), partial(parse, path), "parse")
+
+    def digest(self, path: Path) -> str:
+        """Return the SHA-256 of a file, hashing it only the first time.
+
+        Args:
+            path: File to hash; symlinks are resolved, so a file reachable
+                through several paths is read once.
+
+        Returns:
+            Hex SHA-256 of the file's contents.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        path = path.resolve()
+        return cast(str, self._memo(("sha256", path), partial(sha256_file, path), "hash"))
+
+    def _memo(self, key: tuple[str, Path], compute: Callable[[], Any], phase: str) -> Any:
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._results:
+                try:
+                    with span(phase):
+                        self._results[key] = compute()
+                except Exception as e:
+                    self._results[key] = e
+            result = self._results[key]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def invalidate(self, paths: Iterable[Path] | None = None) -> None:
+        """Forget parses so changed sources are parsed again on the next get.
+
+        Args:
+            paths: Changed files. Parses of those files, and of directories
+                containing them (skills), are dropped, under the given path
+                and under its resolved one (digests are keyed by the latter).
+                None drops everything.
+        """
+        with self._lock:
+            if paths is None:
+                self._results.clear()
+                self._key_locks.clear()
+                return
+            changed = {variant for path in paths for variant in (path, path.resolve())}
+            affected = changed | {parent for path in changed for parent in path.parents}
+            for key in [key for key in self._key_locks if key[1] in affected]:
+                del self._key_locks[key]
+                self._results.pop(key, None)
 
 
 @dataclass
@@ -124,14 +293,18 @@ def get_bundled_subagents_dir() -> Path:
     return _get_bundled_subagents_dir()
 
 
-def create_jinja_env(prompts_dir: Path) -> JinjaEnvironment:
+def create_jinja_env(prompts_dir: Path) -> "JinjaEnvironment":
     """Create a Jinja2 environment for processing prompt templates.
 
     Args:
         prompts_dir: Path to the directory containing prompt templates.
 
+    Templates precompiled at build time are loaded from their modules while
+    their source is unchanged; everything else goes through a FileSystemLoader
+    backed by the user-level bytecode cache (see dot_work.template_cache).
+
     Returns:
-        Configured Jinja2 environment with FileSystemLoader.
+        Configured Jinja2 environment.
 
     Security Considerations:
         **Autoescape is disabled** because this function generates markdown files,
@@ -149,12 +322,21 @@ def create_jinja_env(prompts_dir: Path) -> JinjaEnvironment:
 
         Reference: OWASP A03:2021 (Cross-Site Scripting)
     """
+    # Imported here: Jinja is only needed on the legacy render path, not at CLI startup
+    from jinja2 import BaseLoader, ChoiceLoader, FileSystemLoader
+    from jinja2 import Environment as JinjaEnvironment
+
+    from dot_work.template_cache import TEMPLATE_ENV_OPTIONS, bytecode_cache, precompiled_loader
+
+    loader: BaseLoader = FileSystemLoader(prompts_dir)
+    precompiled = precompiled_loader(prompts_dir)
+    if precompiled is not None:
+        loader = ChoiceLoader([precompiled, loader])
     return JinjaEnvironment(  # noqa: S701 - autoescape disabled for markdown
-        loader=FileSystemLoader(prompts_dir),
-        keep_trailing_newline=True,
-        trim_blocks=False,
-        lstrip_blocks=False,
-        autoescape=False,  # Markdown templates, not HTML - see security notes above
+        loader=loader,
+        bytecode_cache=bytecode_cache(),
+        # autoescape=False: Markdown templates, not HTML - see security notes above
+        **TEMPLATE_ENV_OPTIONS,
     )
 
 
@@ -181,7 +363,7 @@ def render_prompt(
     prompts_dir: Path,
     prompt_file: Path,
     env_config: Environment,
-    jinja_env: JinjaEnvironment | None = None,
+    jinja_env: "JinjaEnvironment | None" = None,
 ) -> str:
     """Render a prompt template with environment-specific variables.
 
@@ -206,6 +388,34 @@ def render_prompt(
     return template.render(**context)
 
 
+def render_prompt_stream(
+    prompts_dir: Path,
+    prompt_file: Path,
+    env_config: Environment,
+    jinja_env: "JinjaEnvironment | None" = None,
+) -> Iterator[str]:
+    """Render a prompt template piece by piece, without building the whole string.
+
+    Args:
+        prompts_dir: Path to the directory containing prompt templates.
+        prompt_file: Path to the specific prompt file to render.
+        env_config: Environment configuration with template values.
+        jinja_env: Optional pre-configured Jinja2 environment (see render_prompt).
+
+    Returns:
+        Iterator over the rendered content's chunks.
+
+    Raises:
+        jinja2.TemplateNotFound: If the template file doesn't exist.
+        jinja2.TemplateSyntaxError: If the template has invalid syntax.
+    """
+    if jinja_env is None:
+        jinja_env = create_jinja_env(prompts_dir)
+    template = jinja_env.get_template(prompt_file.name)
+    context = build_template_context(env_config)
+    return template.generate(**context)
+
+
 def should_write_file(
     dest_path: Path,
     force: bool,
@@ -284,6 +494,10 @@ def _prompt_batch_choice(console: Console, state: InstallState) -> BatchChoice:
     table.add_column("Count", justify="right")
     table.add_row("[yellow]Existing[/yellow]", str(len(state.existing_files)))
     table.add_row("[green]New[/green]", str(len(state.new_files)))
+    if state.updated_files:
+        table.add_row("[blue]Updated[/blue]", str(len(state.updated_files)))
+    if state.up_to_date_files:
+        table.add_row("[dim]Up to date[/dim]", str(len(state.up_to_date_files)))
     console.print(table)
 
     # Menu
@@ -322,6 +536,9 @@ def install_prompts(
     force: bool = False,
     dry_run: bool = False,
     fallback_to_legacy: bool = True,
+    manifest: InstallManifest | None = None,
+    parsed: ParsedAssets | None = None,
+    copy_mode: CopyMode = CopyMode.COPY,
 ) -> None:
     """Install prompts for the specified environment.
 
@@ -338,6 +555,9 @@ def install_prompts(
         dry_run: If True, preview changes without writing files.
         fallback_to_legacy: If True (default), try legacy installation when
             canonical prompts are not found. If False, raise ValueError.
+        manifest: Install manifest of the target; loaded from target if omitted.
+        parsed: Parsed sources shared across environments, if installing several.
+        copy_mode: How verbatim files are placed (copy, or link to the asset store).
 
     Raises:
         ValueError: If environment not found and fallback_to_legacy is False,
@@ -346,7 +566,15 @@ def install_prompts(
     # Try canonical prompt installation first
     try:
         install_canonical_prompts_by_environment(
-            env_key, target, prompts_dir, console, force=force, dry_run=dry_run
+            env_key,
+            target,
+            prompts_dir,
+            console,
+            force=force,
+            dry_run=dry_run,
+            manifest=manifest,
+            parsed=parsed,
+            copy_mode=copy_mode,
         )
         return
     except ValueError as e:
@@ -399,6 +627,7 @@ def install_prompts_generic(
         dry_run: If True, preview changes without writing files.
     """
     env_config = ENVIRONMENTS[config.env_key]
+    category = prompts_dir.name
 
     # Combined file mode (claude, aider, amazon-q)
     if config.combined:
@@ -417,31 +646,39 @@ def install_prompts_generic(
         # Check if we should write (in dry-run, always show what would happen)
         if not dry_run and not should_write_file(combined_path, force, console):
             console.print(f"  [dim]⏭[/dim] Skipped {combined_path.name}")
+            count("skipped", 1, category)
             return
 
-        sections = [_build_combined_header(config)]
-
         # Get prompt files
-        prompt_files = (
-            sorted(prompts_dir.glob("*.md")) if config.sort_files else prompts_dir.glob("*.md")
-        )
-
-        # Create Jinja2 environment once for all files
-        jinja_env = create_jinja_env(prompts_dir)
-
-        for prompt_file in prompt_files:
-            content = render_prompt(prompts_dir, prompt_file, env_config, jinja_env)
-            title = prompt_file.stem.replace("-", " ").replace("_", " ").title()
-            sections.append(f"---\n\n## {title}\n\n")
-            sections.append(content)
-            sections.append("\n\n")
+        with span("discover", category):
+            prompt_files = (
+                sorted(prompts_dir.glob("*.md"))
+                if config.sort_files
+                else list(prompts_dir.glob("*.md"))
+            )
+        count("files", len(prompt_files), category)
 
         if dry_run:
             action = "Would create" if not combined_path.exists() else "Would overwrite"
             console.print(f"  [yellow][DRY-RUN][/yellow] [dim]{action}[/dim] {combined_path}")
         else:
+            # Create Jinja2 environment once for all files
+            jinja_env = create_jinja_env(prompts_dir)
             try:
-                combined_path.write_text("".join(sections), encoding="utf-8")
+                # Stream each rendered prompt into the file instead of joining
+                # them all in memory; the file is replaced only once complete.
+                # Rendering and writing interleave, so they are timed together.
+                with span("render", category), _atomic_text_writer(combined_path) as combined:
+                    combined.write(_build_combined_header(config))
+                    for prompt_file in prompt_files:
+                        title = prompt_file.stem.replace("-", " ").replace("_", " ").title()
+                        combined.write(f"---\n\n## {title}\n\n")
+                        combined.writelines(
+                            render_prompt_stream(prompts_dir, prompt_file, env_config, jinja_env)
+                        )
+                        combined.write("\n\n")
+                count("written", 1, category)
+                count("bytes_written", combined_path.stat().st_size, category)
                 console.print(f"  [green]✓[/green] Created {combined_path.name}")
             except PermissionError as e:
                 console.print(f"  [red]❌ Permission denied writing to:[/red] {combined_path}")
@@ -474,28 +711,31 @@ def install_prompts_generic(
 
     # Scan phase: collect all destination paths and categorize
     state = InstallState()
-    prompt_files = list(prompts_dir.glob("*.md"))
+    with span("discover", category):
+        prompt_files = list(prompts_dir.glob("*.md"))
+    count("files", len(prompt_files), category)
 
-    for prompt_file in prompt_files:
-        dest_name = _get_dest_filename(prompt_file, config)
-        dest_path = dest_dir / dest_name
-        if dest_path.exists():
-            state.existing_files.append(dest_path)
-        else:
-            state.new_files.append(dest_path)
+    with span("scan", category):
+        for prompt_file in prompt_files:
+            dest_name = _get_dest_filename(prompt_file, config)
+            dest_path = dest_dir / dest_name
+            if dest_path.exists():
+                state.existing_files.append(dest_path)
+            else:
+                state.new_files.append(dest_path)
 
-    # Add auxiliary files to scan
-    for aux_path, _aux_content in config.auxiliary_files:
-        try:
-            aux_full_path = safe_path_join(target, aux_path)
-        except PathTraversalError:
-            # Skip unsafe auxiliary paths
-            console.print(f"  [yellow]⚠[/yellow] Skipping unsafe auxiliary path: {aux_path}")
-            continue
-        if aux_full_path.exists():
-            state.existing_files.append(aux_full_path)
-        else:
-            state.new_files.append(aux_full_path)
+        # Add auxiliary files to scan
+        for aux_path, _aux_content in config.auxiliary_files:
+            try:
+                aux_full_path = safe_path_join(target, aux_path)
+            except PathTraversalError:
+                # Skip unsafe auxiliary paths
+                console.print(f"  [yellow]⚠[/yellow] Skipping unsafe auxiliary path: {aux_path}")
+                continue
+            if aux_full_path.exists():
+                state.existing_files.append(aux_full_path)
+            else:
+                state.new_files.append(aux_full_path)
 
     # Show batch menu if there are existing files and not in force/dry-run mode
     batch_choice: BatchChoice | None = None
@@ -519,6 +759,7 @@ def install_prompts_generic(
             dest_path, force, console, batch_choice=batch_choice
         ):
             console.print(f"  [dim]⏭[/dim] Skipped {dest_name}")
+            count("skipped", 1, category)
             continue
 
         if dry_run:
@@ -527,8 +768,14 @@ def install_prompts_generic(
         else:
             # Render and write
             try:
-                rendered_content = render_prompt(prompts_dir, prompt_file, env_config, jinja_env)
-                dest_path.write_text(rendered_content, encoding="utf-8")
+                with span("render", category):
+                    rendered_content = render_prompt(
+                        prompts_dir, prompt_file, env_config, jinja_env
+                    )
+                with span("write", category):
+                    dest_path.write_text(rendered_content, encoding="utf-8")
+                count("written", 1, category)
+                count("bytes_written", dest_path.stat().st_size, category)
                 console.print(f"  [green]✓[/green] {config.messages[0].format(name=dest_name)}")
             except PermissionError as e:
                 console.print(f"  [red]❌ Permission denied writing to:[/red] {dest_path}")
@@ -1021,6 +1268,12 @@ def detect_project_context(target: Path) -> dict[str, str]:
     Returns:
         Dictionary with detected project context values.
     """
+    fingerprint = project_fingerprint(target)
+    return dict(fingerprint.detect("project_context", partial(_project_context, fingerprint)))
+
+
+def _project_context(fingerprint: ProjectFingerprint) -> dict[str, str]:
+    """Compute detect_project_context from a project fingerprint."""
     context = {
         "language": "unknown",
         "framework": "unknown",
@@ -1028,9 +1281,9 @@ def detect_project_context(target: Path) -> dict[str, str]:
         "test_framework": "unknown",
     }
 
-    # Detect Python - read file once
-    try:
-        pyproject_content = (target / "pyproject.toml").read_text(encoding="utf-8")
+    # Detect Python
+    pyproject_content = fingerprint.read_text("pyproject.toml")
+    if pyproject_content is not None:
         context["language"] = "Python"
         context["package_manager"] = "uv or pip"
         if "pytest" in pyproject_content:
@@ -1043,16 +1296,15 @@ def detect_project_context(target: Path) -> dict[str, str]:
             context["framework"] = "Django"
         elif "flask" in pyproject_content:
             context["framework"] = "Flask"
-    except FileNotFoundError:
-        # Check for requirements.txt as fallback
-        if (target / "requirements.txt").exists():
-            context["language"] = "Python"
-            context["package_manager"] = "pip"
+    elif fingerprint.exists("requirements.txt"):
+        # requirements.txt as fallback
+        context["language"] = "Python"
+        context["package_manager"] = "pip"
 
-    # Detect Node.js - read file once
+    # Detect Node.js
     if context["language"] == "unknown":
-        try:
-            pkg_content = (target / "package.json").read_text(encoding="utf-8")
+        pkg_content = fingerprint.read_text("package.json")
+        if pkg_content is not None:
             context["language"] = "JavaScript/TypeScript"
             context["package_manager"] = "npm or yarn"
             if "jest" in pkg_content:
@@ -1067,17 +1319,15 @@ def detect_project_context(target: Path) -> dict[str, str]:
                 context["framework"] = "Vue"
             elif "express" in pkg_content:
                 context["framework"] = "Express"
-        except FileNotFoundError:
-            pass
 
     # Detect Rust
-    if context["language"] == "unknown" and (target / "Cargo.toml").exists():
+    if context["language"] == "unknown" and fingerprint.exists("Cargo.toml"):
         context["language"] = "Rust"
         context["package_manager"] = "cargo"
         context["test_framework"] = "cargo test"
 
     # Detect Go
-    if context["language"] == "unknown" and (target / "go.mod").exists():
+    if context["language"] == "unknown" and fingerprint.exists("go.mod"):
         context["language"] = "Go"
         context["package_manager"] = "go modules"
         context["test_framework"] = "go test"
@@ -1150,13 +1400,16 @@ def initialize_work_directory(
     console.print("[dim]💡 Run 'generate-baseline' before making code changes[/dim]")
 
 
-def validate_canonical_prompt_file(prompt_file: Path, strict: bool = False) -> None:
+def validate_canonical_prompt_file(prompt_file: Path, strict: bool = False) -> "CanonicalPrompt":
     """Validate a canonical prompt file and raise exception if invalid.
 
     Args:
         prompt_file: Path to canonical prompt file (.canon.md or similar).
         strict: Whether to use strict validation mode.
 
+    Returns:
+        The parsed prompt, so callers need not parse it again.
+
     Raises:
         ValueError: If the file is not a valid canonical prompt.
     """
@@ -1190,6 +1443,8 @@ def validate_canonical_prompt_file(prompt_file: Path, strict: bool = False) -> N
             error_text = "\n  ".join(all_strict_issues)
             raise ValueError(f"Canonical prompt strict validation failed:\n  {error_text}")
 
+        return prompt
+
     except ValueError as e:
         # For strict validation failures, wrap them appropriately
         if "Canonical prompt strict validation failed" in str(e):
@@ -1225,13 +1480,10 @@ def install_canonical_prompt(
         ValueError: If the environment is not supported or prompt is invalid.
         FileNotFoundError: If the prompt file doesn't exist.
     """
-    from dot_work.prompts.canonical import CANONICAL_PARSER, CanonicalPromptError
-
-    # First validate canonical prompt
-    validate_canonical_prompt_file(prompt_file, strict=False)
+    from dot_work.prompts.canonical import CanonicalPromptError
 
-    # Parse canonical prompt
-    prompt = CANONICAL_PARSER.parse(prompt_file)
+    # Validate and parse the canonical prompt (parsed once)
+    prompt = validate_canonical_prompt_file(prompt_file, strict=False)
 
     # Get environment configuration (will raise CanonicalPromptError if not found)
     try:
@@ -1412,7 +1664,9 @@ def discover_available_environments(prompts_dir: Path) -> dict[str, set[str]]:
     """Discover available environments from prompt file frontmatter.
 
     Scans all *.md files, parses their canonical frontmatter,
-    and returns which environments each prompt supports.
+    and returns which environments each prompt supports. Bundled assets are
+    answered from the prebuilt assets/index.json without parsing any YAML;
+    other directories (or a stale index) fall back to parsing.
 
     Args:
         prompts_dir: Directory containing prompt files with canonical frontmatter.
@@ -1421,29 +1675,153 @@ def discover_available_environments(prompts_dir: Path) -> dict[str, set[str]]:
         Dictionary mapping environment names to sets of prompt file names that support them.
         Example: {"claude": {"do-work", "new-issue"}, "copilot": {"do-work"}}
     """
+    from dot_work.asset_index import indexed_environments
+
+    indexed = indexed_environments(prompts_dir)
+    if indexed is not None:
+        return indexed
+
     from dot_work.prompts.canonical import CANONICAL_PARSER
 
     environments: dict[str, set[str]] = {}
 
-    # Find all prompt files with canonical frontmatter
-    for prompt_file in prompts_dir.glob("*.md"):
-        try:
-            prompt = CANONICAL_PARSER.parse(prompt_file)
-            prompt_name = prompt_file.stem
-
-            # Add this prompt to each environment it supports
-            for env_name in prompt.environments:
-                if env_name not in environments:
-                    environments[env_name] = set()
-                environments[env_name].add(prompt_name)
-        except Exception:  # noqa: S112, pylint: disable=broad-except
-            # Skip files that can't be parsed (not canonical format)
-            # Logging here would be too verbose during discovery
-            continue
+    # Find all prompt files with canonical frontmatter (parsing is prompts' work)
+    with span("discover", "prompts"):
+        for prompt_file in prompts_dir.glob("*.md"):
+            try:
+                prompt = CANONICAL_PARSER.parse(prompt_file)
+                prompt_name = prompt_file.stem
+
+                # Add this prompt to each environment it supports
+                for env_name in prompt.environments:
+                    if env_name not in environments:
+                        environments[env_name] = set()
+                    environments[env_name].add(prompt_name)
+            except Exception:  # noqa: S112, pylint: disable=broad-except
+                # Skip files that can't be parsed (not canonical format)
+                # Logging here would be too verbose during discovery
+                continue
 
     return environments
 
 
+def _resolve_canonical_output_path(
+    target: Path, env_config: "EnvironmentConfig", prompt_file: Path
+) -> Path:
+    """Resolve the destination path for a canonical asset from its environment config.
+
+    Args:
+        target: Target project directory.
+        env_config: Environment configuration from the prompt frontmatter.
+        prompt_file: Canonical source file (used for the default/stem-based filename).
+
+    Returns:
+        Destination path inside the target project.
+    """
+    # Determine output directory from frontmatter target
+    if env_config.target.startswith("/"):
+        # Absolute path (relative to target root)
+        output_dir = target / env_config.target.lstrip("/")
+    elif env_config.target.startswith("./"):
+        # Relative path
+        output_dir = target / env_config.target[2:]
+    else:
+        # Relative path
+        output_dir = target / env_config.target
+
+    # Determine filename from frontmatter
+    if env_config.filename:
+        output_filename = env_config.filename
+    elif env_config.filename_suffix:
+        # Use prompt file stem with suffix
+        output_filename = prompt_file.stem + env_config.filename_suffix
+    else:
+        # Default to original filename
+        output_filename = prompt_file.name
+
+    return output_dir / output_filename
+
+
+def _print_canonical_parse_error(console: Console, prompt_file: Path, error: Exception) -> None:
+    """Report a canonical file that could not be planned, with actionable guidance."""
+    error_str = str(error)
+
+    console.print(f"  [yellow]⚠[/yellow] Skipping {prompt_file.name}")
+    console.print(f"  [dim]Error: {error_str}[/dim]")
+
+    # Provide actionable guidance for common errors
+    if "filename" in error_str.lower() or "filename_suffix" in error_str.lower():
+        console.print(
+            "  [dim]💡 Fix: Add 'environments.YOUR_ENV.filename' or 'environments.YOUR_ENV.filename_suffix' to the prompt frontmatter[/dim]"
+        )
+    elif "yaml" in error_str.lower() or "frontmatter" in error_str.lower():
+        console.print(
+            "  [dim]💡 Fix: Check that the frontmatter section (before the first ---) has valid YAML syntax[/dim]"
+        )
+        console.print(
+            "  [dim]💡 Fix: Ensure multi-line values are properly indented or quoted[/dim]"
+        )
+    elif "document" in error_str.lower():
+        console.print(
+            "  [dim]💡 Fix: Ensure there's only one --- separator and one YAML document in the frontmatter[/dim]"
+        )
+
+
+def _read_canonical_source(prompt_file: Path) -> tuple[bytes, "CanonicalPrompt"]:
+    """Read a canonical source file and parse it from the bytes that were read."""
+    from dot_work.prompts.canonical import CANONICAL_PARSER
+
+    data = prompt_file.read_bytes()
+    return data, CANONICAL_PARSER.parse_bytes(data, source_file=prompt_file)
+
+
+def build_canonical_install_plan(
+    env_name: str,
+    target: Path,
+    prompt_files: list[Path],
+    console: Console,
+    *,
+    parsed: ParsedAssets | None = None,
+) -> InstallPlan:
+    """Read and parse each canonical file once and resolve its destination.
+
+    Args:
+        env_name: Name of the environment to plan for.
+        target: Target project directory.
+        prompt_files: Canonical source files to scan.
+        console: Rich console for reporting files that fail to parse.
+        parsed: Parsed sources shared with other environments' plans, if any.
+
+    Returns:
+        InstallPlan holding the parsed prompt, output path and raw bytes for every
+        file that supports env_name.
+    """
+    if parsed is None:
+        parsed = ParsedAssets()
+    plan = InstallPlan(env_name=env_name, source_count=len(prompt_files))
+
+    for prompt_file in prompt_files:
+        try:
+            data, prompt = parsed.get("canonical", prompt_file, _read_canonical_source)
+
+            # Skip if prompt doesn't support this environment
+            if env_name not in prompt.environments:
+                continue
+
+            env_config = prompt.get_environment(env_name)
+            output_path = _resolve_canonical_output_path(target, env_config, prompt_file)
+            plan.items.append(
+                InstallPlanItem(
+                    source_file=prompt_file, prompt=prompt, output_path=output_path, data=data
+                )
+            )
+        except Exception as e:
+            _print_canonical_parse_error(console, prompt_file, e)
+            plan.error_count += 1
+
+    return plan
+
+
 def install_canonical_prompts_by_environment(
     env_name: str,
     target: Path,
@@ -1452,12 +1830,21 @@ def install_canonical_prompts_by_environment(
     *,
     force: bool = False,
     dry_run: bool = False,
-) -> None:
+    manifest: InstallManifest | None = None,
+    parsed: ParsedAssets | None = None,
+    copy_mode: CopyMode = CopyMode.COPY,
+) -> InstallPlan:
     """Install canonical prompts for a specific environment using frontmatter paths.
 
     For each prompt file that supports the specified environment, reads the
     environment configuration from its frontmatter and installs it to the
-    target path specified in the frontmatter.
+    target path specified in the frontmatter. Each file is read and parsed
+    once; the resulting InstallPlan drives the write phase.
+
+    Destinations are checked against the target's install manifest: files that
+    already hold their source are left alone, files dot-work wrote earlier are
+    updated in place, and only files the user created or edited go through the
+    overwrite prompt.
 
     Args:
         env_name: Name of the environment to install for (e.g., 'claude', 'copilot').
@@ -1466,95 +1853,34 @@ def install_canonical_prompts_by_environment(
         console: Rich console for output.
         force: If True, overwrite existing files without prompting.
         dry_run: If True, preview changes without writing files.
+        manifest: Install manifest of the target; loaded from target if omitted.
+        parsed: Parsed sources shared across environments, if installing several.
+        copy_mode: How verbatim files are placed (copy, or link to the asset store).
+
+    Returns:
+        The executed InstallPlan, including installed, skipped and up-to-date counts.
 
     Raises:
         ValueError: If environment not found in any prompts or installation fails.
     """
-    from dot_work.prompts.canonical import CANONICAL_PARSER
-
-    prompt_files = list(prompts_dir.glob("*.md"))
-    installed_count = 0
-    skipped_count = 0
+    category = prompts_dir.name
+    with span("discover", category):
+        prompt_files = list(prompts_dir.glob("*.md"))
 
     if not prompt_files:
         raise ValueError(f"No prompt files found in {prompts_dir}")
+    count("files", len(prompt_files), category)
 
     console.print(f"Installing prompts for environment: [bold cyan]{env_name}[/bold cyan]")
     console.print(f"Source: {prompts_dir}")
     console.print(f"Target: {target}\n")
 
-    # Scan phase: categorize files
-    state = InstallState()
-    install_plan: list[tuple[Path, Path, Path]] = []  # (prompt_file, output_dir, output_path)
-
-    for prompt_file in prompt_files:
-        try:
-            prompt = CANONICAL_PARSER.parse(prompt_file)
-
-            # Skip if prompt doesn't support this environment
-            if env_name not in prompt.environments:
-                continue
-
-            # Get environment config from frontmatter
-            env_config = prompt.get_environment(env_name)
-
-            # Determine output directory from frontmatter target
-            if env_config.target.startswith("/"):
-                # Absolute path (relative to target root)
-                output_dir = target / env_config.target.lstrip("/")
-            elif env_config.target.startswith("./"):
-                # Relative path
-                output_dir = target / env_config.target[2:]
-            else:
-                # Relative path
-                output_dir = target / env_config.target
-
-            # Determine filename from frontmatter
-            if env_config.filename:
-                output_filename = env_config.filename
-            elif env_config.filename_suffix:
-                # Use prompt file stem with suffix
-                stem = prompt_file.stem
-                output_filename = stem + env_config.filename_suffix
-            else:
-                # Default to original filename
-                output_filename = prompt_file.name
-
-            output_path = output_dir / output_filename
-            install_plan.append((prompt_file, output_dir, output_path))
-
-            # Track for batch prompting
-            if output_path.exists():
-                state.existing_files.append(output_path)
-            else:
-                state.new_files.append(output_path)
-
-        except Exception as e:
-            error_str = str(e)
-
-            console.print(f"  [yellow]⚠[/yellow] Skipping {prompt_file.name}")
-            console.print(f"  [dim]Error: {error_str}[/dim]")
-
-            # Provide actionable guidance for common errors
-            if "filename" in error_str.lower() or "filename_suffix" in error_str.lower():
-                console.print(
-                    "  [dim]💡 Fix: Add 'environments.YOUR_ENV.filename' or 'environments.YOUR_ENV.filename_suffix' to the prompt frontmatter[/dim]"
-                )
-            elif "yaml" in error_str.lower() or "frontmatter" in error_str.lower():
-                console.print(
-                    "  [dim]💡 Fix: Check that the frontmatter section (before the first ---) has valid YAML syntax[/dim]"
-                )
-                console.print(
-                    "  [dim]💡 Fix: Ensure multi-line values are properly indented or quoted[/dim]"
-                )
-            elif "document" in error_str.lower():
-                console.print(
-                    "  [dim]💡 Fix: Ensure there's only one --- separator and one YAML document in the frontmatter[/dim]"
-                )
-
-            skipped_count += 1
+    # Scan phase: parse once, resolve destinations and categorize files
+    with span("scan", category):
+        plan = build_canonical_install_plan(env_name, target, prompt_files, console, parsed=parsed)
+    count("errors", plan.error_count, category)
 
-    if not install_plan:
+    if not plan.items:
         console.print(f"  [red]❌ Environment '{env_name}' not found in any prompt files.[/red]")
         console.print(
             f"  [dim]💡 Fix: Ensure at least one prompt file has an 'environments.{env_name}' section in its frontmatter[/dim]"
@@ -1568,30 +1894,90 @@ def install_canonical_prompts_by_environment(
             f"Add 'environments.{env_name}' section to at least one prompt file."
         )
 
+    # Compare destinations against the install manifest: unchanged outputs are
+    # skipped, outputs whose source changed are updated without prompting
+    if manifest is None:
+        manifest = InstallManifest.load(target)
+    state = InstallState()
+    pending: list[tuple[InstallPlanItem, InstallStatus]] = []
+    with span("scan", category):
+        for item in plan.items:
+            status = manifest.status(item.output_path, item.sha256, item.sha256, copy_mode.value)
+            if status is InstallStatus.CURRENT:
+                state.up_to_date_files.append(item.output_path)
+                if not dry_run:
+                    manifest.record(
+                        item.output_path,
+                        source=item.source_file,
+                        source_sha256=item.sha256,
+                        sha256=item.sha256,
+                        environment=env_name,
+                        mode=copy_mode.value,
+                    )
+                continue
+            pending.append((item, status))
+            if status is InstallStatus.MISSING:
+                state.new_files.append(item.output_path)
+            elif status is InstallStatus.STALE:
+                state.updated_files.append(item.output_path)
+            else:
+                state.existing_files.append(item.output_path)
+    plan.up_to_date_count = len(state.up_to_date_files)
+    count("up_to_date", plan.up_to_date_count, category)
+
     # Show batch menu if there are existing files and not in force/dry-run mode
     batch_choice: BatchChoice | None = None
     if state.has_existing_files and not force and not dry_run:
         batch_choice = _prompt_batch_choice(console, state)
         if batch_choice == BatchChoice.CANCEL:
             console.print("[yellow]Installation cancelled.[/yellow]")
-            return
+            plan.skipped_count = len(pending)
+            count("skipped", plan.skipped_count, category)
+            manifest.save()
+            return plan
 
     # Installation phase
+    up_to_date_note = (
+        f" ({plan.up_to_date_count} already up to date)" if plan.up_to_date_count else ""
+    )
     if not dry_run:
-        console.print(f"Installing {len(install_plan)} prompt(s)...\n")
+        console.print(f"Installing {len(pending)} prompt(s){up_to_date_note}...\n")
     else:
-        console.print(f"[yellow][DRY-RUN] Would install {len(install_plan)} prompt(s):[/yellow]\n")
+        console.print(
+            f"[yellow][DRY-RUN] Would install {len(pending)} prompt(s){up_to_date_note}:[/yellow]\n"
+        )
 
-    for prompt_file, output_dir, output_path in install_plan:
-        # Check if we should write
-        if not dry_run and not should_write_file(
-            output_path, force, console, batch_choice=batch_choice
+    # Decide what to write first, in file order (this is where prompts happen)
+    to_write: list[tuple[InstallPlanItem, InstallStatus]] = []
+    for item, status in pending:
+        output_path = item.output_path
+
+        # Only files the user created or edited need confirmation
+        user_owned = status in (InstallStatus.MODIFIED, InstallStatus.UNTRACKED)
+        if (
+            user_owned
+            and not dry_run
+            and not should_write_file(output_path, force, console, batch_choice=batch_choice)
         ):
             console.print(f"  [dim]⏭[/dim] Skipped {output_path.name}")
+            plan.skipped_count += 1
             continue
 
-        # Create directory if needed
-        if not dry_run:
+        if dry_run:
+            if status is InstallStatus.MISSING:
+                action = "[CREATE]"
+            elif status is InstallStatus.STALE:
+                action = "[UPDATE]"
+            else:
+                action = "[OVERWRITE]"
+            console.print(f"  [yellow][DRY-RUN][/yellow] [dim]{action}[/dim] {output_path}")
+            continue
+
+        to_write.append((item, status))
+
+    with span("write", category):
+        # Create directories if needed
+        for output_dir in dict.fromkeys(item.output_dir for item, _ in to_write):
             try:
                 output_dir.mkdir(parents=True, exist_ok=True)
             except PermissionError as e:
@@ -1604,38 +1990,57 @@ def install_canonical_prompts_by_environment(
                 console.print(f"  [dim]Error: {e}[/dim]")
                 raise typer.Exit(1) from None
 
-        # Read prompt content
-        prompt = CANONICAL_PARSER.parse(prompt_file)
+        # Write (or link) the planned bytes as-is (they already have proper
+        # frontmatter) on the I/O thread pool, then report in file order
+        results = io_map(
+            _install_file,
+            [(item.data, item.output_path, item.sha256, copy_mode) for item, _ in to_write],
+        )
+    for (item, status), result in zip(to_write, results, strict=True):
+        output_path = item.output_path
+        if isinstance(result, PermissionError):
+            console.print(f"  [red]❌ Permission denied writing to:[/red] {output_path}")
+            console.print(f"  [dim]Error: {result}[/dim]")
+            console.print("  [dim]Try running with sudo or fixing directory permissions[/dim]")
+            raise typer.Exit(1) from None
+        if isinstance(result, OSError):
+            console.print(f"  [red]❌ Failed to write file:[/red] {output_path}")
+            console.print(f"  [dim]Error: {result}[/dim]")
+            raise typer.Exit(1) from None
 
-        # Write output (without extra frontmatter - prompts already have it)
-        if dry_run:
-            action = "[CREATE]" if not output_path.exists() else "[OVERWRITE]"
-            console.print(f"  [yellow][DRY-RUN][/yellow] [dim]{action}[/dim] {output_path}")
-        else:
-            # Write the prompt file as-is (it already has proper frontmatter)
-            try:
-                output_path.write_text(prompt_file.read_text(encoding="utf-8"), encoding="utf-8")
-                console.print(f"  [green]✓[/green] Installed {output_path.name}")
-                installed_count += 1
-            except PermissionError as e:
-                console.print(f"  [red]❌ Permission denied writing to:[/red] {output_path}")
-                console.print(f"  [dim]Error: {e}[/dim]")
-                console.print("  [dim]Try running with sudo or fixing directory permissions[/dim]")
-                raise typer.Exit(1) from None
-            except OSError as e:
-                console.print(f"  [red]❌ Failed to write file:[/red] {output_path}")
-                console.print(f"  [dim]Error: {e}[/dim]")
-                raise typer.Exit(1) from None
+        written, placed = result
+        manifest.record(
+            output_path,
+            source=item.source_file,
+            source_sha256=item.sha256,
+            sha256=item.sha256,
+            environment=env_name,
+            stat=written,
+            mode=placed.value,
+        )
+        verb = "Updated" if status is InstallStatus.STALE else "Installed"
+        console.print(f"  [green]✓[/green] {verb} {output_path.name}")
+        plan.installed_count += 1
+        count("bytes_written", written.st_size, category)
+    count("written", plan.installed_count, category)
+    count("skipped", plan.skipped_count, category)
 
     if dry_run:
         console.print(
-            f"\n[cyan]📁 Dry-run complete: {len(install_plan)} file(s) would be installed[/cyan]"
+            f"\n[cyan]📁 Dry-run complete: {len(pending)} file(s) would be installed[/cyan]"
         )
     else:
-        console.print(f"\n[cyan]📁 Installed {installed_count} prompt(s) for {env_name}[/cyan]")
+        manifest.save()
+        console.print(
+            f"\n[cyan]📁 Installed {plan.installed_count} prompt(s) for {env_name}[/cyan]"
+        )
+    if plan.up_to_date_count > 0:
+        console.print(f"[dim]{plan.up_to_date_count} file(s) already up to date[/dim]")
+
+    if plan.error_count > 0:
+        console.print(f"[dim]⚠ {plan.error_count} file(s) skipped due to errors[/dim]")
 
-    if skipped_count > 0:
-        console.print(f"[dim]⚠ {skipped_count} file(s) skipped due to errors[/dim]")
+    return plan
 
 
 # ============================================================================
@@ -1647,6 +2052,403 @@ SKILL_SUPPORTED_ENVIRONMENTS = {"claude"}
 SUBAGENT_SUPPORTED_ENVIRONMENTS = {"claude", "opencode", "copilot"}
 
 
+# Linux ioctl that clones a whole file (reflink) on btrfs, XFS, bcachefs, ...
+_FICLONE = 0x40049409
+
+# (source device, destination device) pairs where reflink is not supported
+_reflink_unsupported: set[tuple[int, int]] = set()
+
+# copy_file_range errors meaning "use another way", not "the copy failed"
+_COPY_RANGE_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL}
+
+
+def asset_store_dir() -> Path:
+    """Return the shared, content-addressed store used by ``install --link``.
+
+    Files are stored once per content hash, so every project on the machine
+    that links an asset shares one physical copy.
+
+    Environment variables:
+        DOT_WORK_STORE_DIR: Store location (default:
+            ``$XDG_DATA_HOME/dot-work/store``, i.e. ``~/.local/share/dot-work/store``).
+    """
+    override = os.environ.get("DOT_WORK_STORE_DIR")
+    if override:
+        return Path(override).expanduser()
+    data_home = os.environ.get("XDG_DATA_HOME")
+    base = Path(data_home) if data_home else Path.home() / ".local" / "share"
+    return base / "dot-work" / "store"
+
+
+def _copy_fd(src_fd: int, dst_fd: int) -> None:
+    """Copy a whole file between descriptors using the fastest available path.
+
+    Tries, in order: a reflink (shares extents, no data copied), in-kernel
+    ``os.copy_file_range``, then a buffered read/write copy.
+    """
+    src_stat = os.fstat(src_fd)
+    devices = (src_stat.st_dev, os.fstat(dst_fd).st_dev)
+    if sys.platform == "linux" and devices not in _reflink_unsupported:
+        import fcntl
+
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return
+        except OSError:
+            _reflink_unsupported.add(devices)
+
+    if hasattr(os, "copy_file_range"):
+        copied = 0
+        try:
+            while copied < src_stat.st_size:
+                copied_now = os.copy_file_range(src_fd, dst_fd, src_stat.st_size - copied)
+                if copied_now == 0:
+                    break
+                copied += copied_now
+            return
+        except OSError as e:
+            if copied or e.errno not in _COPY_RANGE_FALLBACK_ERRNOS:
+                raise
+
+    with open(src_fd, "rb", closefd=False) as src, open(dst_fd, "wb", closefd=False) as dst:
+        shutil.copyfileobj(src, dst)
+
+
+def _temp_sibling(path: Path) -> Path:
+    """Unique temporary path next to path, for an atomic replace."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+@contextmanager
+def _atomic_text_writer(path: Path) -> Iterator[TextIO]:
+    """Open a UTF-8 text file that replaces path when the block exits cleanly.
+
+    Content goes to a temporary sibling that is renamed over path, so a
+    failed or interrupted write leaves the previous file intact. A symlinked
+    path is written through to its target, and an existing file keeps its
+    permissions.
+    """
+    if path.is_symlink():
+        path = Path(os.path.realpath(path))
+    tmp = _temp_sibling(path)
+    try:
+        with tmp.open("x", encoding="utf-8") as f:
+            yield f
+        if path.exists():
+            shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _copy_into_place(source: Path | bytes, dest: Path) -> None:
+    """Atomically replace dest with a copy of source (a file, or its bytes).
+
+    The copy is written to a temporary sibling and renamed over dest, so a
+    destination that is a link into the asset store is replaced rather than
+    written through. An existing file keeps its permissions, unless it is a
+    link into the store (whose files are read-only).
+    """
+    tmp = _temp_sibling(dest)
+    try:
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        dst_fd = os.open(tmp, flags, 0o666)
+        try:
+            if isinstance(source, bytes):
+                with open(dst_fd, "wb", closefd=False) as dst:
+                    dst.write(source)
+            else:
+                with source.open("rb") as src:
+                    _copy_fd(src.fileno(), dst_fd)
+        finally:
+            os.close(dst_fd)
+        if not dest.is_symlink() and dest.exists() and dest.stat().st_nlink == 1:
+            shutil.copymode(dest, tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _store_file(source: Path | bytes, sha256: str, suffix: str) -> Path:
+    """Return the asset store file holding source's content, adding it if needed.
+
+    An existing store file is re-hashed before it is reused: it is shared by
+    every linked project, so an edit made in place through one of them (as
+    root, after ``chmod u+w`` or by an editor writing in place) would
+    otherwise spread to every later ``--link`` install. Such a file is
+    replaced by a fresh copy.
+
+    Raises:
+        OSError: If source no longer has the given SHA-256 (it changed after
+            it was hashed), or the store cannot be written.
+    """
+    stored = asset_store_dir() / sha256[:2] / f"{sha256}{suffix}"
+    try:
+        if sha256_file(stored) == sha256:
+            return stored
+    except FileNotFoundError:
+        pass
+    stored.parent.mkdir(parents=True, exist_ok=True)
+    _copy_into_place(source, stored)
+    if not isinstance(source, bytes) and sha256_file(stored) != sha256:
+        stored.unlink(missing_ok=True)
+        raise OSError(errno.EAGAIN, "Source changed while it was being installed", str(source))
+    # Shared by every linked project: make accidental edits fail loudly
+    stored.chmod(0o444)
+    return stored
+
+
+def _link_into_place(source: Path | bytes, dest: Path, sha256: str) -> CopyMode:
+    """Atomically replace dest with a link to source's content in the asset store.
+
+    Prefers a hard link; falls back to a symlink when the store is on another
+    filesystem, and to a copy when links are not supported at all.
+
+    Returns:
+        CopyMode.LINK, or CopyMode.COPY if dest had to be copied instead.
+    """
+    stored = _store_file(source, sha256, dest.suffix)
+    tmp = _temp_sibling(dest)
+    try:
+        try:
+            os.link(stored, tmp)
+        except OSError:
+            try:
+                os.symlink(stored, tmp)
+            except OSError:
+                _copy_into_place(source, dest)
+                return CopyMode.COPY
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return CopyMode.LINK
+
+
+def _install_file(
+    job: tuple[Path | bytes, Path, str, CopyMode],
+) -> tuple[os.stat_result, CopyMode] | OSError:
+    """Place one verbatim asset file at its destination (I/O pool worker).
+
+    Args:
+        job: Source file (or its bytes), destination path (parent directories
+            are created), SHA-256 of the source and the CopyMode to use.
+
+    Returns:
+        The destination's stat after the write and the CopyMode actually
+        used (a link may fall back to a copy), or the OSError that prevented it.
+    """
+    source, dest, sha256, mode = job
+    try:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if mode is CopyMode.LINK:
+            mode = _link_into_place(source, dest, sha256)
+        else:
+            _copy_into_place(source, dest)
+        return dest.stat(), mode
+    except OSError as e:
+        return e
+
+
+@dataclass
+class _AssetCopy:
+    """A skill or subagent file to copy verbatim to its destination."""
+
+    name: str
+    source_file: Path
+    output_path: Path
+    sha256: str
+    status: InstallStatus
+
+
+def _scan_asset_file(
+    job: tuple[Path, Path, InstallManifest, CopyMode, ParsedAssets],
+) -> tuple[str, InstallStatus] | OSError:
+    """Hash a source file and classify its destination (I/O pool worker).
+
+    Args:
+        job: Source file, destination path, install manifest of the target,
+            CopyMode, and the ParsedAssets memoizing source digests.
+
+    Returns:
+        The source's SHA-256 and the destination's status, or the OSError
+        that prevented reading either.
+    """
+    source, dest, manifest, copy_mode, parsed = job
+    try:
+        digest = parsed.digest(source)
+        size = source.stat().st_size
+        return digest, manifest.status(dest, digest, digest, copy_mode.value, size=size)
+    except OSError as e:
+        return e
+
+
+def _plan_asset_copy(
+    name: str,
+    source_file: Path,
+    output_path: Path,
+    manifest: InstallManifest,
+    console: Console,
+    *,
+    force: bool = False,
+    dry_run: bool = False,
+    copy_mode: CopyMode = CopyMode.COPY,
+    scanned: tuple[str, InstallStatus] | None = None,
+) -> _AssetCopy | None:
+    """Compare one asset file with its destination and decide whether to copy it.
+
+    Destinations the user edited since the last install are only overwritten
+    after confirmation (or with force). In dry-run mode the copy is previewed.
+
+    Args:
+        name: Asset name for messages.
+        source_file: Asset file to copy.
+        output_path: Destination path inside the target project.
+        manifest: Install manifest of the target project.
+        console: Rich console for output.
+        force: If True, overwrite edited files without prompting.
+        dry_run: If True, preview the copy without writing.
+        copy_mode: How the file will be placed (copy, or link to the asset store).
+        scanned: Source digest and destination status, if already computed
+            (see _scan_asset_file).
+
+    Returns:
+        The planned copy (its status CURRENT if nothing needs writing), or None
+        if the user kept their edited file.
+    """
+    if scanned is None:
+        data = source_file.read_bytes()
+        digest = sha256_hex(data)
+        status = manifest.status(output_path, digest, digest, copy_mode.value, size=len(data))
+    else:
+        digest, status = scanned
+
+    if dry_run:
+        if status is not InstallStatus.CURRENT:
+            action = "[CREATE]" if status is InstallStatus.MISSING else "[OVERWRITE]"
+            console.print(f"  [yellow][DRY-RUN][/yellow] [dim]{action}[/dim] {output_path}")
+    elif status is InstallStatus.MODIFIED and not should_write_file(output_path, force, console):
+        return None
+    return _AssetCopy(name, source_file, output_path, digest, status)
+
+
+def _write_asset_copies(
+    copies: list[_AssetCopy],
+    manifest: InstallManifest,
+    env_name: str,
+    console: Console,
+    kind: str,
+    copy_mode: CopyMode = CopyMode.COPY,
+) -> int:
+    """Write planned asset copies on the I/O thread pool and record them.
+
+    Copies with identical contents (e.g. a reference document shared by
+    several skills) are read from their source once: in copy mode the first
+    destination is written from the source and the others are then copied
+    from it, which the copy fast paths turn into shared extents on
+    copy-on-write filesystems. In link mode the content-addressed store
+    already holds a single copy.
+
+    Args:
+        copies: Planned copies; those already CURRENT are only recorded.
+        manifest: Install manifest of the target project.
+        env_name: Environment being installed (recorded in the manifest).
+        console: Rich console for output.
+        kind: Asset kind for messages ("skill", "subagent").
+        copy_mode: How the files are placed (copy, or link to the asset store).
+
+    Returns:
+        Number of files written.
+    """
+    to_write = []
+    for copy in copies:
+        if copy.status is InstallStatus.CURRENT:
+            manifest.record(
+                copy.output_path,
+                source=copy.source_file,
+                source_sha256=copy.sha256,
+                sha256=copy.sha256,
+                environment=env_name,
+                mode=copy_mode.value,
+            )
+        else:
+            to_write.append(copy)
+
+    originals: list[int] = []
+    duplicates: list[int] = []
+    first: dict[str, int] = {}
+    for index, copy in enumerate(to_write):
+        if copy_mode is CopyMode.COPY and copy.sha256 in first:
+            duplicates.append(index)
+        else:
+            first.setdefault(copy.sha256, index)
+            originals.append(index)
+
+    results: dict[int, tuple[os.stat_result, CopyMode] | OSError] = {}
+
+    def install(indexes: list[int], source_of: Callable[[_AssetCopy], Path]) -> None:
+        jobs = [
+            (source_of(to_write[i]), to_write[i].output_path, to_write[i].sha256, copy_mode)
+            for i in indexes
+        ]
+        results.update(zip(indexes, io_map(_install_file, jobs), strict=True))
+
+    def written_copy(copy: _AssetCopy) -> Path:
+        original = first[copy.sha256]
+        if isinstance(results[original], OSError):
+            return copy.source_file
+        return to_write[original].output_path
+
+    install(originals, lambda copy: copy.source_file)
+    install(duplicates, written_copy)
+
+    written = 0
+    for index, copy in enumerate(to_write):
+        result = results[index]
+        if isinstance(result, OSError):
+            console.print(f"  [red]❌ Failed to install {kind} {copy.name}:[/red] {result}")
+            continue
+        stat, placed = result
+        manifest.record(
+            copy.output_path,
+            source=copy.source_file,
+            source_sha256=copy.sha256,
+            sha256=copy.sha256,
+            environment=env_name,
+            stat=stat,
+            mode=placed.value,
+        )
+        console.print(f"  [green]✓[/green] Installed {copy.name}")
+        count("bytes_written", stat.st_size)
+        written += 1
+    return written
+
+
+def _skill_resource_files(skill: "Skill") -> list[tuple[Path, Path]]:
+    """List the files of a skill's resource directories.
+
+    Hidden files and ``__pycache__`` directories are left out.
+
+    Args:
+        skill: Parsed skill (its resource directories are already resolved).
+
+    Returns:
+        (source file, path relative to the skill directory) pairs, sorted.
+    """
+    files: list[tuple[Path, Path]] = []
+    for entry in [*(skill.scripts or []), *(skill.references or []), *(skill.assets or [])]:
+        candidates = sorted(entry.rglob("*")) if entry.is_dir() else [entry]
+        for source in candidates:
+            relative = source.relative_to(skill.path)
+            if source.is_file() and not any(
+                part.startswith(".") or part == "__pycache__" for part in relative.parts
+            ):
+                files.append((source, relative))
+    return files
+
+
 def install_skills_by_environment(
     env_name: str,
     target: Path,
@@ -1655,22 +2457,32 @@ def install_skills_by_environment(
     *,
     force: bool = False,
     dry_run: bool = False,
+    manifest: InstallManifest | None = None,
+    parsed: ParsedAssets | None = None,
+    copy_mode: CopyMode = CopyMode.COPY,
 ) -> int:
     """Install bundled skills for a specific environment.
 
     Skills are only supported in Claude Code currently. For other environments,
-    this function skips silently and returns 0.
+    this function skips silently and returns 0. Skills installed as a directory
+    (``<name>/SKILL.md``) get their scripts/, references/ and assets/ trees
+    too; those files are hashed and copied on the I/O thread pool. Files whose
+    installed copy is already up to date are not rewritten.
 
     Args:
         env_name: Name of the environment to install for (e.g., 'claude').
         target: Target project directory to install in.
         skills_dir: Source directory containing skill directories.
         console: Rich console for output.
-        force: If True, overwrite existing files without prompting.
+        force: If True, overwrite edited files without prompting.
         dry_run: If True, preview changes without writing files.
+        manifest: Install manifest of the target; loaded from target if omitted.
+        parsed: Parsed sources shared across environments, if installing several.
+        copy_mode: How verbatim files are placed (copy, or link to the asset store).
 
     Returns:
-        Number of skills installed, or 0 if environment doesn't support skills.
+        Number of skills installed or already up to date, or 0 if environment
+        doesn't support skills.
     """
     from dot_work.skills import SKILL_PARSER
 
@@ -1679,64 +2491,128 @@ def install_skills_by_environment(
         return 0
 
     # Find all skill directories (containing SKILL.md)
-    skill_dirs = [d for d in skills_dir.iterdir() if d.is_dir() and (d / "SKILL.md").exists()]
+    category = skills_dir.name
+    with span("discover", category):
+        skill_dirs = [d for d in skills_dir.iterdir() if d.is_dir() and (d / "SKILL.md").exists()]
 
     if not skill_dirs:
         console.print("[dim]No bundled skills found[/dim]")
         return 0
+    count("files", len(skill_dirs), category)
 
     console.print("\n[bold cyan]Skills[/bold cyan]")
+    if manifest is None:
+        manifest = InstallManifest.load(target)
+    if parsed is None:
+        parsed = ParsedAssets()
     installed_count = 0
+    copies: list[_AssetCopy] = []
+    resources: list[tuple[str, Path, Path]] = []
+    resource_copies: list[_AssetCopy] = []
 
-    for skill_dir in skill_dirs:
-        try:
-            skill = SKILL_PARSER.parse(skill_dir)
-
-            # Check if skill has environment config for this environment
-            if skill.meta.environments is None or env_name not in skill.meta.environments:
-                continue
-
-            env_config = skill.meta.environments[env_name]
-
-            # Determine output path from frontmatter target
-            if env_config.target.startswith("/"):
-                output_dir = target / env_config.target.lstrip("/")
-            elif env_config.target.startswith("./"):
-                output_dir = target / env_config.target[2:]
-            else:
-                output_dir = target / env_config.target
-
-            # Determine filename
-            if env_config.filename:
-                skill_filename = env_config.filename
-            elif env_config.filename_suffix:
-                skill_filename = skill.meta.name + env_config.filename_suffix
-            else:
-                skill_filename = skill.meta.name + "/SKILL.md"
-
-            output_path = output_dir / skill_filename
+    with span("scan", category):
+        for skill_dir in skill_dirs:
+            try:
+                skill = parsed.get("skill", skill_dir, SKILL_PARSER.parse)
+
+                # Check if skill has environment config for this environment
+                if skill.meta.environments is None or env_name not in skill.meta.environments:
+                    continue
+
+                env_config = skill.meta.environments[env_name]
+
+                # Determine output path from frontmatter target
+                if env_config.target.startswith("/"):
+                    output_dir = target / env_config.target.lstrip("/")
+                elif env_config.target.startswith("./"):
+                    output_dir = target / env_config.target[2:]
+                else:
+                    output_dir = target / env_config.target
+
+                # Determine filename
+                if env_config.filename:
+                    skill_filename = env_config.filename
+                elif env_config.filename_suffix:
+                    skill_filename = skill.meta.name + env_config.filename_suffix
+                else:
+                    skill_filename = skill.meta.name + "/SKILL.md"
+
+                output_path = output_dir / skill_filename
+
+                copy = _plan_asset_copy(
+                    skill.meta.name,
+                    skill_dir / "SKILL.md",
+                    output_path,
+                    manifest,
+                    console,
+                    force=force,
+                    dry_run=dry_run,
+                    copy_mode=copy_mode,
+                )
+                if copy is None:
+                    console.print(f"  [dim]⏭[/dim] Skipped {skill.meta.name}")
+                    count("skipped")
+                else:
+                    copies.append(copy)
+
+                # Resources keep their layout next to SKILL.md
+                if output_path.name == "SKILL.md":
+                    resources.extend(
+                        (f"{skill.meta.name}/{relative}", source, output_path.parent / relative)
+                        for source, relative in _skill_resource_files(skill)
+                    )
 
-            # Create parent directory
-            if not dry_run:
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+            except Exception as e:
+                console.print(f"  [red]❌ Failed to install skill {skill_dir.name}:[/red] {e}")
+                count("errors")
 
-            # Write or preview
-            if dry_run:
-                action = "[CREATE]" if not output_path.exists() else "[OVERWRITE]"
-                console.print(f"  [yellow][DRY-RUN][/yellow] [dim]{action}[/dim] {output_path}")
+        scans = io_map(
+            _scan_asset_file,
+            [(source, dest, manifest, copy_mode, parsed) for _, source, dest in resources],
+        )
+        for (name, source, dest), scanned in zip(resources, scans, strict=True):
+            if isinstance(scanned, OSError):
+                console.print(f"  [red]❌ Failed to install skill resource {name}:[/red] {scanned}")
+                count("errors")
+                continue
+            copy = _plan_asset_copy(
+                name,
+                source,
+                dest,
+                manifest,
+                console,
+                force=force,
+                dry_run=dry_run,
+                copy_mode=copy_mode,
+                scanned=scanned,
+            )
+            if copy is None:
+                console.print(f"  [dim]⏭[/dim] Skipped {name}")
+                count("skipped")
             else:
-                skill_file = skill_dir / "SKILL.md"
-                output_path.write_text(skill_file.read_text(encoding="utf-8"), encoding="utf-8")
-                console.print(f"  [green]✓[/green] Installed {skill.meta.name}")
-                installed_count += 1
-
-        except Exception as e:
-            console.print(f"  [red]❌ Failed to install skill {skill_dir.name}:[/red] {e}")
+                resource_copies.append(copy)
 
+    up_to_date_count = sum(copy.status is InstallStatus.CURRENT for copy in copies)
+    count("up_to_date", up_to_date_count, category)
+    resource_count = 0
+    if not dry_run:
+        with span("write", category):
+            installed_count = _write_asset_copies(
+                copies, manifest, env_name, console, "skill", copy_mode
+            )
+            resource_count = _write_asset_copies(
+                resource_copies, manifest, env_name, console, "skill resource", copy_mode
+            )
+        count("written", installed_count + resource_count, category)
+        manifest.save()
     if installed_count > 0:
         console.print(f"[cyan]📁 Installed {installed_count} skill(s)[/cyan]")
+    if resource_count > 0:
+        console.print(f"[cyan]📁 Installed {resource_count} skill resource file(s)[/cyan]")
+    if up_to_date_count > 0:
+        console.print(f"[dim]{up_to_date_count} skill(s) already up to date[/dim]")
 
-    return installed_count
+    return installed_count + up_to_date_count
 
 
 def install_subagents_by_environment(
@@ -1747,78 +2623,111 @@ def install_subagents_by_environment(
     *,
     force: bool = False,
     dry_run: bool = False,
+    manifest: InstallManifest | None = None,
+    parsed: ParsedAssets | None = None,
+    copy_mode: CopyMode = CopyMode.COPY,
 ) -> int:
     """Install bundled subagents for a specific environment.
 
     For environments that support native agents (claude, opencode, copilot),
     installs as native agent files. For other environments, treats subagents
-    as prompts and installs them using the prompt installer.
+    as prompts and installs them using the prompt installer. Subagents whose
+    installed copy is already up to date are not rewritten.
 
     Args:
         env_name: Name of the environment to install for.
         target: Target project directory to install in.
         subagents_dir: Source directory containing subagent .md files.
         console: Rich console for output.
-        force: If True, overwrite existing files without prompting.
+        force: If True, overwrite edited files without prompting.
         dry_run: If True, preview changes without writing files.
+        manifest: Install manifest of the target; loaded from target if omitted.
+        parsed: Parsed sources shared across environments, if installing several.
+        copy_mode: How verbatim files are placed (copy, or link to the asset store).
 
     Returns:
-        Number of subagents installed.
+        Number of subagents installed or already up to date.
     """
     from dot_work.subagents import SUBAGENT_PARSER
 
     # Find all subagent files
-    subagent_files = list(subagents_dir.glob("*.md"))
+    category = subagents_dir.name
+    with span("discover", category):
+        subagent_files = list(subagents_dir.glob("*.md"))
 
     if not subagent_files:
         console.print("[dim]No bundled subagents found[/dim]")
         return 0
+    count("files", len(subagent_files), category)
 
     console.print("\n[bold cyan]Subagents[/bold cyan]")
+    if manifest is None:
+        manifest = InstallManifest.load(target)
+    if parsed is None:
+        parsed = ParsedAssets()
     installed_count = 0
+    copies: list[_AssetCopy] = []
 
-    for subagent_file in subagent_files:
-        try:
-            subagent = SUBAGENT_PARSER.parse(subagent_file)
-
-            # Check if subagent has environment config for this environment
-            if subagent.environments is None or env_name not in subagent.environments:
-                continue
-
-            env_config = subagent.environments[env_name]
-
-            # Determine output path from frontmatter target
-            if env_config.target.startswith("/"):
-                output_dir = target / env_config.target.lstrip("/")
-            elif env_config.target.startswith("./"):
-                output_dir = target / env_config.target[2:]
-            else:
-                output_dir = target / env_config.target
-
-            # Use original filename for subagents (SubagentEnvironmentConfig doesn't have filename/filename_suffix)
-            output_filename = subagent_file.name
-            output_path = output_dir / output_filename
-
-            # Create parent directory
-            if not dry_run:
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write or preview
-            if dry_run:
-                action = "[CREATE]" if not output_path.exists() else "[OVERWRITE]"
-                console.print(f"  [yellow][DRY-RUN][/yellow] [dim]{action}[/dim] {output_path}")
-            else:
-                output_path.write_text(subagent_file.read_text(encoding="utf-8"), encoding="utf-8")
-                console.print(f"  [green]✓[/green] Installed {subagent.meta.name}")
-                installed_count += 1
+    with span("scan", category):
+        for subagent_file in subagent_files:
+            try:
+                subagent = parsed.get("subagent", subagent_file, SUBAGENT_PARSER.parse)
+
+                # Check if subagent has environment config for this environment
+                if subagent.environments is None or env_name not in subagent.environments:
+                    continue
+
+                env_config = subagent.environments[env_name]
+
+                # Determine output path from frontmatter target
+                if env_config.target.startswith("/"):
+                    output_dir = target / env_config.target.lstrip("/")
+                elif env_config.target.startswith("./"):
+                    output_dir = target / env_config.target[2:]
+                else:
+                    output_dir = target / env_config.target
+
+                # Use original filename for subagents (SubagentEnvironmentConfig doesn't have filename/filename_suffix)
+                output_filename = subagent_file.name
+                output_path = output_dir / output_filename
+
+                copy = _plan_asset_copy(
+                    subagent.meta.name,
+                    subagent_file,
+                    output_path,
+                    manifest,
+                    console,
+                    force=force,
+                    dry_run=dry_run,
+                    copy_mode=copy_mode,
+                )
+                if copy is None:
+                    console.print(f"  [dim]⏭[/dim] Skipped {subagent.meta.name}")
+                    count("skipped")
+                else:
+                    copies.append(copy)
 
-        except Exception as e:
-            console.print(f"  [red]❌ Failed to install subagent {subagent_file.name}:[/red] {e}")
+            except Exception as e:
+                console.print(
+                    f"  [red]❌ Failed to install subagent {subagent_file.name}:[/red] {e}"
+                )
+                count("errors")
 
+    up_to_date_count = sum(copy.status is InstallStatus.CURRENT for copy in copies)
+    count("up_to_date", up_to_date_count, category)
+    if not dry_run:
+        with span("write", category):
+            installed_count = _write_asset_copies(
+                copies, manifest, env_name, console, "subagent", copy_mode
+            )
+        count("written", installed_count, category)
+        manifest.save()
     if installed_count > 0:
         console.print(f"[cyan]📁 Installed {installed_count} subagent(s)[/cyan]")
+    if up_to_date_count > 0:
+        console.print(f"[dim]{up_to_date_count} subagent(s) already up to date[/dim]")
 
-    return installed_count
+    return installed_count + up_to_date_count
 
 
 # ============================================================================
@@ -1882,11 +2791,17 @@ def install_all_assets_by_environment(
     *,
     force: bool = False,
     dry_run: bool = False,
+    manifest: InstallManifest | None = None,
+    parsed: ParsedAssets | None = None,
+    copy_mode: CopyMode = CopyMode.COPY,
+    categories: Collection[str] | None = None,
 ) -> dict[str, int]:
     """Install all asset categories for a specific environment.
 
     Auto-discovers asset categories by scanning for global.yml files.
     New categories are automatically picked up without code changes.
+    Categories are installed concurrently on the I/O thread pool; console
+    output (and any overwrite prompt) appears in category order.
 
     Args:
         env_name: Environment to install for (e.g., 'claude').
@@ -1895,61 +2810,93 @@ def install_all_assets_by_environment(
         console: Rich console for output.
         force: Overwrite existing files.
         dry_run: Preview changes without writing.
+        manifest: Install manifest of the target; loaded from target if omitted.
+        parsed: Parsed sources shared across environments, if installing several.
+        copy_mode: How verbatim files are placed (copy, or link to the asset store).
+        categories: Only install these categories (default: all).
 
     Returns:
         Dict mapping category name to installed count.
     """
-    results: dict[str, int] = {}
+    if manifest is None:
+        manifest = InstallManifest.load(target)
+    if parsed is None:
+        parsed = ParsedAssets()
 
     # Auto-discover all asset categories (directories with global.yml)
-    categories = discover_asset_categories(assets_dir)
-
-    for category_name, category_dir in categories:
-        # Skip prompts (already handled separately for backward compat)
-        if category_name == "prompts":
-            continue
-
+    # Skip prompts (already handled separately for backward compat)
+    with span("discover", GLOBAL_CATEGORY):
+        selected = [
+            (category_name, category_dir)
+            for category_name, category_dir in discover_asset_categories(assets_dir)
+            if category_name != "prompts" and (categories is None or category_name in categories)
+        ]
+
+    def install_category(category_name: str, category_dir: Path, console: Console) -> int:
         try:
             console.print(f"\n[bold cyan]Installing {category_name}...[/bold cyan]")
 
             # Use existing specialized installer for skills
             if category_name == "skills":
-                count = install_skills_by_environment(
-                    env_name, target, category_dir, console, force=force, dry_run=dry_run
+                installed = install_skills_by_environment(
+                    env_name,
+                    target,
+                    category_dir,
+                    console,
+                    force=force,
+                    dry_run=dry_run,
+                    manifest=manifest,
+                    parsed=parsed,
+                    copy_mode=copy_mode,
                 )
             # Use existing specialized installer for subagents
             elif category_name == "subagents":
-                count = install_subagents_by_environment(
-                    env_name, target, category_dir, console, force=force, dry_run=dry_run
+                installed = install_subagents_by_environment(
+                    env_name,
+                    target,
+                    category_dir,
+                    console,
+                    force=force,
+                    dry_run=dry_run,
+                    manifest=manifest,
+                    parsed=parsed,
+                    copy_mode=copy_mode,
                 )
             # Use canonical installer for all other categories (hooks, templates, etc.)
             else:
                 try:
-                    install_canonical_prompts_by_environment(
-                        env_name, target, category_dir, console, force=force, dry_run=dry_run
-                    )
-                    # Count installed files by checking which had this environment
-                    from dot_work.prompts.canonical import CANONICAL_PARSER
-
-                    source_files = list(category_dir.glob("*.md"))
-                    count = sum(
-                        1
-                        for f in source_files
-                        if env_name in CANONICAL_PARSER.parse(f).environments
+                    plan = install_canonical_prompts_by_environment(
+                        env_name,
+                        target,
+                        category_dir,
+                        console,
+                        force=force,
+                        dry_run=dry_run,
+                        manifest=manifest,
+                        parsed=parsed,
+                        copy_mode=copy_mode,
                     )
+                    # Count files that support this environment (from the executed plan)
+                    installed = plan.planned_count
                 except ValueError as e:
                     # No files for this environment - not an error
                     if "not found in any" in str(e):
-                        count = 0
+                        installed = 0
                     else:
                         raise
 
-            results[category_name] = count
-            if count > 0:
-                console.print(f"  [green]✓[/green] {category_name}: {count} installed")
+            if installed > 0:
+                console.print(f"  [green]✓[/green] {category_name}: {installed} installed")
+            return installed
 
         except Exception as e:
             console.print(f"  [yellow]⚠[/yellow] Failed to install {category_name}: {e}")
-            results[category_name] = 0
+            return 0
+
+    # Categories install concurrently; their output is printed in category order
+    counts = run_ordered(
+        console, [partial(install_category, name, path) for name, path in selected]
+    )
+    results = {name: installed for (name, _), installed in zip(selected, counts, strict=True)}
 
     return results
@@ -8,6 +8,7 @@ import re
 from pathlib import Path
 
 from dot_work.languages.base import BuildResult, LanguageAdapter, TestResult
+from dot_work.utils.fingerprint import project_fingerprint
 
 
 class DotNetAdapter(LanguageAdapter):
@@ -26,17 +27,28 @@ class DotNetAdapter(LanguageAdapter):
         Returns:
             True if .NET project markers are found.
         """
+        fingerprint = project_fingerprint(project_path)
+
         # Check for solution file
-        if list(project_path.glob("*.sln")):
+        if fingerprint.glob("*.sln"):
             return True
 
-        # Check for project files
+        # Check for project files, at the top level first. The recursive search
+        # is remembered for this process only: the fingerprint does not track
+        # changes below the root.
         project_patterns = ["*.csproj", "*.fsproj", "*.vbproj"]
-        for pattern in project_patterns:
-            if list(project_path.rglob(pattern)):
-                return True
-
-        return False
+        if any(fingerprint.glob(pattern) for pattern in project_patterns):
+            return True
+        return bool(
+            fingerprint.detect(
+                "dotnet_nested_project",
+                lambda: any(
+                    next(project_path.rglob(pattern), None) is not None
+                    for pattern in project_patterns
+                ),
+                persist=False,
+            )
+        )
 
     def get_build_command(self, project_path: Path) -> list[str]:
         """Get the command to build the project.
@@ -48,9 +60,9 @@ class DotNetAdapter(LanguageAdapter):
             Command to run dotnet build.
         """
         # Prefer solution file if available
-        sln_files = list(project_path.glob("*.sln"))
+        sln_files = project_fingerprint(project_path).glob("*.sln")
         if sln_files:
-            return ["dotnet", "build", str(sln_files[0])]
+            return ["dotnet", "build", str(project_path / sln_files[0])]
 
         # Fallback to dotnet build without specific target
         return ["dotnet", "build"]
@@ -8,6 +8,7 @@ import re
 from pathlib import Path
 
 from dot_work.languages.base import BuildResult, LanguageAdapter, TestResult
+from dot_work.utils.fingerprint import project_fingerprint
 
 
 class PythonAdapter(LanguageAdapter):
@@ -34,7 +35,8 @@ class PythonAdapter(LanguageAdapter):
             "Pipfile",
             "poetry.lock",
         ]
-        return any((project_path / marker).exists() for marker in markers)
+        fingerprint = project_fingerprint(project_path)
+        return any(fingerprint.exists(marker) for marker in markers)
 
     def get_build_command(self, project_path: Path) -> list[str]:
         """Get the command to build the project.
@@ -6,8 +6,10 @@ LanguageAdapter interface, handling TS/JS project detection, building, testing,
 
 import re
 from pathlib import Path
+from typing import Any
 
 from dot_work.languages.base import BuildResult, LanguageAdapter, TestResult
+from dot_work.utils.fingerprint import project_fingerprint
 
 
 class TypeScriptAdapter(LanguageAdapter):
@@ -31,7 +33,8 @@ class TypeScriptAdapter(LanguageAdapter):
             "tsconfig.json",
             "jsconfig.json",
         ]
-        return any((project_path / marker).exists() for marker in markers)
+        fingerprint = project_fingerprint(project_path)
+        return any(fingerprint.exists(marker) for marker in markers)
 
     def get_build_command(self, project_path: Path) -> list[str]:
         """Get the command to build the project.
@@ -89,28 +92,18 @@ class TypeScriptAdapter(LanguageAdapter):
         """
         # Common lint script names
         lint_scripts = ["lint", "eslint"]
-        package_json = project_path / "package.json"
-
-        if package_json.exists():
-            import json
-
-            try:
-                with open(package_json) as f:
-                    data = json.load(f)
-                    scripts = data.get("scripts", {})
-                    for script_name in lint_scripts:
-                        if script_name in scripts:
-                            package_manager = self._detect_package_manager(project_path)
-                            if package_manager == "yarn":
-                                return ["yarn", script_name]
-                            elif package_manager == "pnpm":
-                                return ["pnpm", "run", script_name]
-                            elif package_manager == "bun":
-                                return ["bun", "run", script_name]
-                            else:
-                                return ["npm", "run", script_name]
-            except (OSError, json.JSONDecodeError):
-                pass
+        scripts = self._package_scripts(project_path)
+        for script_name in lint_scripts:
+            if script_name in scripts:
+                package_manager = self._detect_package_manager(project_path)
+                if package_manager == "yarn":
+                    return ["yarn", script_name]
+                elif package_manager == "pnpm":
+                    return ["pnpm", "run", script_name]
+                elif package_manager == "bun":
+                    return ["bun", "run", script_name]
+                else:
+                    return ["npm", "run", script_name]
 
         # Fallback to direct eslint
         return ["npx", "eslint", "."]
@@ -127,7 +120,7 @@ class TypeScriptAdapter(LanguageAdapter):
             Command to run tsc, or empty list for pure JS projects.
         """
         # Check if this is a TypeScript project
-        if (project_path / "tsconfig.json").exists():
+        if project_fingerprint(project_path).exists("tsconfig.json"):
             return ["npx", "tsc", "--noEmit"]
         return []
 
@@ -141,26 +134,16 @@ class TypeScriptAdapter(LanguageAdapter):
             Command to check formatting with prettier.
         """
         # Check for format script in package.json
-        package_json = project_path / "package.json"
-        if package_json.exists():
-            import json
-
-            try:
-                with open(package_json) as f:
-                    data = json.load(f)
-                    scripts = data.get("scripts", {})
-                    if "format:check" in scripts:
-                        package_manager = self._detect_package_manager(project_path)
-                        if package_manager == "yarn":
-                            return ["yarn", "format:check"]
-                        elif package_manager == "pnpm":
-                            return ["pnpm", "run", "format:check"]
-                        elif package_manager == "bun":
-                            return ["bun", "run", "format:check"]
-                        else:
-                            return ["npm", "run", "format:check"]
-            except (OSError, json.JSONDecodeError):
-                pass
+        if "format:check" in self._package_scripts(project_path):
+            package_manager = self._detect_package_manager(project_path)
+            if package_manager == "yarn":
+                return ["yarn", "format:check"]
+            elif package_manager == "pnpm":
+                return ["pnpm", "run", "format:check"]
+            elif package_manager == "bun":
+                return ["bun", "run", "format:check"]
+            else:
+                return ["npm", "run", "format:check"]
 
         # Fallback to direct prettier
         return ["npx", "prettier", "--check", "."]
@@ -175,30 +158,33 @@ class TypeScriptAdapter(LanguageAdapter):
             Command to format code with prettier.
         """
         # Check for format script in package.json
-        package_json = project_path / "package.json"
-        if package_json.exists():
-            import json
-
-            try:
-                with open(package_json) as f:
-                    data = json.load(f)
-                    scripts = data.get("scripts", {})
-                    if "format" in scripts:
-                        package_manager = self._detect_package_manager(project_path)
-                        if package_manager == "yarn":
-                            return ["yarn", "format"]
-                        elif package_manager == "pnpm":
-                            return ["pnpm", "run", "format"]
-                        elif package_manager == "bun":
-                            return ["bun", "run", "format"]
-                        else:
-                            return ["npm", "run", "format"]
-            except (OSError, json.JSONDecodeError):
-                pass
+        if "format" in self._package_scripts(project_path):
+            package_manager = self._detect_package_manager(project_path)
+            if package_manager == "yarn":
+                return ["yarn", "format"]
+            elif package_manager == "pnpm":
+                return ["pnpm", "run", "format"]
+            elif package_manager == "bun":
+                return ["bun", "run", "format"]
+            else:
+                return ["npm", "run", "format"]
 
         # Fallback to direct prettier
         return ["npx", "prettier", "--write", "."]
 
+    def _package_scripts(self, project_path: Path) -> dict[str, Any]:
+        """Scripts defined in package.json (empty if missing or unreadable).
+
+        Args:
+            project_path: Path to the project directory.
+
+        Returns:
+            The "scripts" mapping of package.json.
+        """
+        data = project_fingerprint(project_path).json("package.json")
+        scripts = data.get("scripts") if isinstance(data, dict) else None
+        return scripts if isinstance(scripts, dict) else {}
+
     def _detect_package_manager(self, project_path: Path) -> str:
         """Detect which package manager is in use.
 
@@ -216,8 +202,9 @@ class TypeScriptAdapter(LanguageAdapter):
             ("package-lock.json", "npm"),
         ]
 
+        fingerprint = project_fingerprint(project_path)
         for lockfile, manager in lockfiles:
-            if (project_path / lockfile).exists():
+            if fingerprint.exists(lockfile):
                 return manager
 
         # Default to npm
@@ -12,14 +12,28 @@ Example:
     And in my_package/__init__.py:
         CLI_GROUP = "my-command"
         app = typer.Typer()
+
+Discovering a plugin's CLI_GROUP and version means importing it, so the
+metadata of all plugins is cached as JSON in ``plugins.json`` under the cache
+root (see dot_work.utils.fileio.cache_root_dir). The cache is keyed by the
+plugin entry points and the names and versions of the distributions that
+provide them, so installing, removing or upgrading a plugin refreshes it.
+Plugins are registered lazily on the main app: a plugin module is imported
+only when its command is invoked.
 """
 
 from __future__ import annotations
 
+import json
 import logging
-from dataclasses import dataclass
-from importlib.metadata import entry_points
-from typing import TYPE_CHECKING
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from importlib.metadata import EntryPoint, entry_points
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from dot_work.utils.fileio import atomic_write_json, cache_root_dir
+from dot_work.utils.lazy_typer import LazySubcommand, add_lazy_subcommand
 
 if TYPE_CHECKING:
     import typer
@@ -29,6 +43,9 @@ logger = logging.getLogger(__name__)
 # Entry point group for dot-work plugins
 PLUGIN_ENTRY_POINT = "dot_work.plugins"
 
+# Bump when the cached plugin metadata changes shape
+PLUGIN_CACHE_VERSION = 1
+
 
 @dataclass(frozen=True)
 class DotWorkPlugin:
@@ -39,17 +56,86 @@ class DotWorkPlugin:
         module: The Python module path (e.g., "my_package")
         cli_group: The CLI command group (e.g., "db-issues") if defined
         version: Plugin version string if available
+        help: Help text of the plugin's Typer app, shown before it is imported
     """
 
     name: str
     module: str
     cli_group: str | None
     version: str | None = None
+    help: str | None = None
+
+    @property
+    def command_name(self) -> str:
+        """CLI command the plugin registers: its cli_group, else the entry point name."""
+        return self.cli_group if self.cli_group else self.name
+
+
+def _typer_help(plugin_app: Any) -> str | None:
+    """Help text of a Typer app, as shown in its parent's command list."""
+    info = getattr(plugin_app, "info", None)
+    if info is None:
+        return None
+    if isinstance(info.help, str):
+        return info.help
+    callback = info.callback
+    doc = getattr(callback, "__doc__", None) if callback is not None else None
+    return doc.strip() if doc else None
+
+
+def _cache_key(eps: Iterable[EntryPoint]) -> list[list[str]] | None:
+    """Entry points with their distributions' names and versions, or None if unknown."""
+    key: list[list[str]] = []
+    for ep in eps:
+        dist = getattr(ep, "dist", None)
+        if dist is None:
+            return None
+        key.append([ep.name, str(ep.value), dist.name, dist.version])
+    return sorted(key)
+
+
+def _cache_file() -> Path | None:
+    cache_root = cache_root_dir()
+    return cache_root / "plugins.json" if cache_root is not None else None
+
+
+def _load_cached_plugins(key: list[list[str]]) -> list[DotWorkPlugin] | None:
+    """Return the cached plugin metadata if it was stored for the same key."""
+    path = _cache_file()
+    if path is None:
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data["version"] != PLUGIN_CACHE_VERSION or data["key"] != key:
+            return None
+        return [DotWorkPlugin(**entry) for entry in data["plugins"]]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug("Ignoring unreadable plugin cache %s: %s", path, e)
+        return None
+
+
+def _save_cached_plugins(key: list[list[str]], plugins: list[DotWorkPlugin]) -> None:
+    """Atomically write plugin metadata to the cache, ignoring any failure."""
+    path = _cache_file()
+    if path is None:
+        return
+    data = {
+        "version": PLUGIN_CACHE_VERSION,
+        "key": key,
+        "plugins": [asdict(plugin) for plugin in plugins],
+    }
+    atomic_write_json(path, data)
 
 
 def discover_plugins() -> list[DotWorkPlugin]:
     """Discover all installed dot-work plugins via entry points.
 
+    Plugin modules are imported only when the plugin metadata cache does not
+    match the installed plugin distributions. The metadata is cached only if
+    every plugin imported and yielded its metadata.
+
     Returns:
         A list of DotWorkPlugin instances for all discovered plugins.
         Returns an empty list if no plugins are installed.
@@ -74,6 +160,15 @@ def discover_plugins() -> list[DotWorkPlugin]:
             logger.warning("Failed to discover plugins: %s", e)
             return []
 
+    key = _cache_key(eps)
+    if key is not None:
+        cached = _load_cached_plugins(key)
+        if cached is not None:
+            return cached
+
+    # Only cache a complete result: a plugin failing because of something the
+    # key does not cover (e.g. a missing dependency) must be retried next time
+    complete = True
     for ep in eps:
         try:
             module_path = str(ep.value)
@@ -81,11 +176,13 @@ def discover_plugins() -> list[DotWorkPlugin]:
             # Try to import the module to get metadata
             cli_group: str | None = None
             version: str | None = None
+            help_text: str | None = None
 
             try:
                 module = __import__(module_path, fromlist=[""])
                 cli_group = getattr(module, "CLI_GROUP", None)
                 version = getattr(module, "__version__", None)
+                help_text = _typer_help(getattr(module, "app", None))
             except ImportError as import_error:
                 logger.warning(
                     "Plugin '%s' module '%s' not importable: %s",
@@ -93,6 +190,7 @@ def discover_plugins() -> list[DotWorkPlugin]:
                     module_path,
                     import_error,
                 )
+                complete = False
                 continue
             except Exception as e:
                 logger.warning(
@@ -100,6 +198,7 @@ def discover_plugins() -> list[DotWorkPlugin]:
                     ep.name,
                     e,
                 )
+                complete = False
                 # Continue anyway - we'll create plugin without metadata
 
             plugins.append(
@@ -108,20 +207,28 @@ def discover_plugins() -> list[DotWorkPlugin]:
                     module=module_path,
                     cli_group=cli_group,
                     version=version,
+                    help=help_text,
                 )
             )
             logger.debug("Discovered plugin: %s (%s)", ep.name, module_path)
 
         except Exception as e:
             logger.warning("Failed to load plugin entry point '%s': %s", ep.name, e)
+            complete = False
             continue
 
+    if key is not None and complete:
+        _save_cached_plugins(key, plugins)
     return plugins
 
 
 def register_plugin_cli(app: typer.Typer, plugin: DotWorkPlugin) -> bool:
     """Register a plugin's CLI with the main typer application.
 
+    If the app uses a lazy group (see dot_work.utils.lazy_typer), the plugin is
+    registered from its metadata and imported only when its command is
+    invoked. Otherwise it is imported and added right away.
+
     Args:
         app: The main typer.Typer application instance.
         plugin: The DotWorkPlugin metadata.
@@ -136,6 +243,13 @@ def register_plugin_cli(app: typer.Typer, plugin: DotWorkPlugin) -> bool:
         >>> register_plugin_cli(app, plugin)
         True
     """
+    command_name = plugin.command_name
+    if add_lazy_subcommand(
+        app, command_name, LazySubcommand(f"{plugin.module}:app", plugin.help or "")
+    ):
+        logger.info("Registered plugin '%s' as command '%s' (lazy)", plugin.name, command_name)
+        return True
+
     try:
         module = __import__(plugin.module, fromlist=[""])
         plugin_app = getattr(module, "app", None)
@@ -147,9 +261,6 @@ def register_plugin_cli(app: typer.Typer, plugin: DotWorkPlugin) -> bool:
             )
             return False
 
-        # Use cli_group if defined, otherwise use entry point name
-        command_name = plugin.cli_group if plugin.cli_group else plugin.name
-
         app.add_typer(plugin_app, name=command_name)
         logger.info("Registered plugin '%s' as command '%s'", plugin.name, command_name)
         return True
@@ -26,21 +26,31 @@ Canonical prompt body content...
 
 from __future__ import annotations
 
-import copy
 import io
+import os
 import re
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from dot_work.utils.defaults import load_global_defaults, merge_defaults, thaw
+from dot_work.utils.frontmatter import BodyRef, LazyText, decode_source, read_frontmatter
+from dot_work.utils.parse_cache import cached_parse
+from dot_work.utils.profiling import span
+from dot_work.utils.yaml_loader import load_frontmatter
+
 # Path to global defaults file (now in assets/prompts/)
 GLOBAL_DEFAULTS_PATH = Path(__file__).parent.parent / "assets" / "prompts" / "global.yml"
 
 
-def _deep_merge(a: dict, b: dict) -> dict:
-    """Recursively merge dict b into dict a (a is not mutated, returns new dict).
+def _deep_merge(a: Mapping[str, Any], b: Mapping[str, Any]) -> dict:
+    """Recursively merge dict b into dict a (neither is mutated, returns new dict).
 
     Special handling for environment configs: if local (b) specifies 'filename',
     any 'filename_suffix' from global (a) is removed, and vice versa.
@@ -48,31 +58,18 @@ def _deep_merge(a: dict, b: dict) -> dict:
     Empty local dict {} does NOT override global defaults - global values are used.
     This allows prompts to explicitly declare environments section while relying
     on global defaults.
+
+    Parsers use the lazy merge_defaults() view directly; this materializes it.
     """
-    result = copy.deepcopy(a)
-    for k, v in b.items():
-        if k in result and isinstance(result[k], dict) and isinstance(v, dict):
-            # Recursively merge non-empty dicts (empty local dict preserves global defaults)
-            if v:
-                result[k] = _deep_merge(result[k], v)
-                # Handle filename/filename_suffix mutual exclusion for environment configs
-                if "filename" in v or "filename_suffix" in v:
-                    if "filename" in v:
-                        result[k].pop("filename_suffix", None)
-                    elif "filename_suffix" in v:
-                        result[k].pop("filename", None)
-        else:
-            result[k] = copy.deepcopy(v)
-    return result
+    return thaw(merge_defaults(a, b))
 
 
-def _load_global_defaults() -> dict:
-    """Load global.yml defaults if present, else return empty dict."""
-    if GLOBAL_DEFAULTS_PATH.exists():
-        with GLOBAL_DEFAULTS_PATH.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            return data.get("defaults", {}) if isinstance(data, dict) else {}
-    return {}
+def _load_global_defaults() -> Any:
+    """Load global.yml defaults if present, else return empty mapping.
+
+    The result is memoized per process and frozen; see dot_work.utils.defaults.
+    """
+    return load_global_defaults(GLOBAL_DEFAULTS_PATH)
 
 
 class CanonicalPromptError(Exception):
@@ -119,11 +116,14 @@ class ValidationError:
 
 @dataclass
 class CanonicalPrompt:
-    """Parsed canonical prompt with metadata, environments, and content."""
+    """Parsed canonical prompt with metadata, environments, and content.
+
+    When parsed from a file, ``content`` is read from disk on first access.
+    """
 
     meta: dict[str, Any]
     environments: dict[str, EnvironmentConfig]
-    content: str
+    content: LazyText = LazyText()
     source_file: Path | None = None
 
     def get_environment(self, name: str) -> EnvironmentConfig:
@@ -161,16 +161,50 @@ class CanonicalPromptParser:
     FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n?(.*)$", re.DOTALL)
 
     def parse(self, file_path: str | Path) -> CanonicalPrompt:
-        """Parse a canonical prompt file, merging with global defaults if present."""
+        """Parse a canonical prompt file, merging with global defaults if present.
+
+        Only the frontmatter is read; the prompt body is loaded from disk the
+        first time ``content`` is accessed.
+        """
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"Canonical prompt file not found: {file_path}")
-        content = file_path.read_text(encoding="utf-8").strip()
-        return self._parse_content(content, source_file=file_path)
 
-    def parse_content(self, content: str) -> CanonicalPrompt:
-        """Parse canonical prompt content directly, merging with global defaults if present."""
-        return self._parse_content(content.strip())
+        block = read_frontmatter(file_path)
+        if block is None:
+            raise ValueError("Invalid canonical prompt format: missing frontmatter markers")
+
+        return cached_parse(
+            "canonical",
+            block.head,
+            file_path,
+            GLOBAL_DEFAULTS_PATH,
+            lambda: self._parse_frontmatter(block.text, block.body, source_file=file_path),
+        )
+
+    def parse_bytes(self, data: bytes, source_file: Path | None = None) -> CanonicalPrompt:
+        """Parse raw canonical prompt bytes, using the persistent parse cache.
+
+        Args:
+            data: Raw UTF-8 file content (frontmatter and body).
+            source_file: Optional path the content was read from, recorded on the result.
+        """
+        return cached_parse(
+            "canonical",
+            data,
+            source_file,
+            GLOBAL_DEFAULTS_PATH,
+            lambda: self._parse_content(decode_source(data).strip(), source_file=source_file),
+        )
+
+    def parse_content(self, content: str, source_file: Path | None = None) -> CanonicalPrompt:
+        """Parse canonical prompt content directly, merging with global defaults if present.
+
+        Args:
+            content: Full prompt file content (frontmatter and body).
+            source_file: Optional path the content was read from, recorded on the result.
+        """
+        return self._parse_content(content.strip(), source_file=source_file)
 
     def _parse_content(self, content: str, source_file: Path | None = None) -> CanonicalPrompt:
         """Parse content string into CanonicalPrompt, merging with global defaults."""
@@ -180,48 +214,65 @@ class CanonicalPromptParser:
             raise ValueError("Invalid canonical prompt format: missing frontmatter markers")
 
         frontmatter_text, prompt_content = match.groups()
+        return self._parse_frontmatter(frontmatter_text, prompt_content, source_file=source_file)
 
+    def _parse_frontmatter(
+        self,
+        frontmatter_text: str,
+        prompt_content: str | BodyRef,
+        source_file: Path | None = None,
+    ) -> CanonicalPrompt:
+        """Parse frontmatter YAML into CanonicalPrompt, merging with global defaults.
+
+        Args:
+            frontmatter_text: YAML text between the ``---`` markers.
+            prompt_content: Prompt body, or a BodyRef to load it lazily.
+            source_file: Optional path the content was read from, recorded on the result.
+        """
         # Parse YAML frontmatter
         try:
-            frontmatter = yaml.safe_load(frontmatter_text)
+            frontmatter = load_frontmatter(frontmatter_text)
             if not isinstance(frontmatter, dict):
                 raise ValueError("Frontmatter must be a dictionary")
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in frontmatter: {e}") from e
 
-        # Load and merge global defaults (deep merge, local overrides global)
-        global_defaults = _load_global_defaults()
-        merged_frontmatter = _deep_merge(global_defaults, frontmatter)
+        # Layer over global defaults (local overrides global, merged lazily on access)
+        with span("merge"):
+            global_defaults = _load_global_defaults()
+            merged_frontmatter = merge_defaults(global_defaults, frontmatter)
 
-        # Validate frontmatter structure
-        self._validate_frontmatter(merged_frontmatter)
+            # Validate frontmatter structure
+            self._validate_frontmatter(merged_frontmatter)
 
-        # Extract and parse environments
-        meta = merged_frontmatter.get("meta", {})
-        environments_raw = merged_frontmatter.get("environments", {})
-        environments = self._parse_environments(environments_raw)
+            # Extract and parse environments
+            meta = thaw(merged_frontmatter.get("meta", {}))
+            environments_raw = merged_frontmatter.get("environments", {})
+            environments = self._parse_environments(environments_raw)
 
         return CanonicalPrompt(
             meta=meta, environments=environments, content=prompt_content, source_file=source_file
         )
 
-    def _validate_frontmatter(self, frontmatter: dict[str, Any]) -> None:
+    def _validate_frontmatter(self, frontmatter: Mapping[str, Any]) -> None:
         """Validate frontmatter structure."""
         if "environments" not in frontmatter:
             raise ValueError("Frontmatter must contain 'environments' section")
 
-        if not isinstance(frontmatter["environments"], dict):
+        if not isinstance(frontmatter["environments"], Mapping):
             raise ValueError("'environments' must be a dictionary")
 
         if not frontmatter["environments"]:
             raise ValueError("'environments' cannot be empty")
 
-    def _parse_environments(self, environments_raw: dict[str, Any]) -> dict[str, EnvironmentConfig]:
+    def _parse_environments(
+        self, environments_raw: Mapping[str, Any]
+    ) -> dict[str, EnvironmentConfig]:
         """Parse environment configurations from raw dict."""
         environments: dict[str, EnvironmentConfig] = {}
 
         for env_name, env_config in environments_raw.items():
-            if not isinstance(env_config, dict):
+            if not isinstance(env_config, Mapping):
                 raise ValueError(f"Environment '{env_name}' must be a dictionary")
 
             if "target" not in env_config:
@@ -359,6 +410,107 @@ class CanonicalPromptValidator:
         errors = self.validate(prompt, strict)
         return not any(error.severity == "error" for error in errors)
 
+    def validate_file(self, path: Path, strict: bool = False) -> FileValidationResult:
+        """Parse and validate one canonical prompt file, timing both steps.
+
+        Parse failures (missing file, bad frontmatter, invalid environments)
+        are reported as errors rather than raised.
+
+        Args:
+            path: Canonical prompt file.
+            strict: Whether to use strict validation mode.
+
+        Returns:
+            FileValidationResult for the file.
+        """
+        start = time.perf_counter()
+        try:
+            errors = self.validate(CANONICAL_PARSER.parse(path), strict)
+        except Exception as e:  # noqa: BLE001 - reported per file
+            errors = [ValidationError(0, str(e))]
+        return FileValidationResult(path, errors, time.perf_counter() - start, strict)
+
+    def validate_many(
+        self, paths: Sequence[Path], strict: bool = False, jobs: int | None = None
+    ) -> list[FileValidationResult]:
+        """Validate many canonical prompt files across a process pool.
+
+        Args:
+            paths: Canonical prompt files.
+            strict: Whether to use strict validation mode.
+            jobs: Worker processes (default: CPU count); 1 validates in-process.
+
+        Returns:
+            One FileValidationResult per path, in input order.
+        """
+        workers = min(jobs or os.cpu_count() or 1, len(paths))
+        if workers <= 1:
+            return [self.validate_file(path, strict) for path in paths]
+
+        # A few chunks per worker keeps IPC low while still balancing load
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_validate_file, paths, repeat(strict), chunksize=chunksize))
+
+
+@dataclass
+class FileValidationResult:
+    """Validation outcome and timing for one canonical prompt file."""
+
+    path: Path
+    errors: list[ValidationError]
+    duration: float  # seconds spent parsing and validating
+    strict: bool = False
+
+    @property
+    def valid(self) -> bool:
+        """Whether the file passes (in strict mode, warnings also fail)."""
+        if self.strict:
+            return not self.errors
+        return not any(error.severity == "error" for error in self.errors)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form for reports."""
+        return {
+            "path": str(self.path),
+            "valid": self.valid,
+            "duration_ms": round(self.duration * 1000, 3),
+            "errors": [e.message for e in self.errors if e.severity == "error"],
+            "warnings": [e.message for e in self.errors if e.severity == "warning"],
+        }
+
+
+def _validate_file(path: Path, strict: bool) -> FileValidationResult:
+    """Process-pool entry point for CanonicalPromptValidator.validate_many."""
+    return CANONICAL_VALIDATOR.validate_file(path, strict)
+
+
+def find_canonical_prompt_files(inputs: Iterable[str | Path]) -> list[Path]:
+    """Expand files, directories and glob patterns into canonical prompt files.
+
+    Directories are searched recursively for ``*.md`` files. Plain paths are
+    kept even if they do not exist so validation can report them.
+
+    Args:
+        inputs: File paths, directories or glob patterns (e.g. ``prompts/*.md``).
+
+    Returns:
+        De-duplicated list of files, in input order (sorted within each input).
+    """
+    files: dict[Path, None] = {}
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            matches = sorted(p for p in path.rglob("*.md") if p.is_file())
+        elif any(ch in str(item) for ch in "*?["):
+            anchor = Path(path.anchor) if path.is_absolute() else Path()
+            pattern = str(path.relative_to(anchor)) if path.is_absolute() else str(item)
+            matches = sorted(p for p in anchor.glob(pattern) if p.is_file())
+        else:
+            matches = [path]
+        files.update(dict.fromkeys(matches))
+    return list(files)
+
 
 def parse_canonical_prompt(file_path: str | Path) -> CanonicalPrompt:
     """Convenience function to parse a canonical prompt file."""
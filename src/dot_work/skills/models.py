@@ -13,6 +13,8 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 
+from dot_work.utils.frontmatter import BodyRef, LazyText
+
 
 @dataclass
 class SkillEnvironmentConfig:
@@ -137,7 +139,8 @@ class Skill:
 
     Attributes:
         meta: SkillMetadata with name, description, and other metadata.
-        content: Markdown body content (< 5000 tokens recommended).
+        content: Markdown body content (< 5000 tokens recommended). When parsed
+            from SKILL.md it is read from disk on first access.
         path: Skill directory path.
         scripts: Optional list of paths to scripts/ directory contents.
         references: Optional list of paths to references/ directory contents.
@@ -145,8 +148,8 @@ class Skill:
     """
 
     meta: SkillMetadata
-    content: str
-    path: Path
+    content: LazyText = LazyText()
+    path: Path  # type: ignore[misc]  # LazyText has no class-level default
     scripts: list[Path] | None = None
     references: list[Path] | None = None
     assets: list[Path] | None = None
@@ -157,8 +160,8 @@ class Skill:
         if not isinstance(self.path, Path):
             self.path = Path(self.path)
 
-        # Validate content is a string
-        if not isinstance(self.content, str):
+        # Validate content is a string (or a deferred body, without loading it)
+        if not isinstance(LazyText.raw(self, "content"), str | BodyRef):
             raise ValueError("Skill content must be a string")
 
         # Verify skill name matches directory name
@@ -8,8 +8,7 @@ The parser mirrors the pattern of CanonicalPromptParser for consistency.
 
 from __future__ import annotations
 
-import copy
-import re
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -17,13 +16,18 @@ from typing import Any
 import yaml
 
 from dot_work.skills.models import Skill, SkillEnvironmentConfig, SkillMetadata
+from dot_work.utils.defaults import load_global_defaults, merge_defaults, thaw
+from dot_work.utils.frontmatter import read_frontmatter
+from dot_work.utils.parse_cache import cached_parse
+from dot_work.utils.profiling import span
+from dot_work.utils.yaml_loader import load_frontmatter
 
 # Path to global defaults file (now in assets/skills/)
 GLOBAL_DEFAULTS_PATH = Path(__file__).parent.parent / "assets" / "skills" / "global.yml"
 
 
-def _deep_merge(a: dict, b: dict) -> dict:
-    """Recursively merge dict b into dict a (a is not mutated, returns new dict).
+def _deep_merge(a: Mapping[str, Any], b: Mapping[str, Any]) -> dict:
+    """Recursively merge dict b into dict a (neither is mutated, returns new dict).
 
     Special handling for environment configs: if local (b) specifies 'filename',
     any 'filename_suffix' from global (a) is removed, and vice versa.
@@ -31,31 +35,18 @@ def _deep_merge(a: dict, b: dict) -> dict:
     Empty local dict {} does NOT override global defaults - global values are used.
     This allows skills to explicitly declare environments section while relying
     on global defaults.
+
+    Parsers use the lazy merge_defaults() view directly; this materializes it.
+    """
+    return thaw(merge_defaults(a, b))
+
+
+def _load_global_defaults() -> Any:
+    """Load global.yml defaults if present, else return empty mapping.
+
+    The result is memoized per process and frozen; see dot_work.utils.defaults.
     """
-    result = copy.deepcopy(a)
-    for k, v in b.items():
-        if k in result and isinstance(result[k], dict) and isinstance(v, dict):
-            # Recursively merge non-empty dicts (empty local dict preserves global defaults)
-            if v:
-                result[k] = _deep_merge(result[k], v)
-                # Handle filename/filename_suffix mutual exclusion for environment configs
-                if "filename" in v or "filename_suffix" in v:
-                    if "filename" in v:
-                        result[k].pop("filename_suffix", None)
-                    elif "filename_suffix" in v:
-                        result[k].pop("filename", None)
-        else:
-            result[k] = copy.deepcopy(v)
-    return result
-
-
-def _load_global_defaults() -> dict:
-    """Load global.yml defaults if present, else return empty dict."""
-    if GLOBAL_DEFAULTS_PATH.exists():
-        with GLOBAL_DEFAULTS_PATH.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            return data.get("defaults", {}) if isinstance(data, dict) else {}
-    return {}
+    return load_global_defaults(GLOBAL_DEFAULTS_PATH)
 
 
 class SkillParserError(Exception):
@@ -97,8 +88,6 @@ class SkillParser:
     Skill content here in markdown format...
     """
 
-    FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n?(.*)$", re.DOTALL)
-
     def parse(self, skill_dir: str | Path) -> Skill:
         """Parse a skill directory containing SKILL.md.
 
@@ -106,7 +95,8 @@ class SkillParser:
             skill_dir: Path to the skill directory.
 
         Returns:
-            Skill object with metadata, content, and optional resources.
+            Skill object with metadata, content, and optional resources. The
+            body is read from disk the first time ``content`` is accessed.
 
         Raises:
             FileNotFoundError: If SKILL.md not found in directory.
@@ -118,13 +108,21 @@ class SkillParser:
         if not skill_file.exists():
             raise FileNotFoundError(f"SKILL.md not found in skill directory: {skill_dir}")
 
-        content = skill_file.read_text(encoding="utf-8").strip()
-        return self._parse_content(content, skill_dir=skill_dir)
+        block = read_frontmatter(skill_file)
+        if block is None:
+            raise ValueError("Invalid skill format: missing frontmatter markers")
+        return Skill(
+            meta=self._parse_metadata(block.text, skill_dir=skill_dir),
+            content=block.body,
+            path=skill_dir,
+        )
 
     def parse_metadata_only(self, skill_dir: str | Path) -> SkillMetadata:
         """Parse only frontmatter for lightweight discovery.
 
-        This is useful for scanning multiple skills without loading full content.
+        This is useful for scanning multiple skills without loading full content:
+        SKILL.md is read only up to the closing ``---``. Results are served from
+        the persistent parse cache when the frontmatter and global.yml are unchanged.
 
         Args:
             skill_dir: Path to the skill directory.
@@ -142,87 +140,46 @@ class SkillParser:
         if not skill_file.exists():
             raise FileNotFoundError(f"SKILL.md not found in skill directory: {skill_dir}")
 
-        content = skill_file.read_text(encoding="utf-8").strip()
-        return self._parse_metadata(content, skill_dir=skill_dir)
-
-    def _parse_content(self, content: str, skill_dir: Path) -> Skill:
-        """Parse content string into Skill object.
-
-        Args:
-            content: Full SKILL.md file content.
-            skill_dir: Path to the skill directory.
-
-        Returns:
-            Skill object.
-
-        Raises:
-            ValueError: If frontmatter format is invalid.
-            SkillParserError: If YAML parsing fails or validation fails.
-        """
-        # Extract frontmatter and content
-        match = self.FRONTMATTER_PATTERN.match(content)
-        if not match:
+        block = read_frontmatter(skill_file)
+        if block is None:
             raise ValueError("Invalid skill format: missing frontmatter markers")
-
-        frontmatter_text, skill_content = match.groups()
-
-        # Parse YAML frontmatter
-        try:
-            frontmatter = yaml.safe_load(frontmatter_text)
-            if not isinstance(frontmatter, dict):
-                raise ValueError("Frontmatter must be a dictionary")
-        except yaml.YAMLError as e:
-            raise SkillParserError(f"Invalid YAML in frontmatter: {e}") from e
-
-        # Load and merge global defaults (deep merge, local overrides global)
-        global_defaults = _load_global_defaults()
-        merged_frontmatter = _deep_merge(global_defaults, frontmatter)
-
-        # Extract metadata
-        metadata = self._extract_metadata(merged_frontmatter, skill_dir)
-
-        return Skill(
-            meta=metadata,
-            content=skill_content,
-            path=skill_dir,
+        return cached_parse(
+            "skill-metadata",
+            block.head,
+            skill_dir,
+            GLOBAL_DEFAULTS_PATH,
+            lambda: self._parse_metadata(block.text, skill_dir=skill_dir),
         )
 
-    def _parse_metadata(self, content: str, skill_dir: Path) -> SkillMetadata:
-        """Parse only metadata from frontmatter (lightweight discovery).
+    def _parse_metadata(self, frontmatter_text: str, skill_dir: Path) -> SkillMetadata:
+        """Parse metadata from frontmatter YAML (lightweight discovery).
 
         Args:
-            content: Full SKILL.md file content.
+            frontmatter_text: YAML text between the ``---`` markers of SKILL.md.
             skill_dir: Path to the skill directory.
 
         Returns:
             SkillMetadata object.
 
         Raises:
-            ValueError: If frontmatter format is invalid.
+            ValueError: If the frontmatter is not a dictionary.
             SkillParserError: If YAML parsing fails or validation fails.
         """
-        # Extract frontmatter (ignore content body)
-        match = self.FRONTMATTER_PATTERN.match(content)
-        if not match:
-            raise ValueError("Invalid skill format: missing frontmatter markers")
-
-        frontmatter_text = match.group(1)
-
         # Parse YAML frontmatter
         try:
-            frontmatter = yaml.safe_load(frontmatter_text)
+            frontmatter = load_frontmatter(frontmatter_text)
             if not isinstance(frontmatter, dict):
                 raise ValueError("Frontmatter must be a dictionary")
         except yaml.YAMLError as e:
             raise SkillParserError(f"Invalid YAML in frontmatter: {e}") from e
 
-        # Load and merge global defaults (deep merge, local overrides global)
-        global_defaults = _load_global_defaults()
-        merged_frontmatter = _deep_merge(global_defaults, frontmatter)
-
-        return self._extract_metadata(merged_frontmatter, skill_dir)
+        # Layer over global defaults (local overrides global, merged lazily on access)
+        with span("merge"):
+            global_defaults = _load_global_defaults()
+            merged_frontmatter = merge_defaults(global_defaults, frontmatter)
+            return self._extract_metadata(merged_frontmatter, skill_dir)
 
-    def _extract_metadata(self, frontmatter: dict[str, Any], skill_dir: Path) -> SkillMetadata:
+    def _extract_metadata(self, frontmatter: Mapping[str, Any], skill_dir: Path) -> SkillMetadata:
         """Extract and validate metadata from frontmatter dictionary.
 
         Args:
@@ -249,7 +206,7 @@ class SkillParser:
         description = frontmatter["description"]
         license_str = frontmatter.get("license")
         compatibility = frontmatter.get("compatibility")
-        metadata = frontmatter.get("metadata")
+        metadata = thaw(frontmatter.get("metadata"))
         allowed_tools = frontmatter.get("allowed_tools")
         environments = self._parse_environments(frontmatter.get("environments"), skill_dir)
 
@@ -290,13 +247,13 @@ class SkillParser:
         Raises:
             SkillParserError: If environment configuration is invalid.
         """
-        if not isinstance(environments_raw, dict):
+        if not isinstance(environments_raw, Mapping):
             return None
 
         environments: dict[str, SkillEnvironmentConfig] = {}
 
         for env_name, env_config in environments_raw.items():
-            if not isinstance(env_config, dict):
+            if not isinstance(env_config, Mapping):
                 raise SkillParserError(
                     f"Environment '{env_name}' must be a dictionary in {skill_dir / 'SKILL.md'}"
                 )
@@ -125,15 +125,29 @@ class SubagentDiscovery:
     def discover_metadata(self) -> list[SubagentMetadata]:
         """Discover lightweight metadata for native subagents.
 
-        This is faster than discover_native() as it only reads frontmatter.
+        This is faster than discover_native() as it only reads frontmatter;
+        prompt bodies are never loaded.
 
         Returns:
             List of SubagentMetadata objects.
         """
-        configs = self.discover_native()
-        return [
-            SubagentMetadata(name=config.name, description=config.description) for config in configs
-        ]
+        target_path = self.adapter.get_target_path(self.project_root)
+
+        if not target_path.exists() or not target_path.is_dir():
+            return []
+
+        metadata: list[SubagentMetadata] = []
+
+        for file_path in target_path.glob("*.md"):
+            try:
+                name, description = SUBAGENT_PARSER.parse_native_metadata(file_path)
+            except Exception as e:
+                # Skip files that fail to parse
+                logger.debug(f"Skipping unparsable file {file_path}: {e}")
+                continue
+            metadata.append(SubagentMetadata(name=name, description=description))
+
+        return metadata
 
     def load_native(self, name: str) -> SubagentConfig:
         """Load a native subagent by name.
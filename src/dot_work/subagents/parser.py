@@ -9,8 +9,8 @@ for consistency.
 
 from __future__ import annotations
 
-import copy
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -23,13 +23,18 @@ from dot_work.subagents.models import (
     SubagentEnvironmentConfig,
     SubagentMetadata,
 )
+from dot_work.utils.defaults import load_global_defaults, merge_defaults, thaw
+from dot_work.utils.frontmatter import decode_source, read_frontmatter
+from dot_work.utils.parse_cache import cached_parse
+from dot_work.utils.profiling import span
+from dot_work.utils.yaml_loader import load_frontmatter
 
 # Path to global defaults file (now in assets/subagents/)
 GLOBAL_DEFAULTS_PATH = Path(__file__).parent.parent / "assets" / "subagents" / "global.yml"
 
 
-def _deep_merge(a: dict, b: dict) -> dict:
-    """Recursively merge dict b into dict a (a is not mutated, returns new dict).
+def _deep_merge(a: Mapping[str, Any], b: Mapping[str, Any]) -> dict:
+    """Recursively merge dict b into dict a (neither is mutated, returns new dict).
 
     Special handling for environment configs: if local (b) specifies 'filename',
     any 'filename_suffix' from global (a) is removed, and vice versa.
@@ -37,31 +42,18 @@ def _deep_merge(a: dict, b: dict) -> dict:
     Empty local dict {} does NOT override global defaults - global values are used.
     This allows subagents to explicitly declare environments section while relying
     on global defaults.
+
+    Parsers use the lazy merge_defaults() view directly; this materializes it.
+    """
+    return thaw(merge_defaults(a, b))
+
+
+def _load_global_defaults() -> Any:
+    """Load global.yml defaults if present, else return empty mapping.
+
+    The result is memoized per process and frozen; see dot_work.utils.defaults.
     """
-    result = copy.deepcopy(a)
-    for k, v in b.items():
-        if k in result and isinstance(result[k], dict) and isinstance(v, dict):
-            # Recursively merge non-empty dicts (empty local dict preserves global defaults)
-            if v:
-                result[k] = _deep_merge(result[k], v)
-                # Handle filename/filename_suffix mutual exclusion for environment configs
-                if "filename" in v or "filename_suffix" in v:
-                    if "filename" in v:
-                        result[k].pop("filename_suffix", None)
-                    elif "filename_suffix" in v:
-                        result[k].pop("filename", None)
-        else:
-            result[k] = copy.deepcopy(v)
-    return result
-
-
-def _load_global_defaults() -> dict:
-    """Load global.yml defaults if present, else return empty dict."""
-    if GLOBAL_DEFAULTS_PATH.exists():
-        with GLOBAL_DEFAULTS_PATH.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-            return data.get("defaults", {}) if isinstance(data, dict) else {}
-    return {}
+    return load_global_defaults(GLOBAL_DEFAULTS_PATH)
 
 
 class SubagentParserError(Exception):
@@ -116,7 +108,7 @@ class SubagentParser:
     FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n?(.*)$", re.DOTALL)
 
     def parse(self, file_path: str | Path) -> CanonicalSubagent:
-        """Parse a canonical subagent file.
+        """Parse a canonical subagent file, using the persistent parse cache.
 
         Args:
             file_path: Path to the subagent .md file.
@@ -133,8 +125,14 @@ class SubagentParser:
         if not file_path.exists():
             raise FileNotFoundError(f"Subagent file not found: {file_path}")
 
-        content = file_path.read_text(encoding="utf-8").strip()
-        return self._parse_content(content, source_file=file_path)
+        data = file_path.read_bytes()
+        return cached_parse(
+            "subagent",
+            data,
+            file_path,
+            GLOBAL_DEFAULTS_PATH,
+            lambda: self._parse_content(decode_source(data).strip(), source_file=file_path),
+        )
 
     def parse_native(self, file_path: str | Path, environment: str) -> SubagentConfig:
         """Parse a native environment-specific subagent file.
@@ -158,6 +156,36 @@ class SubagentParser:
         content = file_path.read_text(encoding="utf-8").strip()
         return self._parse_native_content(content, environment, source_file=file_path)
 
+    def parse_native_metadata(self, file_path: str | Path) -> tuple[str, str]:
+        """Read the name and description of a native subagent file.
+
+        Only the frontmatter is read; the prompt body is never loaded.
+
+        Args:
+            file_path: Path to the native subagent file.
+
+        Returns:
+            Tuple of (name, description), resolved like parse_native().
+
+        Raises:
+            FileNotFoundError: If file not found.
+            SubagentParserError: If parsing fails or the name is missing.
+        """
+        file_path = Path(file_path)
+
+        block = read_frontmatter(file_path)
+        if block is None:
+            raise ValueError("Invalid subagent format: missing frontmatter markers")
+
+        try:
+            frontmatter = load_frontmatter(block.text)
+            if not isinstance(frontmatter, dict):
+                raise ValueError("Frontmatter must be a dictionary")
+        except yaml.YAMLError as e:
+            raise SubagentParserError(f"Invalid YAML in frontmatter: {e}") from e
+
+        return self._extract_name_description(frontmatter, file_path)
+
     def _parse_content(self, content: str, source_file: Path) -> CanonicalSubagent:
         """Parse content string into CanonicalSubagent object.
 
@@ -181,20 +209,21 @@ class SubagentParser:
 
         # Parse YAML frontmatter
         try:
-            frontmatter = yaml.safe_load(frontmatter_text)
+            frontmatter = load_frontmatter(frontmatter_text)
             if not isinstance(frontmatter, dict):
                 raise ValueError("Frontmatter must be a dictionary")
         except yaml.YAMLError as e:
             raise SubagentParserError(f"Invalid YAML in frontmatter: {e}") from e
 
-        # Load and merge global defaults (deep merge, local overrides global)
-        global_defaults = _load_global_defaults()
-        merged_frontmatter = _deep_merge(global_defaults, frontmatter)
+        # Layer over global defaults (local overrides global, merged lazily on access)
+        with span("merge"):
+            global_defaults = _load_global_defaults()
+            merged_frontmatter = merge_defaults(global_defaults, frontmatter)
 
-        # Extract metadata and config
-        meta = self._extract_metadata(merged_frontmatter, source_file)
-        config = self._extract_config(merged_frontmatter, prompt_body, source_file)
-        environments = self._extract_environments(merged_frontmatter, source_file)
+            # Extract metadata and config
+            meta = self._extract_metadata(merged_frontmatter, source_file)
+            config = self._extract_config(merged_frontmatter, prompt_body, source_file)
+            environments = self._extract_environments(merged_frontmatter, source_file)
 
         return CanonicalSubagent(
             meta=meta,
@@ -229,7 +258,7 @@ class SubagentParser:
 
         # Parse YAML frontmatter
         try:
-            frontmatter = yaml.safe_load(frontmatter_text)
+            frontmatter = load_frontmatter(frontmatter_text)
             if not isinstance(frontmatter, dict):
                 raise ValueError("Frontmatter must be a dictionary")
         except yaml.YAMLError as e:
@@ -237,7 +266,9 @@ class SubagentParser:
 
         return self._extract_config(frontmatter, prompt_body, source_file)
 
-    def _extract_metadata(self, frontmatter: dict[str, Any], source_file: Path) -> SubagentMetadata:
+    def _extract_metadata(
+        self, frontmatter: Mapping[str, Any], source_file: Path
+    ) -> SubagentMetadata:
         """Extract and validate metadata from frontmatter.
 
         Args:
@@ -252,7 +283,7 @@ class SubagentParser:
         """
         # Check for meta section
         meta_section = frontmatter.get("meta")
-        if not isinstance(meta_section, dict):
+        if not isinstance(meta_section, Mapping):
             raise SubagentParserError(f"Missing or invalid 'meta' section in {source_file}")
 
         # Check for required fields
@@ -268,7 +299,7 @@ class SubagentParser:
         return SubagentMetadata(name=name, description=description)
 
     def _extract_config(
-        self, frontmatter: dict[str, Any], prompt_body: str, source_file: Path
+        self, frontmatter: Mapping[str, Any], prompt_body: str, source_file: Path
     ) -> SubagentConfig:
         """Extract configuration from frontmatter.
 
@@ -280,18 +311,13 @@ class SubagentParser:
         Returns:
             SubagentConfig object.
         """
-        # Get name from meta or frontmatter root
-        meta_section = frontmatter.get("meta", {})
-        name = meta_section.get("name") or frontmatter.get("name")
-        if name is None:
-            raise SubagentParserError(f"Missing required field 'name' in {source_file}")
-        description = meta_section.get("description") or frontmatter.get("description", "")
+        name, description = self._extract_name_description(frontmatter, source_file)
 
         # Extract optional fields
         tools = frontmatter.get("tools")
         model = frontmatter.get("model")
         permission_mode = frontmatter.get("permissionMode") or frontmatter.get("permission_mode")
-        permissions = frontmatter.get("permissions")
+        permissions = thaw(frontmatter.get("permissions"))
 
         # OpenCode-specific
         mode = frontmatter.get("mode")
@@ -304,7 +330,7 @@ class SubagentParser:
         # GitHub Copilot-specific
         target = frontmatter.get("target")
         infer = frontmatter.get("infer")
-        mcp_servers = frontmatter.get("mcpServers") or frontmatter.get("mcp_servers")
+        mcp_servers = thaw(frontmatter.get("mcpServers") or frontmatter.get("mcp_servers"))
 
         return SubagentConfig(
             name=name,
@@ -324,8 +350,30 @@ class SubagentParser:
             source_file=source_file,
         )
 
+    def _extract_name_description(
+        self, frontmatter: Mapping[str, Any], source_file: Path
+    ) -> tuple[str, str]:
+        """Get name and description from the meta section or the frontmatter root.
+
+        Args:
+            frontmatter: Parsed YAML frontmatter dictionary.
+            source_file: Path to the source file (for error messages).
+
+        Returns:
+            Tuple of (name, description).
+
+        Raises:
+            SubagentParserError: If no name is present.
+        """
+        meta_section = frontmatter.get("meta", {})
+        name = meta_section.get("name") or frontmatter.get("name")
+        if name is None:
+            raise SubagentParserError(f"Missing required field 'name' in {source_file}")
+        description = meta_section.get("description") or frontmatter.get("description", "")
+        return name, description
+
     def _extract_environments(
-        self, frontmatter: dict[str, Any], source_file: Path
+        self, frontmatter: Mapping[str, Any], source_file: Path
     ) -> dict[str, SubagentEnvironmentConfig]:
         """Extract environment-specific configurations.
 
@@ -337,13 +385,13 @@ class SubagentParser:
             Dict of environment name to SubagentEnvironmentConfig.
         """
         env_section = frontmatter.get("environments")
-        if not isinstance(env_section, dict):
+        if not isinstance(env_section, Mapping):
             return {}
 
         environments: dict[str, SubagentEnvironmentConfig] = {}
 
         for env_name, env_config in env_section.items():
-            if not isinstance(env_config, dict):
+            if not isinstance(env_config, Mapping):
                 continue
 
             # Extract environment config
@@ -0,0 +1,178 @@
+"""Compiled-template caches for the legacy (Jinja-rendered) prompt install path.
+
+Environments without canonical frontmatter (e.g. claude, aider and amazon-q in
+combined-file mode) render every bundled prompt through Jinja on every
+install, and compiling a template costs about a hundred times more than
+rendering it. Two caches avoid recompiling:
+
+- Precompiled templates: the build compiles the bundled prompts with
+  ``Environment.compile_templates`` into ``assets/compiled_templates/<dir>/``
+  next to a ``digests.json`` of their sources. :func:`precompiled_loader`
+  serves those modules through a ``ModuleLoader``, but only for templates whose
+  source still has the recorded SHA-256 and only under the same Jinja version.
+- A ``FileSystemBytecodeCache`` under ``$XDG_CACHE_HOME/dot-work/jinja/``
+  (see :func:`bytecode_cache`) for everything else, including user-supplied
+  prompt directories. Jinja keys its entries by template name and source
+  checksum, so edited templates are recompiled automatically.
+
+Regenerate the precompiled templates with
+``python scripts/build.py --compiled-templates``; wheel builds do this
+automatically through the hatch build hook in hatch_build.py.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import shutil
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import jinja2
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+    TemplateNotFound,
+)
+
+from dot_work.utils.fileio import cache_root_dir
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+logger = logging.getLogger(__name__)
+
+# Directory (next to the template directory) holding precompiled templates
+COMPILED_DIRNAME = "compiled_templates"
+
+# Source digests written next to the compiled modules
+DIGESTS_FILENAME = "digests.json"
+
+# Bump when the compiled layout changes; older builds are ignored
+COMPILED_VERSION = 1
+
+# Options prompts are rendered with (see installer.create_jinja_env, which also
+# explains why autoescape is off). Compiled code depends on them, so the build
+# compiles with exactly these.
+TEMPLATE_ENV_OPTIONS: dict[str, Any] = {
+    "keep_trailing_newline": True,
+    "trim_blocks": False,
+    "lstrip_blocks": False,
+    "autoescape": False,
+}
+
+
+def _sha256(path: Path) -> str:
+    """Hex SHA-256 of a file's contents."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def bytecode_cache() -> FileSystemBytecodeCache | None:
+    """Return the user-level Jinja bytecode cache, or None if caching is disabled."""
+    root = cache_root_dir()
+    if root is None:
+        return None
+    directory = root / "jinja"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.debug("Jinja bytecode cache disabled, cannot create %s: %s", directory, e)
+        return None
+    return FileSystemBytecodeCache(str(directory))
+
+
+def compiled_templates_dir(templates_dir: Path) -> Path:
+    """Directory the precompiled modules of templates_dir are written to."""
+    return templates_dir.parent / COMPILED_DIRNAME / templates_dir.name
+
+
+def write_compiled_templates(templates_dir: Path) -> Path:
+    """Precompile every ``*.md`` template of a directory.
+
+    Args:
+        templates_dir: Directory of templates, e.g. assets/prompts.
+
+    Returns:
+        Directory the compiled modules and digests were written to.
+    """
+    names = sorted(path.name for path in templates_dir.glob("*.md"))
+    target = compiled_templates_dir(templates_dir)
+    shutil.rmtree(target, ignore_errors=True)
+    target.mkdir(parents=True)
+
+    jinja_env = Environment(  # noqa: S701 - markdown output, see TEMPLATE_ENV_OPTIONS
+        loader=FileSystemLoader(templates_dir), **TEMPLATE_ENV_OPTIONS
+    )
+    jinja_env.compile_templates(target, filter_func=set(names).__contains__, zip=None)
+
+    digests = {
+        "version": COMPILED_VERSION,
+        "jinja": jinja2.__version__,
+        "templates": {name: _sha256(templates_dir / name) for name in names},
+    }
+    (target / DIGESTS_FILENAME).write_text(
+        json.dumps(digests, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    return target
+
+
+class PrecompiledLoader(ModuleLoader):
+    """ModuleLoader that only serves templates whose source is unchanged.
+
+    Anything else raises TemplateNotFound, so a ChoiceLoader falls through to
+    the regular FileSystemLoader.
+    """
+
+    def __init__(self, path: Path, templates_dir: Path, digests: dict[str, str]) -> None:
+        super().__init__(path)
+        self.templates_dir = templates_dir
+        self.digests = digests
+
+    def load(
+        self,
+        environment: Environment,
+        name: str,
+        globals: MutableMapping[str, Any] | None = None,
+    ) -> Template:
+        expected = self.digests.get(name)
+        try:
+            current = _sha256(self.templates_dir / name)
+        except OSError:
+            raise TemplateNotFound(name) from None
+        if current != expected:
+            raise TemplateNotFound(name)
+        return super().load(environment, name, globals)
+
+
+def precompiled_loader(templates_dir: Path) -> PrecompiledLoader | None:
+    """Return a loader for the precompiled templates of a directory, if usable.
+
+    Args:
+        templates_dir: Directory of templates.
+
+    Returns:
+        The loader, or None if there are no precompiled templates for this
+        directory or they were built by another layout or Jinja version.
+    """
+    directory = compiled_templates_dir(templates_dir)
+    try:
+        data = json.loads((directory / DIGESTS_FILENAME).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable compiled templates in %s: %s", directory, e)
+        return None
+
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != COMPILED_VERSION
+        or data.get("jinja") != jinja2.__version__
+        or not isinstance(data.get("templates"), dict)
+    ):
+        logger.debug("Ignoring compiled templates in %s from another build", directory)
+        return None
+    return PrecompiledLoader(directory, templates_dir, data["templates"])
@@ -18,6 +18,8 @@ from typing import Any
 
 import yaml
 
+from dot_work.utils.yaml_loader import safe_load
+
 
 @dataclass
 class YAMLError:
@@ -102,7 +104,7 @@ def validate_yaml(content: str) -> YAMLValidationResult:
     warnings = _check_tabs(content)
 
     try:
-        data = yaml.safe_load(content)
+        data = safe_load(content)
         return YAMLValidationResult(valid=True, data=data, warnings=warnings)
     except yaml.YAMLError as e:
         error = YAMLError(str(e))
@@ -220,4 +222,4 @@ def parse_yaml(content: str) -> dict[str, Any] | list[Any]:
     Raises:
         yaml.YAMLError: If parsing fails.
     """
-    return yaml.safe_load(content)
+    return safe_load(content)
@@ -0,0 +1,265 @@
+"""Process-wide registry for global.yml frontmatter defaults.
+
+Canonical prompts, skills and subagents each merge their frontmatter with the
+``defaults`` section of a ``global.yml`` file. Parsers call
+:func:`load_global_defaults` on every parse, so the file is read and
+YAML-parsed once per process and then served from memory until its
+``(mtime_ns, size)`` signature changes.
+
+Cached defaults are frozen (mappings become read-only ``MappingProxyType``
+views, lists become tuples) so that a parser can never mutate the shared copy.
+Use :func:`thaw` to get a private mutable copy.
+
+:func:`merge_defaults` layers a file's own frontmatter over the frozen defaults
+without copying either side. Nested sections are merged lazily, when a caller
+first reads them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from types import MappingProxyType, NoneType
+from typing import Any
+
+from dot_work.utils.yaml_loader import safe_load
+
+# Shared empty defaults returned when a global.yml file does not exist
+EMPTY_DEFAULTS: Mapping[str, Any] = MappingProxyType({})
+
+# Keys that are mutually exclusive in environment configs
+_FILENAME_KEYS = ("filename", "filename_suffix")
+
+# Concrete mapping types produced by yaml.safe_load and freeze(); isinstance
+# against a tuple of classes is much cheaper than against the Mapping ABC
+_MAPPING_TYPES: tuple[type[Mapping[Any, Any]], ...] = (dict, MappingProxyType)
+
+# path -> ((mtime_ns, size), frozen defaults)
+_DEFAULTS_CACHE: dict[Path, tuple[tuple[int, int], Any]] = {}
+# path -> ((mtime_ns, size), content digest)
+_DIGEST_CACHE: dict[Path, tuple[tuple[int, int], str]] = {}
+_DEFAULTS_LOCK = threading.Lock()
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert a parsed YAML value into an immutable equivalent.
+
+    Args:
+        value: Value produced by ``yaml.safe_load``.
+
+    Returns:
+        The same data with dicts as read-only mappings, lists as tuples and
+        sets as frozensets. Scalars are returned unchanged.
+    """
+    if isinstance(value, _MAPPING_TYPES):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list | tuple):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively copy a (possibly frozen) value into plain mutable containers.
+
+    Args:
+        value: Frozen or plain YAML data.
+
+    Returns:
+        A deep copy using dict, list and set containers.
+    """
+    if isinstance(value, str | int | float | NoneType):
+        return value
+    if isinstance(value, list | tuple):
+        return [thaw(v) for v in value]
+    if isinstance(value, set | frozenset):
+        return set(value)
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    return value
+
+
+def load_global_defaults(path: Path) -> Any:
+    """Load the ``defaults`` section of a global.yml file, memoized per process.
+
+    The cache entry for ``path`` is reused while the file's ``mtime_ns`` and
+    ``size`` are unchanged, so editing global.yml is picked up without a restart.
+
+    Args:
+        path: Path to the global.yml file.
+
+    Returns:
+        Frozen defaults (usually a read-only mapping), or EMPTY_DEFAULTS if the
+        file does not exist or has no ``defaults`` section.
+
+    Raises:
+        yaml.YAMLError: If the file contains invalid YAML (not cached).
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return EMPTY_DEFAULTS
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _DEFAULTS_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    raw = path.read_bytes()
+    data = safe_load(raw.decode("utf-8"))
+    defaults = freeze(data.get("defaults", {}) if isinstance(data, dict) else {})
+
+    with _DEFAULTS_LOCK:
+        _DEFAULTS_CACHE[path] = (signature, defaults)
+        _DIGEST_CACHE[path] = (signature, _digest(raw))
+    return defaults
+
+
+def global_defaults_digest(path: Path) -> str:
+    """Return a content hash of a global.yml file, for keying derived caches.
+
+    Args:
+        path: Path to the global.yml file.
+
+    Unlike load_global_defaults this never parses YAML, so a warm derived
+    cache can be consulted without paying for global.yml at all.
+
+    Returns:
+        Hex digest of the file's bytes, or an empty string if it does not exist.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return ""
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _DIGEST_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    digest = _digest(path.read_bytes())
+    with _DEFAULTS_LOCK:
+        _DIGEST_CACHE[path] = (signature, digest)
+    return digest
+
+
+def _digest(raw: bytes) -> str:
+    """Hex content hash of a global.yml file."""
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def clear_global_defaults_cache() -> None:
+    """Drop all memoized global.yml defaults (mainly for tests)."""
+    with _DEFAULTS_LOCK:
+        _DEFAULTS_CACHE.clear()
+        _DIGEST_CACHE.clear()
+
+
+class LayeredDefaults(Mapping[str, Any]):
+    """Read-only view of local frontmatter layered over global defaults.
+
+    Lookups check the local layer first and fall back to the defaults. Nested
+    mappings present in both layers become child views, so only sections a
+    caller reads are merged. Non-mapping values from the defaults are thawed
+    on access, so callers never get the shared frozen containers.
+
+    Merge rules match the historical deep merge:
+
+    - Local values override defaults; non-empty nested mappings merge recursively.
+    - An empty local mapping ``{}`` keeps the default mapping for that key.
+    - In a merged nested mapping, a local ``filename`` hides ``filename_suffix``
+      and a local ``filename_suffix`` hides ``filename``.
+    - Iteration yields default keys first (in their order), then local-only keys.
+    """
+
+    __slots__ = ("_local", "_defaults", "_hidden", "_children")
+
+    def __init__(
+        self,
+        local: Mapping[str, Any],
+        defaults: Mapping[str, Any],
+        hidden: frozenset[str] = frozenset(),
+    ) -> None:
+        self._local = local
+        self._defaults = defaults
+        self._hidden = hidden
+        self._children: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._hidden:
+            raise KeyError(key)
+        if key in self._children:
+            return self._children[key]
+
+        in_defaults = key in self._defaults
+        if key in self._local:
+            value = self._local[key]
+            default = self._defaults[key] if in_defaults else None
+            if not (isinstance(value, _MAPPING_TYPES) and isinstance(default, _MAPPING_TYPES)):
+                return value
+            if value:
+                child = LayeredDefaults(value, default, _hidden_filename_keys(value))
+            else:
+                # Empty local mapping preserves the default mapping
+                child = LayeredDefaults(EMPTY_DEFAULTS, default)
+        elif in_defaults:
+            default = self._defaults[key]
+            if not isinstance(default, _MAPPING_TYPES):
+                return thaw(default)
+            child = LayeredDefaults(EMPTY_DEFAULTS, default)
+        else:
+            raise KeyError(key)
+
+        self._children[key] = child
+        return child
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._defaults:
+            if key not in self._hidden:
+                yield key
+        for key in self._local:
+            if key not in self._defaults and key not in self._hidden:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._hidden:
+            return False
+        return key in self._local or key in self._defaults
+
+    def __repr__(self) -> str:
+        return f"LayeredDefaults({thaw(self)!r})"
+
+
+def _hidden_filename_keys(local: Mapping[str, Any]) -> frozenset[str]:
+    """Keys to hide from a merged mapping given its local layer."""
+    if _FILENAME_KEYS[0] in local:
+        return frozenset({_FILENAME_KEYS[1]})
+    if _FILENAME_KEYS[1] in local:
+        return frozenset({_FILENAME_KEYS[0]})
+    return frozenset()
+
+
+def merge_defaults(defaults: Any, local: Mapping[str, Any]) -> LayeredDefaults:
+    """Layer a file's frontmatter over global defaults without copying either.
+
+    Args:
+        defaults: Frozen defaults from load_global_defaults (non-mappings are ignored).
+        local: The file's own parsed frontmatter.
+
+    Returns:
+        A read-only merged view; use thaw() to get a plain dict.
+    """
+    if not isinstance(defaults, _MAPPING_TYPES):
+        defaults = EMPTY_DEFAULTS
+    return LayeredDefaults(local, defaults)
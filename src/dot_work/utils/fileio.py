@@ -0,0 +1,80 @@
+"""File helpers shared by dot-work's on-disk caches and the install manifest.
+
+- :func:`cache_root_dir` resolves the user cache directory that every cache
+  (parse results, project fingerprints, plugin metadata, ...) lives under.
+- :func:`atomic_write` and :func:`atomic_write_json` write a file through a
+  temporary sibling that is renamed over it, so readers (including other
+  dot-work processes) never see a half-written file.
+
+Environment variables:
+    DOT_WORK_CACHE_DIR: Override the cache root directory.
+    DOT_WORK_NO_CACHE: Set to any non-empty value to disable every cache.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO, Any
+
+logger = logging.getLogger(__name__)
+
+
+def cache_root_dir() -> Path | None:
+    """Return dot-work's user cache directory, or None if caching is disabled."""
+    if os.environ.get("DOT_WORK_NO_CACHE"):
+        return None
+
+    override = os.environ.get("DOT_WORK_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "dot-work"
+
+
+def atomic_write(path: Path, write: Callable[[IO[bytes]], object]) -> None:
+    """Write a file through a temporary sibling so readers never see it half-written.
+
+    Args:
+        path: File to write; missing parent directories are created.
+        write: Writes the content to the binary file object it is given.
+
+    Raises:
+        Exception: Whatever creating, writing or renaming the file raised; the
+            temporary file is removed and path is left as it was.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_json(path: Path, data: Any, *, indent: int | None = None) -> bool:
+    """Atomically write data to path as JSON, ignoring any failure.
+
+    Args:
+        path: File to write; missing parent directories are created.
+        data: JSON-serializable value.
+        indent: Indentation passed to json.dumps (None for compact output).
+
+    Returns:
+        True if the file was written, False if the write failed (logged at debug level).
+    """
+    try:
+        text = json.dumps(data, indent=indent) + "\n"
+        atomic_write(path, lambda f: f.write(text.encode("utf-8")))
+    except Exception as e:  # noqa: BLE001
+        logger.debug("Could not write %s: %s", path, e)
+        return False
+    return True
@@ -0,0 +1,278 @@
+"""One-scan snapshot of a project directory shared by the project detectors.
+
+Environment detection (``cli.detect_environments``), project context
+detection (``installer.detect_project_context``) and language detection
+(``languages``) all ask the same questions about a project: does
+``pyproject.toml`` exist, what does ``package.json`` contain, which lockfile
+is there. A :class:`ProjectFingerprint` answers them from a single
+``os.scandir`` of the project root; manifests are read and parsed on first
+use only.
+
+Detector results are memoized on the fingerprint (:meth:`ProjectFingerprint.detect`),
+so they are reused by every command in the process, and persisted as JSON
+under ``$XDG_CACHE_HOME/dot-work/fingerprint/`` for later runs. A fingerprint
+records the stat of everything its answers depend on: the root directory
+(whose mtime changes when entries are added, removed or renamed), every
+manifest it read and the parent directory of every nested path it probed. It
+is discarded as soon as one of those changes.
+
+Environment variables:
+    DOT_WORK_CACHE_DIR: Override the cache root directory.
+    DOT_WORK_NO_CACHE: Set to any non-empty value to disable the on-disk cache.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from dot_work.utils.fileio import atomic_write_json, cache_root_dir
+
+logger = logging.getLogger(__name__)
+
+# Bump when the persisted layout changes
+FINGERPRINT_FORMAT_VERSION = 1
+
+# Modules whose detectors store results on fingerprints (relative to dot_work)
+_DETECTOR_MODULES = (
+    "cli.py",
+    "environments.py",
+    "installer.py",
+    "languages/dotnet.py",
+    "languages/python.py",
+    "languages/typescript.py",
+)
+
+# (mtime_ns, size) of a path; (-1, -1) if it does not exist
+_Stat = tuple[int, int]
+_MISSING: _Stat = (-1, -1)
+
+
+def _stat(path: Path) -> _Stat:
+    try:
+        stat = path.stat()
+    except OSError:
+        return _MISSING
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@functools.cache
+def _code_signature() -> str:
+    """Stat signature of the detector modules, so changed detectors never read old results."""
+    package_dir = Path(__file__).resolve().parent.parent
+    return ";".join(f"{module}:{_stat(package_dir / module)}" for module in _DETECTOR_MODULES)
+
+
+class ProjectFingerprint:
+    """Snapshot of a project root that detectors query instead of the filesystem.
+
+    Attributes:
+        root: Project directory.
+        entries: Names of the root's entries, mapped to whether they are directories.
+    """
+
+    def __init__(self, root: Path, entries: dict[str, bool], deps: dict[str, _Stat]) -> None:
+        self.root = root
+        self.entries = entries
+        self._deps = deps
+        self._results: dict[str, Any] = {}
+        self._persisted: set[str] = set()
+        self._texts: dict[str, str | None] = {}
+        self._json: dict[str, Any] = {}
+        self._nested: dict[str, bool] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def scan(cls, root: Path) -> ProjectFingerprint:
+        """Take a fingerprint of root with one directory scan."""
+        deps = {".": _stat(root)}
+        entries: dict[str, bool] = {}
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    try:
+                        entries[entry.name] = entry.is_dir()
+                    except OSError:
+                        entries[entry.name] = False
+        except OSError:
+            pass
+        return cls(root, entries, deps)
+
+    def is_current(self) -> bool:
+        """Whether nothing the fingerprint depends on has changed since it was taken."""
+        with self._lock:
+            deps = list(self._deps.items())
+        return all(_stat(self.root / rel) == recorded for rel, recorded in deps)
+
+    def exists(self, relpath: str) -> bool:
+        """Whether a file or directory exists, given relative to the root.
+
+        Top-level names are answered from the scan; nested paths are checked
+        once, and only if their top-level directory exists.
+        """
+        parts = Path(relpath).parts
+        if len(parts) <= 1:
+            return relpath in self.entries
+        if not self.entries.get(parts[0], False):
+            return False
+        with self._lock:
+            if relpath not in self._nested:
+                parent = os.path.join(*parts[:-1])
+                self._deps.setdefault(parent, _stat(self.root / parent))
+                self._nested[relpath] = (self.root / relpath).exists()
+            return self._nested[relpath]
+
+    def is_dir(self, name: str) -> bool:
+        """Whether a top-level entry is a directory."""
+        return self.entries.get(name, False)
+
+    def glob(self, pattern: str) -> list[str]:
+        """Sorted top-level entry names matching a glob pattern."""
+        return sorted(fnmatch.filter(self.entries, pattern))
+
+    def read_text(self, name: str) -> str | None:
+        """Contents of a top-level file, read on first use; None if it cannot be read."""
+        with self._lock:
+            if name not in self._texts:
+                text = None
+                if name in self.entries and not self.entries[name]:
+                    path = self.root / name
+                    self._deps.setdefault(name, _stat(path))
+                    try:
+                        text = path.read_text(encoding="utf-8")
+                    except (OSError, UnicodeDecodeError):
+                        pass
+                self._texts[name] = text
+            return self._texts[name]
+
+    def json(self, name: str) -> Any:
+        """Parsed contents of a top-level JSON file; None if missing or invalid."""
+        with self._lock:
+            if name not in self._json:
+                text = self.read_text(name)
+                try:
+                    self._json[name] = json.loads(text) if text is not None else None
+                except ValueError:
+                    self._json[name] = None
+            return self._json[name]
+
+    def detect(self, key: str, compute: Callable[[], Any], *, persist: bool = True) -> Any:
+        """Return a detector result, computing it only once per fingerprint.
+
+        Args:
+            key: Detector name.
+            compute: Computes the result from this fingerprint's queries.
+            persist: Also store the (JSON-serializable) result on disk for
+                later runs. Pass False for results that depend on more than
+                the fingerprint tracks, e.g. a recursive search.
+
+        Returns:
+            The detector result.
+        """
+        with self._lock:
+            if key in self._results:
+                return self._results[key]
+            result = compute()
+            self._results[key] = result
+            if persist:
+                self._persisted.add(key)
+        if persist:
+            _save(self)
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable state of the fingerprint (persisted results only)."""
+        with self._lock:
+            return {
+                "version": FINGERPRINT_FORMAT_VERSION,
+                "code": _code_signature(),
+                "root": str(self.root),
+                "entries": self.entries,
+                "deps": {rel: list(stat) for rel, stat in self._deps.items()},
+                "nested": self._nested,
+                "results": {key: self._results[key] for key in self._persisted},
+            }
+
+    @classmethod
+    def from_dict(cls, root: Path, data: dict[str, Any]) -> ProjectFingerprint | None:
+        """Rebuild a persisted fingerprint, or None if it is stale or malformed."""
+        try:
+            if (
+                data["version"] != FINGERPRINT_FORMAT_VERSION
+                or data["code"] != _code_signature()
+                or data["root"] != str(root)
+            ):
+                return None
+            deps = {rel: (int(stat[0]), int(stat[1])) for rel, stat in data["deps"].items()}
+            fingerprint = cls(root, dict(data["entries"]), deps)
+            fingerprint._nested = dict(data["nested"])
+            fingerprint._results = dict(data["results"])
+            fingerprint._persisted = set(fingerprint._results)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+        return fingerprint if fingerprint.is_current() else None
+
+
+_fingerprints: dict[Path, ProjectFingerprint] = {}
+_fingerprints_lock = threading.Lock()
+
+
+def _cache_file(root: Path) -> Path | None:
+    cache_root = cache_root_dir()
+    if cache_root is None:
+        return None
+    digest = hashlib.blake2b(str(root).encode("utf-8"), digest_size=16).hexdigest()
+    return cache_root / "fingerprint" / f"{digest}.json"
+
+
+def _load(root: Path) -> ProjectFingerprint | None:
+    path = _cache_file(root)
+    if path is None:
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable fingerprint cache %s: %s", path, e)
+        return None
+    return ProjectFingerprint.from_dict(root, data) if isinstance(data, dict) else None
+
+
+def _save(fingerprint: ProjectFingerprint) -> None:
+    """Atomically write a fingerprint to the cache, ignoring any failure."""
+    path = _cache_file(fingerprint.root)
+    if path is not None:
+        atomic_write_json(path, fingerprint.to_dict())
+
+
+def project_fingerprint(root: Path) -> ProjectFingerprint:
+    """Return a current fingerprint of a project directory.
+
+    Reuses the fingerprint taken earlier in this process, or the one persisted
+    by an earlier run, as long as nothing it depends on has changed.
+
+    Args:
+        root: Project directory.
+
+    Returns:
+        The project's fingerprint.
+    """
+    root = root.absolute()
+    with _fingerprints_lock:
+        fingerprint = _fingerprints.get(root)
+    if fingerprint is not None and fingerprint.is_current():
+        return fingerprint
+
+    fingerprint = _load(root) or ProjectFingerprint.scan(root)
+    with _fingerprints_lock:
+        _fingerprints[root] = fingerprint
+    return fingerprint
@@ -0,0 +1,148 @@
+"""Streaming YAML frontmatter reader with lazily loaded bodies.
+
+Canonical prompts, skills and subagents are markdown files that start with a
+``---`` delimited YAML block. Metadata-only operations (environment discovery,
+``skills list``, subagent listing) only need that block, so
+:func:`read_frontmatter` reads the file line by line and stops at the closing
+``---``. The body is returned as a :class:`BodyRef` (path plus byte offset)
+that is only read when someone asks for it.
+
+Dataclasses declare a lazily loaded text field with :class:`LazyText`. The
+field accepts either a string or a BodyRef and always reads back as a string.
+
+Splitting matches the parsers' historical ``FRONTMATTER_PATTERN`` regex applied
+to ``read_text().strip()``:
+
+- Leading blank lines are skipped; the first line must be ``---``.
+- The block ends at the first line that starts with ``---``.
+- The body is everything after that marker, stripped of surrounding whitespace.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+OPENING_MARKER = b"---"
+
+
+def decode_source(data: bytes) -> str:
+    """Decode raw source bytes the way Path.read_text() would (UTF-8, universal newlines)."""
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+@dataclass(frozen=True)
+class BodyRef:
+    """Deferred loader for the body of a frontmatter file.
+
+    Attributes:
+        path: File the body lives in.
+        offset: Byte offset just past the closing ``---`` marker.
+    """
+
+    path: Path
+    offset: int
+
+    def load(self) -> str:
+        """Read and return the body text (stripped, universal newlines)."""
+        with self.path.open("rb") as f:
+            f.seek(self.offset)
+            return decode_source(f.read()).strip()
+
+
+@dataclass(frozen=True)
+class FrontmatterBlock:
+    """Frontmatter read from the start of a file.
+
+    Attributes:
+        head: Raw bytes from the start of the file through the closing marker
+            line; everything the frontmatter depends on (use as a cache key).
+        text: The YAML text between the markers.
+        body: Deferred loader for the rest of the file.
+    """
+
+    head: bytes
+    text: str
+    body: BodyRef
+
+
+def read_frontmatter(path: Path) -> FrontmatterBlock | None:
+    """Read a file's frontmatter block without reading its body.
+
+    Args:
+        path: File to read.
+
+    Returns:
+        The frontmatter block, or None if the file does not start with a
+        ``---`` line or has no closing marker.
+
+    Raises:
+        OSError: If the file cannot be read.
+        UnicodeDecodeError: If the frontmatter is not valid UTF-8.
+    """
+    with path.open("rb") as f:
+        head: list[bytes] = []
+
+        line = f.readline()
+        while line and not line.strip():
+            head.append(line)
+            line = f.readline()
+        if line.strip() != OPENING_MARKER:
+            return None
+        head.append(line)
+
+        lines: list[bytes] = []
+        while True:
+            line = f.readline()
+            if not line:
+                return None
+            head.append(line)
+            if line.startswith(OPENING_MARKER):
+                break
+            lines.append(line)
+
+        offset = f.tell() - len(line) + len(OPENING_MARKER)
+
+    text = decode_source(b"".join(lines)).removesuffix("\n")
+    return FrontmatterBlock(head=b"".join(head), text=text, body=BodyRef(path, offset))
+
+
+class LazyText:
+    """Dataclass field descriptor for text that may be loaded on first access.
+
+    Assign either a string or a BodyRef; reading the attribute always returns a
+    string, loading (and memoizing) a BodyRef the first time. The field has no
+    default, so it stays a required dataclass argument.
+
+    Example:
+        @dataclass
+        class Prompt:
+            content: LazyText = LazyText()
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = f"_{name}"
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> str:
+        if obj is None:
+            # No class-level default: keeps the dataclass field required
+            raise AttributeError(self._attr[1:])
+        value = obj.__dict__[self._attr]
+        if isinstance(value, BodyRef):
+            value = value.load()
+            obj.__dict__[self._attr] = value
+        return value
+
+    def __set__(self, obj: Any, value: str | BodyRef) -> None:
+        obj.__dict__[self._attr] = value
+
+    @staticmethod
+    def is_loaded(obj: Any, name: str) -> bool:
+        """Whether the lazy field ``name`` of ``obj`` has been read from disk."""
+        return not isinstance(obj.__dict__.get(f"_{name}"), BodyRef)
+
+    @staticmethod
+    def raw(obj: Any, name: str) -> str | BodyRef:
+        """The stored value of lazy field ``name`` without loading it."""
+        return obj.__dict__[f"_{name}"]
@@ -0,0 +1,124 @@
+"""Typer groups whose subcommand groups are imported only when invoked.
+
+``app.add_typer(sub_app, name=...)`` needs ``sub_app``, so every subcommand
+module (and everything it imports) is loaded on each start of ``dot-work``,
+even for ``dot-work --help``. :func:`lazy_group` instead builds a group class
+from a static table of :class:`LazySubcommand` entries:
+
+- ``--help`` lists them with the help text from the table, without importing
+  anything.
+- Resolving one for invocation (or shell completion) imports its module and
+  replaces the entry with the real group. If the import fails, the command
+  fails with a usage error instead of a traceback.
+
+Entries can also be added after the app is created with
+:func:`add_lazy_subcommand` (used for plugins, see ``dot_work.plugins``).
+
+Keep the help text in the table in sync with the subcommand's own ``Typer``
+help; the unit tests check this.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import typer
+from typer.core import TyperCommand, TyperGroup
+
+
+@dataclass(frozen=True)
+class LazySubcommand:
+    """Static entry for a subcommand group that is imported on first use.
+
+    Attributes:
+        import_path: ``"module:attribute"`` of the subcommand's ``typer.Typer``.
+        help: Help text shown in the parent's command list.
+    """
+
+    import_path: str
+    help: str
+
+    def load(self) -> typer.Typer:
+        """Import the module and return the subcommand's Typer app."""
+        module_name, _, attribute = self.import_path.partition(":")
+        sub_app = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(sub_app, typer.Typer):
+            raise TypeError(f"{self.import_path} is not a typer.Typer instance")
+        return sub_app
+
+
+class _Placeholder(TyperCommand):
+    """Stands in for a lazy subcommand in help listings."""
+
+
+def lazy_group(subcommands: Mapping[str, LazySubcommand]) -> type[TyperGroup]:
+    """Build a TyperGroup class that adds the given subcommands lazily.
+
+    Pass the result as ``typer.Typer(cls=...)``. Subcommands registered
+    eagerly (``@app.command``, ``app.add_typer``) keep working and are listed
+    first.
+
+    Args:
+        subcommands: Lazy subcommands by name, in the order they are listed.
+
+    Returns:
+        The group class.
+    """
+
+    class LazyTyperGroup(TyperGroup):
+        """TyperGroup with subcommands imported on invocation."""
+
+        lazy_subcommands = dict(subcommands)
+
+        def list_commands(self, ctx: Any) -> list[str]:
+            names = super().list_commands(ctx)
+            return names + [name for name in self.lazy_subcommands if name not in names]
+
+        def get_command(self, ctx: Any, cmd_name: str) -> Any:
+            command = super().get_command(ctx, cmd_name)
+            if command is None and cmd_name in self.lazy_subcommands:
+                entry = self.lazy_subcommands[cmd_name]
+                command = _Placeholder(name=cmd_name, help=entry.help, callback=None)
+            return command
+
+        def resolve_command(self, ctx: Any, args: list[str]) -> Any:
+            cmd_name, command, rest = super().resolve_command(ctx, args)
+            if isinstance(command, _Placeholder) and cmd_name is not None:
+                try:
+                    command = self.load_command(cmd_name)
+                except Exception as e:  # noqa: BLE001 - any import-time failure
+                    ctx.fail(f"Could not load command '{cmd_name}': {e}")
+            return cmd_name, command, rest
+
+        def load_command(self, cmd_name: str) -> TyperGroup:
+            """Import a lazy subcommand and register it as a regular command."""
+            sub_app = self.lazy_subcommands[cmd_name].load()
+            command = typer.main.get_group(sub_app)
+            command.name = cmd_name
+            self.commands[cmd_name] = command
+            return command
+
+    return LazyTyperGroup
+
+
+def add_lazy_subcommand(app: typer.Typer, name: str, entry: LazySubcommand) -> bool:
+    """Add a lazy subcommand to an app created with a :func:`lazy_group` class.
+
+    Args:
+        app: The parent Typer app.
+        name: Subcommand name.
+        entry: Where to import the subcommand from, and its help text.
+
+    Returns:
+        True if the entry was added, False if app does not use a lazy group
+        (register the subcommand eagerly with ``app.add_typer`` instead).
+    """
+    group_class = app.info.cls
+    lazy_subcommands = getattr(group_class, "lazy_subcommands", None)
+    if lazy_subcommands is None:
+        return False
+    lazy_subcommands[name] = entry
+    return True
@@ -0,0 +1,237 @@
+"""Persistent on-disk cache for parsed canonical prompts, skills and subagents.
+
+Parsing an asset means running its YAML frontmatter through ``yaml.safe_load``
+and layering it over a ``global.yml``. Commands such as ``install`` and
+``skills list`` repeat that work for every bundled file on every invocation,
+which adds up when an agent loop calls dot-work many times.
+
+Parsed results are pickled under ``$XDG_CACHE_HOME/dot-work/parse/`` (default
+``~/.cache/dot-work/parse/``), in one generation directory per cache format
+version and parser modules' stat signature. An entry's key is a hash of:
+
+- the raw file bytes,
+- the content hash of the governing ``global.yml``,
+- the source path and the parser kind.
+
+Editing either file therefore produces a new key. Stale entries are pruned:
+only the most recently used generations are kept (a reinstall or upgrade
+starts a new one), and each kind keeps at most ``MAX_ENTRIES_PER_KIND``
+entries, dropping the oldest first.
+
+Unpickling runs code, so an entry is only loaded if it is owned by the
+current user and not writable by group or others. A cache directory shared
+with other users (e.g. through ``DOT_WORK_CACHE_DIR``) is therefore ignored
+rather than trusted.
+
+Environment variables:
+    DOT_WORK_CACHE_DIR: Override the cache root directory.
+    DOT_WORK_NO_CACHE: Set to any non-empty value to disable the cache.
+
+The cache is best-effort: unreadable, corrupt or unwritable entries fall back
+to a normal parse and are never reported as errors.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+import os
+import pickle
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from dot_work.utils.defaults import global_defaults_digest
+from dot_work.utils.fileio import atomic_write, cache_root_dir
+from dot_work.utils.profiling import count
+
+logger = logging.getLogger(__name__)
+
+# Bump when the pickled shape of a parsed model changes
+CACHE_FORMAT_VERSION = "2"
+
+# Generation directories kept (several dot-work installs may share the cache)
+MAX_GENERATIONS = 3
+
+# Entries kept per parser kind, so edits (e.g. in install --watch) cannot grow
+# the cache without bound
+MAX_ENTRIES_PER_KIND = 2048
+
+# Entries a process writes per kind between two prunes (the first write prunes)
+PRUNE_INTERVAL = 256
+
+# Entries written per (cache root, kind) by this process
+_writes: dict[tuple[Path, str], int] = {}
+
+
+def parse_cache_dir() -> Path | None:
+    """Return the parse cache directory, or None if caching is disabled."""
+    root = cache_root_dir()
+    return root / "parse" if root is not None else None
+
+
+# Modules whose code shapes the cached objects (relative to the dot_work package)
+_PARSER_MODULES = (
+    "prompts/canonical.py",
+    "skills/models.py",
+    "skills/parser.py",
+    "subagents/models.py",
+    "subagents/parser.py",
+    "utils/defaults.py",
+    "utils/frontmatter.py",
+    "utils/yaml_loader.py",
+)
+
+
+@functools.cache
+def _code_signature() -> str:
+    """Stat signature of the parser modules, so code changes never read older entries.
+
+    Cheaper than importlib.metadata, and also catches edits in editable installs.
+    """
+    package_dir = Path(__file__).resolve().parent.parent
+    parts = []
+    for module in _PARSER_MODULES:
+        try:
+            stat = (package_dir / module).stat()
+            parts.append(f"{module}:{stat.st_mtime_ns}:{stat.st_size}")
+        except OSError:
+            parts.append(f"{module}:missing")
+    return ";".join(parts)
+
+
+@functools.cache
+def _generation() -> str:
+    """Directory name of the entries written by this version of the parsers."""
+    signature = f"{CACHE_FORMAT_VERSION};{_code_signature()}"
+    return hashlib.blake2b(signature.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _is_private(stat: os.stat_result) -> bool:
+    """Whether a file is owned by the current user and writable by nobody else."""
+    getuid = getattr(os, "getuid", None)
+    if getuid is None:  # No POSIX ownership (Windows)
+        return True
+    return stat.st_uid == getuid() and not stat.st_mode & 0o022
+
+
+def parse_cache_key(kind: str, data: bytes, source_file: Path | None, defaults_path: Path) -> str:
+    """Compute the cache key for one parse.
+
+    Args:
+        kind: Parser result kind (e.g. "canonical", "skill-metadata", "subagent").
+        data: Raw bytes of the file being parsed.
+        source_file: Path recorded on the parsed result, if any.
+        defaults_path: The global.yml the parser merges with.
+
+    Returns:
+        Hex digest identifying the parsed result.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    for part in (
+        kind,
+        str(source_file) if source_file is not None else "",
+        global_defaults_digest(defaults_path),
+    ):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    h.update(data)
+    return h.hexdigest()
+
+
+def cached_parse(
+    kind: str,
+    data: bytes,
+    source_file: Path | None,
+    defaults_path: Path,
+    parse: Callable[[], Any],
+) -> Any:
+    """Return a cached parse result, or run ``parse`` and store its result.
+
+    Exceptions raised by ``parse`` propagate and nothing is cached, so files
+    with errors are re-parsed (and re-reported) on every run.
+
+    Args:
+        kind: Parser result kind, used to namespace entries.
+        data: Raw bytes of the file being parsed.
+        source_file: Path recorded on the parsed result, if any.
+        defaults_path: The global.yml the parser merges with.
+        parse: Zero-argument callable performing the actual parse.
+
+    Returns:
+        The parsed result.
+    """
+    root = parse_cache_dir()
+    if root is None:
+        return parse()
+
+    try:
+        key = parse_cache_key(kind, data, source_file, defaults_path)
+    except Exception:  # noqa: BLE001 - an unreadable global.yml surfaces from parse()
+        return parse()
+
+    entry = root / _generation() / kind / key[:2] / key
+    try:
+        with entry.open("rb") as f:
+            if not _is_private(os.fstat(f.fileno())):
+                raise PermissionError("not owned by the current user, or writable by others")
+            result = pickle.load(f)  # noqa: S301 - only private entries (see _is_private)
+        count("parse_cache_hits")
+        return result
+    except FileNotFoundError:
+        pass
+    except Exception as e:  # noqa: BLE001
+        logger.debug(f"Ignoring unreadable parse cache entry {entry}: {e}")
+
+    count("parse_cache_misses")
+    result = parse()
+    writes = _writes.get((root, kind), 0)
+    _writes[(root, kind)] = writes + 1
+    if writes % PRUNE_INTERVAL == 0:
+        _prune(root, kind)
+    _write_entry(entry, result)
+    return result
+
+
+def _prune(root: Path, kind: str) -> None:
+    """Drop old generations and the oldest entries of kind, ignoring any failure."""
+    try:
+        generation = root / _generation()
+        generation.mkdir(parents=True, exist_ok=True)
+        os.utime(generation)  # Marks it as the most recently used
+        generations = sorted(
+            (path for path in root.iterdir() if path.is_dir()),
+            key=lambda path: path.stat().st_mtime_ns,
+            reverse=True,
+        )
+        for old in generations[MAX_GENERATIONS:]:
+            shutil.rmtree(old, ignore_errors=True)
+
+        entries = [
+            (entry.stat().st_mtime_ns, entry)
+            for entry in (generation / kind).glob("*/*")
+            if not entry.name.startswith(".")
+        ]
+        if len(entries) > MAX_ENTRIES_PER_KIND:
+            entries.sort()
+            for _, entry in entries[: len(entries) - MAX_ENTRIES_PER_KIND]:
+                entry.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Could not prune parse cache {root}: {e}")
+
+
+def _write_entry(entry: Path, value: object) -> None:
+    """Atomically write a cache entry, ignoring any failure."""
+    try:
+        atomic_write(entry, lambda f: pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception as e:  # noqa: BLE001
+        logger.debug(f"Could not write parse cache entry {entry}: {e}")
+
+
+def clear_parse_cache() -> None:
+    """Delete every parse cache entry (no-op when caching is disabled)."""
+    root = parse_cache_dir()
+    if root is not None:
+        shutil.rmtree(root, ignore_errors=True)
@@ -0,0 +1,158 @@
+"""Wall-time spans and counters for ``dot-work install --profile``.
+
+Installer code reports into the active :class:`InstallProfile`:
+
+- ``with span("parse", category):`` adds the block's wall time to a phase of
+  an asset category. Spans nested inside inherit the category, so parser code
+  that does not know which category it serves (e.g. the global-defaults
+  merge) is still attributed correctly. The category is a context variable,
+  so work submitted through ``dot_work.utils.io_pool`` inherits it too.
+- ``count("bytes_written", n, category)`` adds to a counter.
+
+Outside :func:`profiling` no profile is active and both are no-ops, so the
+instrumentation stays in place at negligible cost. Phases may nest: the time
+of an inner phase (``merge``) is also part of the outer one (``parse``), which
+is part of ``scan``. Categories install concurrently, so the phase times of all
+categories can add up to more than the wall time.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Category for work that belongs to no single asset category
+GLOBAL_CATEGORY = "install"
+
+
+@dataclass
+class PhaseTiming:
+    """Accumulated wall time of one phase in one category."""
+
+    seconds: float = 0.0
+    calls: int = 0
+
+
+class InstallProfile:
+    """Per-category phase timings and counters collected during an install.
+
+    Safe to report into from several threads (categories install concurrently).
+
+    Attributes:
+        timings: Phase timings keyed by (category, phase), in first-seen order.
+        counters: Counter values keyed by (category, counter), in first-seen order.
+    """
+
+    def __init__(self) -> None:
+        self.timings: dict[tuple[str, str], PhaseTiming] = {}
+        self.counters: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self.wall_seconds = 0.0
+
+    def add_time(self, category: str, phase: str, seconds: float) -> None:
+        """Add wall time to a phase."""
+        with self._lock:
+            timing = self.timings.setdefault((category, phase), PhaseTiming())
+            timing.seconds += seconds
+            timing.calls += 1
+
+    def add(self, category: str, counter: str, value: int = 1) -> None:
+        """Add to a counter."""
+        with self._lock:
+            self.counters[(category, counter)] = self.counters.get((category, counter), 0) + value
+
+    def finish(self) -> None:
+        """Record the total wall time since the profile was created."""
+        self.wall_seconds = time.perf_counter() - self._started
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable report, grouped by category."""
+        categories: dict[str, dict[str, Any]] = {}
+        for (category, phase), timing in self.timings.items():
+            entry = categories.setdefault(category, {"phases": {}, "counters": {}})
+            entry["phases"][phase] = {
+                "seconds": round(timing.seconds, 6),
+                "calls": timing.calls,
+            }
+        for (category, counter), value in self.counters.items():
+            entry = categories.setdefault(category, {"phases": {}, "counters": {}})
+            entry["counters"][counter] = value
+        return {"wall_seconds": round(self.wall_seconds, 6), "categories": categories}
+
+    def print_table(self, console: Console) -> None:
+        """Print the phases and counters of every category as a table."""
+        # Imported here: parsers import this module, also in the build hook without rich
+        from rich.table import Table
+
+        report = self.to_dict()
+        table = Table(title=f"Install profile ({report['wall_seconds']:.3f}s wall)")
+        table.add_column("Category", style="cyan")
+        table.add_column("Phase / counter")
+        table.add_column("Time (ms)", justify="right")
+        table.add_column("Calls / value", justify="right")
+        for category, entry in report["categories"].items():
+            for phase, timing in entry["phases"].items():
+                table.add_row(
+                    category, phase, f"{timing['seconds'] * 1000:.1f}", str(timing["calls"])
+                )
+            for counter, value in entry["counters"].items():
+                table.add_row(category, f"[dim]{counter}[/dim]", "", str(value))
+            table.add_section()
+        console.print(table)
+
+
+_active: InstallProfile | None = None
+# Category of the innermost enclosing span
+_category: ContextVar[str | None] = ContextVar("dot_work_profile_category", default=None)
+
+
+@contextmanager
+def profiling() -> Iterator[InstallProfile]:
+    """Activate a new InstallProfile for the duration of the block."""
+    global _active
+    profile = InstallProfile()
+    previous, _active = _active, profile
+    try:
+        yield profile
+    finally:
+        profile.finish()
+        _active = previous
+
+
+def active_profile() -> InstallProfile | None:
+    """Return the active profile, or None when not profiling."""
+    return _active
+
+
+@contextmanager
+def span(phase: str, category: str | None = None) -> Iterator[None]:
+    """Time the block as a phase of a category (default: the enclosing span's)."""
+    profile = _active
+    if profile is None:
+        yield
+        return
+    category = category or _category.get() or GLOBAL_CATEGORY
+    token = _category.set(category)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_time(category, phase, time.perf_counter() - start)
+        _category.reset(token)
+
+
+def count(counter: str, value: int = 1, category: str | None = None) -> None:
+    """Add to a counter of a category (default: the enclosing span's)."""
+    profile = _active
+    if profile is not None:
+        category = category or _category.get() or GLOBAL_CATEGORY
+        profile.add(category, counter, value)
@@ -0,0 +1,233 @@
+"""Watch a directory tree for file changes.
+
+Used by ``dot-work install --watch`` to re-install assets as they are edited.
+:func:`watch_changes` yields debounced batches of changed paths, using inotify
+on Linux (through ctypes, no extra dependency) and polling file stats
+everywhere else, or when inotify is unavailable (e.g. watch limit reached).
+
+Environment variables:
+    DOT_WORK_WATCH_POLL: Set to any non-empty value to force polling.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Quiet period that ends a batch of changes (editors save in several steps)
+DEFAULT_DEBOUNCE = 0.3
+
+# Interval between scans when polling
+DEFAULT_POLL_INTERVAL = 0.5
+
+# inotify event masks (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+)
+
+# struct inotify_event header: wd, mask, cookie, len (followed by the name)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _is_ignored(path: Path) -> bool:
+    """Editor swap/backup files and hidden files never count as changes."""
+    name = path.name
+    return name.startswith((".", "#")) or name.endswith(("~", ".swp", ".swx", ".tmp"))
+
+
+class PollingWatcher:
+    """Detect changes by comparing (mtime_ns, size) snapshots of every file."""
+
+    def __init__(self, root: Path, interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot: dict[Path, tuple[int, int]] = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+            for name in filenames:
+                path = Path(dirpath) / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def read(self, timeout: float) -> set[Path]:
+        """Wait up to timeout seconds and return the paths changed since the last call."""
+        deadline = time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {
+                path
+                for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.interval, remaining))
+
+    def close(self) -> None:
+        """Release resources (nothing to release when polling)."""
+
+
+class InotifyWatcher:
+    """Detect changes with Linux inotify, watching every directory under root."""
+
+    def __init__(self, root: Path) -> None:
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.root = root
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, Path] = {}
+        try:
+            for dirpath, dirnames, _ in os.walk(root):
+                dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+                self._add_watch(Path(dirpath))
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch failed: {os.strerror(errno)}", str(directory))
+        self._dirs[wd] = directory
+
+    def read(self, timeout: float) -> set[Path]:
+        """Wait up to timeout seconds and return the paths changed in the meantime."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & _IN_Q_OVERFLOW:
+                    # Events were lost: report the whole tree as changed
+                    changed.add(self.root)
+                    continue
+                directory = self._dirs.get(wd)
+                if directory is None:
+                    continue
+                if mask & _IN_IGNORED:
+                    del self._dirs[wd]
+                    continue
+                path = directory / os.fsdecode(name) if name else directory
+                if mask & _IN_ISDIR:
+                    if mask & (_IN_CREATE | _IN_MOVED_TO) and not path.name.startswith("."):
+                        try:
+                            self._add_watch(path)
+                            # Files may have landed before the watch existed
+                            changed.update(p for p in path.rglob("*") if p.is_file())
+                        except OSError as e:
+                            # Gone already, or out of watches (ENOSPC): changes under
+                            # it may be missed, so report the whole tree as changed
+                            logger.debug("Cannot watch new directory %s: %s", path, e)
+                            changed.add(self.root)
+                    continue
+                changed.add(path)
+
+    def close(self) -> None:
+        """Close the inotify descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(root: Path) -> InotifyWatcher | PollingWatcher:
+    """Return an inotify watcher on Linux, or a polling watcher as fallback."""
+    if sys.platform == "linux" and not os.environ.get("DOT_WORK_WATCH_POLL"):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError) as e:
+            logger.debug("inotify unavailable, polling %s instead: %s", root, e)
+    return PollingWatcher(root)
+
+
+def watch_changes(
+    root: Path,
+    *,
+    debounce: float = DEFAULT_DEBOUNCE,
+    stop: threading.Event | None = None,
+    watcher_factory: Callable[[Path], InotifyWatcher | PollingWatcher] = create_watcher,
+) -> Iterator[set[Path]]:
+    """Yield batches of changed files under root, debounced.
+
+    A batch starts with the first change and ends once no further change
+    arrives for ``debounce`` seconds. Hidden files and editor swap/backup
+    files are left out; a batch that only contains those is not yielded.
+
+    Args:
+        root: Directory to watch recursively.
+        debounce: Quiet period in seconds that ends a batch.
+        stop: Event that ends the iteration when set (checked between reads).
+        watcher_factory: Creates the watcher (default: :func:`create_watcher`).
+
+    Yields:
+        Sets of changed paths; ``{root}`` if changes were lost and everything
+        should be treated as changed.
+    """
+    watcher = watcher_factory(root)
+    try:
+        while stop is None or not stop.is_set():
+            changed = watcher.read(DEFAULT_POLL_INTERVAL)
+            if not changed:
+                continue
+            while more := watcher.read(debounce):
+                changed |= more
+            changed = {path for path in changed if path == root or not _is_ignored(path)}
+            if changed:
+                yield changed
+    finally:
+        watcher.close()
@@ -0,0 +1,227 @@
+"""Fast YAML loading for frontmatter and config files.
+
+Two layers sit in front of ``yaml.safe_load``:
+
+- :func:`safe_load` uses libyaml's ``CSafeLoader`` when PyYAML was built with
+  it, and the pure-Python ``SafeLoader`` otherwise. Documents that fail to load
+  are re-parsed with ``SafeLoader`` so error messages and marks are identical
+  either way.
+- :func:`load_frontmatter` first tries :func:`fast_load`, a restricted parser
+  for the block-mapping shape asset frontmatter actually uses (``meta``,
+  ``environments.<env>.target`` and friends), and falls back to
+  :func:`safe_load` for anything it does not recognise.
+
+:func:`fast_load` is deliberately conservative. It accepts only:
+
+- block mappings with simple keys, nested to any depth by space indentation,
+- block sequences of scalars and one-line flow sequences of plain scalars,
+- single-line plain, single-quoted and double-quoted scalars without escapes,
+- full-line comments and blank lines.
+
+Plain scalars are resolved with PyYAML's own implicit resolvers. Bools, nulls,
+decimal ints and simple decimal floats are converted; anything else they
+match (timestamps, octal/hex/sexagesimal numbers, ``.inf``, merge keys...) is
+handed to the full loader, so a fast-path result always equals what
+``yaml.safe_load`` returns.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+import yaml
+
+# libyaml-backed loader, or None when PyYAML was built without it
+CSafeLoader: type[yaml.SafeLoader] | None = getattr(yaml, "CSafeLoader", None)
+
+_BOOL_TAG = "tag:yaml.org,2002:bool"
+_FLOAT_TAG = "tag:yaml.org,2002:float"
+_INT_TAG = "tag:yaml.org,2002:int"
+_NULL_TAG = "tag:yaml.org,2002:null"
+_IMPLICIT_RESOLVERS = yaml.SafeLoader.yaml_implicit_resolvers
+
+_KEY_LINE = re.compile(r"([A-Za-z_][A-Za-z0-9_-]*):(?: +(.*))?")
+_DOUBLE_QUOTED = re.compile(r'"([^"\\]*)"(?: +#.*)?')
+_SINGLE_QUOTED = re.compile(r"'([^']*)'(?: +#.*)?")
+_DECIMAL = re.compile(r"[-+]?(?:0|[1-9][0-9]*)")
+_SIMPLE_FLOAT = re.compile(r"[-+]?[0-9]+\.[0-9]+")
+
+# Characters that always start a non-plain YAML node
+_INDICATORS = frozenset("#&*!|>%@`[]{},")
+
+# Sentinel for "not handled by the fast path"
+_UNSUPPORTED = object()
+
+
+def safe_load(text: str) -> Any:
+    """Load YAML with ``CSafeLoader`` if available, else ``yaml.safe_load``.
+
+    Args:
+        text: YAML document.
+
+    Returns:
+        The loaded data.
+
+    Raises:
+        yaml.YAMLError: If the document is invalid (raised by the pure-Python
+            loader so messages do not depend on libyaml being installed).
+    """
+    if CSafeLoader is None:
+        return yaml.safe_load(text)
+    try:
+        return yaml.load(text, Loader=CSafeLoader)  # noqa: S506 - CSafeLoader is safe
+    except yaml.YAMLError:
+        return yaml.safe_load(text)
+
+
+def load_frontmatter(text: str) -> Any:
+    """Load frontmatter YAML, using the fast path when the shape allows it.
+
+    Args:
+        text: YAML text between the ``---`` markers.
+
+    Returns:
+        The loaded data, equal to ``yaml.safe_load(text)``.
+
+    Raises:
+        yaml.YAMLError: If the document is invalid.
+    """
+    data = fast_load(text)
+    if data is None:
+        return safe_load(text)
+    return data
+
+
+def _resolve_plain(value: str) -> Any:
+    """Resolve a plain scalar the way SafeLoader would, or return _UNSUPPORTED."""
+    first = value[0]
+    if first in _INDICATORS or (first in "-?:" and (len(value) == 1 or value[1] == " ")):
+        return _UNSUPPORTED
+    if ": " in value or " #" in value or value.endswith(":"):
+        return _UNSUPPORTED
+
+    for tag, regexp in _IMPLICIT_RESOLVERS.get(first, []):
+        if regexp.match(value):
+            if tag == _BOOL_TAG:
+                return value.lower() in ("yes", "true", "on")
+            if tag == _NULL_TAG:
+                return None
+            if tag == _INT_TAG and _DECIMAL.fullmatch(value):
+                return int(value)
+            if tag == _FLOAT_TAG and _SIMPLE_FLOAT.fullmatch(value):
+                return float(value)
+            return _UNSUPPORTED
+    return value
+
+
+def _flow_sequence(value: str) -> Any:
+    """Parse a one-line flow sequence of plain scalars, or return _UNSUPPORTED."""
+    inner = value[1:-1].strip(" ")
+    if not inner:
+        return []
+    if any(ch in inner for ch in "[]{}\"'#"):
+        return _UNSUPPORTED
+    items = [item.strip(" ") for item in inner.split(",")]
+    if items[-1] == "":
+        items.pop()  # trailing comma is allowed
+    result = []
+    for item in items:
+        if not item or item[0] in "?:-":
+            return _UNSUPPORTED
+        resolved = _resolve_plain(item)
+        if resolved is _UNSUPPORTED:
+            return _UNSUPPORTED
+        result.append(resolved)
+    return result
+
+
+def _scalar(value: str) -> Any:
+    """Parse a single-line scalar, or return _UNSUPPORTED."""
+    if value[0] == '"':
+        match = _DOUBLE_QUOTED.fullmatch(value)
+        return match.group(1) if match else _UNSUPPORTED
+    if value[0] == "'":
+        match = _SINGLE_QUOTED.fullmatch(value)
+        return match.group(1) if match else _UNSUPPORTED
+    if value[0] == "[" and value[-1] == "]":
+        return _flow_sequence(value)
+    if value == "{}":
+        return {}
+    return _resolve_plain(value)
+
+
+def fast_load(text: str) -> dict[str, Any] | None:
+    """Parse simple block-mapping YAML without the full YAML machinery.
+
+    Args:
+        text: YAML text.
+
+    Returns:
+        The loaded mapping, or None if the text uses anything outside the
+        supported subset (the caller should then use :func:`safe_load`).
+    """
+    root: dict[str, Any] = {}
+    # Open containers as (indent, container); sequences may share their key's indent
+    stack: list[tuple[int, dict[str, Any] | list[Any]]] = [(0, root)]
+    # Mapping key whose value is on the following lines: (mapping, key, key indent)
+    pending: tuple[dict[str, Any], str, int] | None = None
+
+    for raw_line in text.split("\n"):
+        line = raw_line.rstrip(" ")
+        if not line.isprintable():
+            return None
+        content = line.lstrip(" ")
+        if not content or content[0] == "#":
+            continue
+        indent = len(line) - len(content)
+        is_item = content.startswith("- ")
+
+        if pending is not None:
+            mapping, key, key_indent = pending
+            pending = None
+            if is_item and indent >= key_indent:
+                mapping[key] = []
+                stack.append((indent, mapping[key]))
+            elif indent > key_indent:
+                mapping[key] = {}
+                stack.append((indent, mapping[key]))
+            else:
+                mapping[key] = None
+
+        while stack[-1][0] > indent or (
+            stack[-1][0] == indent and isinstance(stack[-1][1], list) and not is_item
+        ):
+            stack.pop()
+        top_indent, container = stack[-1]
+        if top_indent != indent:
+            return None
+
+        if isinstance(container, list):
+            value = _scalar(content[2:].lstrip(" "))
+            if value is _UNSUPPORTED:
+                return None
+            container.append(value)
+            continue
+
+        match = _KEY_LINE.fullmatch(content)
+        if not match:
+            return None
+        key, value_text = match.groups()
+        if _resolve_plain(key) != key:
+            return None
+
+        if not value_text or value_text[0] == "#":
+            pending = (container, key, indent)
+            continue
+
+        value = _scalar(value_text)
+        if value is _UNSUPPORTED:
+            return None
+        container[key] = value
+
+    if pending is not None:
+        mapping, key, _ = pending
+        mapping[key] = None
+
+    return root or None
@@ -0,0 +1,442 @@
+"""Issue counts, focus and an issue index for ``dot-work status``, cached between runs.
+
+Agent loops poll ``dot-work status --format json`` on every iteration, while
+the priority files under ``.work/agent/issues/`` keep growing. Issue blocks
+are counted by scanning each file's bytes through ``mmap`` in fixed-size
+windows (``bytes.count`` of the ``id: "`` line prefix), so memory use does
+not grow with the file and nothing is decoded or regex-matched.
+
+Looking up a single issue (``dot-work status --issue`` / ``dot-work issue
+show``) goes through an index of every issue block in ``issues/*.md``: its
+ID, file, byte offset and length, and status. Next to each file's rows the
+index keeps a map from issue ID to its row, so a lookup only checks the one
+file holding the issue, and reads only the block's slice of it.
+
+Each file's count, its index entries and the parsed focus.md are cached as
+JSON under ``$XDG_CACHE_HOME/dot-work/`` (``status/`` and ``issue-index/``,
+not in ``.work/``, which is often committed), keyed by the file's mtime and
+size. A call only rescans files that changed since the previous one.
+
+Environment variables:
+    DOT_WORK_CACHE_DIR: Override the cache root directory.
+    DOT_WORK_NO_CACHE: Set to any non-empty value to disable the on-disk cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from dot_work.utils.fileio import atomic_write_json, cache_root_dir
+
+logger = logging.getLogger(__name__)
+
+# Priority files under .work/agent/issues/, in display order
+PRIORITIES = ("shortlist", "critical", "high", "medium", "low", "backlog")
+
+# Focus sections, by the heading that starts them in focus.md
+FOCUS_SECTIONS = {"## Previous": "previous", "## Current": "current", "## Next": "next"}
+
+# Bump when the cached layout changes
+STATUS_CACHE_VERSION = 1
+ISSUE_INDEX_VERSION = 1
+
+# Every issue block has a line starting with this (``id: "PREFIX-NNN@hash"``)
+_ISSUE_LINE = b'id: "'
+
+# Bytes scanned per window when counting
+_SCAN_WINDOW = 1 << 20
+
+_ISSUE_ID = re.compile(r"[\w-]+@[\w-]+")
+
+# Line that opens (and closes) an issue block's frontmatter
+_SEPARATOR = b"---\n"
+
+
+@dataclass
+class WorkStatus:
+    """Current focus and issue counts of a .work/ directory.
+
+    Attributes:
+        focus: Issue IDs of the previous, current and next focus ("N/A" if unset).
+        issue_counts: Number of issues in each priority file, in PRIORITIES order.
+    """
+
+    focus: dict[str, str]
+    issue_counts: dict[str, int]
+
+
+@dataclass
+class IssueEntry:
+    """Location of one issue block in .work/agent/issues/.
+
+    Attributes:
+        id: Issue ID (``PREFIX-NNN@hash``).
+        priority: Stem of the file holding the block ("high", "history", ...).
+        path: The file holding the block.
+        offset: Byte offset of the block (its opening ``---`` line).
+        length: Length of the block in bytes, without the separator after it.
+        status: The block's ``status:`` value ("" if it has none).
+        focus: Focus sections (previous/current/next) pointing at the issue.
+    """
+
+    id: str
+    priority: str
+    path: Path
+    offset: int
+    length: int
+    status: str
+    focus: list[str] = field(default_factory=list)
+
+    def read(self) -> str:
+        """Read the issue block, and nothing else of its file."""
+        with self.path.open("rb") as f:
+            f.seek(self.offset)
+            return f.read(self.length).decode("utf-8", errors="replace")
+
+
+def count_issues(path: Path) -> int:
+    """Count the issue blocks in a priority file (lines starting with ``id: "``).
+
+    Args:
+        path: Priority file; a missing or empty file has no issues.
+
+    Returns:
+        Number of issue blocks.
+    """
+    marker = b"\n" + _ISSUE_LINE
+    try:
+        with path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return 0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                count = 1 if mm[: len(_ISSUE_LINE)] == _ISSUE_LINE else 0
+                # Windows overlap by one byte less than the marker, so a marker
+                # split across a boundary is counted exactly once
+                overlap = len(marker) - 1
+                for start in range(0, size, _SCAN_WINDOW):
+                    count += mm[max(start - overlap, 0) : start + _SCAN_WINDOW].count(marker)
+                return count
+    except FileNotFoundError:
+        return 0
+
+
+def _frontmatter_value(block: bytes, key: bytes) -> str:
+    """Value of a ``key: value`` frontmatter line, unquoted ("" if missing)."""
+    start = block.find(b"\n" + key + b":")
+    if start == -1:
+        return ""
+    start += len(key) + 2
+    end = block.find(b"\n", start)
+    value = block[start : end if end != -1 else len(block)].strip()
+    return value.strip(b"\"'").decode("utf-8", errors="replace")
+
+
+def _index_blocks(mm: mmap.mmap, size: int) -> list[list[Any]]:
+    """[id, offset, length, status] of each issue block in a mapped file."""
+    marker = b"\n" + _ISSUE_LINE
+    id_lines = [0] if mm[: len(_ISSUE_LINE)] == _ISSUE_LINE else []
+    pos = mm.find(marker)
+    while pos != -1:
+        id_lines.append(pos + 1)
+        pos = mm.find(marker, pos + 1)
+
+    # A block starts at the ``---`` line right before its id line, if any
+    starts = []
+    for id_line in id_lines:
+        opener = id_line - len(_SEPARATOR)
+        if mm[max(opener - 1, 0) : id_line] in (_SEPARATOR, b"\n" + _SEPARATOR):
+            starts.append(opener)
+        else:
+            starts.append(id_line)
+
+    blocks = []
+    for i, (start, id_line) in enumerate(zip(starts, id_lines, strict=True)):
+        end = starts[i + 1] if i + 1 < len(starts) else size
+        closer = mm.find(b"\n---", id_line, end)
+        frontmatter_end = closer + 4 if closer != -1 else end
+        # Drop trailing blank lines and the ``---`` lines separating it from the next block
+        tail_start = max(frontmatter_end, end - 4096)
+        tail = mm[tail_start:end].rstrip()
+        while tail.endswith(b"\n---"):
+            tail = tail[:-4].rstrip()
+        end = max(tail_start + len(tail), frontmatter_end)
+        if mm[end : end + 1] == b"\n":
+            end += 1
+        frontmatter = b"\n" + mm[id_line:frontmatter_end]
+        issue_id = _frontmatter_value(frontmatter, b"id")
+        blocks.append([issue_id, start, end - start, _frontmatter_value(frontmatter, b"status")])
+    return blocks
+
+
+def index_issue_file(path: Path) -> list[list[Any]]:
+    """Index the issue blocks of a file under .work/agent/issues/.
+
+    Args:
+        path: Issue file; a missing or empty file has no issues.
+
+    Returns:
+        ``[id, offset, length, status]`` of each block, in file order.
+    """
+    try:
+        with path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _index_blocks(mm, size)
+    except FileNotFoundError:
+        return []
+
+
+def parse_focus(text: str) -> dict[str, str]:
+    """Extract the previous/current/next issue IDs from focus.md content."""
+    focus = dict.fromkeys(FOCUS_SECTIONS.values(), "N/A")
+    current_section = None
+    for line in text.splitlines():
+        line = line.strip()
+        for heading, section in FOCUS_SECTIONS.items():
+            if line.startswith(heading):
+                current_section = section
+                break
+        else:
+            if line.startswith("- Issue:") and current_section:
+                issue_id = _ISSUE_ID.search(line)
+                if issue_id:
+                    focus[current_section] = issue_id.group(0)
+    return focus
+
+
+def _read_focus(path: Path) -> dict[str, str]:
+    try:
+        return parse_focus(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return parse_focus("")
+
+
+def _stat(path: Path) -> list[int]:
+    """[mtime_ns, size] of a path; [-1, -1] if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return [-1, -1]
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _cache_file(work_dir: Path, kind: str) -> Path | None:
+    cache_root = cache_root_dir()
+    if cache_root is None:
+        return None
+    digest = hashlib.blake2b(str(work_dir).encode("utf-8"), digest_size=16).hexdigest()
+    return cache_root / kind / f"{digest}.json"
+
+
+def _load_data(path: Path | None, work_dir: Path, version: int) -> dict[str, Any]:
+    """The whole cache, or {} if there is no usable cache."""
+    if path is None:
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data["version"] != version or data["work_dir"] != str(work_dir):
+            return {}
+        return dict(data)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug("Ignoring unreadable cache %s: %s", path, e)
+        return {}
+
+
+def _load(path: Path | None, work_dir: Path, version: int) -> dict[str, Any]:
+    """Cached entries by relative path, or {} if there is no usable cache."""
+    files = _load_data(path, work_dir, version).get("files")
+    return dict(files) if isinstance(files, dict) else {}
+
+
+def _save(
+    path: Path, work_dir: Path, version: int, files: dict[str, Any], **extra: dict[str, Any]
+) -> None:
+    """Atomically write the cache, ignoring any failure."""
+    data = {"version": version, "work_dir": str(work_dir), "files": files, **extra}
+    atomic_write_json(path, data)
+
+
+def read_work_status(work_dir: Path) -> WorkStatus:
+    """Return the focus and issue counts of a .work/ directory.
+
+    Files unchanged (same mtime and size) since the previous call are answered
+    from the cache; the others are rescanned.
+
+    Args:
+        work_dir: The project's .work/ directory.
+
+    Returns:
+        The directory's status.
+    """
+    work_dir = work_dir.absolute()
+    agent_dir = work_dir / "agent"
+    cache_file = _cache_file(work_dir, "status")
+    cached = _load(cache_file, work_dir, STATUS_CACHE_VERSION)
+    files: dict[str, Any] = {}
+
+    def lookup(relpath: str, compute: Callable[[Path], Any]) -> Any:
+        stat = _stat(agent_dir / relpath)
+        entry = cached.get(relpath)
+        if entry is None or entry.get("stat") != stat:
+            entry = {"stat": stat, "value": compute(agent_dir / relpath)}
+        files[relpath] = entry
+        return entry["value"]
+
+    focus = lookup("focus.md", _read_focus)
+    issue_counts = {
+        priority: lookup(f"issues/{priority}.md", count_issues) for priority in PRIORITIES
+    }
+    if cache_file is not None and files != cached:
+        _save(cache_file, work_dir, STATUS_CACHE_VERSION, files)
+    return WorkStatus(focus=dict(focus), issue_counts=issue_counts)
+
+
+def _issue_files(issues_dir: Path) -> list[Path]:
+    """Issue files, priority files first (in PRIORITIES order), then the rest by name."""
+    order = {priority: i for i, priority in enumerate(PRIORITIES)}
+    return sorted(
+        issues_dir.glob("*.md"), key=lambda path: (order.get(path.stem, len(order)), path.name)
+    )
+
+
+def _issue_ids(files: dict[str, Any]) -> dict[str, list[Any]]:
+    """Map issue IDs to ``[id, relpath, offset, length, status]`` of their first block.
+
+    The part of an ID before its ``@`` is mapped too, for lookups by short ID.
+    """
+    ids: dict[str, list[Any]] = {}
+    for relpath, entry in files.items():
+        for issue_id, offset, length, status in entry["issues"]:
+            row = [issue_id, relpath, offset, length, status]
+            ids.setdefault(issue_id, row)
+            ids.setdefault(issue_id.partition("@")[0], row)
+    return ids
+
+
+def _save_issue_index(cache_file: Path | None, work_dir: Path, files: dict[str, Any]) -> None:
+    if cache_file is not None:
+        _save(cache_file, work_dir, ISSUE_INDEX_VERSION, files, ids=_issue_ids(files))
+
+
+def _load_issue_index(work_dir: Path) -> dict[str, Any]:
+    """Index entries of each issue file, rescanning changed files and updating the cache.
+
+    Args:
+        work_dir: Absolute path of the .work/ directory.
+
+    Returns:
+        ``{"stat": ..., "issues": rows}`` by relative path (``"issues/high.md"``),
+        in index order.
+    """
+    cache_file = _cache_file(work_dir, "issue-index")
+    cached = _load(cache_file, work_dir, ISSUE_INDEX_VERSION)
+    files: dict[str, Any] = {}
+
+    for path in _issue_files(work_dir / "agent" / "issues"):
+        relpath = f"issues/{path.name}"
+        stat = _stat(path)
+        entry = cached.get(relpath)
+        if entry is None or entry.get("stat") != stat:
+            entry = {"stat": stat, "issues": index_issue_file(path)}
+        files[relpath] = entry
+
+    if files != cached:
+        _save_issue_index(cache_file, work_dir, files)
+    return files
+
+
+def _issue_entry(path: Path, row: list[Any]) -> IssueEntry:
+    issue_id, offset, length, status = row
+    return IssueEntry(
+        id=issue_id, priority=path.stem, path=path, offset=offset, length=length, status=status
+    )
+
+
+def _is_current(issue: IssueEntry, stat: list[int] | None) -> bool:
+    """Whether an indexed issue still is where the index says (its file's stat and ID line)."""
+    # Same mtime and size does not guarantee same content (coarse timestamps)
+    return stat == _stat(issue.path) and f'id: "{issue.id}"' in issue.read()
+
+
+def index_issues(work_dir: Path) -> list[IssueEntry]:
+    """Return every issue block in ``.work/agent/issues/*.md``.
+
+    Files unchanged (same mtime and size) since the previous call are answered
+    from the on-disk index; the others are rescanned.
+
+    Args:
+        work_dir: The project's .work/ directory.
+
+    Returns:
+        The issues, priority files first, in file order within each file.
+    """
+    work_dir = work_dir.absolute()
+    files = _load_issue_index(work_dir)
+    return [
+        _issue_entry(work_dir / "agent" / relpath, row)
+        for relpath, entry in files.items()
+        for row in entry["issues"]
+    ]
+
+
+def find_issue(work_dir: Path, issue_id: str) -> IssueEntry | None:
+    """Look up one issue by ID through the issue index.
+
+    Args:
+        work_dir: The project's .work/ directory.
+        issue_id: Full ID (``BUG-003@a9f3c2``), or just the part before ``@``.
+
+    Returns:
+        The issue, with its focus sections filled in, or None if no block has
+        that ID. An ID found in several files resolves to the first one (priority
+        files before history).
+    """
+    work_dir = work_dir.absolute()
+    agent_dir = work_dir / "agent"
+    cache_file = _cache_file(work_dir, "issue-index")
+    cached = _load_data(cache_file, work_dir, ISSUE_INDEX_VERSION)
+    files: dict[str, Any] = cached.get("files", {})
+    ids: dict[str, list[Any]] = cached.get("ids", {})
+
+    def lookup() -> IssueEntry | None:
+        row = ids.get(issue_id)
+        if row is None:
+            return None
+        found_id, relpath, offset, length, status = row
+        issue = _issue_entry(agent_dir / relpath, [found_id, offset, length, status])
+        return issue if _is_current(issue, files.get(relpath, {}).get("stat")) else None
+
+    issue = lookup()
+    if issue is None and issue_id in ids:
+        # Its file changed since it was indexed: rescan that file alone
+        relpath = ids[issue_id][1]
+        path = agent_dir / relpath
+        files[relpath] = {"stat": _stat(path), "issues": index_issue_file(path)}
+        _save_issue_index(cache_file, work_dir, files)
+        ids = _issue_ids(files)
+        issue = lookup()
+    if issue is None:
+        # Not indexed (e.g. a new issue, or one moved to another file): rescan
+        # every file that changed
+        files = _load_issue_index(work_dir)
+        ids = _issue_ids(files)
+        issue = lookup()
+
+    if issue is not None:
+        focus = _read_focus(agent_dir / "focus.md")
+        issue.focus = [section for section, focus_id in focus.items() if focus_id == issue.id]
+    return issue
@@ -43,6 +43,15 @@ def zip_callback(
             help="Upload to configured API endpoint after creating zip",
         ),
     ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="Files compressed in parallel (default: number of CPUs; 1 compresses serially)",
+        ),
+    ] = None,
 ) -> None:
     """Create a zip archive of a folder, respecting .gitignore patterns.
 
@@ -52,6 +61,7 @@ def zip_callback(
         dot-work zip my-folder
         dot-work zip my-folder --output custom.zip
         dot-work zip my-folder --upload
+        dot-work zip my-folder --jobs 4
         dot-work zip upload my-file.zip
     """
     # If a subcommand was specified, let it handle execution
@@ -67,6 +77,7 @@ def zip_callback(
         folder=folder,
         output=output,
         upload=upload_to_api,
+        jobs=jobs,
     )
 
 
@@ -92,16 +103,31 @@ def create(
             help="Upload to configured API endpoint after creating zip",
         ),
     ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=1,
+            help="Files compressed in parallel (default: number of CPUs; 1 compresses serially)",
+        ),
+    ] = None,
 ) -> None:
-    """Create a zip archive of a folder, respecting .gitignore patterns."""
+    """Create a zip archive of a folder, respecting .gitignore patterns.
+
+    Files are compressed on --jobs threads and written in a fixed order, so the
+    archive is the same whatever the number of jobs.
+    """
     try:
-        _create_zip_internal(folder=folder, output=output, upload=upload_file)
+        _create_zip_internal(folder=folder, output=output, upload=upload_file, jobs=jobs)
     except Exception as e:
         console.print(f"[red]❌ Error:[/red] {e}")
         raise typer.Exit(1) from e
 
 
-def _create_zip_internal(folder: Path, output: Path | None, upload: bool) -> None:
+def _create_zip_internal(
+    folder: Path, output: Path | None, upload: bool, jobs: int | None = None
+) -> None:
     """Internal implementation of zip create functionality."""
     # Lazy import to defer dependency errors
     from dot_work.zip import zip_folder
@@ -124,7 +150,7 @@ def _create_zip_internal(folder: Path, output: Path | None, upload: bool) -> Non
     # Create zip archive
     try:
         console.print(f"[cyan]Creating zip archive:[/cyan] {folder} -> {output_path}")
-        zip_folder(folder, output_path)
+        zip_folder(folder, output_path, jobs=jobs)
         console.print("[green]SUCCESS: Zip created[/green]")
         console.print(f"[dim]   Location: {output_path}[/dim]")
         file_size_mb = output_path.stat().st_size / 1024 / 1024
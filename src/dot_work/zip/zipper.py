@@ -3,11 +3,20 @@
 This module provides functionality to create zip archives from directories while
 respecting .gitignore patterns. It uses gitignore_parser to accurately match
 gitignore rules.
+
+Deflated archives are built by a pipeline: a thread pool reads and compresses
+file contents in parallel (zlib releases the GIL while compressing), and the
+calling thread appends the compressed entries to the archive in walk order.
+The archive is byte-for-byte the same as one written serially with
+``ZipFile.write``.
 """
 
 import os
 import zipfile
+import zlib
+from collections import deque
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -38,10 +47,100 @@ def should_include(filepath: Path, ignore_matcher: Callable[[str], bool] | None)
     return True
 
 
+# Files larger than this are streamed by the writer instead of compressed in memory
+MAX_BUFFERED_FILE_SIZE = 32 * 1024 * 1024
+
+# Upper bound on the bytes of file content queued or being compressed at once
+MAX_BUFFERED_BYTES = 256 * 1024 * 1024
+
+
+def default_jobs() -> int:
+    """Return the default number of compression threads (one per CPU)."""
+    return os.cpu_count() or 1
+
+
+def _deflate(path: Path) -> tuple[bytes, int, int]:
+    """Read and deflate a file the way ZipFile does.
+
+    Returns:
+        (raw deflate data, CRC-32 of the content, content size)
+    """
+    data = path.read_bytes()
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush(), zlib.crc32(data), len(data)
+
+
+def _write_compressed(
+    zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, compressed: bytes, crc: int, size: int
+) -> None:
+    """Append an entry whose data is already deflated.
+
+    Mirrors what ``ZipFile.open(zinfo, "w")`` and closing the handle do for a
+    seekable archive, with sizes and CRC known up front so the local header is
+    written once.
+    """
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.flag_bits = 0
+    zinfo.file_size = size
+    zinfo.compress_size = len(compressed)
+    zinfo.CRC = crc
+    # Same rule as ZipFile.open: compressed data may be larger than the file
+    zip64 = zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+
+    fp = zipf.fp
+    assert fp is not None
+    fp.seek(zipf.start_dir)
+    zinfo.header_offset = fp.tell()
+    zipf._writecheck(zinfo)  # type: ignore[attr-defined]
+    zipf._didModify = True  # type: ignore[attr-defined]
+    fp.write(zinfo.FileHeader(zip64))
+    fp.write(compressed)
+    zipf.start_dir = fp.tell()
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+
+
+def _write_parallel(zipf: zipfile.ZipFile, files: list[tuple[Path, Path]], jobs: int) -> None:
+    """Deflate files on a thread pool and append them to zipf in order."""
+    executor = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="dot-work-zip")
+    # Entries in archive order; None for files the writer streams itself
+    pending: deque[tuple[Path, zipfile.ZipInfo, Future[tuple[bytes, int, int]] | None]] = deque()
+    buffered = 0
+
+    def write_next() -> None:
+        nonlocal buffered
+        file_path, zinfo, future = pending.popleft()
+        if future is None:
+            zipf.write(file_path, zinfo.filename)
+            return
+        compressed, crc, size = future.result()
+        buffered -= zinfo.file_size
+        _write_compressed(zipf, zinfo, compressed, crc, size)
+
+    try:
+        for file_path, rel_path in files:
+            zinfo = zipfile.ZipInfo.from_file(file_path, rel_path)
+            if zinfo.file_size > MAX_BUFFERED_FILE_SIZE:
+                pending.append((file_path, zinfo, None))
+            else:
+                pending.append((file_path, zinfo, executor.submit(_deflate, file_path)))
+                buffered += zinfo.file_size
+            # Bound memory: keep a few entries per thread and a byte budget in flight
+            while len(pending) > 4 * jobs or buffered > MAX_BUFFERED_BYTES:
+                write_next()
+        while pending:
+            write_next()
+    except BaseException:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+
 def zip_folder(
     folder_path: Path,
     output_path: Path,
     compression: int = zipfile.ZIP_DEFLATED,
+    jobs: int | None = None,
 ) -> None:
     """Create a zip archive of a folder respecting .gitignore patterns.
 
@@ -49,6 +148,8 @@ def zip_folder(
         folder_path: Path to the folder to zip
         output_path: Path where the zip file should be created
         compression: Compression method (default: ZIP_DEFLATED for deflate)
+        jobs: Threads compressing files in parallel (default: one per CPU);
+            only used with ZIP_DEFLATED, 1 writes serially
 
     Raises:
         FileNotFoundError: If folder_path does not exist
@@ -73,15 +174,24 @@ def zip_folder(
             # If .gitignore parsing fails, warn but continue
             print(f"Warning: Failed to parse .gitignore: {e}")
 
-    # Create zip archive
-    with zipfile.ZipFile(output_path, "w", compression) as zipf:
-        for root, _dirs, files in os.walk(folder_path):
-            root_path = Path(root)
+    # Collect files in walk order, which is also the archive order
+    included: list[tuple[Path, Path]] = []
+    for root, _dirs, files in os.walk(folder_path):
+        root_path = Path(root)
+
+        for filename in files:
+            file_path = root_path / filename
+            rel_path = file_path.relative_to(folder_path)
 
-            for filename in files:
-                file_path = root_path / filename
-                rel_path = file_path.relative_to(folder_path)
+            # Check if file should be included
+            if should_include(file_path, ignore_matcher):
+                included.append((file_path, rel_path))
 
-                # Check if file should be included
-                if should_include(file_path, ignore_matcher):
-                    zipf.write(file_path, rel_path)
+    # Create zip archive
+    jobs = default_jobs() if jobs is None else jobs
+    with zipfile.ZipFile(output_path, "w", compression) as zipf:
+        if compression == zipfile.ZIP_DEFLATED and jobs > 1:
+            _write_parallel(zipf, included, jobs)
+        else:
+            for file_path, rel_path in included:
+                zipf.write(file_path, rel_path)
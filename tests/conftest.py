@@ -284,6 +284,15 @@ def cleanup_connection_pools() -> Generator[None, None, None]:
         pass
 
 
+@pytest.fixture(autouse=True)
+def disable_parse_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Auto-use fixture that keeps tests off the user's persistent parse cache.
+
+    Tests that exercise the cache re-enable it with DOT_WORK_CACHE_DIR.
+    """
+    monkeypatch.setenv("DOT_WORK_NO_CACHE", "1")
+
+
 @pytest.fixture
 def temp_dir(tmp_path: Path) -> Path:
     """Create a temporary directory for tests.
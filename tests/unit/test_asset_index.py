@@ -0,0 +1,177 @@
+"""Tests for the prebuilt bundled asset index."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dot_work.asset_index import (
+    INDEX_FILENAME,
+    build_asset_index,
+    indexed_environments,
+    load_category_index,
+    write_asset_index,
+)
+from dot_work.installer import discover_available_environments, get_bundled_assets_dir
+from dot_work.prompts import canonical
+from dot_work.prompts.canonical import CANONICAL_PARSER
+from dot_work.skills import parser as skills_parser
+
+GLOBAL_YML = """defaults:
+  environments:
+    claude:
+      target: ".claude/commands/"
+      filename_suffix: ".md"
+"""
+
+PROMPT = """---
+meta:
+  title: "{title}"
+environments:
+  {env}:
+    target: ".{env}/"
+    filename_suffix: ".md"
+---
+Body
+"""
+
+SKILL = """---
+name: test-skill
+description: A test skill
+environments:
+  claude:
+    target: ".claude/skills/"
+---
+Skill body
+"""
+
+
+@pytest.fixture
+def assets_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create a small assets tree and point the parsers at its global.yml files."""
+    assets = tmp_path / "assets"
+    prompts = assets / "prompts"
+    prompts.mkdir(parents=True)
+    (prompts / "global.yml").write_text(GLOBAL_YML, encoding="utf-8")
+    (prompts / "one.md").write_text(PROMPT.format(title="One", env="copilot"), encoding="utf-8")
+    (prompts / "two.md").write_text(PROMPT.format(title="Two", env="cursor"), encoding="utf-8")
+
+    skill_dir = assets / "skills" / "test-skill"
+    skill_dir.mkdir(parents=True)
+    (assets / "skills" / "global.yml").write_text("defaults: {}\n", encoding="utf-8")
+    (skill_dir / "SKILL.md").write_text(SKILL, encoding="utf-8")
+
+    monkeypatch.setattr(canonical, "GLOBAL_DEFAULTS_PATH", prompts / "global.yml")
+    monkeypatch.setattr(skills_parser, "GLOBAL_DEFAULTS_PATH", assets / "skills" / "global.yml")
+    return assets
+
+
+class TestBuildAssetIndex:
+    """Tests for building the index."""
+
+    def test_records_environments_sizes_and_hashes(self, assets_dir: Path) -> None:
+        """Test that each asset records merged environments, size and hash."""
+        index = build_asset_index(assets_dir)
+
+        one = index["categories"]["prompts"]["assets"]["one.md"]
+        assert one["size"] == (assets_dir / "prompts" / "one.md").stat().st_size
+        assert len(one["sha256"]) == 64
+        assert one["environments"]["copilot"]["target"] == ".copilot/"
+        assert one["environments"]["claude"] == {
+            "target": ".claude/commands/",
+            "filename": None,
+            "filename_suffix": ".md",
+        }
+
+        skill = index["categories"]["skills"]["assets"]["test-skill/SKILL.md"]
+        assert skill["environments"]["claude"]["target"] == ".claude/skills/"
+
+    def test_records_parse_errors(self, assets_dir: Path) -> None:
+        """Test that invalid assets are indexed with an error and no environments."""
+        (assets_dir / "prompts" / "broken.md").write_text("no frontmatter", encoding="utf-8")
+
+        entry = build_asset_index(assets_dir)["categories"]["prompts"]["assets"]["broken.md"]
+
+        assert entry["environments"] == {}
+        assert "error" in entry
+
+
+class TestLoadCategoryIndex:
+    """Tests for index validation against the files on disk."""
+
+    def test_missing_index_returns_none(self, assets_dir: Path) -> None:
+        """Test that directories without an index fall back to parsing."""
+        assert load_category_index(assets_dir / "prompts") is None
+
+    def test_current_index_is_used(self, assets_dir: Path) -> None:
+        """Test that a freshly written index is trusted."""
+        write_asset_index(assets_dir)
+
+        assert indexed_environments(assets_dir / "prompts") == {
+            "claude": {"one", "two"},
+            "copilot": {"one"},
+            "cursor": {"two"},
+        }
+        assert indexed_environments(assets_dir / "skills") == {"claude": {"test-skill"}}
+
+    @pytest.mark.parametrize(
+        "change",
+        ["edit_asset", "add_asset", "remove_asset", "edit_global"],
+    )
+    def test_stale_index_is_rejected(self, assets_dir: Path, change: str) -> None:
+        """Test that any change to the category invalidates the index."""
+        write_asset_index(assets_dir)
+        prompts = assets_dir / "prompts"
+
+        if change == "edit_asset":
+            (prompts / "one.md").write_text(PROMPT.format(title="Uno", env="copilot"))
+        elif change == "add_asset":
+            (prompts / "three.md").write_text(PROMPT.format(title="Three", env="copilot"))
+        elif change == "remove_asset":
+            (prompts / "two.md").unlink()
+        else:
+            (prompts / "global.yml").write_text("defaults: {}\n", encoding="utf-8")
+
+        assert load_category_index(prompts) is None
+
+    def test_wrong_version_is_rejected(self, assets_dir: Path) -> None:
+        """Test that an index from another layout version is ignored."""
+        index_path = write_asset_index(assets_dir)
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        index["version"] = 0
+        index_path.write_text(json.dumps(index), encoding="utf-8")
+
+        assert load_category_index(assets_dir / "prompts") is None
+
+
+class TestDiscoveryUsesIndex:
+    """Tests for discover_available_environments with an index."""
+
+    def test_indexed_discovery_skips_parsing(self, assets_dir: Path) -> None:
+        """Test that discovery answers from the index without parsing YAML."""
+        write_asset_index(assets_dir)
+
+        with patch.object(CANONICAL_PARSER, "parse") as spy:
+            result = discover_available_environments(assets_dir / "prompts")
+
+        spy.assert_not_called()
+        assert result["copilot"] == {"one"}
+
+    def test_unindexed_directory_is_parsed(self, assets_dir: Path) -> None:
+        """Test that user directories without an index are still parsed."""
+        assert discover_available_environments(assets_dir / "prompts")["cursor"] == {"two"}
+
+    def test_index_matches_parsing_for_bundled_assets(self, tmp_path: Path) -> None:
+        """Test that the index of the bundled assets agrees with parsing them."""
+        assets = tmp_path / "assets"
+        shutil.copytree(get_bundled_assets_dir(), assets)
+        (assets / INDEX_FILENAME).unlink(missing_ok=True)
+        parsed = discover_available_environments(assets / "prompts")
+
+        write_asset_index(assets)
+
+        assert indexed_environments(assets / "prompts") == parsed
@@ -17,6 +17,7 @@ from dot_work.prompts.canonical import (
     _deep_merge,
     _load_global_defaults,
     extract_environment_file,
+    find_canonical_prompt_files,
     generate_environment_prompt,
     parse_canonical_prompt,
     validate_canonical_prompt,
@@ -445,6 +446,66 @@ Content here"""
         assert validator.is_valid(valid_prompt, strict=True)  # Should still be True
 
 
+class TestBatchValidation:
+    """Tests for validate_file, validate_many and find_canonical_prompt_files."""
+
+    @pytest.fixture
+    def prompt_dir(self, tmp_path: Path, valid_canonical_content: str) -> Path:
+        """Directory with two valid prompts and one with an empty body."""
+        (tmp_path / "a.md").write_text(valid_canonical_content, encoding="utf-8")
+        nested = tmp_path / "nested"
+        nested.mkdir()
+        (nested / "b.md").write_text(valid_canonical_content, encoding="utf-8")
+        (tmp_path / "empty.md").write_text(
+            valid_canonical_content.split("---\n\nThis is")[0] + "---\n", encoding="utf-8"
+        )
+        return tmp_path
+
+    def test_validate_file_reports_errors_and_timing(self, prompt_dir: Path) -> None:
+        """Test that a file's errors and duration are recorded."""
+        result = CanonicalPromptValidator().validate_file(prompt_dir / "empty.md")
+
+        assert not result.valid
+        assert [e.message for e in result.errors] == ["Prompt content is empty"]
+        assert result.duration > 0
+        assert result.to_dict()["errors"] == ["Prompt content is empty"]
+
+    def test_validate_file_reports_parse_failures(self, tmp_path: Path) -> None:
+        """Test that unreadable files become errors instead of exceptions."""
+        result = CanonicalPromptValidator().validate_file(tmp_path / "missing.md")
+
+        assert not result.valid
+        assert "not found" in result.errors[0].message
+
+    def test_strict_warnings_fail(self, minimal_canonical_content: str, tmp_path: Path) -> None:
+        """Test that warnings only fail the file in strict mode."""
+        path = tmp_path / "minimal.md"
+        path.write_text(minimal_canonical_content, encoding="utf-8")
+        validator = CanonicalPromptValidator()
+
+        assert validator.validate_file(path).valid
+        assert not validator.validate_file(path, strict=True).valid
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_validate_many_keeps_input_order(self, prompt_dir: Path, jobs: int) -> None:
+        """Test that in-process and process-pool validation agree."""
+        paths = find_canonical_prompt_files([prompt_dir])
+
+        results = CanonicalPromptValidator().validate_many(paths, jobs=jobs)
+
+        assert [r.path for r in results] == paths
+        assert [r.valid for r in results] == [True, False, True]
+
+    def test_find_files_expands_dirs_and_globs(self, prompt_dir: Path) -> None:
+        """Test directory recursion, glob expansion and de-duplication."""
+        found = find_canonical_prompt_files(
+            [prompt_dir / "a.md", str(prompt_dir / "*.md"), prompt_dir / "missing.md"]
+        )
+
+        assert found == [prompt_dir / "a.md", prompt_dir / "empty.md", prompt_dir / "missing.md"]
+        assert prompt_dir / "nested" / "b.md" in find_canonical_prompt_files([prompt_dir])
+
+
 class TestConvenienceFunctions:
     """Test convenience functions."""
 
@@ -6,15 +6,21 @@ Regression guard for TEST-002@d8c4e1.
 
 from __future__ import annotations
 
+import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 from typer.testing import CliRunner
 
-from dot_work.cli import app
+import dot_work
+from dot_work.cli import LAZY_SUBCOMMANDS, app
 
 if TYPE_CHECKING:
-    pass
+    import pytest
 
 
 runner = CliRunner()
@@ -131,6 +137,40 @@ class TestHelpCommand:
         assert "FILE" in result.stdout
         assert "--frontmatter" in result.stdout
 
+    def test_lazy_subcommands_match_their_help(self) -> None:
+        """The static help of lazily imported subcommands should match their own."""
+        result = runner.invoke(app, ["--help"])
+        assert result.exit_code == 0
+        for name, entry in LAZY_SUBCOMMANDS.items():
+            assert name in result.stdout
+            assert entry.load().info.help == entry.help
+
+    def test_startup_does_not_import_heavy_modules(self) -> None:
+        """Importing the CLI should not pull in subcommand modules, the installer or YAML."""
+        heavy = [
+            "jinja2",
+            "yaml",
+            "dot_work.installer",
+            "dot_work.install_manifest",
+            "dot_work.utils.fingerprint",
+            "dot_work.utils.io_pool",
+            "dot_work.utils.watch",
+            *(entry.import_path.split(":")[0] for entry in LAZY_SUBCOMMANDS.values()),
+        ]
+        code = f"import sys, dot_work.cli; print([m for m in {heavy!r} if m in sys.modules])"
+        src_dir = Path(dot_work.__file__).resolve().parent.parent
+        env = dict(os.environ, PYTHONPATH=str(src_dir))
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_lazy_subcommand_help(self) -> None:
+        """A lazily imported subcommand group should show its own commands."""
+        result = runner.invoke(app, ["skills", "--help"])
+        assert result.exit_code == 0
+        assert "list" in result.stdout
+
 
 # =============================================================================
 # List Command Tests
@@ -192,6 +232,17 @@ class TestDetectCommand:
         assert result.exit_code == 0
         assert "Detected" in result.stdout
 
+    def test_detect_environments_returns_all_matches(self, tmp_path: Path) -> None:
+        """detect_environments should report every environment with a marker."""
+        from dot_work.cli import detect_environment, detect_environments
+
+        (tmp_path / ".cursor").mkdir()
+        (tmp_path / ".github" / "prompts").mkdir(parents=True)
+
+        detected = detect_environments(tmp_path)
+        assert {"copilot", "cursor"} <= set(detected)
+        assert detected[0] == detect_environment(tmp_path)
+
     def test_detect_nonexistent_directory(self, tmp_path: Path) -> None:
         """detect should error on nonexistent directory."""
         fake_path = tmp_path / "nonexistent"
@@ -248,6 +299,44 @@ class TestInitWorkCommand:
         result = runner.invoke(app, ["init-tracking", "--target", str(tmp_path), "--force"])
         assert result.exit_code == 0
 
+    def test_status_json_after_init(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """status --format json should report the counts of a fresh .work/ directory."""
+        runner.invoke(app, ["init-tracking", "--target", str(tmp_path)])
+        high = tmp_path / ".work" / "agent" / "issues" / "high.md"
+        high.write_text(high.read_text() + '---\nid: "BUG-001@abc123"\n---\n', encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(app, ["status", "--format", "json"])
+
+        assert result.exit_code == 0
+        output = json.loads(result.stdout)
+        assert output["focus"]["current"] == "N/A"
+        assert output["issue_counts"]["high"] == 1
+        assert output["issue_counts"]["total"] == 1
+
+    def test_issue_lookup(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """issue show and status --issue should print just the issue's block."""
+        runner.invoke(app, ["init-tracking", "--target", str(tmp_path)])
+        high = tmp_path / ".work" / "agent" / "issues" / "high.md"
+        block = '---\nid: "BUG-001@abc123"\nstatus: proposed\n---\n\n- [ ] Fix [it]\n'
+        high.write_text(high.read_text() + block + "\n---\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(app, ["issue", "show", "BUG-001"])
+        assert result.exit_code == 0
+        assert result.stdout.endswith(block)
+        assert "No issues" not in result.stdout
+
+        result = runner.invoke(app, ["status", "--issue", "BUG-001@abc123", "--format", "json"])
+        assert result.exit_code == 0
+        output = json.loads(result.stdout)
+        assert output["text"] == block
+        assert (output["priority"], output["status"]) == ("high", "proposed")
+
+        result = runner.invoke(app, ["issue", "show", "BUG-002"])
+        assert result.exit_code == 1
+        assert "Issue not found" in result.stdout
+
 
 # =============================================================================
 # Install Command Tests
@@ -292,6 +381,227 @@ class TestInstallCommand:
         prompt_files = list(prompts_dir.glob("*.md"))
         assert len(prompt_files) > 0
 
+    def test_install_multiple_environments(self, tmp_path: Path) -> None:
+        """install --env a,b should install for every listed environment."""
+        result = runner.invoke(
+            app, ["install", "--target", str(tmp_path), "--env", "claude, copilot", "--force"]
+        )
+        assert result.exit_code == 0
+        assert list((tmp_path / ".claude" / "commands").glob("*.md"))
+        assert list((tmp_path / ".github" / "prompts").glob("*.md"))
+
+    def test_install_empty_environment_list(self, tmp_path: Path) -> None:
+        """install --env with no environment in the list should be a usage error."""
+        other = tmp_path / "other"
+        other.mkdir()
+        for env in (",", " ", " , "):
+            single = runner.invoke(app, ["install", "--target", str(tmp_path), "--env", env])
+            fleet = runner.invoke(
+                app, ["install", "--target", str(tmp_path), "--target", str(other), "--env", env]
+            )
+
+            for result in (single, fleet):
+                assert result.exit_code == 2
+                assert "no environment given" in result.output
+        assert list(tmp_path.iterdir()) == [other]
+
+    def test_install_multiple_environments_parses_once(self, tmp_path: Path) -> None:
+        """Each canonical source should be parsed once however many environments."""
+        from dot_work import installer
+
+        with patch.object(
+            installer, "_read_canonical_source", wraps=installer._read_canonical_source
+        ) as spy:
+            result = runner.invoke(
+                app,
+                ["install", "--target", str(tmp_path), "--env", "claude,copilot,cursor", "-f"],
+            )
+
+        assert result.exit_code == 0
+        parsed_files = [c.args[0] for c in spy.call_args_list]
+        assert parsed_files
+        assert len(parsed_files) == len(set(parsed_files))
+
+    def test_install_all_detected(self, tmp_path: Path) -> None:
+        """install --env all-detected should install for every detected environment."""
+        (tmp_path / ".cursor").mkdir()
+        (tmp_path / ".github" / "prompts").mkdir(parents=True)
+
+        result = runner.invoke(
+            app, ["install", "--target", str(tmp_path), "--env", "all-detected", "--force"]
+        )
+
+        assert result.exit_code == 0
+        assert list((tmp_path / ".github" / "prompts").glob("*.md"))
+        assert list((tmp_path / ".cursor" / "rules").glob("*.mdc"))
+
+    def test_install_multiple_targets(self, tmp_path: Path) -> None:
+        """install with repeated --target should install into every target."""
+        targets = [tmp_path / "svc-a", tmp_path / "svc-b"]
+        for target in targets:
+            target.mkdir()
+
+        args = ["install", "--env", "copilot", "--force"]
+        for target in targets:
+            args += ["--target", str(target)]
+        result = runner.invoke(app, args)
+
+        assert result.exit_code == 0
+        assert "Fleet install summary" in result.stdout
+        for target in targets:
+            assert list((target / ".github" / "prompts").glob("*.md"))
+
+    def test_install_targets_from_parses_once(self, tmp_path: Path) -> None:
+        """--targets-from should parse each source once for all targets."""
+        from dot_work import installer
+
+        targets = [tmp_path / f"svc-{i}" for i in range(3)]
+        for target in targets:
+            target.mkdir()
+        targets_file = tmp_path / "targets.txt"
+        targets_file.write_text(
+            "# fleet\n\n" + "\n".join(str(t) for t in targets) + "\n", encoding="utf-8"
+        )
+
+        with patch.object(
+            installer, "_read_canonical_source", wraps=installer._read_canonical_source
+        ) as spy:
+            result = runner.invoke(
+                app, ["install", "--targets-from", str(targets_file), "--env", "claude", "-f"]
+            )
+
+        assert result.exit_code == 0
+        parsed_files = [c.args[0] for c in spy.call_args_list]
+        assert parsed_files
+        assert len(parsed_files) == len(set(parsed_files))
+        for target in targets:
+            assert list((target / ".claude" / "commands").glob("*.md"))
+
+    def test_install_fleet_reports_failed_targets(self, tmp_path: Path) -> None:
+        """A missing target should fail the run without stopping the others."""
+        good = tmp_path / "good"
+        good.mkdir()
+        missing = tmp_path / "missing"
+
+        result = runner.invoke(
+            app,
+            ["install", "-t", str(good), "-t", str(missing), "--env", "copilot", "--force"],
+        )
+
+        assert result.exit_code == 1
+        assert "1 succeeded, 1 failed" in result.stdout
+        assert list((good / ".github" / "prompts").glob("*.md"))
+
+    def test_install_fleet_requires_env(self, tmp_path: Path) -> None:
+        """Installing into several targets should not prompt for an environment."""
+        result = runner.invoke(
+            app, ["install", "-t", str(tmp_path / "a"), "-t", str(tmp_path / "b")]
+        )
+        assert result.exit_code == 1
+        assert "--env is required" in result.stdout
+
+    def test_install_watch_reinstalls_changed_category(self, tmp_path: Path) -> None:
+        """install --watch should re-install only the category of a changed source."""
+        from dot_work import installer
+
+        assets_dir = installer.get_bundled_assets_dir()
+        subagent = sorted((assets_dir / "subagents").glob("*.md"))[0]
+
+        with (
+            patch("dot_work.utils.watch.watch_changes", return_value=iter([{subagent}])),
+            patch.object(
+                installer, "_read_canonical_source", wraps=installer._read_canonical_source
+            ) as spy,
+            patch.object(
+                installer,
+                "install_subagents_by_environment",
+                wraps=installer.install_subagents_by_environment,
+            ) as subagents,
+        ):
+            result = runner.invoke(
+                app, ["install", "--target", str(tmp_path), "--env", "claude", "-f", "--watch"]
+            )
+
+        assert result.exit_code == 0
+        assert f"Changed: {subagent.name} (subagents)" in result.stdout
+        assert subagents.call_count == 2
+        # Canonical prompts were parsed by the first install only
+        parsed_files = [c.args[0] for c in spy.call_args_list]
+        assert len(parsed_files) == len(set(parsed_files))
+
+    def test_install_watch_requires_single_target(self, tmp_path: Path) -> None:
+        """install --watch should refuse several targets."""
+        result = runner.invoke(
+            app,
+            ["install", "-t", str(tmp_path / "a"), "-t", str(tmp_path / "b"), "-e", "claude"]
+            + ["--watch"],
+        )
+        assert result.exit_code == 1
+        assert "--watch supports a single target" in result.stdout
+
+    def test_install_profile_json(self, tmp_path: Path) -> None:
+        """install --profile-json should report phases and counters per category."""
+        report_path = tmp_path / "profile.json"
+        project = tmp_path / "project"
+        project.mkdir()
+
+        result = runner.invoke(
+            app,
+            ["install", "-t", str(project), "-e", "claude", "-f", "--profile"]
+            + ["--profile-json", str(report_path)],
+        )
+
+        assert result.exit_code == 0
+        assert "Install profile" in result.stdout
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        subagents = report["categories"]["subagents"]
+        assert {"discover", "parse", "merge", "scan", "write"} <= set(subagents["phases"])
+        assert subagents["counters"]["written"] > 0
+        assert subagents["counters"]["bytes_written"] > 0
+
+    def test_install_profile_json_to_stdout(self, tmp_path: Path) -> None:
+        """install --profile-json - should leave only the JSON on stdout."""
+        result = runner.invoke(
+            app,
+            ["install", "-t", str(tmp_path), "-e", "claude", "-f", "--profile"]
+            + ["--profile-json", "-"],
+        )
+
+        assert result.exit_code == 0
+        report = json.loads(result.stdout)
+        assert report["categories"]["subagents"]["counters"]["written"] > 0
+        assert "Install profile" in result.stderr
+        assert "Installing" in result.stderr
+
+    def test_install_profile_rejects_watch(self, tmp_path: Path) -> None:
+        """install --profile should refuse --watch, which never finishes."""
+        result = runner.invoke(
+            app, ["install", "-t", str(tmp_path), "-e", "claude", "--profile", "--watch"]
+        )
+        assert result.exit_code == 1
+        assert "--profile cannot be combined with --watch" in result.stdout
+
+    def test_changed_categories(self, tmp_path: Path) -> None:
+        """Changed files should map to their asset categories."""
+        from dot_work.cli import _changed_categories
+
+        assets = tmp_path / "assets"
+        skill = assets / "skills" / "review" / "SKILL.md"
+
+        assert _changed_categories({skill, assets / "index.json"}, assets) == {"skills"}
+        assert _changed_categories({assets / "prompts" / "global.yml", skill}, assets) is None
+        assert _changed_categories({assets}, assets) is None
+        assert (
+            _changed_categories({assets / "compiled_templates" / "prompts" / "x.py"}, assets)
+            == set()
+        )
+
+    def test_install_all_detected_without_markers(self, tmp_path: Path) -> None:
+        """install --env all-detected should fail when nothing is detected."""
+        result = runner.invoke(app, ["install", "--target", str(tmp_path), "--env", "all-detected"])
+        assert result.exit_code == 1
+        assert "No AI environment detected" in result.stdout
+
 
 # =============================================================================
 # Init Command Tests
@@ -458,6 +768,46 @@ class TestValidateYamlCommand:
         assert "error" in result.stdout.lower()
 
 
+class TestCanonicalValidateCommand:
+    """Tests for 'canonical validate' command."""
+
+    PROMPT = (
+        "---\nmeta:\n  title: T\n  description: D\n  version: '1'\n"
+        "environments:\n  claude:\n    target: .claude/\n    filename_suffix: .md\n---\nBody\n"
+    )
+
+    def test_validates_directory(self, tmp_path: Path) -> None:
+        """canonical validate should accept a directory and summarize results."""
+        (tmp_path / "a.md").write_text(self.PROMPT)
+        (tmp_path / "b.md").write_text(self.PROMPT)
+
+        result = runner.invoke(app, ["canonical", "validate", str(tmp_path), "--jobs", "1"])
+        assert result.exit_code == 0
+        assert "2 valid, 0 invalid" in result.stdout
+
+    def test_json_report_and_failure(self, tmp_path: Path) -> None:
+        """canonical validate --format json should report each file and fail on errors."""
+        import json
+
+        (tmp_path / "good.md").write_text(self.PROMPT)
+        (tmp_path / "bad.md").write_text("no frontmatter")
+
+        result = runner.invoke(
+            app, ["canonical", "validate", str(tmp_path / "*.md"), "-f", "json", "-j", "1"]
+        )
+        assert result.exit_code == 1
+        report = json.loads(result.stdout)
+        assert report["summary"]["invalid"] == 1
+        assert [f["valid"] for f in report["files"]] == [False, True]
+        assert "duration_ms" in report["files"][0]
+
+    def test_no_matching_files(self, tmp_path: Path) -> None:
+        """canonical validate should fail when nothing matches."""
+        result = runner.invoke(app, ["canonical", "validate", str(tmp_path / "*.md")])
+        assert result.exit_code == 1
+        assert "no canonical prompt files" in result.stdout.lower()
+
+
 # =============================================================================
 # Edge Cases and Integration
 # =============================================================================
@@ -505,4 +855,5 @@ class TestEdgeCases:
         found = sum(1 for env in environments if env in result.stdout.lower())
         assert found >= 3, f"Expected at least 3 environments in output: {result.stdout}"
 
+
 # Review command tests have been removed - module exported to dot-review plugin
@@ -0,0 +1,287 @@
+"""Tests for the install manifest and incremental installs."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from rich.console import Console
+
+from dot_work.install_manifest import (
+    MANIFEST_PATH,
+    InstallManifest,
+    InstallStatus,
+    sha256_hex,
+)
+from dot_work.installer import (
+    CopyMode,
+    _install_file,
+    install_canonical_prompts_by_environment,
+    install_subagents_by_environment,
+)
+
+PROMPT = (
+    "---\nmeta:\n  title: Alpha\nenvironments:\n  custom:\n"
+    "    target: .custom/\n    filename_suffix: .prompt.md\n---\n\nAlpha body\n"
+)
+
+
+def _record(manifest: InstallManifest, dest: Path, data: bytes) -> str:
+    """Write data to dest and record it as installed from an identical source."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.write_bytes(data)
+    digest = sha256_hex(data)
+    manifest.record(dest, source=Path("src.md"), source_sha256=digest, sha256=digest)
+    return digest
+
+
+class TestInstallManifest:
+    """Tests for InstallManifest status, record and persistence."""
+
+    def test_missing_destination(self, tmp_path: Path) -> None:
+        """Test that a destination that does not exist is MISSING."""
+        manifest = InstallManifest(tmp_path)
+
+        assert manifest.status(tmp_path / "a.md", "x", "x") is InstallStatus.MISSING
+
+    def test_unchanged_destination_is_not_read(self, tmp_path: Path) -> None:
+        """Test that a recorded destination with matching stat is CURRENT without reading it."""
+        manifest = InstallManifest(tmp_path)
+        dest = tmp_path / "a.md"
+        digest = _record(manifest, dest, b"content")
+
+        with patch.object(Path, "read_bytes") as read_bytes:
+            status = manifest.status(dest, digest, digest)
+
+        assert status is InstallStatus.CURRENT
+        read_bytes.assert_not_called()
+
+    def test_source_change_is_stale(self, tmp_path: Path) -> None:
+        """Test that an untouched destination with a new source is STALE."""
+        manifest = InstallManifest(tmp_path)
+        dest = tmp_path / "a.md"
+        _record(manifest, dest, b"old")
+        new = sha256_hex(b"new")
+
+        assert manifest.status(dest, new, new) is InstallStatus.STALE
+
+    def test_user_edit_is_modified(self, tmp_path: Path) -> None:
+        """Test that a destination edited after install is MODIFIED."""
+        manifest = InstallManifest(tmp_path)
+        dest = tmp_path / "a.md"
+        digest = _record(manifest, dest, b"content")
+        dest.write_bytes(b"edited by the user")
+
+        assert manifest.status(dest, digest, digest) is InstallStatus.MODIFIED
+
+    def test_touched_but_identical_is_current(self, tmp_path: Path) -> None:
+        """Test that an mtime-only change is resolved by hashing."""
+        manifest = InstallManifest(tmp_path)
+        dest = tmp_path / "a.md"
+        digest = _record(manifest, dest, b"content")
+        os.utime(dest, ns=(0, 0))
+
+        assert manifest.status(dest, digest, digest) is InstallStatus.CURRENT
+
+    def test_untracked_destination(self, tmp_path: Path) -> None:
+        """Test that unrecorded files are UNTRACKED unless they already match."""
+        manifest = InstallManifest(tmp_path)
+        dest = tmp_path / "a.md"
+        dest.write_bytes(b"mine")
+        digest = sha256_hex(b"content")
+
+        assert manifest.status(dest, digest, digest) is InstallStatus.UNTRACKED
+        dest.write_bytes(b"content")
+        assert manifest.status(dest, digest, digest) is InstallStatus.CURRENT
+
+    def test_size_mismatch_is_not_hashed(self, tmp_path: Path) -> None:
+        """Test that an untracked file of another size is UNTRACKED without reading it."""
+        manifest = InstallManifest(tmp_path)
+        dest = tmp_path / "a.md"
+        dest.write_bytes(b"mine")
+        digest = sha256_hex(b"content")
+
+        with patch.object(Path, "read_bytes") as read_bytes:
+            status = manifest.status(dest, digest, digest, size=len(b"content"))
+
+        assert status is InstallStatus.UNTRACKED
+        read_bytes.assert_not_called()
+
+    def test_mode_change_is_stale(self, tmp_path: Path) -> None:
+        """Test that a file placed another way (copy vs. link) is rewritten silently."""
+        manifest = InstallManifest(tmp_path)
+        dest = tmp_path / "a.md"
+        digest = _record(manifest, dest, b"content")
+
+        assert manifest.status(dest, digest, digest, "link") is InstallStatus.STALE
+        del manifest.entries["a.md"]
+        assert manifest.status(dest, digest, digest, "link") is InstallStatus.STALE
+
+    def test_save_and_load_round_trip(self, tmp_path: Path) -> None:
+        """Test that entries persist under .work/ keyed by relative path."""
+        manifest = InstallManifest(tmp_path)
+        _record(manifest, tmp_path / ".claude" / "a.md", b"content")
+        manifest.save()
+
+        data = json.loads((tmp_path / MANIFEST_PATH).read_text(encoding="utf-8"))
+        assert list(data["files"]) == [".claude/a.md"]
+        assert InstallManifest.load(tmp_path).entries == manifest.entries
+
+    def test_save_skips_when_unchanged(self, tmp_path: Path) -> None:
+        """Test that save does nothing when no entry changed."""
+        InstallManifest(tmp_path).save()
+
+        assert not (tmp_path / MANIFEST_PATH).exists()
+
+    @pytest.mark.parametrize(
+        "text", ["not json", "[]", '{"version": 0, "files": {}}', '{"version": 1, "files": []}']
+    )
+    def test_unusable_manifest_is_empty(self, tmp_path: Path, text: str) -> None:
+        """Test that corrupt or foreign manifests are ignored."""
+        path = tmp_path / MANIFEST_PATH
+        path.parent.mkdir(parents=True)
+        path.write_text(text, encoding="utf-8")
+
+        assert InstallManifest.load(tmp_path).entries == {}
+
+
+class TestIncrementalInstall:
+    """Tests for manifest-driven canonical and subagent installs."""
+
+    @pytest.fixture
+    def source_dir(self, tmp_path: Path) -> Path:
+        """Source directory with one canonical prompt for 'custom'."""
+        source = tmp_path / "prompts"
+        source.mkdir()
+        (source / "alpha.md").write_text(PROMPT, encoding="utf-8")
+        return source
+
+    @pytest.fixture
+    def target(self, tmp_path: Path) -> Path:
+        """Empty target project."""
+        target = tmp_path / "out"
+        target.mkdir()
+        return target
+
+    def test_reinstall_skips_unchanged_files(self, source_dir: Path, target: Path) -> None:
+        """Test that a second install writes nothing and does not prompt."""
+        install_canonical_prompts_by_environment("custom", target, source_dir, Console())
+        console = MagicMock()
+
+        with patch("dot_work.installer._install_file") as install_file:
+            plan = install_canonical_prompts_by_environment("custom", target, source_dir, console)
+
+        install_file.assert_not_called()
+        console.input.assert_not_called()
+        assert plan.up_to_date_count == 1
+        assert plan.installed_count == 0
+
+    def test_changed_source_updates_without_prompt(self, source_dir: Path, target: Path) -> None:
+        """Test that files dot-work wrote are updated silently when their source changes."""
+        install_canonical_prompts_by_environment("custom", target, source_dir, Console())
+        (source_dir / "alpha.md").write_text(PROMPT + "More\n", encoding="utf-8")
+        console = MagicMock()
+
+        plan = install_canonical_prompts_by_environment("custom", target, source_dir, console)
+
+        console.input.assert_not_called()
+        assert plan.installed_count == 1
+        assert (
+            (target / ".custom" / "alpha.prompt.md").read_text(encoding="utf-8").endswith("More\n")
+        )
+
+    def test_user_edits_are_protected(self, source_dir: Path, target: Path) -> None:
+        """Test that an edited destination goes through the overwrite prompt."""
+        install_canonical_prompts_by_environment("custom", target, source_dir, Console())
+        installed = target / ".custom" / "alpha.prompt.md"
+        installed.write_text("my local changes\n", encoding="utf-8")
+        console = MagicMock()
+        console.input.return_value = "s"  # SKIP
+
+        plan = install_canonical_prompts_by_environment("custom", target, source_dir, console)
+
+        console.input.assert_called()
+        assert plan.skipped_count == 1
+        assert installed.read_text(encoding="utf-8") == "my local changes\n"
+
+    def test_dry_run_leaves_manifest_alone(self, source_dir: Path, target: Path) -> None:
+        """Test that dry-run neither writes files nor the manifest."""
+        install_canonical_prompts_by_environment(
+            "custom", target, source_dir, Console(), dry_run=True
+        )
+
+        assert not (target / MANIFEST_PATH).exists()
+
+    def test_subagents_skip_unchanged_files(self, tmp_path: Path, target: Path) -> None:
+        """Test that re-installing subagents leaves up-to-date copies untouched."""
+        subagents = tmp_path / "subagents"
+        subagents.mkdir()
+        (subagents / "reviewer.md").write_text(
+            "---\nmeta:\n  name: reviewer\n  description: Reviews code\n"
+            "environments:\n  claude:\n    target: .claude/agents/\n---\n\nYou review code.\n",
+            encoding="utf-8",
+        )
+        assert install_subagents_by_environment("claude", target, subagents, Console()) == 1
+
+        with patch("dot_work.installer._install_file") as install_file:
+            count = install_subagents_by_environment("claude", target, subagents, Console())
+
+        install_file.assert_not_called()
+        assert count == 1
+
+    def test_link_mode_switches_without_prompt(
+        self, source_dir: Path, target: Path, tmp_path: Path
+    ) -> None:
+        """Test that re-installing with --link replaces copies with store links."""
+        install_canonical_prompts_by_environment("custom", target, source_dir, Console())
+        installed = target / ".custom" / "alpha.prompt.md"
+        console = MagicMock()
+
+        with patch.dict(os.environ, {"DOT_WORK_STORE_DIR": str(tmp_path / "store")}):
+            plan = install_canonical_prompts_by_environment(
+                "custom", target, source_dir, console, copy_mode=CopyMode.LINK
+            )
+            again = install_canonical_prompts_by_environment(
+                "custom", target, source_dir, console, copy_mode=CopyMode.LINK
+            )
+
+        console.input.assert_not_called()
+        assert plan.installed_count == 1
+        assert again.up_to_date_count == 1
+        assert os.path.samefile(installed, next((tmp_path / "store").rglob("*.md")))
+
+    def test_link_fallback_is_recorded_as_copy(
+        self, source_dir: Path, target: Path, tmp_path: Path
+    ) -> None:
+        """Test that a link that fell back to a copy is recorded as a copy."""
+        unsupported = OSError(1, "not permitted")
+
+        with (
+            patch.dict(os.environ, {"DOT_WORK_STORE_DIR": str(tmp_path / "store")}),
+            patch("os.link", side_effect=unsupported),
+            patch("os.symlink", side_effect=unsupported),
+        ):
+            install_canonical_prompts_by_environment(
+                "custom", target, source_dir, Console(), copy_mode=CopyMode.LINK
+            )
+
+        entry = InstallManifest.load(target).get(target / ".custom" / "alpha.prompt.md")
+        assert entry is not None
+        assert entry.mode == "copy"
+
+    def test_planned_bytes_are_written(self, source_dir: Path, target: Path) -> None:
+        """Test that a source edited after planning cannot break the recorded hash."""
+
+        def edit_then_install(job: tuple) -> object:
+            (source_dir / "alpha.md").write_text(PROMPT + "Edited\n", encoding="utf-8")
+            return _install_file(job)
+
+        with patch("dot_work.installer._install_file", side_effect=edit_then_install):
+            install_canonical_prompts_by_environment("custom", target, source_dir, Console())
+
+        installed = target / ".custom" / "alpha.prompt.md"
+        entry = InstallManifest.load(target).get(installed)
+        assert entry is not None
+        assert installed.read_text(encoding="utf-8") == PROMPT
+        assert entry.sha256 == sha256_hex(installed.read_bytes())
@@ -1,15 +1,23 @@
 """Unit tests for the installer module."""
 
+import errno
+import os
 import re
+import stat
+from collections.abc import Iterator
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from dot_work.environments import ENVIRONMENTS
+from dot_work.install_manifest import sha256_hex
 from dot_work.installer import (
     BatchChoice,
+    CopyMode,
     InstallState,
+    ParsedAssets,
+    _install_file,
     _prompt_batch_choice,
     create_jinja_env,
     detect_project_context,
@@ -25,6 +33,7 @@ from dot_work.installer import (
     install_for_windsurf,
     install_for_zed,
     install_prompts,
+    install_skills_by_environment,
     render_prompt,
     should_write_file,
 )
@@ -1103,3 +1112,341 @@ class TestJinjaSecurity:
         assert env.keep_trailing_newline is True  # Preserves markdown formatting
         assert env.trim_blocks is False  # Preserves markdown formatting
         assert env.lstrip_blocks is False  # Preserves markdown formatting
+
+
+class TestCopyStrategies:
+    """Tests for copying and linking verbatim asset files."""
+
+    @pytest.fixture
+    def source(self, tmp_path: Path) -> Path:
+        """Source asset file."""
+        source = tmp_path / "src" / "alpha.md"
+        source.parent.mkdir()
+        source.write_bytes(b"# Alpha\n\nBody\n")
+        return source
+
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> Iterator[Path]:
+        """Asset store directory used for --link installs."""
+        store = tmp_path / "store"
+        with patch.dict(os.environ, {"DOT_WORK_STORE_DIR": str(store)}):
+            yield store
+
+    def _job(self, source: Path, dest: Path, mode: CopyMode) -> tuple[Path, Path, str, CopyMode]:
+        return (source, dest, sha256_hex(source.read_bytes()), mode)
+
+    def test_copy_creates_independent_file(self, source: Path, tmp_path: Path) -> None:
+        """Test that COPY writes an independent copy, creating parent directories."""
+        dest = tmp_path / "out" / "nested" / "alpha.md"
+
+        result = _install_file(self._job(source, dest, CopyMode.COPY))
+
+        assert not isinstance(result, OSError)
+        assert result[1] is CopyMode.COPY
+        assert dest.read_bytes() == source.read_bytes()
+        assert not dest.is_symlink()
+        assert not os.path.samefile(dest, source)
+
+    def test_copy_falls_back_without_kernel_copy(self, source: Path, tmp_path: Path) -> None:
+        """Test that an unsupported copy_file_range falls back to a buffered copy."""
+        dest = tmp_path / "alpha.md"
+        unsupported = OSError(errno.EXDEV, "cross-device")
+
+        with patch("os.copy_file_range", side_effect=unsupported, create=True):
+            result = _install_file(self._job(source, dest, CopyMode.COPY))
+
+        assert not isinstance(result, OSError)
+        assert dest.read_bytes() == source.read_bytes()
+
+    def test_copy_keeps_existing_permissions(self, source: Path, tmp_path: Path) -> None:
+        """Test that re-installing over a file keeps the permissions the user gave it."""
+        dest = tmp_path / "alpha.md"
+        dest.write_bytes(b"old")
+        dest.chmod(0o600)
+
+        _install_file(self._job(source, dest, CopyMode.COPY))
+
+        assert dest.read_bytes() == source.read_bytes()
+        assert stat.S_IMODE(dest.stat().st_mode) == 0o600
+
+    def test_copy_writes_bytes(self, tmp_path: Path) -> None:
+        """Test that in-memory source bytes are written as they are."""
+        dest = tmp_path / "alpha.md"
+
+        result = _install_file((b"planned\n", dest, sha256_hex(b"planned\n"), CopyMode.COPY))
+
+        assert not isinstance(result, OSError)
+        assert dest.read_bytes() == b"planned\n"
+
+    def test_copy_replaces_link_instead_of_writing_through(
+        self, source: Path, tmp_path: Path, store: Path
+    ) -> None:
+        """Test that copying over a linked file leaves the shared store untouched."""
+        dest = tmp_path / "alpha.md"
+        _install_file(self._job(source, dest, CopyMode.LINK))
+        stored = next(store.rglob("*.md"))
+        source.write_bytes(b"# Alpha v2\n")
+
+        _install_file(self._job(source, dest, CopyMode.COPY))
+
+        assert dest.read_bytes() == b"# Alpha v2\n"
+        assert stored.read_bytes() == b"# Alpha\n\nBody\n"
+
+    def test_link_shares_one_read_only_store_file(
+        self, source: Path, tmp_path: Path, store: Path
+    ) -> None:
+        """Test that LINK points every destination at one read-only store file."""
+        first = tmp_path / "a" / "alpha.md"
+        second = tmp_path / "b" / "alpha.md"
+
+        _install_file(self._job(source, first, CopyMode.LINK))
+        _install_file(self._job(source, second, CopyMode.LINK))
+
+        stored = list(store.rglob("*.md"))
+        assert len(stored) == 1
+        assert stored[0].name == f"{sha256_hex(source.read_bytes())}.md"
+        assert os.path.samefile(first, stored[0])
+        assert os.path.samefile(second, stored[0])
+        assert stat.S_IMODE(stored[0].stat().st_mode) == 0o444
+
+    def test_link_replaces_edited_store_file(
+        self, source: Path, tmp_path: Path, store: Path
+    ) -> None:
+        """Test that a store file edited through a hard link is not linked again."""
+        first = tmp_path / "a" / "alpha.md"
+        second = tmp_path / "b" / "alpha.md"
+        _install_file(self._job(source, first, CopyMode.LINK))
+        first.chmod(0o644)
+        with first.open("r+b") as f:  # In-place edit, shared with the store
+            f.write(b"# Edited")
+
+        _install_file(self._job(source, second, CopyMode.LINK))
+
+        stored = next(store.rglob("*.md"))
+        assert stored.read_bytes() == source.read_bytes()
+        assert os.path.samefile(second, stored)
+        assert not os.path.samefile(first, stored)
+
+    def test_link_rejects_source_changed_after_hashing(
+        self, source: Path, tmp_path: Path, store: Path
+    ) -> None:
+        """Test that content not matching the planned hash is never stored under it."""
+        job = self._job(source, tmp_path / "alpha.md", CopyMode.LINK)
+        source.write_bytes(b"# Changed\n")
+
+        result = _install_file(job)
+
+        assert isinstance(result, OSError)
+        assert list(store.rglob("*.md")) == []
+
+    def test_link_falls_back_to_symlink(self, source: Path, tmp_path: Path, store: Path) -> None:
+        """Test that a symlink is used when hard links are not possible."""
+        dest = tmp_path / "alpha.md"
+
+        with patch("os.link", side_effect=OSError(errno.EXDEV, "cross-device")):
+            _install_file(self._job(source, dest, CopyMode.LINK))
+
+        assert dest.is_symlink()
+        assert dest.read_bytes() == source.read_bytes()
+
+    def test_link_falls_back_to_copy(self, source: Path, tmp_path: Path, store: Path) -> None:
+        """Test that a copy is made when neither link type is supported."""
+        dest = tmp_path / "alpha.md"
+        unsupported = OSError(errno.EPERM, "not permitted")
+
+        with (
+            patch("os.link", side_effect=unsupported),
+            patch("os.symlink", side_effect=unsupported),
+        ):
+            result = _install_file(self._job(source, dest, CopyMode.LINK))
+
+        assert not isinstance(result, OSError)
+        assert result[1] is CopyMode.COPY
+        assert not dest.is_symlink()
+        assert dest.read_bytes() == source.read_bytes()
+
+    def test_error_is_returned(self, source: Path, tmp_path: Path) -> None:
+        """Test that I/O errors are returned for the caller to report."""
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+
+        result = _install_file(self._job(source, blocker / "alpha.md", CopyMode.COPY))
+
+        assert isinstance(result, OSError)
+        assert list(tmp_path.glob(".*.tmp")) == []
+
+
+class TestCombinedFileWriter:
+    """Tests for streaming combined-file installs (CLAUDE.md, CONVENTIONS.md, ...)."""
+
+    def test_streams_rendered_prompts(
+        self, temp_project_dir: Path, sample_prompts_dir: Path
+    ) -> None:
+        """Test that prompts are rendered with generate(), not as whole strings."""
+        with patch("jinja2.environment.Template.render") as render:
+            install_for_claude(temp_project_dir, sample_prompts_dir, MagicMock())
+
+        render.assert_not_called()
+        content = (temp_project_dir / "CLAUDE.md").read_text(encoding="utf-8")
+        assert "## Test.Prompt\n\n# Test Prompt\n\nPath: prompts\nTool: claude\n" in content
+
+    def test_failed_render_keeps_previous_file(
+        self, temp_project_dir: Path, sample_prompts_dir: Path
+    ) -> None:
+        """Test that a render error mid-way leaves the old file intact and no temp file."""
+        claude_md = temp_project_dir / "CLAUDE.md"
+        claude_md.write_text("previous\n", encoding="utf-8")
+        (sample_prompts_dir / "zz-broken.prompt.md").write_text(
+            "{{ prompt_path | no_such_filter }}", encoding="utf-8"
+        )
+
+        with pytest.raises(Exception, match="no_such_filter"):
+            install_for_claude(temp_project_dir, sample_prompts_dir, MagicMock(), force=True)
+
+        assert claude_md.read_text(encoding="utf-8") == "previous\n"
+        assert [p.name for p in temp_project_dir.iterdir()] == ["CLAUDE.md"]
+
+    def test_symlink_is_written_through(
+        self, temp_project_dir: Path, sample_prompts_dir: Path
+    ) -> None:
+        """Test that a symlinked combined file updates its target and keeps the link."""
+        agents_md = temp_project_dir / "AGENTS.md"
+        agents_md.write_text("old\n", encoding="utf-8")
+        agents_md.chmod(0o640)
+        claude_md = temp_project_dir / "CLAUDE.md"
+        claude_md.symlink_to("AGENTS.md")
+
+        install_for_claude(temp_project_dir, sample_prompts_dir, MagicMock(), force=True)
+
+        assert claude_md.is_symlink()
+        assert "Claude Code Instructions" in agents_md.read_text(encoding="utf-8")
+        assert stat.S_IMODE(agents_md.stat().st_mode) == 0o640
+
+
+class TestParsedAssets:
+    """Tests for ParsedAssets invalidation."""
+
+    def test_invalidate_changed_sources(self, tmp_path: Path) -> None:
+        """Test that only changed files, and directories containing them, are parsed again."""
+        parse = MagicMock(side_effect=lambda path: path.name)
+        parsed = ParsedAssets()
+        prompt, other, skill_dir = tmp_path / "a.md", tmp_path / "b.md", tmp_path / "review"
+        for path in (prompt, other, skill_dir):
+            parsed.get("kind", path, parse)
+
+        parsed.invalidate({prompt, skill_dir / "SKILL.md"})
+        for path in (prompt, other, skill_dir):
+            parsed.get("kind", path, parse)
+
+        assert [c.args[0] for c in parse.call_args_list[3:]] == [prompt, skill_dir]
+
+        parsed.invalidate()
+        parsed.get("kind", other, parse)
+        assert parse.call_count == 6
+
+    def test_invalidate_drops_key_locks(self, tmp_path: Path) -> None:
+        """Test that invalidated paths do not keep their per-key locks."""
+        kept, changed = tmp_path / "kept.md", tmp_path / "changed.md"
+        parsed = ParsedAssets()
+        for path in (kept, changed):
+            parsed.get("kind", path, lambda path: path.name)
+
+        parsed.invalidate([changed])
+
+        assert list(parsed._key_locks) == [("kind", kept)]
+
+    def test_invalidate_digest_through_symlink(self, tmp_path: Path) -> None:
+        """Test that a digest taken through a symlinked directory is invalidated."""
+        real = tmp_path / "real"
+        real.mkdir()
+        (tmp_path / "assets").symlink_to(real)
+        guide = tmp_path / "assets" / "guide.md"
+        guide.write_text("v1", encoding="utf-8")
+        parsed = ParsedAssets()
+        before = parsed.digest(guide)
+
+        guide.write_text("v2", encoding="utf-8")
+        parsed.invalidate([guide])
+
+        assert parsed.digest(guide) == sha256_hex(b"v2") != before
+        assert len(parsed._key_locks) == 1
+
+
+class TestSkillResources:
+    """Tests for installing skill resource directories."""
+
+    @pytest.fixture
+    def skills_dir(self, tmp_path: Path) -> Path:
+        """Two skills sharing an identical reference document."""
+        skills = tmp_path / "skills"
+        shared = b"# Reference\n" + b"x" * 100_000
+        for name in ("alpha", "beta"):
+            skill = skills / name
+            (skill / "references").mkdir(parents=True)
+            (skill / "SKILL.md").write_text(
+                f"---\nname: {name}\ndescription: The {name} skill\n---\n\nBody\n"
+            )
+            (skill / "references" / "guide.md").write_bytes(shared)
+        scripts = skills / "alpha" / "scripts"
+        (scripts / "__pycache__").mkdir(parents=True)
+        (scripts / "run.sh").write_text("#!/bin/sh\necho alpha\n")
+        (scripts / "__pycache__" / "run.cpython-312.pyc").write_bytes(b"\0")
+        (scripts / ".run.sh.swp").write_bytes(b"\0")
+        return skills
+
+    def _install(self, skills_dir: Path, target: Path, parsed: ParsedAssets | None = None) -> int:
+        return install_skills_by_environment(
+            "claude", target, skills_dir, MagicMock(), force=True, parsed=parsed
+        )
+
+    def test_installs_resource_tree(self, skills_dir: Path, tmp_path: Path) -> None:
+        """Test that scripts/ and references/ are installed next to SKILL.md."""
+        target = tmp_path / "project"
+        target.mkdir()
+
+        assert self._install(skills_dir, target) == 2
+
+        installed = target / ".claude" / "skills"
+        files = sorted(str(p.relative_to(installed)) for p in installed.rglob("*") if p.is_file())
+        assert files == [
+            "alpha/SKILL.md",
+            "alpha/references/guide.md",
+            "alpha/scripts/run.sh",
+            "beta/SKILL.md",
+            "beta/references/guide.md",
+        ]
+        assert (installed / "beta" / "references" / "guide.md").read_bytes() == (
+            skills_dir / "beta" / "references" / "guide.md"
+        ).read_bytes()
+
+    def test_identical_resources_read_once(self, skills_dir: Path, tmp_path: Path) -> None:
+        """Test that a duplicate resource is copied from the first installed copy."""
+        target = tmp_path / "project"
+        target.mkdir()
+
+        with patch("dot_work.installer._install_file", wraps=_install_file) as install_file:
+            self._install(skills_dir, target)
+
+        sources = {job[1]: job[0] for (job,), _ in install_file.call_args_list}
+        installed = target / ".claude" / "skills"
+        guides = [installed / name / "references" / "guide.md" for name in ("alpha", "beta")]
+        assert sources[guides[0]] == guides[1] or sources[guides[1]] == guides[0]
+
+    def test_up_to_date_resources_are_skipped(self, skills_dir: Path, tmp_path: Path) -> None:
+        """Test that a second install neither rewrites nor re-hashes resources."""
+        first, second = tmp_path / "first", tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        parsed = ParsedAssets()
+        self._install(skills_dir, first, parsed)
+
+        with (
+            patch("dot_work.installer._install_file", wraps=_install_file) as install_file,
+            patch("dot_work.installer.sha256_file") as sha256_file,
+        ):
+            self._install(skills_dir, first, parsed)
+            self._install(skills_dir, second, parsed)
+
+        # Only the second project was written to; the sources were hashed once
+        assert all(job[1].is_relative_to(second) for (job,), _ in install_file.call_args_list)
+        sha256_file.assert_not_called()
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import io
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from rich.console import Console
 
 from dot_work.installer import (
+    InstallPlan,
+    get_bundled_assets_dir,
+    install_all_assets_by_environment,
     install_canonical_prompt,
     install_canonical_prompt_directory,
+    install_canonical_prompts_by_environment,
     validate_canonical_prompt_file,
 )
+from dot_work.prompts.canonical import CANONICAL_PARSER
 
 
 class TestCanonicalPromptValidation:
@@ -442,3 +449,146 @@ Deterministic prompt content for testing reproducibility."""
 
         # Environment section should have filename_suffix for copilot
         assert frontmatter["environment"]["filename_suffix"] == ".prompt.md"
+
+
+class TestCanonicalInstallPlan:
+    """Test the single-parse install plan used by environment-based installation."""
+
+    @pytest.fixture
+    def source_dir(self, tmp_path: Path) -> Path:
+        """Source directory with two prompts, only one of which targets 'custom'."""
+        source = tmp_path / "prompts"
+        source.mkdir()
+        (source / "alpha.md").write_bytes(
+            b"---\nmeta:\n  title: Alpha\nenvironments:\n  custom:\n"
+            b"    target: .custom/\n    filename_suffix: .prompt.md\n---\n\nAlpha body\r\n"
+        )
+        (source / "beta.md").write_text(
+            "---\nmeta:\n  title: Beta\n---\n\nBeta body\n", encoding="utf-8"
+        )
+        return source
+
+    def test_returns_plan_with_counts(self, source_dir: Path, tmp_path: Path) -> None:
+        """The executed plan reports planned and installed counts."""
+        target = tmp_path / "out"
+        target.mkdir()
+
+        plan = install_canonical_prompts_by_environment(
+            "custom", target, source_dir, Console(), force=True
+        )
+
+        assert isinstance(plan, InstallPlan)
+        assert plan.source_count == 2
+        assert plan.planned_count == 1
+        assert plan.installed_count == 1
+        assert plan.error_count == 0
+        item = plan.items[0]
+        assert item.output_path == target / ".custom" / "alpha.prompt.md"
+        assert item.prompt.meta["title"] == "Alpha"
+
+    def test_writes_source_bytes_verbatim(self, source_dir: Path, tmp_path: Path) -> None:
+        """Installed files are byte-identical to their sources."""
+        target = tmp_path / "out"
+        target.mkdir()
+
+        install_canonical_prompts_by_environment(
+            "custom", target, source_dir, Console(), force=True
+        )
+
+        installed = target / ".custom" / "alpha.prompt.md"
+        assert installed.read_bytes() == (source_dir / "alpha.md").read_bytes()
+
+    def test_parses_each_file_once(self, source_dir: Path, tmp_path: Path) -> None:
+        """Scan, write and count phases share one parse per source file."""
+        target = tmp_path / "out"
+        target.mkdir()
+
+        with patch.object(
+            CANONICAL_PARSER, "_parse_content", wraps=CANONICAL_PARSER._parse_content
+        ) as spy:
+            install_canonical_prompts_by_environment(
+                "custom", target, source_dir, Console(), force=True
+            )
+
+        assert spy.call_count == 2
+
+    def test_dry_run_does_not_write(self, source_dir: Path, tmp_path: Path) -> None:
+        """Dry-run plans files without installing them."""
+        target = tmp_path / "out"
+        target.mkdir()
+
+        plan = install_canonical_prompts_by_environment(
+            "custom", target, source_dir, Console(), dry_run=True
+        )
+
+        assert plan.planned_count == 1
+        assert plan.installed_count == 0
+        assert not (target / ".custom").exists()
+
+    def test_parse_errors_are_counted(self, source_dir: Path, tmp_path: Path) -> None:
+        """Files that fail to parse are reported and counted, not planned."""
+        (source_dir / "broken.md").write_text("no frontmatter here", encoding="utf-8")
+        target = tmp_path / "out"
+        target.mkdir()
+
+        plan = install_canonical_prompts_by_environment(
+            "custom", target, source_dir, Console(), force=True
+        )
+
+        assert plan.error_count == 1
+        assert plan.planned_count == 1
+
+    def test_asset_category_count_uses_plan(self, tmp_path: Path) -> None:
+        """Category installs count from the plan instead of re-parsing every file."""
+        assets = tmp_path / "assets"
+        hooks = assets / "hooks"
+        hooks.mkdir(parents=True)
+        (hooks / "global.yml").write_text("defaults: {}\n", encoding="utf-8")
+        (hooks / "pre.md").write_text(
+            "---\nenvironments:\n  custom:\n    target: .hooks/\n    filename: pre.md\n"
+            "---\n\nHook body\n",
+            encoding="utf-8",
+        )
+        target = tmp_path / "out"
+        target.mkdir()
+
+        with patch.object(
+            CANONICAL_PARSER, "_parse_content", wraps=CANONICAL_PARSER._parse_content
+        ) as spy:
+            results = install_all_assets_by_environment(
+                "custom", target, assets, Console(), force=True
+            )
+
+        assert results == {"hooks": 1}
+        assert spy.call_count == 1
+        assert (target / ".hooks" / "pre.md").exists()
+
+
+class TestConcurrentCategoryInstall:
+    """Test that concurrent category installs behave like serial ones."""
+
+    def _install(self, target: Path, workers: str) -> tuple[dict[str, int], str]:
+        """Install all bundled categories for claude and return results and output."""
+        console = Console(record=True, width=200, file=io.StringIO())
+        with patch.dict("os.environ", {"DOT_WORK_IO_WORKERS": workers}):
+            results = install_all_assets_by_environment(
+                "claude", target, get_bundled_assets_dir(), console, force=True
+            )
+        return results, console.export_text().replace(str(target), "<target>")
+
+    def test_matches_serial_install(self, tmp_path: Path) -> None:
+        """Results, console output and written files match a single-threaded run."""
+        serial_target = tmp_path / "serial"
+        parallel_target = tmp_path / "parallel"
+        serial_target.mkdir()
+        parallel_target.mkdir()
+
+        serial = self._install(serial_target, "1")
+        parallel = self._install(parallel_target, "8")
+
+        assert parallel == serial
+        assert sum(serial[0].values()) > 0
+        written = sorted(p.relative_to(serial_target) for p in serial_target.rglob("*.md"))
+        assert written == sorted(
+            p.relative_to(parallel_target) for p in parallel_target.rglob("*.md")
+        )
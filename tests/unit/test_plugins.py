@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+
 import pytest
 import typer
+from typer.testing import CliRunner
 
 from dot_work.plugins import (
     DotWorkPlugin,
@@ -11,6 +16,7 @@ from dot_work.plugins import (
     register_all_plugins,
     register_plugin_cli,
 )
+from dot_work.utils.lazy_typer import lazy_group
 
 
 class TestDotWorkPlugin:
@@ -292,3 +298,123 @@ class TestRegisterAllPlugins:
             assert count == 1
         finally:
             del sys.modules["good_pkg"]
+
+
+class _DistEntryPoint:
+    """Entry point with the distribution that provides it."""
+
+    def __init__(self, name: str, value: str, dist_version: str) -> None:
+        self.name = name
+        self.value = value
+        self.dist = SimpleNamespace(name=f"dist-{name}", version=dist_version)
+
+
+@pytest.fixture
+def plugin_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Enable the on-disk cache in a temporary directory."""
+    monkeypatch.delenv("DOT_WORK_NO_CACHE")
+    monkeypatch.setenv("DOT_WORK_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestPluginMetadataCache:
+    """Test that plugin metadata is cached by distribution name and version."""
+
+    def test_cached_metadata_skips_import(
+        self, plugin_cache: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a second discovery does not import the plugin module."""
+        installed = [_DistEntryPoint("cached", "cached_pkg", "1.0")]
+        monkeypatch.setattr("dot_work.plugins.entry_points", lambda *, group: installed)
+
+        module = ModuleType("cached_pkg")
+        module.CLI_GROUP = "cached-cmd"  # type: ignore[attr-defined]
+        module.__version__ = "1.0"  # type: ignore[attr-defined]
+        module.app = typer.Typer(help="Cached commands.")  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "cached_pkg", module)
+        first = discover_plugins()
+
+        # Without the module in sys.modules an import would fail
+        monkeypatch.delitem(sys.modules, "cached_pkg")
+        assert discover_plugins() == first
+        assert first[0].command_name == "cached-cmd"
+        assert first[0].help == "Cached commands."
+        assert (plugin_cache / "plugins.json").exists()
+
+        # Upgrading the distribution invalidates the cache
+        installed[0] = _DistEntryPoint("cached", "cached_pkg", "2.0")
+        assert discover_plugins() == []
+
+    def test_failed_discovery_is_not_cached(
+        self, plugin_cache: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a plugin failing to import is retried once its dependency is installed."""
+        installed = [_DistEntryPoint("late", "late_pkg", "1.0")]
+        monkeypatch.setattr("dot_work.plugins.entry_points", lambda *, group: installed)
+
+        # late_pkg is not importable yet (e.g. a missing dependency)
+        assert discover_plugins() == []
+        assert not (plugin_cache / "plugins.json").exists()
+
+        module = ModuleType("late_pkg")
+        module.CLI_GROUP = "late-cmd"  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "late_pkg", module)
+        plugins = discover_plugins()
+        assert [plugin.command_name for plugin in plugins] == ["late-cmd"]
+        assert (plugin_cache / "plugins.json").exists()
+
+
+class TestLazyPluginRegistration:
+    """Test plugin registration on an app with a lazy group."""
+
+    @pytest.fixture
+    def lazy_app(self) -> typer.Typer:
+        app = typer.Typer(cls=lazy_group({}))
+
+        @app.callback()
+        def main() -> None:
+            """Main app."""
+
+        return app
+
+    def test_registered_without_import(
+        self, lazy_app: typer.Typer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the plugin is listed from its metadata and imported on invocation."""
+        plugin = DotWorkPlugin(
+            name="lazy", module="lazy_plugin_pkg", cli_group="lazy-cmd", help="Lazy commands."
+        )
+        assert register_plugin_cli(lazy_app, plugin) is True
+        assert "lazy_plugin_pkg" not in sys.modules
+
+        runner = CliRunner()
+        result = runner.invoke(lazy_app, ["--help"])
+        assert result.exit_code == 0
+        assert "lazy-cmd" in result.stdout
+        assert "Lazy commands." in result.stdout
+
+        plugin_app = typer.Typer()
+
+        @plugin_app.command()
+        def hello() -> None:
+            typer.echo("hello from plugin")
+
+        @plugin_app.command()
+        def bye() -> None:
+            typer.echo("bye")
+
+        module = ModuleType("lazy_plugin_pkg")
+        module.app = plugin_app  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "lazy_plugin_pkg", module)
+        result = runner.invoke(lazy_app, ["lazy-cmd", "hello"])
+        assert result.exit_code == 0
+        assert result.stdout == "hello from plugin\n"
+
+    def test_broken_plugin_fails_on_invocation(self, lazy_app: typer.Typer) -> None:
+        """Test that a plugin that cannot be imported fails with a usage error."""
+        plugin = DotWorkPlugin(name="gone", module="uninstalled_plugin_pkg", cli_group=None)
+        register_plugin_cli(lazy_app, plugin)
+
+        result = CliRunner().invoke(lazy_app, ["gone", "--help"])
+        assert result.exit_code == 2
+        assert "Could not load command 'gone'" in result.output
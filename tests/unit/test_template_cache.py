@@ -0,0 +1,105 @@
+"""Tests for the Jinja bytecode cache and precompiled prompt templates."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from jinja2 import ChoiceLoader, FileSystemBytecodeCache
+
+from dot_work.environments import ENVIRONMENTS
+from dot_work.installer import create_jinja_env, render_prompt
+from dot_work.template_cache import (
+    DIGESTS_FILENAME,
+    PrecompiledLoader,
+    bytecode_cache,
+    compiled_templates_dir,
+    precompiled_loader,
+    write_compiled_templates,
+)
+
+TEMPLATE = "# Guide\n\nPrompts live in {{ prompt_path }} for {{ ai_tool }}.\n"
+
+
+@pytest.fixture
+def prompts_dir(tmp_path: Path) -> Path:
+    """Template directory with one prompt."""
+    prompts = tmp_path / "assets" / "prompts"
+    prompts.mkdir(parents=True)
+    (prompts / "guide.md").write_text(TEMPLATE, encoding="utf-8")
+    return prompts
+
+
+def _render(prompts_dir: Path) -> str:
+    return render_prompt(prompts_dir, prompts_dir / "guide.md", ENVIRONMENTS["copilot"])
+
+
+class TestBytecodeCache:
+    """Tests for bytecode_cache."""
+
+    def test_disabled_by_no_cache(self) -> None:
+        """Test that DOT_WORK_NO_CACHE disables the bytecode cache."""
+        assert bytecode_cache() is None
+
+    def test_compiled_templates_are_cached(
+        self, prompts_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a second environment loads bytecode instead of recompiling."""
+        monkeypatch.delenv("DOT_WORK_NO_CACHE")
+        monkeypatch.setenv("DOT_WORK_CACHE_DIR", str(tmp_path / "cache"))
+        assert isinstance(bytecode_cache(), FileSystemBytecodeCache)
+        expected = _render(prompts_dir)
+
+        with patch("jinja2.environment.Environment.compile") as compile_source:
+            assert _render(prompts_dir) == expected
+
+        compile_source.assert_not_called()
+        assert list((tmp_path / "cache" / "jinja").iterdir())
+
+
+class TestPrecompiledTemplates:
+    """Tests for write_compiled_templates and precompiled_loader."""
+
+    def test_no_compiled_templates(self, prompts_dir: Path) -> None:
+        """Test that directories without compiled templates use the file loader only."""
+        assert precompiled_loader(prompts_dir) is None
+        assert not isinstance(create_jinja_env(prompts_dir).loader, ChoiceLoader)
+
+    def test_renders_from_compiled_module(self, prompts_dir: Path) -> None:
+        """Test that precompiled templates render identically without compiling."""
+        expected = _render(prompts_dir)
+        target = write_compiled_templates(prompts_dir)
+        assert target == compiled_templates_dir(prompts_dir)
+
+        with patch("jinja2.environment.Environment.compile") as compile_source:
+            assert _render(prompts_dir) == expected
+
+        compile_source.assert_not_called()
+        assert isinstance(create_jinja_env(prompts_dir).loader, ChoiceLoader)
+
+    def test_edited_source_falls_back(self, prompts_dir: Path) -> None:
+        """Test that a template edited after compilation is rendered from source."""
+        write_compiled_templates(prompts_dir)
+        (prompts_dir / "guide.md").write_text("Edited for {{ ai_tool }}\n", encoding="utf-8")
+
+        assert _render(prompts_dir) == "Edited for copilot\n"
+
+    def test_other_jinja_version_is_ignored(self, prompts_dir: Path) -> None:
+        """Test that templates compiled by another Jinja version are not used."""
+        digests_path = write_compiled_templates(prompts_dir) / DIGESTS_FILENAME
+        data = json.loads(digests_path.read_text(encoding="utf-8"))
+        data["jinja"] = "0.0"
+        digests_path.write_text(json.dumps(data), encoding="utf-8")
+
+        assert precompiled_loader(prompts_dir) is None
+
+    def test_loader_checks_digest(self, prompts_dir: Path) -> None:
+        """Test that the loader is built from the recorded digests."""
+        write_compiled_templates(prompts_dir)
+
+        loader = precompiled_loader(prompts_dir)
+
+        assert isinstance(loader, PrecompiledLoader)
+        assert set(loader.digests) == {"guide.md"}
@@ -0,0 +1,220 @@
+"""Tests for the cached issue counts, focus and issue index behind dot-work status."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dot_work import work_status
+from dot_work.work_status import (
+    count_issues,
+    find_issue,
+    index_issue_file,
+    index_issues,
+    parse_focus,
+    read_work_status,
+)
+
+ISSUE = 'id: "FEAT-{n:03d}@abc123"\ntitle: "Issue {n}"\nstatus: proposed\n---\n\nBody\n\n---\n---\n'
+
+
+@pytest.fixture
+def work_dir(tmp_path: Path) -> Path:
+    """A .work/ directory with focus.md and two non-empty priority files."""
+    issues_dir = tmp_path / ".work" / "agent" / "issues"
+    issues_dir.mkdir(parents=True)
+    (tmp_path / ".work" / "agent" / "focus.md").write_text(
+        "# Agent Focus\n\n## Previous\n- Issue: FEAT-001@abc123\n\n## Current\n"
+        "- Issue: FEAT-002@abc123\n\n## Next\nNone\n",
+        encoding="utf-8",
+    )
+    (issues_dir / "high.md").write_text(
+        "# High\n\n---\n" + "".join(ISSUE.format(n=n) for n in range(3)), encoding="utf-8"
+    )
+    (issues_dir / "backlog.md").write_text(ISSUE.format(n=9), encoding="utf-8")
+    return tmp_path / ".work"
+
+
+class TestCountIssues:
+    """Tests for count_issues."""
+
+    def test_counts_id_lines(self, tmp_path: Path) -> None:
+        """Only lines starting with id: " count, including the first line and CRLF files."""
+        path = tmp_path / "issues.md"
+        path.write_bytes(b'id: "A-1@x"\r\n  id: "no"\r\nid: "A-2@x"\r\nsee id: "no"\r\n')
+        assert count_issues(path) == 2
+
+    def test_missing_and_empty(self, tmp_path: Path) -> None:
+        """Missing and empty files have no issues."""
+        (tmp_path / "empty.md").write_bytes(b"")
+        assert count_issues(tmp_path / "empty.md") == 0
+        assert count_issues(tmp_path / "missing.md") == 0
+
+    def test_marker_across_windows(self, tmp_path: Path) -> None:
+        """Markers split across scan windows are counted exactly once."""
+        path = tmp_path / "issues.md"
+        content = "".join(ISSUE.format(n=n) for n in range(50))
+        path.write_text(content, encoding="utf-8")
+        for window in (7, 8, 13, 64):
+            with patch.object(work_status, "_SCAN_WINDOW", window):
+                assert count_issues(path) == 50
+
+
+class TestParseFocus:
+    """Tests for parse_focus."""
+
+    def test_sections(self) -> None:
+        """Issue IDs are taken from the section they appear in."""
+        focus = parse_focus("## Current\n- Issue: BUG-007@ff00aa (in progress)\n## Next\n")
+        assert focus == {"previous": "N/A", "current": "BUG-007@ff00aa", "next": "N/A"}
+
+
+class TestReadWorkStatus:
+    """Tests for read_work_status and its cache."""
+
+    def test_status(self, work_dir: Path) -> None:
+        """Focus and counts are read from the .work/ directory."""
+        status = read_work_status(work_dir)
+
+        assert status.focus == {
+            "previous": "FEAT-001@abc123",
+            "current": "FEAT-002@abc123",
+            "next": "N/A",
+        }
+        assert status.issue_counts == {
+            "shortlist": 0,
+            "critical": 0,
+            "high": 3,
+            "medium": 0,
+            "low": 0,
+            "backlog": 1,
+        }
+
+    def test_unchanged_files_are_not_rescanned(
+        self,
+        work_dir: Path,
+        tmp_path_factory: pytest.TempPathFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Only files whose mtime or size changed are scanned again."""
+        monkeypatch.delenv("DOT_WORK_NO_CACHE")
+        monkeypatch.setenv("DOT_WORK_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+        first = read_work_status(work_dir)
+
+        with patch.object(work_status, "count_issues", wraps=count_issues) as counter:
+            assert read_work_status(work_dir) == first
+            counter.assert_not_called()
+
+            backlog = work_dir / "agent" / "issues" / "backlog.md"
+            backlog.write_text(ISSUE.format(n=9) + ISSUE.format(n=10), encoding="utf-8")
+            assert read_work_status(work_dir).issue_counts["backlog"] == 2
+            counter.assert_called_once_with(backlog)
+
+
+class TestIssueIndex:
+    """Tests for the issue index behind status --issue and issue show."""
+
+    def test_blocks(self, work_dir: Path) -> None:
+        """Each block spans its opening ---, frontmatter and body, without separators."""
+        high = work_dir / "agent" / "issues" / "high.md"
+        rows = index_issue_file(high)
+
+        assert [row[0] for row in rows] == ["FEAT-000@abc123", "FEAT-001@abc123", "FEAT-002@abc123"]
+        assert {row[3] for row in rows} == {"proposed"}
+        _, offset, length, _ = rows[1]
+        block = high.read_bytes()[offset : offset + length].decode("utf-8")
+        assert (
+            block == '---\nid: "FEAT-001@abc123"\ntitle: "Issue 1"\nstatus: proposed\n---\n\nBody\n'
+        )
+
+    def test_index_order(self, work_dir: Path) -> None:
+        """Priority files come first, in priority order, then other files."""
+        (work_dir / "agent" / "issues" / "history.md").write_text(
+            ISSUE.format(n=50), encoding="utf-8"
+        )
+        assert [(entry.priority, entry.id) for entry in index_issues(work_dir)] == [
+            ("high", "FEAT-000@abc123"),
+            ("high", "FEAT-001@abc123"),
+            ("high", "FEAT-002@abc123"),
+            ("backlog", "FEAT-009@abc123"),
+            ("history", "FEAT-050@abc123"),
+        ]
+
+    def test_find_issue(self, work_dir: Path) -> None:
+        """Issues are found by full or short ID, with their focus sections."""
+        issue = find_issue(work_dir, "FEAT-002")
+
+        assert issue is not None
+        assert (issue.id, issue.priority, issue.status) == ("FEAT-002@abc123", "high", "proposed")
+        assert issue.focus == ["current"]
+        assert issue.read().startswith('---\nid: "FEAT-002@abc123"\n')
+        assert find_issue(work_dir, "FEAT-009@abc123") is not None
+        assert find_issue(work_dir, "FEAT-009@ffffff") is None
+        assert find_issue(work_dir, "FEAT-00") is None
+
+    def test_unchanged_files_are_not_rescanned(
+        self,
+        work_dir: Path,
+        tmp_path_factory: pytest.TempPathFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Only files whose mtime or size changed are indexed again."""
+        monkeypatch.delenv("DOT_WORK_NO_CACHE")
+        monkeypatch.setenv("DOT_WORK_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+        first = index_issues(work_dir)
+
+        with patch.object(work_status, "index_issue_file", wraps=index_issue_file) as indexer:
+            assert index_issues(work_dir) == first
+            indexer.assert_not_called()
+
+            backlog = work_dir / "agent" / "issues" / "backlog.md"
+            backlog.write_text(ISSUE.format(n=10), encoding="utf-8")
+            assert find_issue(work_dir, "FEAT-010") is not None
+            indexer.assert_called_once_with(backlog)
+
+    def test_stale_entry_is_reindexed(
+        self,
+        work_dir: Path,
+        tmp_path_factory: pytest.TempPathFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A file rewritten with the same mtime and size is indexed again on lookup."""
+        monkeypatch.delenv("DOT_WORK_NO_CACHE")
+        monkeypatch.setenv("DOT_WORK_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+        high = work_dir / "agent" / "issues" / "high.md"
+        stat = high.stat()
+        index_issues(work_dir)
+
+        high.write_text(
+            "# High\n\n---\n" + "".join(ISSUE.format(n=n) for n in (2, 0, 1)), encoding="utf-8"
+        )
+        os.utime(high, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        issue = find_issue(work_dir, "FEAT-002@abc123")
+        assert issue is not None
+        assert issue.read().startswith('---\nid: "FEAT-002@abc123"\n')
+
+    def test_lookup_checks_only_the_issue_file(
+        self,
+        work_dir: Path,
+        tmp_path_factory: pytest.TempPathFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A warm lookup goes straight to the issue's file, without a scan of the others."""
+        monkeypatch.delenv("DOT_WORK_NO_CACHE")
+        monkeypatch.setenv("DOT_WORK_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+        index_issues(work_dir)
+
+        with (
+            patch.object(work_status, "_stat", wraps=work_status._stat) as stat,
+            patch.object(work_status, "index_issue_file") as indexer,
+            patch.object(work_status, "read_work_status") as status,
+        ):
+            issue = find_issue(work_dir, "FEAT-009")
+
+        assert issue is not None
+        assert issue.priority == "backlog"
+        stat.assert_called_once_with(work_dir.absolute() / "agent" / "issues" / "backlog.md")
+        indexer.assert_not_called()
+        status.assert_not_called()
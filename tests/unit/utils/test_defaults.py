@@ -0,0 +1,203 @@
+"""Tests for the process-wide global.yml defaults registry."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from dot_work.utils.defaults import (
+    EMPTY_DEFAULTS,
+    clear_global_defaults_cache,
+    freeze,
+    global_defaults_digest,
+    load_global_defaults,
+    merge_defaults,
+    thaw,
+)
+from dot_work.utils.yaml_loader import safe_load
+
+GLOBAL_YML = """
+defaults:
+  environments:
+    claude:
+      target: ".claude/"
+      filename_suffix: ".md"
+  tags: [a, b]
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    """Start every test with an empty registry."""
+    clear_global_defaults_cache()
+
+
+class TestLoadGlobalDefaults:
+    """Tests for load_global_defaults."""
+
+    def test_returns_defaults_section(self, tmp_path: Path) -> None:
+        """Test that the defaults section is returned."""
+        path = tmp_path / "global.yml"
+        path.write_text(GLOBAL_YML, encoding="utf-8")
+
+        result = load_global_defaults(path)
+
+        assert result == {
+            "environments": {"claude": {"target": ".claude/", "filename_suffix": ".md"}},
+            "tags": ("a", "b"),
+        }
+
+    def test_loads_file_once_per_process(self, tmp_path: Path) -> None:
+        """Test that repeated loads are served from memory."""
+        path = tmp_path / "global.yml"
+        path.write_text(GLOBAL_YML, encoding="utf-8")
+
+        with patch("dot_work.utils.defaults.safe_load", wraps=safe_load) as spy:
+            first = load_global_defaults(path)
+            second = load_global_defaults(path)
+
+        assert spy.call_count == 1
+        assert first is second
+
+    def test_reloads_when_file_changes(self, tmp_path: Path) -> None:
+        """Test that a changed mtime/size invalidates the cached entry."""
+        path = tmp_path / "global.yml"
+        path.write_text(GLOBAL_YML, encoding="utf-8")
+        load_global_defaults(path)
+
+        path.write_text("defaults:\n  environments: {}\n  extra: true\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_global_defaults(path)["extra"] is True
+
+    def test_result_is_read_only(self, tmp_path: Path) -> None:
+        """Test that cached defaults cannot be mutated by callers."""
+        path = tmp_path / "global.yml"
+        path.write_text(GLOBAL_YML, encoding="utf-8")
+
+        result = load_global_defaults(path)
+
+        with pytest.raises(TypeError):
+            result["environments"]["claude"]["target"] = ".other/"  # type: ignore[index]
+
+    def test_missing_file_returns_empty(self, tmp_path: Path) -> None:
+        """Test that a missing file yields empty defaults."""
+        assert load_global_defaults(tmp_path / "missing.yml") is EMPTY_DEFAULTS
+
+    def test_malformed_yaml_raises_and_is_not_cached(self, tmp_path: Path) -> None:
+        """Test that invalid YAML raises on every call."""
+        path = tmp_path / "global.yml"
+        path.write_text("invalid: yaml: content: [", encoding="utf-8")
+
+        with pytest.raises(yaml.YAMLError):
+            load_global_defaults(path)
+        with pytest.raises(yaml.YAMLError):
+            load_global_defaults(path)
+
+
+class TestGlobalDefaultsDigest:
+    """Tests for global_defaults_digest."""
+
+    def test_digest_tracks_content_without_parsing(self, tmp_path: Path) -> None:
+        """Test that the digest changes with content and never parses YAML."""
+        path = tmp_path / "global.yml"
+        path.write_text(GLOBAL_YML, encoding="utf-8")
+
+        with patch("dot_work.utils.defaults.safe_load") as spy:
+            first = global_defaults_digest(path)
+            path.write_text("defaults: {}\n", encoding="utf-8")
+            second = global_defaults_digest(path)
+
+        spy.assert_not_called()
+        assert first and second and first != second
+
+    def test_missing_file_has_empty_digest(self, tmp_path: Path) -> None:
+        """Test that a missing global.yml yields an empty digest."""
+        assert global_defaults_digest(tmp_path / "missing.yml") == ""
+
+
+class TestFreezeThaw:
+    """Tests for freeze and thaw helpers."""
+
+    def test_thaw_round_trips_to_plain_containers(self) -> None:
+        """Test that thaw produces independent mutable containers."""
+        original = {"a": {"b": [1, {"c": 2}]}, "s": {1, 2}}
+
+        thawed = thaw(freeze(original))
+
+        assert thawed == original
+        assert isinstance(thawed["a"], dict)
+        assert isinstance(thawed["a"]["b"], list)
+        thawed["a"]["b"].append(3)
+        assert original["a"]["b"] == [1, {"c": 2}]
+
+
+class TestMergeDefaults:
+    """Tests for the layered merge_defaults view."""
+
+    def test_local_overrides_and_nested_merge(self) -> None:
+        """Test that local values win and nested sections merge."""
+        defaults = freeze({"environments": {"claude": {"target": ".claude/", "x": 1}}, "v": 1})
+        local = {"environments": {"claude": {"x": 2}}, "v": 2}
+
+        merged = merge_defaults(defaults, local)
+
+        assert thaw(merged) == {"environments": {"claude": {"target": ".claude/", "x": 2}}, "v": 2}
+
+    def test_filename_hides_default_suffix(self) -> None:
+        """Test that a local filename hides a default filename_suffix and vice versa."""
+        defaults = freeze(
+            {
+                "environments": {
+                    "a": {"target": "t", "filename_suffix": ".md"},
+                    "b": {"target": "t", "filename": "x.md"},
+                }
+            }
+        )
+        local = {"environments": {"a": {"filename": "a.md"}, "b": {"filename_suffix": ".b"}}}
+
+        envs = merge_defaults(defaults, local)["environments"]
+
+        assert dict(envs["a"]) == {"target": "t", "filename": "a.md"}
+        assert dict(envs["b"]) == {"target": "t", "filename_suffix": ".b"}
+        assert "filename_suffix" not in envs["a"]
+        assert envs["a"].get("filename_suffix") is None
+
+    def test_empty_local_mapping_keeps_defaults(self) -> None:
+        """Test that an empty local section does not override the default section."""
+        defaults = freeze({"environments": {"claude": {"target": ".claude/"}}})
+
+        merged = merge_defaults(defaults, {"environments": {}})
+
+        assert thaw(merged) == {"environments": {"claude": {"target": ".claude/"}}}
+
+    def test_iteration_order_matches_defaults_first(self) -> None:
+        """Test that default keys come first, then local-only keys."""
+        merged = merge_defaults(freeze({"b": 1, "a": 2}), {"c": 3, "a": 4})
+
+        assert list(merged) == ["b", "a", "c"]
+
+    def test_does_not_copy_untouched_sections(self) -> None:
+        """Test that local sections absent from defaults are shared, not copied."""
+        meta = {"name": "x"}
+
+        merged = merge_defaults(freeze({"environments": {}}), {"meta": meta})
+
+        assert merged["meta"] is meta
+
+    def test_default_values_are_returned_mutable(self) -> None:
+        """Test that non-mapping defaults are thawed so callers can mutate them."""
+        merged = merge_defaults(freeze({"tags": ["a"]}), {})
+
+        tags = merged["tags"]
+        tags.append("b")
+
+        assert tags == ["a", "b"]
+        assert merged["tags"] == ["a"]
+
+    def test_non_mapping_defaults_are_ignored(self) -> None:
+        """Test that malformed defaults behave like empty defaults."""
+        assert thaw(merge_defaults(None, {"a": 1})) == {"a": 1}
@@ -0,0 +1,56 @@
+"""Tests for the file helpers shared by the caches."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dot_work.utils.fileio import atomic_write_json, cache_root_dir
+
+
+class TestCacheRootDir:
+    """Tests for cache directory resolution."""
+
+    def test_disabled_by_env(self) -> None:
+        """Test that DOT_WORK_NO_CACHE disables caching (set by conftest)."""
+        assert cache_root_dir() is None
+
+    def test_override(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that DOT_WORK_CACHE_DIR wins over XDG_CACHE_HOME."""
+        monkeypatch.delenv("DOT_WORK_NO_CACHE")
+        monkeypatch.setenv("DOT_WORK_CACHE_DIR", str(tmp_path / "cache"))
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+
+        assert cache_root_dir() == tmp_path / "cache"
+
+
+class TestAtomicWriteJson:
+    """Tests for atomic_write_json."""
+
+    def test_writes_json_and_creates_parents(self, tmp_path: Path) -> None:
+        """Test that the file is written and missing directories are created."""
+        path = tmp_path / "a" / "b" / "data.json"
+
+        assert atomic_write_json(path, {"key": [1, 2]}, indent=2) is True
+        assert json.loads(path.read_text(encoding="utf-8")) == {"key": [1, 2]}
+        assert os.listdir(path.parent) == ["data.json"]
+
+    def test_failure_keeps_old_file(self, tmp_path: Path) -> None:
+        """Test that a failed write returns False and leaves no temporary file."""
+        path = tmp_path / "data.json"
+        path.write_text("old", encoding="utf-8")
+
+        with patch("dot_work.utils.fileio.os.replace", side_effect=OSError("disk full")):
+            assert atomic_write_json(path, {"key": 1}) is False
+
+        assert path.read_text(encoding="utf-8") == "old"
+        assert os.listdir(tmp_path) == ["data.json"]
+
+    def test_unserializable_data_is_ignored(self, tmp_path: Path) -> None:
+        """Test that data json cannot encode is reported as a failed write."""
+        path = tmp_path / "data.json"
+
+        assert atomic_write_json(path, {"key": object()}) is False
+        assert not path.exists()
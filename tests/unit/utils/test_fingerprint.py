@@ -0,0 +1,95 @@
+"""Tests for the project fingerprint shared by the project detectors."""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from dot_work.utils import fingerprint as fingerprint_module
+from dot_work.utils.fingerprint import ProjectFingerprint, project_fingerprint
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Project with a Python manifest, a lockfile and an environment marker."""
+    (tmp_path / "pyproject.toml").write_text('[project]\nname = "demo"\n', encoding="utf-8")
+    (tmp_path / "package.json").write_text('{"scripts": {"lint": "eslint ."}}')
+    (tmp_path / "yarn.lock").write_text("")
+    (tmp_path / ".github" / "prompts").mkdir(parents=True)
+    return tmp_path
+
+
+class TestProjectFingerprint:
+    """Tests for ProjectFingerprint queries and invalidation."""
+
+    def test_queries(self, project: Path) -> None:
+        """Test that queries are answered from the scan and lazily read manifests."""
+        fingerprint = ProjectFingerprint.scan(project)
+
+        assert fingerprint.exists("pyproject.toml")
+        assert not fingerprint.exists("Cargo.toml")
+        assert fingerprint.exists(".github/prompts")
+        assert not fingerprint.exists(".github/agents")
+        assert not fingerprint.exists(".vscode/settings.json")
+        assert fingerprint.is_dir(".github")
+        assert fingerprint.glob("*.lock") == ["yarn.lock"]
+        assert fingerprint.read_text("pyproject.toml") == '[project]\nname = "demo"\n'
+        assert fingerprint.read_text("missing.toml") is None
+        assert fingerprint.json("package.json") == {"scripts": {"lint": "eslint ."}}
+        assert fingerprint.json("pyproject.toml") is None
+
+    def test_missing_root(self, tmp_path: Path) -> None:
+        """Test that a directory that does not exist has no entries."""
+        fingerprint = ProjectFingerprint.scan(tmp_path / "missing")
+
+        assert fingerprint.entries == {}
+        assert fingerprint.is_current()
+
+    def test_reused_until_dependency_changes(self, project: Path) -> None:
+        """Test that results are reused until the root or a file read changes."""
+        compute = MagicMock(side_effect=lambda: fingerprint.read_text("pyproject.toml"))
+        fingerprint = project_fingerprint(project)
+        fingerprint.detect("manifest", compute)
+
+        assert project_fingerprint(project) is fingerprint
+        assert project_fingerprint(project).detect("manifest", compute) is not None
+        assert compute.call_count == 1
+
+        (project / "pyproject.toml").write_text("[project]\n", encoding="utf-8")
+        assert not fingerprint.is_current()
+        assert project_fingerprint(project) is not fingerprint
+
+    def test_nested_marker_invalidates(self, project: Path) -> None:
+        """Test that creating a probed nested path invalidates the fingerprint."""
+        fingerprint = project_fingerprint(project)
+        assert not fingerprint.exists(".github/agents")
+
+        (project / ".github" / "agents").mkdir()
+
+        assert not fingerprint.is_current()
+        assert project_fingerprint(project).exists(".github/agents")
+
+    def test_results_persist_across_runs(
+        self,
+        project: Path,
+        tmp_path_factory: pytest.TempPathFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that persisted results are loaded by a later process."""
+        monkeypatch.delenv("DOT_WORK_NO_CACHE")
+        monkeypatch.setenv("DOT_WORK_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+        monkeypatch.setattr(fingerprint_module, "_fingerprints", {})
+        project_fingerprint(project).detect("answer", lambda: [42])
+
+        # A new process starts without fingerprints in memory
+        monkeypatch.setattr(fingerprint_module, "_fingerprints", {})
+        compute = MagicMock(return_value=[0])
+        assert project_fingerprint(project).detect("answer", compute) == [42]
+        compute.assert_not_called()
+
+        # Removing a file changes the root directory's mtime
+        (project / "yarn.lock").unlink()
+        os.utime(project, ns=(0, 0))
+        monkeypatch.setattr(fingerprint_module, "_fingerprints", {})
+        assert project_fingerprint(project).detect("answer", compute) == [0]
@@ -0,0 +1,161 @@
+"""Tests for the streaming frontmatter reader."""
+
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dot_work.prompts.canonical import CANONICAL_PARSER
+from dot_work.skills.parser import SKILL_PARSER
+from dot_work.subagents.discovery import SubagentDiscovery
+from dot_work.utils.frontmatter import BodyRef, LazyText, read_frontmatter
+
+PROMPT = """---
+meta:
+  title: Test
+environments:
+  claude:
+    target: ".claude/commands/"
+---
+
+Body line one
+Body line two
+"""
+
+
+@dataclass
+class _Doc:
+    title: str
+    content: LazyText = LazyText()
+
+
+class TestReadFrontmatter:
+    """Tests for read_frontmatter."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            PROMPT,
+            PROMPT.replace("\n", "\r\n"),
+            "\n\n" + PROMPT + "\n\n",
+            "---  \nkey: value\n---\nbody\n",
+            "---\nkey: value\n---",
+            "---\nkey: value\n--- trailing\nbody",
+        ],
+    )
+    def test_matches_regex_split(self, tmp_path: Path, text: str) -> None:
+        """Test that the streamed split agrees with the parsers' historical regex."""
+        path = tmp_path / "doc.md"
+        path.write_bytes(text.encode("utf-8"))
+
+        block = read_frontmatter(path)
+        match = CANONICAL_PARSER.FRONTMATTER_PATTERN.match(path.read_text(encoding="utf-8").strip())
+
+        assert block is not None
+        assert match is not None
+        assert block.text == match.group(1)
+        assert block.body.load() == match.group(2).strip()
+
+    @pytest.mark.parametrize("text", ["no frontmatter", "---\nkey: value\n", ""])
+    def test_missing_markers(self, tmp_path: Path, text: str) -> None:
+        """Test that files without both markers are rejected."""
+        path = tmp_path / "doc.md"
+        path.write_text(text, encoding="utf-8")
+
+        assert read_frontmatter(path) is None
+
+    def test_stops_at_closing_marker(self, tmp_path: Path) -> None:
+        """Test that nothing past the closing marker is part of the head."""
+        path = tmp_path / "doc.md"
+        path.write_text(PROMPT, encoding="utf-8")
+
+        block = read_frontmatter(path)
+
+        assert block is not None
+        assert block.head.endswith(b"---\n")
+        assert b"Body" not in block.head
+
+
+class TestLazyText:
+    """Tests for the LazyText dataclass field."""
+
+    def test_body_loaded_on_first_access(self, tmp_path: Path) -> None:
+        """Test that a BodyRef is read once, on first access."""
+        path = tmp_path / "doc.md"
+        path.write_text("---\nk: v\n---\nhello\n", encoding="utf-8")
+        block = read_frontmatter(path)
+        assert block is not None
+        doc = _Doc(title="t", content=block.body)
+
+        assert not LazyText.is_loaded(doc, "content")
+        with patch.object(BodyRef, "load", return_value="hello") as load:
+            assert doc.content == "hello"
+            assert doc.content == "hello"
+        load.assert_called_once()
+        assert LazyText.is_loaded(doc, "content")
+
+    def test_plain_string(self) -> None:
+        """Test that plain strings are stored and returned as-is."""
+        doc = _Doc(title="t", content="text")
+
+        assert doc.content == "text"
+        assert LazyText.is_loaded(doc, "content")
+
+    def test_field_is_required(self) -> None:
+        """Test that the lazy field has no default."""
+        with pytest.raises(TypeError):
+            _Doc(title="t")  # type: ignore[call-arg]
+
+    def test_pickle_keeps_body_unloaded(self, tmp_path: Path) -> None:
+        """Test that pickling (as the parse cache does) does not read the body."""
+        doc = _Doc(title="t", content=BodyRef(tmp_path / "missing.md", 0))
+
+        restored = pickle.loads(pickle.dumps(doc))
+
+        assert LazyText.raw(restored, "content") == BodyRef(tmp_path / "missing.md", 0)
+
+
+class TestParsersStream:
+    """Tests that the parsers only read frontmatter up front."""
+
+    def test_canonical_prompt_body_is_lazy(self, tmp_path: Path) -> None:
+        """Test that CanonicalPromptParser.parse defers reading the body."""
+        path = tmp_path / "test.md"
+        path.write_text(PROMPT, encoding="utf-8")
+
+        prompt = CANONICAL_PARSER.parse(path)
+
+        assert not LazyText.is_loaded(prompt, "content")
+        assert prompt.content == "Body line one\nBody line two"
+
+    def test_skill_body_is_lazy(self, tmp_path: Path) -> None:
+        """Test that SkillParser.parse defers reading the body."""
+        skill_dir = tmp_path / "test-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: test-skill\ndescription: A test skill\n---\nSkill body\n",
+            encoding="utf-8",
+        )
+
+        skill = SKILL_PARSER.parse(skill_dir)
+
+        assert not LazyText.is_loaded(skill, "content")
+        assert skill.content == "Skill body"
+
+    def test_subagent_metadata_skips_bodies(self, tmp_path: Path) -> None:
+        """Test that discover_metadata reads names without loading prompt bodies."""
+        agents = tmp_path / ".claude" / "agents"
+        agents.mkdir(parents=True)
+        (agents / "reviewer.md").write_text(
+            "---\nname: reviewer\ndescription: Reviews code\n---\nYou review code.\n",
+            encoding="utf-8",
+        )
+        (agents / "broken.md").write_text("no frontmatter", encoding="utf-8")
+
+        with patch.object(BodyRef, "load") as load:
+            metadata = SubagentDiscovery(project_root=tmp_path).discover_metadata()
+
+        load.assert_not_called()
+        assert [(m.name, m.description) for m in metadata] == [("reviewer", "Reviews code")]
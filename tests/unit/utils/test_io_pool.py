@@ -0,0 +1,112 @@
+"""Tests for the bounded I/O pool and ordered console output."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from rich.console import Console
+
+from dot_work.utils.io_pool import io_map, io_workers, run_ordered
+
+
+class TestIoWorkers:
+    """Tests for io_workers."""
+
+    def test_env_override(self) -> None:
+        """Test that DOT_WORK_IO_WORKERS sets the thread limit."""
+        with patch.dict("os.environ", {"DOT_WORK_IO_WORKERS": "3"}):
+            assert io_workers() == 3
+
+    @pytest.mark.parametrize("value", ["0", "-2"])
+    def test_minimum_one(self, value: str) -> None:
+        """Test that the limit never drops below one thread."""
+        with patch.dict("os.environ", {"DOT_WORK_IO_WORKERS": value}):
+            assert io_workers() == 1
+
+    def test_invalid_value_uses_default(self) -> None:
+        """Test that a non-numeric override is ignored."""
+        with patch.dict("os.environ", {"DOT_WORK_IO_WORKERS": "many"}):
+            assert 1 <= io_workers() <= 8
+
+
+class TestIoMap:
+    """Tests for io_map."""
+
+    def test_results_in_input_order(self) -> None:
+        """Test that results follow item order, not completion order."""
+
+        def slow_first(n: int) -> int:
+            time.sleep(0.02 if n == 0 else 0)
+            return n * 2
+
+        assert io_map(slow_first, [0, 1, 2, 3], max_workers=4) == [0, 2, 4, 6]
+
+    def test_single_worker_runs_inline(self) -> None:
+        """Test that one worker runs on the calling thread."""
+        threads = io_map(lambda _: threading.current_thread(), [1, 2], max_workers=1)
+
+        assert threads == [threading.main_thread()] * 2
+
+
+class TestRunOrdered:
+    """Tests for run_ordered."""
+
+    def test_output_in_task_order(self) -> None:
+        """Test that output matches a serial run even when later tasks finish first."""
+        second_done = threading.Event()
+
+        def first(console: Console) -> str:
+            console.print("first: start")
+            second_done.wait(timeout=5)
+            console.print("first: end")
+            return "a"
+
+        def second(console: Console) -> str:
+            console.print("second")
+            second_done.set()
+            return "b"
+
+        console = MagicMock()
+        results = run_ordered(console, [first, second], max_workers=2)
+
+        assert results == ["a", "b"]
+        assert [c.args[0] for c in console.print.call_args_list] == [
+            "first: start",
+            "first: end",
+            "second",
+        ]
+
+    def test_input_on_calling_thread(self) -> None:
+        """Test that prompts are asked on the calling thread, after earlier output."""
+        events: list[str] = []
+        console = MagicMock()
+        console.print.side_effect = lambda text: events.append(text)
+
+        def ask(*_args: object) -> str:
+            events.append(f"ask on {threading.current_thread().name}")
+            return "y"
+
+        console.input.side_effect = ask
+
+        tasks = [
+            lambda c: c.print("one"),
+            lambda c: c.input("Overwrite? "),
+        ]
+        results = run_ordered(console, tasks, max_workers=2)
+
+        assert results == [None, "y"]
+        assert events == ["one", f"ask on {threading.main_thread().name}"]
+
+    def test_task_exception_after_output(self) -> None:
+        """Test that a failing task's error surfaces after all output is printed."""
+
+        def fail(console: Console) -> None:
+            console.print("before failure")
+            raise RuntimeError("boom")
+
+        console = MagicMock()
+        with pytest.raises(RuntimeError, match="boom"):
+            run_ordered(console, [fail, lambda c: c.print("after")], max_workers=2)
+
+        assert [c.args[0] for c in console.print.call_args_list] == ["before failure", "after"]
@@ -0,0 +1,78 @@
+"""Tests for lazily imported Typer subcommand groups."""
+
+import importlib
+import sys
+import types
+from unittest.mock import patch
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from dot_work.utils.lazy_typer import LazySubcommand, lazy_group
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def lazy_app(monkeypatch: pytest.MonkeyPatch) -> typer.Typer:
+    """App with an eager command and a lazy group from a fake module."""
+    sub_app = typer.Typer(help="Greeting commands.")
+
+    @sub_app.command("hello")
+    def hello(name: str = "world") -> None:
+        typer.echo(f"hello {name}")
+
+    @sub_app.command("bye")
+    def bye() -> None:
+        typer.echo("bye")
+
+    module = types.ModuleType("lazy_greetings")
+    module.greetings_app = sub_app  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "lazy_greetings", module)
+
+    lazy = {"greet": LazySubcommand("lazy_greetings:greetings_app", "Greeting commands.")}
+    app = typer.Typer(cls=lazy_group(lazy))
+
+    @app.callback()
+    def main() -> None:
+        """Lazy test app."""
+
+    @app.command("version")
+    def version() -> None:
+        typer.echo("1.0")
+
+    return app
+
+
+class TestLazyGroup:
+    """Tests for lazy_group."""
+
+    def test_help_does_not_import(self, lazy_app: typer.Typer) -> None:
+        """Help lists lazy subcommands from the table without importing them."""
+        with patch(
+            "dot_work.utils.lazy_typer.importlib.import_module", wraps=importlib.import_module
+        ) as import_module:
+            result = runner.invoke(lazy_app, ["--help"])
+
+        assert result.exit_code == 0
+        assert "version" in result.stdout
+        assert "greet" in result.stdout
+        assert "Greeting commands." in result.stdout
+        import_module.assert_not_called()
+
+    def test_invocation_imports(self, lazy_app: typer.Typer) -> None:
+        """Invoking a lazy subcommand imports it and runs the real command."""
+        with patch(
+            "dot_work.utils.lazy_typer.importlib.import_module", wraps=importlib.import_module
+        ) as import_module:
+            result = runner.invoke(lazy_app, ["greet", "hello", "--name", "lazy"])
+
+        assert result.exit_code == 0
+        assert result.stdout == "hello lazy\n"
+        import_module.assert_called_once_with("lazy_greetings")
+
+    def test_not_a_typer_app(self) -> None:
+        """Loading an attribute that is not a Typer app fails clearly."""
+        with pytest.raises(TypeError, match="not a typer.Typer"):
+            LazySubcommand("dot_work.utils.lazy_typer:lazy_group", "").load()
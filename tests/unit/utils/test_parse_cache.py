@@ -0,0 +1,262 @@
+"""Tests for the persistent parse cache."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dot_work.prompts.canonical import CANONICAL_PARSER
+from dot_work.skills.parser import SKILL_PARSER
+from dot_work.subagents.parser import SUBAGENT_PARSER
+from dot_work.utils.defaults import clear_global_defaults_cache
+from dot_work.utils.parse_cache import (
+    MAX_GENERATIONS,
+    cached_parse,
+    clear_parse_cache,
+    parse_cache_dir,
+)
+
+PROMPT = """---
+meta:
+  title: Test
+environments:
+  claude:
+    target: ".claude/commands/"
+---
+Body text
+"""
+
+SKILL = """---
+name: test-skill
+description: A test skill
+---
+Skill body
+"""
+
+SUBAGENT = """---
+meta:
+  name: reviewer
+  description: Reviews code
+environments:
+  claude:
+    target: ".claude/agents/"
+---
+You review code.
+"""
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Enable the parse cache in a temporary directory."""
+    monkeypatch.delenv("DOT_WORK_NO_CACHE", raising=False)
+    monkeypatch.setenv("DOT_WORK_CACHE_DIR", str(tmp_path / "cache"))
+    clear_global_defaults_cache()
+    return tmp_path / "cache"
+
+
+class TestParseCacheDir:
+    """Tests for cache directory resolution."""
+
+    def test_disabled_by_env(self) -> None:
+        """Test that DOT_WORK_NO_CACHE disables the cache (set by conftest)."""
+        assert parse_cache_dir() is None
+
+    def test_xdg_cache_home(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that XDG_CACHE_HOME is honoured."""
+        monkeypatch.delenv("DOT_WORK_NO_CACHE")
+        monkeypatch.delenv("DOT_WORK_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert parse_cache_dir() == tmp_path / "dot-work" / "parse"
+
+
+class TestCachedParse:
+    """Tests for cached_parse keying and invalidation."""
+
+    def test_warm_run_skips_parse(self, cache_dir: Path, tmp_path: Path) -> None:
+        """Test that a second parse of unchanged content is served from disk."""
+        defaults = tmp_path / "global.yml"
+        calls: list[int] = []
+
+        def parse() -> dict[str, int]:
+            calls.append(1)
+            return {"value": 42}
+
+        first = cached_parse("test", b"data", None, defaults, parse)
+        second = cached_parse("test", b"data", None, defaults, parse)
+
+        assert first == second == {"value": 42}
+        assert len(calls) == 1
+
+    def test_content_change_invalidates(self, cache_dir: Path, tmp_path: Path) -> None:
+        """Test that different file bytes produce a fresh parse."""
+        defaults = tmp_path / "global.yml"
+
+        cached_parse("test", b"one", None, defaults, lambda: 1)
+
+        assert cached_parse("test", b"two", None, defaults, lambda: 2) == 2
+
+    def test_global_defaults_change_invalidates(self, cache_dir: Path, tmp_path: Path) -> None:
+        """Test that editing global.yml produces a fresh parse."""
+        defaults = tmp_path / "global.yml"
+        defaults.write_text("defaults: {a: 1}\n", encoding="utf-8")
+        cached_parse("test", b"data", None, defaults, lambda: 1)
+
+        defaults.write_text("defaults: {a: 22}\n", encoding="utf-8")
+        stat = defaults.stat()
+        os.utime(defaults, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert cached_parse("test", b"data", None, defaults, lambda: 2) == 2
+
+    def test_errors_are_not_cached(self, cache_dir: Path, tmp_path: Path) -> None:
+        """Test that a failing parse is retried on the next call."""
+        defaults = tmp_path / "global.yml"
+
+        def fail() -> None:
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError):
+            cached_parse("test", b"data", None, defaults, fail)
+
+        assert cached_parse("test", b"data", None, defaults, lambda: "ok") == "ok"
+
+    def test_corrupt_entry_falls_back_to_parse(self, cache_dir: Path, tmp_path: Path) -> None:
+        """Test that an unreadable entry is replaced by a fresh parse."""
+        defaults = tmp_path / "global.yml"
+        cached_parse("test", b"data", None, defaults, lambda: 1)
+        for entry in cache_dir.rglob("*"):
+            if entry.is_file():
+                entry.write_bytes(b"not a pickle")
+
+        assert cached_parse("test", b"data", None, defaults, lambda: 2) == 2
+        assert cached_parse("test", b"data", None, defaults, lambda: 3) == 2
+
+    def test_clear_parse_cache(self, cache_dir: Path, tmp_path: Path) -> None:
+        """Test that clearing removes every entry."""
+        cached_parse("test", b"data", None, tmp_path / "global.yml", lambda: 1)
+
+        clear_parse_cache()
+
+        assert not (cache_dir / "parse").exists()
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="needs POSIX file ownership")
+    def test_entries_others_can_write_are_not_loaded(self, cache_dir: Path, tmp_path: Path) -> None:
+        """Test that a group- or world-writable entry is never unpickled."""
+        defaults = tmp_path / "global.yml"
+        cached_parse("test", b"data", None, defaults, lambda: 1)
+        (entry,) = (path for path in cache_dir.rglob("*") if path.is_file())
+        entry.chmod(0o666)
+
+        with patch("dot_work.utils.parse_cache.pickle.load") as load:
+            assert cached_parse("test", b"data", None, defaults, lambda: 2) == 2
+
+        load.assert_not_called()
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="needs POSIX file ownership")
+    def test_entries_of_other_users_are_not_loaded(self, cache_dir: Path, tmp_path: Path) -> None:
+        """Test that an entry owned by another user is never unpickled."""
+        defaults = tmp_path / "global.yml"
+        cached_parse("test", b"data", None, defaults, lambda: 1)
+
+        with (
+            patch("dot_work.utils.parse_cache.os.getuid", return_value=os.getuid() + 1),
+            patch("dot_work.utils.parse_cache.pickle.load") as load,
+        ):
+            assert cached_parse("test", b"data", None, defaults, lambda: 2) == 2
+
+        load.assert_not_called()
+
+    def test_old_generations_are_pruned(self, cache_dir: Path, tmp_path: Path) -> None:
+        """Test that only the most recently used generation directories are kept."""
+        root = cache_dir / "parse"
+        for index in range(MAX_GENERATIONS + 1):
+            old = root / f"old{index}"
+            old.mkdir(parents=True)
+            os.utime(old, ns=(index, index))
+
+        cached_parse("test", b"data", None, tmp_path / "global.yml", lambda: 1)
+
+        kept = sorted(path.name for path in root.iterdir())
+        assert len(kept) == MAX_GENERATIONS
+        assert "old0" not in kept
+        assert f"old{MAX_GENERATIONS}" in kept
+
+    def test_entries_per_kind_are_capped(self, cache_dir: Path, tmp_path: Path) -> None:
+        """Test that the oldest entries of a kind are dropped beyond the cap."""
+        defaults = tmp_path / "global.yml"
+
+        with (
+            patch("dot_work.utils.parse_cache.MAX_ENTRIES_PER_KIND", 2),
+            patch("dot_work.utils.parse_cache.PRUNE_INTERVAL", 1),
+        ):
+            for index in range(5):
+                cached_parse("test", str(index).encode(), None, defaults, lambda: 1)
+
+        entries = [path for path in cache_dir.rglob("*") if path.is_file()]
+        assert len(entries) == 3  # The cap, plus the entry written after pruning
+
+
+class TestParserIntegration:
+    """Tests that the parsers hit the cache on warm runs."""
+
+    def test_canonical_parse_is_cached(self, cache_dir: Path, tmp_path: Path) -> None:
+        """Test that CanonicalPromptParser.parse skips YAML parsing when warm."""
+        prompt_file = tmp_path / "test.md"
+        prompt_file.write_text(PROMPT, encoding="utf-8")
+        first = CANONICAL_PARSER.parse(prompt_file)
+
+        with patch.object(CANONICAL_PARSER, "_parse_frontmatter") as spy:
+            second = CANONICAL_PARSER.parse(prompt_file)
+
+        spy.assert_not_called()
+        assert second == first
+        assert second.source_file == prompt_file
+
+    def test_body_edit_keeps_cached_frontmatter(self, cache_dir: Path, tmp_path: Path) -> None:
+        """Test that editing only the body reuses the cached parse but reads the new body."""
+        prompt_file = tmp_path / "test.md"
+        prompt_file.write_text(PROMPT, encoding="utf-8")
+        CANONICAL_PARSER.parse(prompt_file)
+        prompt_file.write_text(PROMPT.replace("Body text", "New body"), encoding="utf-8")
+
+        with patch.object(CANONICAL_PARSER, "_parse_frontmatter") as spy:
+            prompt = CANONICAL_PARSER.parse(prompt_file)
+
+        spy.assert_not_called()
+        assert prompt.content == "New body"
+
+    def test_skill_metadata_is_cached(self, cache_dir: Path, tmp_path: Path) -> None:
+        """Test that SkillParser.parse_metadata_only skips YAML parsing when warm."""
+        skill_dir = tmp_path / "test-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(SKILL, encoding="utf-8")
+        first = SKILL_PARSER.parse_metadata_only(skill_dir)
+
+        with patch.object(SKILL_PARSER, "_parse_metadata") as spy:
+            second = SKILL_PARSER.parse_metadata_only(skill_dir)
+
+        spy.assert_not_called()
+        assert second == first
+
+    def test_subagent_parse_is_cached(self, cache_dir: Path, tmp_path: Path) -> None:
+        """Test that SubagentParser.parse skips YAML parsing when warm."""
+        subagent_file = tmp_path / "reviewer.md"
+        subagent_file.write_text(SUBAGENT, encoding="utf-8")
+        first = SUBAGENT_PARSER.parse(subagent_file)
+
+        with patch.object(SUBAGENT_PARSER, "_parse_content") as spy:
+            second = SUBAGENT_PARSER.parse(subagent_file)
+
+        spy.assert_not_called()
+        assert second == first
+
+    def test_edited_file_is_reparsed(self, cache_dir: Path, tmp_path: Path) -> None:
+        """Test that editing a prompt invalidates its cached parse."""
+        prompt_file = tmp_path / "test.md"
+        prompt_file.write_text(PROMPT, encoding="utf-8")
+        CANONICAL_PARSER.parse(prompt_file)
+
+        prompt_file.write_text(PROMPT.replace("Body text", "New body"), encoding="utf-8")
+
+        assert CANONICAL_PARSER.parse(prompt_file).content == "New body"
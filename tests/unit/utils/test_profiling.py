@@ -0,0 +1,84 @@
+"""Tests for the install profiling spans and counters."""
+
+import io
+import threading
+
+from rich.console import Console
+
+from dot_work.utils.io_pool import io_map, run_ordered
+from dot_work.utils.profiling import (
+    GLOBAL_CATEGORY,
+    active_profile,
+    count,
+    profiling,
+    span,
+)
+
+
+class TestProfiling:
+    """Tests for profiling, span and count."""
+
+    def test_noop_without_profile(self) -> None:
+        """Spans and counters do nothing outside profiling()."""
+        assert active_profile() is None
+        with span("parse", "skills"):
+            count("files", 3)
+        assert active_profile() is None
+
+    def test_spans_and_counters_by_category(self) -> None:
+        """Nested spans and counters inherit the enclosing span's category."""
+        with profiling() as profile:
+            with span("scan", "skills"):
+                with span("merge"):
+                    count("parse_cache_hits")
+                count("files", 2)
+            count("written", 1, "skills")
+            with span("discover"):
+                pass
+
+        report = profile.to_dict()
+        skills = report["categories"]["skills"]
+        assert set(skills["phases"]) == {"scan", "merge"}
+        assert skills["phases"]["scan"]["seconds"] >= skills["phases"]["merge"]["seconds"]
+        assert skills["counters"] == {"parse_cache_hits": 1, "files": 2, "written": 1}
+        assert set(report["categories"][GLOBAL_CATEGORY]["phases"]) == {"discover"}
+        assert report["wall_seconds"] > 0
+        assert active_profile() is None
+
+    def test_threads_report_into_one_profile(self) -> None:
+        """Threads count into the active profile with their own categories."""
+
+        def work(category: str) -> None:
+            with span("write", category):
+                for _ in range(100):
+                    count("bytes_written", 10)
+
+        with profiling() as profile:
+            threads = [threading.Thread(target=work, args=(name,)) for name in ("skills", "hooks")]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert profile.counters == {
+            ("skills", "bytes_written"): 1000,
+            ("hooks", "bytes_written"): 1000,
+        }
+        assert profile.timings[("skills", "write")].calls == 1
+
+    def test_pool_work_inherits_category(self) -> None:
+        """Work submitted through the I/O pool reports into the enclosing span's category."""
+
+        def merge(_item: int) -> None:
+            with span("merge"):
+                count("files")
+
+        with profiling() as profile:
+            with span("scan", "prompts"):
+                io_map(merge, range(8), max_workers=4)
+                run_ordered(Console(file=io.StringIO()), [lambda _: merge(0)] * 2, max_workers=2)
+
+        report = profile.to_dict()
+        assert set(report["categories"]) == {"prompts"}
+        assert report["categories"]["prompts"]["phases"]["merge"]["calls"] == 10
+        assert report["categories"]["prompts"]["counters"] == {"files": 10}
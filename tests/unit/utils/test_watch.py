@@ -0,0 +1,116 @@
+"""Tests for the directory watchers used by install --watch."""
+
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dot_work.utils.watch import InotifyWatcher, PollingWatcher, watch_changes
+
+WatcherFactory = Callable[[Path], InotifyWatcher | PollingWatcher]
+
+WATCHERS = [pytest.param(lambda root: PollingWatcher(root, interval=0.02), id="polling")]
+if sys.platform == "linux":
+    WATCHERS.append(pytest.param(InotifyWatcher, id="inotify"))
+
+
+@pytest.mark.parametrize("factory", WATCHERS)
+class TestWatchers:
+    """Tests shared by the inotify and polling watchers."""
+
+    def test_reports_created_modified_and_deleted(
+        self, tmp_path: Path, factory: WatcherFactory
+    ) -> None:
+        """Test that file creation, modification and deletion are reported."""
+        existing = tmp_path / "old.md"
+        existing.write_text("old")
+        watcher = factory(tmp_path)
+        try:
+            (tmp_path / "new.md").write_text("new")
+            existing.unlink()
+
+            changed = set()
+            deadline = time.monotonic() + 2
+            while len(changed) < 2 and time.monotonic() < deadline:
+                changed |= watcher.read(0.2)
+        finally:
+            watcher.close()
+
+        assert changed == {tmp_path / "new.md", existing}
+
+    def test_watches_new_subdirectories(self, tmp_path: Path, factory: WatcherFactory) -> None:
+        """Test that files in directories created after start are reported."""
+        watcher = factory(tmp_path)
+        try:
+            skill = tmp_path / "review"
+            skill.mkdir()
+            (skill / "SKILL.md").write_text("skill")
+
+            changed = set()
+            deadline = time.monotonic() + 2
+            while skill / "SKILL.md" not in changed and time.monotonic() < deadline:
+                changed |= watcher.read(0.2)
+        finally:
+            watcher.close()
+
+        assert skill / "SKILL.md" in changed
+
+    def test_idle_read_times_out(self, tmp_path: Path, factory: WatcherFactory) -> None:
+        """Test that read returns nothing when no file changes."""
+        watcher = factory(tmp_path)
+        try:
+            assert watcher.read(0.05) == set()
+        finally:
+            watcher.close()
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="inotify is Linux-only")
+class TestInotifyWatcher:
+    """Tests specific to the inotify watcher."""
+
+    def test_unwatchable_new_directory_reports_root(self, tmp_path: Path) -> None:
+        """Test that a new directory that cannot be watched reports the whole tree."""
+        watcher = InotifyWatcher(tmp_path)
+        try:
+            with patch.object(
+                watcher, "_add_watch", side_effect=OSError(28, "No space left on device")
+            ):
+                (tmp_path / "review").mkdir()
+                changed = watcher.read(2)
+        finally:
+            watcher.close()
+
+        assert changed == {tmp_path}
+
+
+class TestWatchChanges:
+    """Tests for watch_changes."""
+
+    def test_debounces_and_ignores_swap_files(self, tmp_path: Path) -> None:
+        """Test that a burst of saves is one batch without editor temporary files."""
+        stop = threading.Event()
+        batches: list[set[Path]] = []
+
+        def collect() -> None:
+            def factory(root: Path) -> PollingWatcher:
+                return PollingWatcher(root, interval=0.02)
+
+            for batch in watch_changes(tmp_path, debounce=0.3, stop=stop, watcher_factory=factory):
+                batches.append(batch)
+                stop.set()
+
+        thread = threading.Thread(target=collect)
+        thread.start()
+        time.sleep(0.1)
+        (tmp_path / ".a.md.swp").write_text("swap")
+        (tmp_path / "a.md").write_text("one")
+        time.sleep(0.1)
+        (tmp_path / "b.md").write_text("two")
+        (tmp_path / "b.md~").write_text("backup")
+        thread.join(timeout=5)
+
+        assert batches == [{tmp_path / "a.md", tmp_path / "b.md"}]
@@ -0,0 +1,117 @@
+"""Tests for the accelerated YAML loaders."""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from dot_work.installer import get_bundled_assets_dir
+from dot_work.utils import yaml_loader
+from dot_work.utils.frontmatter import read_frontmatter
+from dot_work.utils.yaml_loader import fast_load, load_frontmatter, safe_load
+
+SUPPORTED = [
+    'meta:\n  title: "Test"\n  description: A test prompt\n  version: "1.0"\n',
+    "environments:\n  claude:\n    target: .claude/commands/\n    filename_suffix: .md\n",
+    "environments:\n  copilot:\n    target: '.github/prompts/'\n\n  cursor:\n    target: x\n",
+    "tools:\n  - Read\n  - Grep\nmodel: opus\n",
+    "calls:\n- a.md\n- b.md\nnext: value\n",
+    "tags: [python, refactoring, best practices]\nempty: []\nobj: {}\n",
+    "a: 1\nb: -2\nc: 0.2\nd: true\ne: off\nf: null\ng: ~\nh:\n",
+    "url: http://example.com/a#b\nversion: 2.0.0\nnote: it's fine\n",
+    "# comment\nmeta:   # trailing\n  # nested comment\n  name: x\n",
+    "dup: 1\ndup: 2\n",
+    "quoted: \"a # b: c\"\nsingle: 'x'  # comment\n",
+    "y: n\noctal_looking: 0o17\nsci_looking: 1e3\n",
+]
+
+UNSUPPORTED = [
+    "date: 2024-01-01\n",
+    "octal: 017\n",
+    "hex: 0x1F\n",
+    "sci: 1.0e+3\n",
+    "inf: .inf\n",
+    "anchor: &a x\nref: *a\n",
+    "block: |\n  text\n",
+    "folded: >\n  text\n",
+    'escaped: "a\\nb"\n',
+    "single: 'it''s'\n",
+    "multi: first\n  second\n",
+    "items:\n  - key: value\n",
+    "flow: {a: 1}\n",
+    "nested: [[a]]\n",
+    "tab:\tvalue\n",
+    "on: value\n",
+    "  indented: root\n",
+    "plain list\n",
+    "---\na: 1\n",
+    "",
+]
+
+
+class TestFastLoad:
+    """Tests for the restricted frontmatter parser."""
+
+    @pytest.mark.parametrize("text", SUPPORTED)
+    def test_matches_safe_load(self, text: str) -> None:
+        """Test that supported documents load exactly as yaml.safe_load does."""
+        result = fast_load(text)
+
+        assert result is not None
+        assert result == yaml.safe_load(text)
+        assert [type(v) for v in result.values()] == [
+            type(v) for v in yaml.safe_load(text).values()
+        ]
+
+    @pytest.mark.parametrize("text", UNSUPPORTED)
+    def test_unsupported_falls_back(self, text: str) -> None:
+        """Test that anything outside the subset is left to the full loader."""
+        assert fast_load(text) is None
+
+    def test_bundled_assets_match_safe_load(self) -> None:
+        """Test that every bundled frontmatter loads identically via load_frontmatter."""
+        hits = 0
+        for path in sorted(get_bundled_assets_dir().rglob("*.md")):
+            block = read_frontmatter(path)
+            if block is None:
+                continue
+            expected = yaml.safe_load(block.text)
+            assert load_frontmatter(block.text) == expected, path
+            hits += fast_load(block.text) is not None
+
+        assert hits > 0
+
+
+class TestSafeLoad:
+    """Tests for the libyaml-backed safe_load."""
+
+    def test_uses_libyaml_when_available(self) -> None:
+        """Test that valid documents go through CSafeLoader when present."""
+        if yaml_loader.CSafeLoader is None:
+            pytest.skip("PyYAML built without libyaml")
+
+        with patch("dot_work.utils.yaml_loader.yaml.safe_load") as pure:
+            assert safe_load("a: [1, 2]\n") == {"a": [1, 2]}
+
+        pure.assert_not_called()
+
+    def test_without_libyaml(self) -> None:
+        """Test the pure-Python path when libyaml is missing."""
+        with patch.object(yaml_loader, "CSafeLoader", None):
+            assert safe_load("a: b\n") == {"a": "b"}
+
+    def test_errors_match_pure_python_loader(self) -> None:
+        """Test that invalid YAML raises the pure-Python loader's error."""
+        text = "key: value\n  bad: indent\n"
+        with pytest.raises(yaml.YAMLError) as expected:
+            yaml.safe_load(text)
+
+        with pytest.raises(yaml.YAMLError) as actual:
+            safe_load(text)
+
+        assert str(actual.value) == str(expected.value)
+
+    def test_load_frontmatter_raises_on_invalid(self) -> None:
+        """Test that invalid frontmatter still raises YAMLError."""
+        with pytest.raises(yaml.YAMLError):
+            load_frontmatter("invalid: yaml: content: [")
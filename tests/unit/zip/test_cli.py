@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from dot_work.zip.cli import _create_zip_internal, _upload_zip_internal
+from dot_work.zip.zipper import zip_folder
 
 
 class TestCreateZipInternal:
@@ -62,6 +63,24 @@ class TestCreateZipInternal:
 
         assert output_path.exists()
 
+    def test_create_zip_internal_passes_jobs(
+        self, test_folder_structure: Path, zip_output_dir: Path
+    ) -> None:
+        """Test that the number of compression jobs reaches zip_folder.
+
+        Args:
+            test_folder_structure: Fixture providing test folder
+            zip_output_dir: Fixture providing output directory
+        """
+        output_path = zip_output_dir / "jobs.zip"
+
+        with patch("dot_work.zip.zipper.zip_folder", side_effect=zip_folder) as mock_zip:
+            _create_zip_internal(test_folder_structure, output_path, upload=False, jobs=3)
+
+        mock_zip.assert_called_once_with(
+            test_folder_structure.resolve(), output_path.resolve(), jobs=3
+        )
+
     def test_create_zip_internal_nonexistent_folder(self, zip_output_dir: Path) -> None:
         """Test with nonexistent folder raises FileNotFoundError.
 
@@ -2,9 +2,11 @@
 
 import zipfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from dot_work.zip import zipper
 from dot_work.zip.zipper import should_include, zip_folder
 
 
@@ -180,6 +182,55 @@ class TestZipFolder:
             assert content == "print('hello')"
 
 
+class TestParallelZipFolder:
+    """Tests for compressing files on several threads."""
+
+    def test_parallel_archive_matches_serial(
+        self, gitignore_folder: Path, zip_output_dir: Path
+    ) -> None:
+        """The archive is byte-identical whatever the number of jobs.
+
+        Args:
+            gitignore_folder: Fixture providing folder with .gitignore
+            zip_output_dir: Fixture providing output directory
+        """
+        (gitignore_folder / "large.txt").write_text("line of text\n" * 20000)
+        (gitignore_folder / "empty.txt").write_text("")
+        serial = zip_output_dir / "serial.zip"
+        zip_folder(gitignore_folder, serial, jobs=1)
+
+        parallel = zip_output_dir / "parallel.zip"
+        zip_folder(gitignore_folder, parallel, jobs=4)
+        assert parallel.read_bytes() == serial.read_bytes()
+
+        # Large files streamed by the writer, and a small in-flight byte budget
+        with (
+            patch.object(zipper, "MAX_BUFFERED_FILE_SIZE", 1000),
+            patch.object(zipper, "MAX_BUFFERED_BYTES", 10),
+        ):
+            zip_folder(gitignore_folder, parallel, jobs=3)
+        assert parallel.read_bytes() == serial.read_bytes()
+
+        with zipfile.ZipFile(parallel) as zf:
+            assert zf.testzip() is None
+            assert zf.read("large.txt") == b"line of text\n" * 20000
+
+    def test_parallel_read_error_propagates(
+        self, test_folder_structure: Path, zip_output_dir: Path
+    ) -> None:
+        """An error reading a file in a worker fails the whole zip.
+
+        Args:
+            test_folder_structure: Fixture providing test folder
+            zip_output_dir: Fixture providing output directory
+        """
+        with (
+            patch.object(zipper, "_deflate", side_effect=PermissionError("denied")),
+            pytest.raises(PermissionError, match="denied"),
+        ):
+            zip_folder(test_folder_structure, zip_output_dir / "test.zip", jobs=2)
+
+
 class TestShouldInclude:
     """Tests for should_include function."""
 